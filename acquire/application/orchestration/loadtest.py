@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/application/orchestration/loadtest.py                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:40:55 pm                                                #
+# Modified   : Friday October 16th 2026 08:15:58 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Load Test Harness Module"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+import numpy as np
+from pydantic import ValidationError
+
+from acquire.application.orchestration.context import JobContext
+from acquire.application.orchestration.runner import default_session_factory
+from acquire.core.data import DataClass
+from acquire.core.enum import Category, DataType
+from acquire.domain.artifact.request.appdata import AppDataRequestSpec, RequestAppData
+from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+from acquire.domain.artifact.request.review import (
+    AppReviewRequest,
+    AppReviewRequestSpec,
+)
+from acquire.domain.content.appdata import RawAppData
+from acquire.domain.content.review import AppReview
+from acquire.infra.base.config import Config
+from acquire.infra.web.mock import MockAppStoreProcess, MockProfile
+
+if TYPE_CHECKING:  # pragma: no cover
+    from acquire.domain.artifact.response.response import Response
+    from acquire.infra.web.asession import AsyncSession
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    LOAD TEST RESULT                                              #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class LoadTestResult(DataClass):
+    """Throughput and cost of one load test run.
+
+    Attributes:
+        data_type (str): The endpoint exercised, "appdata" or "review".
+        requests (int): The pages requested.
+        responses (int): The pages returned successfully.
+        failures (int): The pages that failed after retries.
+        records (int): The records transformed from the returned pages.
+        invalid (int): The records that failed validation.
+        duration (float): Wall clock seconds from the first request to the last response.
+        requests_per_second (float): Completed pages, successful or not, per second.
+        latency_p50 (float): The median request latency in seconds.
+        latency_p99 (float): The 99th percentile request latency in seconds.
+        cpu_per_page (float): Client CPU seconds per completed page, covering extract and transform.
+        status_counts (Dict[int, int]): Responses served by the mock App Store, by status code.
+        stage (str): The adapter stage at the end of the run, which names the adapter strategy.
+        rate (float): The request rate the adapter settled on, in requests per second.
+        concurrency (float): The concurrency the adapter settled on.
+    """
+
+    data_type: str
+    requests: int = 0
+    responses: int = 0
+    failures: int = 0
+    records: int = 0
+    invalid: int = 0
+    duration: float = 0.0
+    requests_per_second: float = 0.0
+    latency_p50: float = 0.0
+    latency_p99: float = 0.0
+    cpu_per_page: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    stage: str = ""
+    rate: float = 0.0
+    concurrency: float = 0.0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  LOAD TEST REQUEST GEN                                           #
+# ------------------------------------------------------------------------------------------------ #
+class LoadTestRequestGen(RequestGen[AsyncRequest[Request]]):
+    """Generates App Store requests pointed at the mock server.
+
+    Args:
+        host (str): The mock server's host and port.
+        data_type (str): "appdata" for search pages, or "review" for review pages.
+        pages (int): The number of pages to request.
+        limit (int): The records per page.
+        genre_id (int): The genre searched, for appdata.
+        app_id (int): The app whose reviews are requested, for reviews.
+        batch_size (int): The requests per batch.
+        context (Optional[JobContext]): The job context attached to each request.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        data_type: str,
+        pages: int,
+        limit: int,
+        genre_id: int = 6000,
+        app_id: int = 1,
+        batch_size: int = 100,
+        context: Optional[JobContext] = None,
+    ) -> None:
+        self._host = host
+        self._data_type = data_type
+        self._pages = pages
+        self._limit = limit
+        self._genre_id = genre_id
+        self._app_id = app_id
+        self._batch_size = batch_size
+        self._context = context
+        self._page = 0
+        self._appdata_spec = AppDataRequestSpec(
+            context=context, limit=limit, scheme="http", host=host
+        )
+        self._review_spec = AppReviewRequestSpec(
+            context=context, limit=limit, scheme="http", host=host
+        )
+
+    @property
+    def bookmark(self) -> int:
+        return self._page
+
+    @property
+    def max_requests(self) -> int:
+        return self._pages
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def __iter__(self) -> LoadTestRequestGen:
+        return self
+
+    def __next__(self) -> AsyncRequest[Request]:
+        if self._page >= self._pages:
+            raise StopIteration
+        async_request: AsyncRequest[Request] = AsyncRequest(context=self._context)
+        while async_request.request_count < self._batch_size:
+            request = self.next_request()
+            if request is None:
+                break
+            async_request.add_request(request=request)
+        return async_request
+
+    def next_request(self) -> Optional[Request]:
+        if self._page >= self._pages:
+            return None
+        request = self.create_request(page=self._page)
+        self._page += 1
+        return request
+
+    def create_request(self, page: int) -> Request:
+        """Creates the request for a page."""
+        if self._data_type == "appdata":
+            return RequestAppData(
+                spec=self._appdata_spec, page=page, genreId=self._genre_id
+            )
+        return AppReviewRequest(spec=self._review_spec, page=page, app_id=self._app_id)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       LOAD TEST                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class LoadTest:
+    """Drives the real `AsyncSession` and `Adapter` against a local mock App Store.
+
+    The mock server runs in its own process with the behavior given by a `MockProfile`.
+    The session streams the requested pages from it, and each page is transformed as it
+    arrives, so the measurements cover the extract and transform path end to end. Client
+    CPU time is measured with `time.process_time`, which excludes the server process.
+    Because the server is deterministic, runs of the same profile are comparable across
+    changes, and so are the adapter strategies: the result reports the stage, rate and
+    concurrency the adapter settled on under the configured `adapter.strategy`.
+
+    Args:
+        profile (MockProfile): The mock server behavior.
+        data_type (str): "appdata" for search pages, or "review" for review pages.
+        pages (int): The number of pages to request.
+        limit (int): The records per page.
+        session_factory (Callable[[], AsyncSession]): Creates the session under test.
+            Defaults to the configured `AsyncSession`.
+    """
+
+    def __init__(
+        self,
+        profile: MockProfile,
+        data_type: str = "appdata",
+        pages: int = 1000,
+        limit: int = 200,
+        session_factory: Callable[[], AsyncSession] = default_session_factory,
+    ) -> None:
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        if data_type not in ("appdata", "review"):
+            msg = f"Invalid data type: {data_type}. Valid values are 'appdata' and 'review'."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._profile = profile
+        self._data_type = data_type
+        self._pages = pages
+        self._limit = limit
+        self._session_factory = session_factory
+
+    @classmethod
+    def from_config(cls, config_cls: type[Config] = Config) -> LoadTest:
+        """Creates a load test from the `loadtest` section of the configuration."""
+        config = config_cls().loadtest
+        return cls(
+            profile=MockProfile(**vars(config.profile)),
+            data_type=config.data_type,
+            pages=config.pages,
+            limit=config.limit,
+        )
+
+    def run(self) -> LoadTestResult:
+        """Starts the mock server, runs the load test, and stops the server."""
+        server = MockAppStoreProcess(profile=self._profile)
+        host = server.start()
+        try:
+            result = asyncio.run(self._run(host=host))
+        finally:
+            status_counts = server.stop()
+        result.status_counts = status_counts
+        self._logger.info(f"Load test complete: {result}")
+        return result
+
+    async def _run(self, host: str) -> LoadTestResult:
+        """Streams the pages through the session and measures throughput and cost."""
+        result = LoadTestResult(data_type=self._data_type, requests=self._pages)
+        request_gen = LoadTestRequestGen(
+            host=host,
+            data_type=self._data_type,
+            pages=self._pages,
+            limit=self._limit,
+            context=self._create_context(),
+        )
+        latencies: List[float] = []
+
+        session = self._session_factory()
+        await session.__enter__()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            async for response in session.stream(request_gen=request_gen):
+                result.responses += 1
+                latencies.append(response.latency)
+                records, invalid = self._transform(response=response)
+                result.records += records
+                result.invalid += invalid
+        finally:
+            await session.__exit__()
+        result.duration = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+
+        result.failures = result.requests - result.responses
+        if result.duration > 0:
+            result.requests_per_second = result.requests / result.duration
+        if latencies:
+            result.latency_p50, result.latency_p99 = (
+                float(value) for value in np.percentile(latencies, [50, 99])
+            )
+        result.cpu_per_page = cpu / result.requests if result.requests else 0.0
+        result.stage = session.adapter.stage.__class__.__name__
+        result.rate = session.adapter.session_control.rate
+        result.concurrency = session.adapter.session_control.concurrency
+        return result
+
+    def _create_context(self) -> JobContext:
+        """Creates the job context attached to the load test's requests, e.g. for error logging."""
+        now = datetime.now()
+        return JobContext(
+            job_id="loadtest",
+            category=Category.BUSINESS,
+            data_type=DataType.APPDATA
+            if self._data_type == "appdata"
+            else DataType.APPREVIEW,
+            description=f"Load test of {self._data_type} pages",
+            dt_created=now,
+        )
+
+    def _transform(self, response: Response) -> tuple[int, int]:
+        """Validates the records on a page, returning the number of records and invalid records."""
+        content = response.content if isinstance(response.content, dict) else {}
+        if self._data_type == "review":
+            reviews = content.get("userReviewList", [])
+            invalid = 0
+            for item in reviews:
+                try:
+                    self._create_review(item=item)
+                except (KeyError, ValueError, TypeError):
+                    invalid += 1
+            return len(reviews), invalid
+
+        results = content.get("results", [])
+        invalid = 0
+        for item in results:
+            try:
+                RawAppData.create(content=item)
+            except (ValidationError, KeyError, ValueError):
+                invalid += 1
+        return len(results), invalid
+
+    @staticmethod
+    def _create_review(item: Dict[str, Any]) -> AppReview:
+        """Creates an `AppReview` from a review in a `userReviewsRow` response."""
+        body = item["body"]
+        return AppReview.create(
+            appreview_row={
+                "review_id": item["userReviewId"],
+                "app_id": item.get("appId", 1),
+                "review": body,
+                "review_length": len(body.split()),
+                "review_date": datetime.fromisoformat(
+                    item["date"].replace("Z", "+00:00")
+                ),
+                "reviewer_name": item["name"],
+                "rating": int(item["rating"]),
+                "review_title": item["title"],
+                "vote_count": int(item["voteCount"]),
+                "vote_sum": int(item["voteSum"]),
+                "is_edited": bool(item["isEdited"]),
+                "reviews_url": item["viewUsersUserReviewsUrl"],
+                "vote_url": item["voteUrl"],
+                "customer_type": item["customerType"],
+                "extract_date": datetime.now(),
+            }
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    from acquire.toolkit.print import Printer
+
+    load_test_result = LoadTest.from_config().run()
+    Printer().print_dict(title="Load Test", data=load_test_result.as_dict())
@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 28th 2024 01:30:04 am                                              #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 08:18:55 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -49,6 +49,8 @@ class Project(DataClass):
         job_successes (int): Number of successful jobs; starts at 0.
         success_rate (float): Percentage of successful jobs; computed dynamically based on job_count and job_successes.
         status (ProjectStatus): Current status of the project, defaulting to IDLE.
+        controller (str): The adapter stage that follows exploration for the project's jobs:
+            "exploit" to scale the rate against the baseline, or "pid" to hold a latency SLO.
     """
 
     project_id: str
@@ -71,6 +73,9 @@ class Project(DataClass):
     )
     job_count: int = 0  # Total number of jobs created; starts at 0.
     status: ProjectStatus = ProjectStatus.IDLE  # Project status; defaults to IDLE.
+    controller: str = (
+        "exploit"  # Adapter controller for the project's jobs: exploit or pid.
+    )
 
     def __post_init__(self) -> None:
         """
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/application/orchestration/runner.py                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:32:36 pm                                                #
+# Modified   : Friday October 16th 2026 08:48:35 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Sharded Extraction Runner Module"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import queue
+import shelve
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from acquire.application.orchestration.project import Project
+from acquire.core.data import DataClass
+from acquire.infra.base.config import Config
+from acquire.infra.exceptions.web import ShortCircuitError
+from acquire.infra.web.pacer import SharedTokenBucket
+
+if TYPE_CHECKING:  # pragma: no cover
+    from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+    from acquire.domain.artifact.response.response import Response
+    from acquire.infra.web.asession import AsyncSession
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          SHARD                                                   #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class Shard(DataClass):
+    """A unit of extraction work, resumable from its own bookmark.
+
+    A shard is a request generator class plus the keyword arguments to build it, e.g. a
+    `RequestAppDataGen` for one category, or a page range of one. The runner supplies
+    `start_page` and `max_requests` itself, resuming from the shard's bookmark. Shards are
+    sent to worker processes, so the generator class and its arguments must be picklable.
+
+    Attributes:
+        key (str): A unique, stable name for the shard, under which its bookmark is kept.
+        request_gen_cls (type): The request generator class, e.g. `RequestAppDataGen`.
+        request_gen_kwargs (Dict[str, Any]): Keyword arguments for the generator, excluding
+            `start_page` and `max_requests`.
+        start_page (int): The first page of the shard.
+        max_requests (int): The number of pages in the shard.
+        bookmark (int): The page from which the shard resumes. Set by the runner.
+    """
+
+    key: str
+    request_gen_cls: type
+    request_gen_kwargs: Dict[str, Any] = field(default_factory=dict)
+    start_page: int = 0
+    max_requests: int = sys.maxsize
+    bookmark: int = 0
+
+    @property
+    def remaining(self) -> int:
+        """Returns the number of pages left from the bookmark to the end of the shard."""
+        if self.max_requests == sys.maxsize:
+            return sys.maxsize
+        return max(self.max_requests - (self.bookmark - self.start_page), 0)
+
+    def create_request_gen(self) -> RequestGen[AsyncRequest[Request]]:
+        """Creates the shard's request generator, positioned at its bookmark."""
+        return self.request_gen_cls(
+            **self.request_gen_kwargs,
+            start_page=self.bookmark,
+            max_requests=self.remaining,
+        )
+
+    @classmethod
+    def split(
+        cls,
+        key: str,
+        request_gen_cls: type,
+        request_gen_kwargs: Dict[str, Any],
+        pages: int,
+        shards: int,
+        start_page: int = 0,
+    ) -> List[Shard]:
+        """Splits a page range into contiguous shards of near-equal size.
+
+        Args:
+            key (str): The key prefix. Each shard is named `{key}-{index}`.
+            request_gen_cls (type): The request generator class.
+            request_gen_kwargs (Dict[str, Any]): Keyword arguments for the generator.
+            pages (int): The number of pages to split.
+            shards (int): The number of shards.
+            start_page (int): The first page of the range. Defaults to 0.
+        """
+        shards = max(min(shards, pages), 1)
+        size, extra = divmod(pages, shards)
+        result = []
+        page = start_page
+        for index in range(shards):
+            count = size + (1 if index < extra else 0)
+            result.append(
+                cls(
+                    key=f"{key}-{index}",
+                    request_gen_cls=request_gen_cls,
+                    request_gen_kwargs=dict(request_gen_kwargs),
+                    start_page=page,
+                    max_requests=count,
+                )
+            )
+            page += count
+        return result
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SHARD RESULT                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class ShardResult(DataClass):
+    """The outcome and metrics of one shard, reported by its worker.
+
+    Attributes:
+        key (str): The shard key.
+        worker (int): The index of the worker that ran the shard.
+        pid (int): The process id of the worker.
+        responses (int): The number of successful responses.
+        size (int): Decompressed body bytes received.
+        wire_size (int): Body bytes received on the wire.
+        latency_total (float): The sum of response latencies in seconds.
+        latency_max (float): The largest response latency in seconds.
+        duration (float): Seconds spent on the shard.
+        bookmark (int): The page from which the shard would resume.
+        error (str): The error that stopped the shard, if any.
+    """
+
+    key: str
+    worker: int = 0
+    pid: int = 0
+    responses: int = 0
+    size: int = 0
+    wire_size: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+    duration: float = 0.0
+    bookmark: int = 0
+    error: str = ""
+
+    def add_response(self, response: Response) -> None:
+        """Accumulates the metrics of one response.
+
+        Args:
+            response (Response): The response.
+        """
+        self.responses += 1
+        self.size += response.size
+        self.wire_size += response.headers.size
+        self.latency_total += response.latency
+        self.latency_max = max(self.latency_max, response.latency)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      RUNNER RESULT                                               #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class RunnerResult(DataClass):
+    """The merged metrics of a sharded run.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        shards (int): The number of shards run.
+        failed (int): The number of shards that stopped with an error.
+        responses (int): The number of successful responses across all shards.
+        size (int): Decompressed body bytes received across all shards.
+        wire_size (int): Body bytes received on the wire across all shards.
+        duration (float): Wall-clock seconds for the run.
+        throughput (float): Responses per second across all shards.
+        latency_average (float): The mean response latency in seconds.
+        latency_max (float): The largest response latency in seconds.
+        results (List[ShardResult]): The per-shard results.
+    """
+
+    workers: int = 0
+    shards: int = 0
+    failed: int = 0
+    responses: int = 0
+    size: int = 0
+    wire_size: int = 0
+    duration: float = 0.0
+    throughput: float = 0.0
+    latency_average: float = 0.0
+    latency_max: float = 0.0
+    results: List[ShardResult] = field(default_factory=list)
+
+    @classmethod
+    def merge(
+        cls, results: List[ShardResult], workers: int, duration: float
+    ) -> RunnerResult:
+        """Merges per-shard results into run-level metrics.
+
+        Args:
+            results (List[ShardResult]): The per-shard results.
+            workers (int): The number of worker processes.
+            duration (float): Wall-clock seconds for the run.
+        """
+        responses = sum(result.responses for result in results)
+        latency_total = sum(result.latency_total for result in results)
+        return cls(
+            workers=workers,
+            shards=len(results),
+            failed=sum(1 for result in results if result.error),
+            responses=responses,
+            size=sum(result.size for result in results),
+            wire_size=sum(result.wire_size for result in results),
+            duration=duration,
+            throughput=responses / duration if duration else 0.0,
+            latency_average=latency_total / responses if responses else 0.0,
+            latency_max=max((result.latency_max for result in results), default=0.0),
+            results=results,
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      BOOKMARK STORE                                              #
+# ------------------------------------------------------------------------------------------------ #
+class BookmarkStore:
+    """Persists shard bookmarks, so each shard resumes independently after a restart.
+
+    Only the runner's parent process writes to the store, so the shelve file never has
+    concurrent writers.
+
+    Args:
+        directory (str): The directory holding the bookmark file.
+    """
+
+    def __init__(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._filepath = os.path.join(directory, "bookmarks")
+
+    def get(self, key: str, default: int = 0) -> int:
+        """Returns the bookmark for a shard, or the default if none is stored."""
+        with shelve.open(self._filepath) as db:
+            return int(db.get(key, default))
+
+    def set(self, key: str, bookmark: int) -> None:
+        """Stores the bookmark for a shard."""
+        with shelve.open(self._filepath) as db:
+            db[key] = bookmark
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SHARDED RUNNER                                              #
+# ------------------------------------------------------------------------------------------------ #
+def default_session_factory(controller: Optional[str] = None) -> AsyncSession:
+    """Creates an AsyncSession, with its own Adapter, from the configuration of the current environment.
+
+    Args:
+        controller (Optional[str]): Overrides the adapter controller chosen by `adapter.controller`
+            in the configuration, "exploit" or "pid", e.g. with a project's `controller`.
+    """
+    from acquire.container import AsyncSessionContainer
+
+    container = AsyncSessionContainer()
+    container.config.from_dict(Config().load_config())
+    if controller is not None:
+        container.config.adapter.controller.from_value(controller)
+    return container.async_session()
+
+
+def project_session_factory(project: Project) -> Callable[[], AsyncSession]:
+    """Returns a session factory whose sessions adapt with the project's controller.
+
+    The factory can be pickled, so it can be passed to a `ShardedRunner` as well as a
+    `JobScheduler`.
+
+    Args:
+        project (Project): The project whose jobs the sessions run.
+    """
+    return functools.partial(default_session_factory, controller=project.controller)
+
+
+class ShardedRunner:
+    """Runs shards across worker processes that share one global rate budget.
+
+    A single event loop tops out on CPU (decoding, validation, logging) before the network
+    is saturated. The runner starts `workers` processes, each with its own event loop,
+    `AsyncSession` and `Adapter`. Workers pull shards from a shared queue and stream each
+    shard's requests through their session. Every pacer of every worker also draws on a
+    `SharedTokenBucket`, so each adapter tunes its own rate while the combined rate stays
+    within `rate`.
+
+    The parent process persists shard bookmarks as workers report progress, and resumes
+    each shard from its bookmark. Checkpoints taken during a shard trail the generator by
+    the stream window, because up to that many pages may still be in flight. A resumed
+    shard may therefore refetch up to one window of pages, but never skips one.
+
+    Args:
+        session_factory (Callable[[], AsyncSession]): Creates each worker's session. It must be
+            picklable, e.g. a module-level function. Defaults to `default_session_factory`.
+            `project_session_factory` creates one that adapts with a project's controller.
+        handler (Optional[Callable[[Response], None]]): Called in the worker with each response,
+            e.g. to transform and load it. It must be picklable.
+        config_cls (type[Config]): The configuration class. Defaults to `Config`.
+
+    Attributes:
+        _workers (int): The number of worker processes.
+        _rate (float): The combined requests per second for all workers.
+        _burst (float): The shared bucket capacity in tokens.
+        _checkpoint_interval (int): Responses between bookmark checkpoints.
+        _window (int): The stream window, by which checkpoints trail the generator.
+        _bookmarks (BookmarkStore): The shard bookmarks.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = default_session_factory,
+        handler: Optional[Callable[[Response], None]] = None,
+        config_cls: type[Config] = Config,
+    ) -> None:
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._config = config_cls()
+        self._session_factory = session_factory
+        self._handler = handler
+
+        runner = self._config.runner
+        self._workers: int = runner.workers
+        self._rate: float = runner.rate
+        self._burst: float = runner.burst
+        self._checkpoint_interval: int = runner.checkpoint_interval
+        self._window: int = self._config.async_session.stream.window
+
+        directory = os.getenv("OPS_DIRECTORY")
+        if not directory:
+            msg = "Environment variable OPS_DIRECTORY is not set."
+            self._logger.error(msg)
+            raise EnvironmentError(msg)
+        self._bookmarks = BookmarkStore(
+            directory=os.path.join(directory, runner.directory)
+        )
+
+    def run(self, shards: List[Shard]) -> RunnerResult:
+        """Runs the shards to completion and returns the merged metrics.
+
+        Args:
+            shards (List[Shard]): The shards to run. Keys must be unique.
+
+        Returns:
+            RunnerResult: The merged metrics, with the per-shard results.
+        """
+        keys = [shard.key for shard in shards]
+        if len(set(keys)) != len(keys):
+            msg = "Shard keys must be unique."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        context = multiprocessing.get_context("spawn")
+        budget = SharedTokenBucket(rate=self._rate, burst=self._burst, context=context)
+        tasks = context.Queue()
+        progress = context.Queue()
+        workers = max(min(self._workers, len(shards)), 1)
+
+        for shard in shards:
+            shard.bookmark = self._bookmarks.get(shard.key, default=shard.start_page)
+            tasks.put(shard)
+        for _ in range(workers):
+            tasks.put(None)
+
+        started = time.perf_counter()
+        processes = [
+            context.Process(
+                target=_work,
+                name=f"ShardWorker-{worker}",
+                kwargs={
+                    "worker": worker,
+                    "tasks": tasks,
+                    "progress": progress,
+                    "budget": budget,
+                    "session_factory": self._session_factory,
+                    "handler": self._handler,
+                    "checkpoint_interval": self._checkpoint_interval,
+                    "window": self._window,
+                },
+            )
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+
+        results = self._collect(
+            progress=progress, processes=processes, expected=len(shards)
+        )
+
+        for process in processes:
+            process.join()
+        duration = time.perf_counter() - started
+
+        result = RunnerResult.merge(results=results, workers=workers, duration=duration)
+        self._logger.info(
+            f"Ran {result.shards} shards on {workers} workers in {round(duration, 1)} seconds: "
+            f"{result.responses} responses at {round(result.throughput, 1)} per second, "
+            f"{result.failed} failed."
+        )
+        return result
+
+    def _collect(
+        self, progress: Any, processes: List[Any], expected: int
+    ) -> List[ShardResult]:
+        """Persists checkpoints and gathers shard results until every shard has reported.
+
+        Args:
+            progress (multiprocessing.Queue): The queue on which workers report.
+            processes (List[multiprocessing.Process]): The worker processes.
+            expected (int): The number of shards.
+        """
+        results: List[ShardResult] = []
+        while len(results) < expected:
+            try:
+                kind, payload = progress.get(timeout=1)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    self._logger.error(
+                        f"Workers exited with {expected - len(results)} shards unreported."
+                    )
+                    break
+                continue
+            if kind == "checkpoint":
+                self._bookmarks.set(*payload)
+            else:
+                results.append(payload)
+                self._bookmarks.set(payload.key, payload.bookmark)
+        return results
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         WORKER                                                   #
+# ------------------------------------------------------------------------------------------------ #
+def _work(**kwargs: Any) -> None:
+    """Entry point of a worker process, which runs its own event loop."""
+    asyncio.run(_work_async(**kwargs))
+
+
+async def _work_async(
+    worker: int,
+    tasks: Any,
+    progress: Any,
+    budget: SharedTokenBucket,
+    session_factory: Callable[[], AsyncSession],
+    handler: Optional[Callable[[Response], None]],
+    checkpoint_interval: int,
+    window: int,
+) -> None:
+    """Streams shards from the task queue through one session until the queue is drained.
+
+    Each shard's stream begins with a fresh short circuit on the session's breaker, so a
+    shard cut short does not end the shards after it. A short-circuited shard is reported
+    with an error, and resumes from its trailing bookmark, rather than as completed.
+
+    Args:
+        worker (int): The index of the worker.
+        tasks (multiprocessing.Queue): The shards, followed by a None sentinel per worker.
+        progress (multiprocessing.Queue): The queue on which checkpoints and results are reported.
+        budget (SharedTokenBucket): The rate budget shared by all workers.
+        session_factory (Callable[[], AsyncSession]): Creates the worker's session.
+        handler (Optional[Callable[[Response], None]]): Called with each response.
+        checkpoint_interval (int): Responses between bookmark checkpoints.
+        window (int): The stream window, by which checkpoints trail the generator.
+    """
+    session = session_factory()
+    session.endpoints.budget = budget
+
+    try:
+        while True:
+            shard = tasks.get()
+            if shard is None:
+                break
+
+            result = ShardResult(
+                key=shard.key, worker=worker, pid=os.getpid(), bookmark=shard.bookmark
+            )
+            started = time.perf_counter()
+            request_gen = shard.create_request_gen()
+            try:
+                async for response in session.stream(request_gen):
+                    result.add_response(response)
+                    if handler is not None:
+                        handler(response)
+                    if result.responses % checkpoint_interval == 0:
+                        # Up to a window of pages behind the generator may still be in flight.
+                        checkpoint = max(request_gen.bookmark - window, shard.bookmark)
+                        progress.put(("checkpoint", (shard.key, checkpoint)))
+                result.bookmark = request_gen.bookmark
+            except ShortCircuitError as e:
+                logger.warning(
+                    f"Shard {shard.key} was short-circuited on worker {worker}: {e.reason}."
+                )
+                result.error = str(e)
+                result.bookmark = max(request_gen.bookmark - window, shard.bookmark)
+            except Exception as e:
+                logger.exception(f"Shard {shard.key} failed on worker {worker}.")
+                result.error = f"{type(e).__name__}: {e}"
+                result.bookmark = max(request_gen.bookmark - window, shard.bookmark)
+            result.duration = time.perf_counter() - started
+            progress.put(("result", result))
+    finally:
+        await session.__exit__()
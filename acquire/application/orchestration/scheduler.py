@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/application/orchestration/scheduler.py                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:05:42 pm                                                #
+# Modified   : Friday October 16th 2026 08:50:03 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Weighted Fair Job Scheduler Module"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from acquire.application.orchestration.runner import default_session_factory
+from acquire.domain.artifact.request.fair import FairRequestGen, JobStats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+    from acquire.domain.artifact.response.response import Response
+    from acquire.infra.web.asession import AsyncSession
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      JOB SCHEDULER                                               #
+# ------------------------------------------------------------------------------------------------ #
+class JobScheduler:
+    """Runs many jobs concurrently over one session, sharing its rate in proportion to weight.
+
+    Run one after another, each job pays for its own ramp-up and for its tail, when too few
+    pages remain to fill the window. The scheduler instead streams every job through a single
+    `AsyncSession`, so the jobs share one connector and one session-wide budget of rate and
+    concurrency. Within that budget, each class of endpoint the jobs request, e.g. app search
+    or review pages, is paced and adapted by its own adapter and pacer against its own
+    latency, so a slow endpoint does not throttle the others. Requests are interleaved by a
+    `FairRequestGen`, so each job's share of its endpoint's rate follows its weight, and a
+    large category, e.g. Games, cannot starve small ones. As jobs finish, their share passes
+    to the jobs that remain, and the window stays full until the last job drains.
+
+    Each job is short-circuited separately. A job whose 404 or error rate shows it cannot
+    succeed is retired, and reported as unfinished with the reason as its error, while the
+    other jobs run on.
+
+    Args:
+        session_factory (Callable[[], AsyncSession]): Creates the session. Defaults to
+            `default_session_factory`. `project_session_factory` creates one that adapts with
+            a project's controller.
+        handler (Optional[Callable[[Response], None]]): Called with each response, e.g. to
+            transform and load it.
+        batch_size (int): The requests per batch when the jobs are iterated in batches.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = default_session_factory,
+        handler: Optional[Callable[[Response], None]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._session_factory = session_factory
+        self._handler = handler
+        self._request_gen = FairRequestGen(batch_size=batch_size)
+
+    @property
+    def stats(self) -> Dict[str, JobStats]:
+        """Returns the throughput of each job, by job key."""
+        return self._request_gen.stats
+
+    def add(
+        self,
+        key: str,
+        request_gen: RequestGen[AsyncRequest[Request]],
+        weight: float = 1.0,
+    ) -> None:
+        """Adds a job.
+
+        Args:
+            key (str): A unique name for the job, e.g. the category and data type.
+            request_gen (RequestGen[AsyncRequest[Request]]): The job's request generator.
+            weight (float): The job's share of the rate relative to the other jobs.
+
+        Raises:
+            ValueError: If the key is already scheduled or the weight is not positive.
+        """
+        try:
+            self._request_gen.add(key=key, request_gen=request_gen, weight=weight)
+        except ValueError as e:
+            self._logger.error(str(e))
+            raise
+
+    def run(self) -> Dict[str, JobStats]:
+        """Runs the jobs to completion and returns the throughput of each.
+
+        Returns:
+            Dict[str, JobStats]: The throughput of each job, by job key.
+        """
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> Dict[str, JobStats]:
+        """Runs the jobs to completion in the running event loop.
+
+        Returns:
+            Dict[str, JobStats]: The throughput of each job, by job key.
+        """
+        if not self._request_gen.request_gens:
+            msg = "No jobs to schedule."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+
+        session = self._session_factory()
+        started = time.perf_counter()
+        responses = 0
+        try:
+            async for response in session.stream(self._request_gen):
+                responses += 1
+                if self._handler is not None:
+                    self._handler(response)
+        finally:
+            await session.__exit__()
+        duration = time.perf_counter() - started
+
+        stats = self.stats
+        for job in stats.values():
+            outcome = (
+                "finished" if job.finished else f"unfinished ({job.error or 'stopped'})"
+            )
+            self._logger.info(
+                f"Job {job.key} (weight {job.weight}) {outcome}: {job.responses} responses, "
+                f"{job.failures} failed, in {round(job.duration, 1)} seconds at "
+                f"{round(job.throughput, 1)} per second."
+            )
+        throughput = responses / duration if duration else 0.0
+        self._logger.info(
+            f"Ran {len(stats)} jobs in {round(duration, 1)} seconds: {responses} responses "
+            f"at {round(throughput, 1)} per second."
+        )
+        return stats
@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/application/orchestration/simulator.py                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:24:33 pm                                                #
+# Modified   : Friday October 16th 2026 09:00:01 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Adapter Simulator Module"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from acquire.core.data import DataClass
+from acquire.infra.base.config import Config
+from acquire.infra.web.adapter import (
+    Adapter,
+    AdapterBaselineStage,
+    AdapterConcurrencyExploreStage,
+    AdapterExploitStage,
+    AdapterFactory,
+    AdapterGradientStage,
+    AdapterPIDStage,
+    AdapterRateExploreStage,
+)
+from acquire.infra.web.profile import SessionHistory
+
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+# Event kinds, in the order in which simultaneous events are handled.
+COMPLETE = 0
+SEND = 1
+SAMPLE = 2
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      VIRTUAL CLOCK                                               #
+# ------------------------------------------------------------------------------------------------ #
+class VirtualClock:
+    """A clock that only moves when the simulation advances it.
+
+    Passed as the `clock` of a `SessionHistory`, it times the adapter's stages and metrics, so
+    hours of adaptation run as fast as the events can be processed.
+
+    Args:
+        start (Optional[float]): The initial time, in seconds since the epoch. Defaults to now.
+    """
+
+    def __init__(self, start: Optional[float] = None) -> None:
+        self._now = time.time() if start is None else start
+
+    def __call__(self) -> float:
+        return self._now
+
+    @property
+    def now(self) -> float:
+        """Returns the current virtual time."""
+        return self._now
+
+    def advance(self, to: float) -> None:
+        """Moves the clock forward to a time. The clock never moves backwards."""
+        self._now = max(self._now, to)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SERVER MODEL                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class ServerModel(DataClass):
+    """Describes how the simulated upstream serves requests.
+
+    The server serves `workers` requests at a time, with service times drawn from a lognormal
+    distribution, and queues the rest in arrival order. Its capacity is therefore about
+    `workers` divided by the mean service time; offered more, its queue and latencies grow.
+    Arrivals beyond `throttle_rate` in any second are throttled with a 429, and arrivals that
+    find `max_queue` requests waiting are rejected with a 503, both after `reject_latency`.
+
+    Attributes:
+        workers (int): The requests served in parallel.
+        latency_median (float): The median service time in seconds.
+        latency_sigma (float): The lognormal shape parameter. Larger values give a longer tail.
+        max_queue (int): The requests that may wait for a worker. 0 for no limit.
+        throttle_rate (float): The arrivals per second above which requests are throttled. 0 disables throttling.
+        reject_latency (float): The latency of throttled and rejected requests in seconds.
+        seed (int): The random seed for service times.
+    """
+
+    workers: int = 50
+    latency_median: float = 0.2
+    latency_sigma: float = 0.5
+    max_queue: int = 0
+    throttle_rate: float = 0.0
+    reject_latency: float = 0.05
+    seed: int = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      LATENCY TRACE                                               #
+# ------------------------------------------------------------------------------------------------ #
+class LatencyTrace:
+    """Latencies recorded from a real run, replayed as the server's service times.
+
+    At each point in the simulation, a service time is drawn from the latencies recorded in
+    the `resolution` seconds at the same offset into the trace, so the trace's slowdowns
+    and bursts recur at the same times. The trace repeats if the simulation outlasts it.
+    Recorded latencies already include the upstream's queueing at the recorded load, so
+    set the server's `workers` high to replay them unchanged.
+
+    Args:
+        timestamps (Sequence[float]): When each latency was recorded, in seconds.
+        latencies (Sequence[float]): The latencies in seconds.
+        resolution (float): The seconds of trace from which each service time is drawn.
+
+    Raises:
+        ValueError: If the trace is empty or the sequences differ in length.
+    """
+
+    def __init__(
+        self,
+        timestamps: Sequence[float],
+        latencies: Sequence[float],
+        resolution: float = 1.0,
+    ) -> None:
+        if len(timestamps) == 0 or len(timestamps) != len(latencies):
+            msg = "A latency trace requires one timestamp for each of at least one latency."
+            logger.error(msg)
+            raise ValueError(msg)
+        order = np.argsort(np.asarray(timestamps, dtype=float), kind="stable")
+        times = np.asarray(timestamps, dtype=float)[order]
+        self._offsets = times - times[0]
+        self._latencies = np.asarray(latencies, dtype=float)[order]
+        self._resolution = resolution
+        self._duration = max(float(self._offsets[-1]), resolution)
+
+    @property
+    def duration(self) -> float:
+        """Returns the seconds spanned by the trace."""
+        return self._duration
+
+    @classmethod
+    def from_csv(
+        cls,
+        filepath: str,
+        time_column: str = "timestamp",
+        latency_column: str = "latency",
+        resolution: float = 1.0,
+    ) -> LatencyTrace:
+        """Loads a trace from a CSV file with a column of timestamps in seconds and a column of latencies.
+
+        Args:
+            filepath (str): The CSV file.
+            time_column (str): The column of timestamps.
+            latency_column (str): The column of latencies.
+            resolution (float): The seconds of trace from which each service time is drawn.
+        """
+        df = pd.read_csv(filepath, usecols=[time_column, latency_column]).dropna()
+        return cls(
+            timestamps=df[time_column].to_numpy(),
+            latencies=df[latency_column].to_numpy(),
+            resolution=resolution,
+        )
+
+    def latency_at(self, offset: float, rng: np.random.Generator) -> float:
+        """Draws a latency recorded at an offset into the trace.
+
+        Args:
+            offset (float): Seconds since the start of the simulation.
+            rng (np.random.Generator): The random generator.
+        """
+        offset = offset % self._duration
+        low = int(np.searchsorted(self._offsets, offset, side="left"))
+        high = int(
+            np.searchsorted(self._offsets, offset + self._resolution, side="left")
+        )
+        low = min(low, len(self._latencies) - 1)
+        return float(self._latencies[int(rng.integers(low, max(high, low + 1)))])
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   SIMULATION RESULTS                                             #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class SimulationSample(DataClass):
+    """The adapter's settings and the upstream's performance over one sample interval.
+
+    Attributes:
+        time (float): The end of the interval, in seconds since the start of the simulation.
+        stage (str): The adapter stage at the end of the interval.
+        rate (float): The adapter's rate at the end of the interval.
+        concurrency (float): The adapter's concurrency at the end of the interval.
+        requests (int): Requests sent in the interval.
+        responses (int): Successful responses in the interval.
+        failures (int): Throttled or rejected requests in the interval.
+        throughput (float): Successful responses per second in the interval.
+        latency_p50 (float): The median latency of the successful responses in the interval.
+        latency_p95 (float): The 95th percentile latency of the successful responses in the interval.
+        queued (int): The requests waiting for a server worker at the end of the interval.
+    """
+
+    time: float
+    stage: str
+    rate: float
+    concurrency: float
+    requests: int = 0
+    responses: int = 0
+    failures: int = 0
+    throughput: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    queued: int = 0
+
+
+@dataclass
+class SimulationResult(DataClass):
+    """Throughput and latency of a simulated run.
+
+    Attributes:
+        duration (float): The simulated seconds.
+        wall_time (float): The wall clock seconds the simulation took.
+        requests (int): Requests sent.
+        responses (int): Successful responses.
+        failures (int): Throttled or rejected requests.
+        throughput (float): Successful responses per simulated second.
+        latency_p50 (float): The median latency of the successful responses.
+        latency_p95 (float): The 95th percentile latency of the successful responses.
+        latency_p99 (float): The 99th percentile latency of the successful responses.
+        stage (str): The adapter stage at the end of the run.
+        samples (List[SimulationSample]): The time series, one sample per interval.
+    """
+
+    duration: float = 0.0
+    wall_time: float = 0.0
+    requests: int = 0
+    responses: int = 0
+    failures: int = 0
+    throughput: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    latency_p99: float = 0.0
+    stage: str = ""
+    samples: List[SimulationSample] = field(default_factory=list)
+
+    def series(self) -> pd.DataFrame:
+        """Returns the time series as a DataFrame, one row per sample, e.g. to compare configs."""
+        return pd.DataFrame([sample.as_dict() for sample in self.samples])
+
+
+# ------------------------------------------------------------------------------------------------ #
+class SimulatedResponse:
+    """The part of a response the adapter observes."""
+
+    __slots__ = ("latency", "cached")
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.cached = False
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    ADAPTER SIMULATOR                                             #
+# ------------------------------------------------------------------------------------------------ #
+class AdapterSimulator:
+    """Runs the real `Adapter` and its stages against a simulated upstream on a virtual clock.
+
+    The simulator is a discrete-event loop over request sends and completions. The client
+    side follows `AsyncSession.stream`: requests are spaced by the adapter's rate, as by the
+    pacer, at most the adapter's concurrency are in flight, as under the limiter, and the
+    adapter adapts every `adapt_interval` completed requests. The server side is a
+    `ServerModel`, optionally replaying a `LatencyTrace`. The adapter's clock is a
+    `VirtualClock`, so the stages' periods elapse in simulated time, and hours of
+    adaptation take seconds.
+
+    The adapter is built from the `adapter` section of a configuration, as the container
+    builds it, so the stage settings of e.g. `config/prod.yaml` can be tuned and compared
+    offline, or in CI, from the returned time series.
+
+    Args:
+        config (Dict[str, Any]): The `adapter` section of a configuration.
+        server (ServerModel): The simulated upstream.
+        trace (Optional[LatencyTrace]): Recorded latencies to replay as service times.
+        duration (float): The simulated seconds.
+        adapt_interval (int): Completed requests between adaptations.
+        sample_interval (float): Simulated seconds between samples of the time series.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        server: Optional[ServerModel] = None,
+        trace: Optional[LatencyTrace] = None,
+        duration: float = 3600.0,
+        adapt_interval: int = 100,
+        sample_interval: float = 60.0,
+    ) -> None:
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._config = config
+        self._server = server or ServerModel()
+        self._trace = trace
+        self._duration = duration
+        self._adapt_interval = adapt_interval
+        self._sample_interval = sample_interval
+
+    @classmethod
+    def from_config(
+        cls, config_cls: type[Config] = Config, **kwargs: Any
+    ) -> AdapterSimulator:
+        """Creates a simulator of the adapter configured for the current environment.
+
+        Args:
+            config_cls (type[Config]): The configuration class.
+            **kwargs: The other arguments of the simulator, e.g. `server` and `duration`.
+        """
+        return cls(config=config_cls().load_config()["adapter"], **kwargs)
+
+    def create_adapter(self, clock: VirtualClock) -> Adapter:
+        """Creates the adapter from the configuration, as `AsyncSessionContainer` does, on a clock.
+
+        Args:
+            clock (VirtualClock): The clock that times the adapter's stages and metrics.
+        """
+        config = self._config
+        history = SessionHistory(
+            max_history=config["history"],
+            capacity=config.get("history_capacity", 2**17),
+            clock=clock,
+        )
+        factory = AdapterFactory(
+            adapter=Adapter,
+            history=history,
+            baseline=AdapterBaselineStage(config=config["baseline"]),
+            explore_rate=AdapterRateExploreStage(config=config["explore_rate"]),
+            explore_concurrency=AdapterConcurrencyExploreStage(
+                config=config["explore_concurrency"]
+            ),
+            exploit=AdapterExploitStage(config=config["exploit"]),
+            gradient=(
+                AdapterGradientStage(config=config["gradient"])
+                if "gradient" in config
+                else None
+            ),
+            strategy=config.get("strategy", "staged"),
+            pid=AdapterPIDStage(config=config["pid"]) if "pid" in config else None,
+            controller=config.get("controller", "exploit"),
+        )
+        return factory.create()
+
+    def run(self) -> SimulationResult:
+        """Simulates the adapter against the server for the configured duration.
+
+        Returns:
+            SimulationResult: The totals and the time series of the run.
+        """
+        started = time.perf_counter()
+        server = self._server
+        rng = np.random.default_rng(server.seed)
+        log_median = math.log(server.latency_median)
+
+        clock = VirtualClock()
+        start = clock.now
+        end = start + self._duration
+        adapter = self.create_adapter(clock=clock)
+        # Until the adapter first adapts, requests are paced at the baseline settings.
+        rate = float(self._config["baseline"]["rate"]["base"])
+        concurrency = float(self._config["baseline"]["concurrency"]["base"])
+
+        events: List[Tuple[float, int, int, Tuple[float, int, bool]]] = []
+        sequence = 0
+
+        def schedule(at: float, kind: int, payload: Tuple[float, int, bool]) -> None:
+            nonlocal sequence
+            sequence += 1
+            heapq.heappush(events, (at, kind, sequence, payload))
+
+        def service_time(now: float) -> float:
+            if self._trace is not None:
+                return self._trace.latency_at(offset=now - start, rng=rng)
+            return float(
+                math.exp(log_median + server.latency_sigma * rng.standard_normal())
+            )
+
+        result = SimulationResult(duration=self._duration)
+        sample = SimulationSample(
+            time=0.0, stage="", rate=rate, concurrency=concurrency
+        )
+        sample_latencies: List[float] = []
+        latencies: List[float] = []
+        responses: List[SimulatedResponse] = []
+        arrivals: Deque[float] = deque()
+        queue: Deque[float] = deque()
+        busy = 0
+        in_flight = 0
+        completed = 0
+        next_send = start
+        send_scheduled = False
+
+        def schedule_send(now: float) -> None:
+            nonlocal send_scheduled
+            if not send_scheduled and in_flight < max(round(concurrency), 1):
+                schedule(max(now, next_send), SEND, (0.0, 0, False))
+                send_scheduled = True
+
+        adapter.initialize(async_request=None)
+        adapter.profile.send()
+        schedule_send(start)
+        schedule(start + self._sample_interval, SAMPLE, (0.0, 0, False))
+
+        while events and events[0][0] <= end:
+            now, kind, _, (sent, status, served) = heapq.heappop(events)
+            clock.advance(now)
+
+            if kind == SEND:
+                send_scheduled = False
+                if in_flight >= max(round(concurrency), 1):
+                    continue
+                in_flight += 1
+                next_send = now + 1.0 / rate
+                adapter.profile.requests += 1
+                sample.requests += 1
+                # The server throttles, rejects, serves or queues the request.
+                while arrivals and arrivals[0] <= now - 1.0:
+                    arrivals.popleft()
+                if server.throttle_rate and len(arrivals) >= server.throttle_rate:
+                    schedule(now + server.reject_latency, COMPLETE, (now, 429, False))
+                elif busy < server.workers:
+                    arrivals.append(now)
+                    busy += 1
+                    schedule(now + service_time(now), COMPLETE, (now, 200, True))
+                elif server.max_queue and len(queue) >= server.max_queue:
+                    arrivals.append(now)
+                    schedule(now + server.reject_latency, COMPLETE, (now, 503, False))
+                else:
+                    arrivals.append(now)
+                    queue.append(now)
+                schedule_send(now)
+
+            elif kind == COMPLETE:
+                in_flight -= 1
+                if served:
+                    busy -= 1
+                    if queue:
+                        busy += 1
+                        schedule(
+                            now + service_time(now),
+                            COMPLETE,
+                            (queue.popleft(), 200, True),
+                        )
+                # As in `AsyncSession.make_request`, every status feeds back to the adapter.
+                adapter.profile.add_status(status)
+                if status == 200:
+                    latency = now - sent
+                    latencies.append(latency)
+                    sample_latencies.append(latency)
+                    responses.append(SimulatedResponse(latency=latency))
+                    sample.responses += 1
+                else:
+                    sample.failures += 1
+                completed += 1
+                if completed >= self._adapt_interval:
+                    # As in `AsyncSession._adapt_stream`.
+                    adapter.profile.recv()
+                    adapter.update_profile(responses=responses)  # type: ignore[arg-type]
+                    adapter.adapt_requests()
+                    adapter.initialize(async_request=None)
+                    adapter.profile.send()
+                    responses = []
+                    completed = 0
+                    if adapter.session_control.rate > 0:
+                        rate = adapter.session_control.rate
+                    if adapter.session_control.concurrency > 0:
+                        concurrency = adapter.session_control.concurrency
+                schedule_send(now)
+
+            else:
+                sample.time = round(now - start, 6)
+                sample.stage = adapter.stage.__class__.__name__
+                sample.rate = rate
+                sample.concurrency = concurrency
+                sample.throughput = sample.responses / self._sample_interval
+                if sample_latencies:
+                    sample.latency_p50, sample.latency_p95 = (
+                        float(value)
+                        for value in np.percentile(sample_latencies, [50, 95])
+                    )
+                sample.queued = len(queue)
+                result.samples.append(sample)
+                result.requests += sample.requests
+                result.responses += sample.responses
+                result.failures += sample.failures
+                sample = SimulationSample(
+                    time=0.0, stage="", rate=rate, concurrency=concurrency
+                )
+                sample_latencies = []
+                schedule(now + self._sample_interval, SAMPLE, (0.0, 0, False))
+
+        result.throughput = result.responses / self._duration if self._duration else 0.0
+        if latencies:
+            result.latency_p50, result.latency_p95, result.latency_p99 = (
+                float(value) for value in np.percentile(latencies, [50, 95, 99])
+            )
+        result.stage = adapter.stage.__class__.__name__
+        result.wall_time = time.perf_counter() - started
+        self._logger.info(
+            f"Simulated {round(self._duration)} seconds in {round(result.wall_time, 1)} seconds: "
+            f"{result.responses} responses at {round(result.throughput, 1)} per second, "
+            f"p95 latency {round(result.latency_p95, 3)} seconds."
+        )
+        return result
+
+
+# ------------------------------------------------------------------------------------------------ #
+if __name__ == "__main__":
+    from acquire.toolkit.print import Printer
+
+    simulation_result = AdapterSimulator.from_config().run()
+    printer = Printer()
+    printer.print_dict(
+        title="Adapter Simulation",
+        data={k: v for k, v in simulation_result.as_dict().items() if k != "samples"},
+    )
+    printer.print_dataframe(
+        df=simulation_result.series(), title="Adapter Simulation Series"
+    )
@@ -72,7 +72,8 @@ class ExtractStage(Stage):  # type: ignore
         Raises:
             Exception: If the HTTP request fails or the response validation fails.
         """
-        async_request.context.stage = self.stage
+        if async_request.context is not None:
+            async_request.context.stage = self.stage
         try:
 
             # Execute the asynchronous HTTP request
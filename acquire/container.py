@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Thursday July 25th 2024 04:17:11 am                                                 #
-# Modified   : Wednesday September 11th 2024 09:21:42 pm                                           #
+# Modified   : Friday October 16th 2026 08:18:55 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -35,6 +35,8 @@ from acquire.infra.web.adapter import (
     AdapterConcurrencyExploreStage,
     AdapterExploitStage,
     AdapterFactory,
+    AdapterGradientStage,
+    AdapterPIDStage,
     AdapterRateExploreStage,
 )
 from acquire.infra.web.asession import AsyncSession
@@ -104,7 +106,11 @@ class AsyncSessionContainer(containers.DeclarativeContainer):
     )
 
     # Controls the adapter metrics and statistics history
-    history = providers.Singleton(SessionHistory, max_history=config.adapter.history)
+    history = providers.Singleton(
+        SessionHistory,
+        max_history=config.adapter.history,
+        capacity=config.adapter.history_capacity,
+    )
 
     # The four rate and concurrency adapter stages are defined here.
     # 1. Baseline adapter stage: Gathers baseline statistics
@@ -127,6 +133,14 @@ class AsyncSessionContainer(containers.DeclarativeContainer):
         AdapterExploitStage, config=config.adapter.exploit
     )
 
+    # Alternatively, the PID Stage exploits the explored rate to hold a latency SLO.
+    adapter_pid_stage = providers.Singleton(AdapterPIDStage, config=config.adapter.pid)
+
+    # Alternatively, the Gradient Stage adjusts concurrency continuously from RTT gradients.
+    adapter_gradient_stage = providers.Singleton(
+        AdapterGradientStage, config=config.adapter.gradient
+    )
+
     # 5. Create the Adapter Factory
     adapter_factory = providers.Singleton(
         AdapterFactory,
@@ -136,6 +150,10 @@ class AsyncSessionContainer(containers.DeclarativeContainer):
         explore_rate=adapter_explore_rate_stage,
         explore_concurrency=adapter_explore_concurrency_stage,
         exploit=adapter_exploit_stage,
+        gradient=adapter_gradient_stage,
+        strategy=config.adapter.strategy,
+        pid=adapter_pid_stage,
+        controller=config.adapter.controller,
     )
 
     # 6. Instantiate AsyncSession
@@ -160,4 +178,4 @@ class AppVoCAIContainer(containers.DeclarativeContainer):
 
     db = providers.Container(DatabaseContainer)
 
-    monitor = providers.Container(MonitorContainer, db)
+    monitor = providers.Container(MonitorContainer, db=db)
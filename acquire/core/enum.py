@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 28th 2024 02:31:31 pm                                              #
-# Modified   : Sunday September 8th 2024 07:00:57 pm                                               #
+# Modified   : Friday October 16th 2026 07:44:08 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -134,6 +134,13 @@ class Status(Enum):
     COMPLETED = "Completed"
 
 
+# ------------------------------------------------------------------------------------------------ #
+class CircuitState(Enum):
+    CLOSED = "Closed"
+    OPEN = "Open"
+    HALF_OPEN = "Half-Open"
+
+
 # ------------------------------------------------------------------------------------------------ #
 class ProjectFrequency(Enum):
     DAILY = "Daily"
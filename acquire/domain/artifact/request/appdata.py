@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Monday August 26th 2024 10:35:55 pm                                                 #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 08:52:33 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -20,12 +20,16 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
-from typing import Any, Collection, Dict, Union
+from typing import Any, Dict, Optional
 
-from acquire.application.orchestration.job import Context
+from acquire.application.orchestration.context import JobContext
 from acquire.core.enum import DataType
-from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+from acquire.domain.artifact.request.base import (
+    AsyncRequest,
+    PagedRequestGen,
+    Request,
+    RequestSpec,
+)
 from acquire.infra.web.header import BrowserHeaders
 
 # ------------------------------------------------------------------------------------------------ #
@@ -35,114 +39,127 @@ headers = BrowserHeaders()
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+class AppDataRequestSpec(RequestSpec):
+    """The parts of an AppData search request shared by every page of a category.
+
+    Args:
+        context (Optional[JobContext]): The context of the job the requests belong to.
+        limit (int): The records requested per page. Defaults to 200.
+        scheme (str): The URL scheme. Defaults to "https".
+        host (str): The host, and optionally port, requested. Defaults to "itunes.apple.com".
+        media (str): The media type searched. Defaults to "software".
+        term (str): The search term. Defaults to "app".
+        command (str): The search command. Defaults to "search?".
+        country (str): The storefront country. Defaults to "us".
+        lang (str): The language of the results. Defaults to "en-us".
+        explicit (str): Whether explicit content is included. Defaults to "yes".
+    """
+
+    __slots__ = ("media", "term", "command", "country", "lang", "explicit", "baseurl")
+
+    def __init__(
+        self,
+        context: Optional[JobContext],
+        limit: int = 200,
+        scheme: str = "https",
+        host: str = "itunes.apple.com",
+        media: str = "software",
+        term: str = "app",
+        command: str = "search?",
+        country: str = "us",
+        lang: str = "en-us",
+        explicit: str = "yes",
+    ) -> None:
+        super().__init__(context=context, limit=limit, scheme=scheme, host=host)
+        self.media = media
+        self.term = term
+        self.command = command
+        self.country = country
+        self.lang = lang
+        self.explicit = explicit
+        self.baseurl = f"{scheme}://{host}/{command}"
+
+
+# ------------------------------------------------------------------------------------------------ #
 class RequestAppData(Request):
-    """Represents a request for AppData.
+    """Represents a request for one page of AppData search results in a genre.
 
-    Attributes:
-        baseurl (str): The base URL for the request.
-        param_list (list[Dict]): The list of parameters for the request.
-        header DefaultDict[str, str]: Header parameters
+    Args:
+        spec (AppDataRequestSpec): The parts of the request shared by every page of the category.
+        page (int): The page requested.
+        genreId (int): The genre searched.
     """
 
+    __slots__ = ("genreId",)
+
     data_type: DataType = DataType.APPDATA
-    genreId: int = 0
-    page: int = 0
     request_type: str = "appdata"
-    media: str = "software"
-    scheme: str = "https"
-    host: str = "itunes.apple.com"
-    term: str = "app"
-    command: str = "search?"
-    country: str = "us"
-    lang: str = "en-us"
-    explicit: str = "yes"
-    limit: int = 200
-
-    @property
-    def start_index(self) -> int:
-        """Returns the starting index for the current page (zero-based)."""
-        return self.page * self.limit  # Zero-based index
 
-    @property
-    def end_index(self) -> int:
-        """Returns the ending index for the current page (zero-based)."""
-        return (self.page + 1) * self.limit  # Zero-based index
+    def __init__(
+        self, spec: AppDataRequestSpec, page: int = 0, genreId: int = 0
+    ) -> None:
+        super().__init__(spec=spec, page=page)
+        self.genreId = genreId
 
-    @property
-    def headers(self) -> Union[Collection[str], Dict[str, Any]]:
+    def _build_headers(self) -> Dict[str, Any]:
         return next(headers)
 
-    @property
-    def baseurl(self) -> str:
-        return f"{self.scheme}://{self.host}/{self.command}"
+    def _build_baseurl(self) -> str:
+        return self.spec.baseurl
 
-    @property
-    def params(self) -> Dict[str, Any]:
-        params = {
-            "media": self.media,
+    def _build_params(self) -> Dict[str, Any]:
+        spec = self.spec
+        return {
+            "media": spec.media,
             "genreId": self.genreId,
-            "term": self.term,
-            "country": self.country,
-            "lang": self.lang,
-            "explicit": self.explicit,
-            "limit": self.limit,
+            "term": spec.term,
+            "country": spec.country,
+            "lang": spec.lang,
+            "explicit": spec.explicit,
+            "limit": spec.limit,
             "offset": self.start_index,
         }
-        return params
-
-    def __init__(self) -> None:
-        super().__init__()
 
 
 # ------------------------------------------------------------------------------------------------ #
-class RequestAppDataGen(RequestGen[AsyncRequest[RequestAppData]]):
+class RequestAppDataGen(PagedRequestGen[AsyncRequest[RequestAppData]]):
     """Encapsulates an asynchronous AppData request generation.
 
     Args:
-        task_passport (TaskPassport): Class encapsulating identity for the Task.
-        category_id (int): Four digit identifier for app genre or category.
+        context (JobContext): The context of the job.
         max_requests (int): Maximum number of apps to process.
         batch_size (int): Number of requests within an async call.
         start_page (int): Page from which to start the requests.
-        request_params_cls (type[AppDataRequestParams]): The request parameters
-        browser_header (BrowserHeader): Browser header iterator.
+        limit (int): The records requested per page.
+        request_cls (type[RequestAppData]): The request class.
     """
 
     def __init__(
         self,
-        context: Context,
+        context: JobContext,
         max_requests: int = sys.maxsize,
         batch_size: int = 100,
         start_page: int = 0,
         limit: int = 200,
         request_cls: type[RequestAppData] = RequestAppData,
     ) -> None:
-        super().__init__()
+        super().__init__(max_requests=max_requests, start_page=start_page)
         self._context = context
-        self._max_requests = max_requests
         self._batch_size = batch_size
-        self._start_page = start_page
-        self._page = start_page
         self._limit = limit
 
         self._category_id = self._context.category.value
 
         self._request_cls = request_cls
-
-        self._request_count = 0
-
-    @property
-    def bookmark(self) -> int:
-        return self._page
+        self._spec = AppDataRequestSpec(context=context, limit=limit)
 
     @property
     def batchsize(self) -> int:
         return self._batch_size
 
     @property
-    def max_requests(self) -> int:
-        return self._max_requests
+    def limit(self) -> int:
+        return self._limit
 
     def __iter__(self) -> RequestAppDataGen:
         """Returns an iterator object for the request generator.
@@ -156,33 +173,35 @@ class RequestAppDataGen(RequestGen[AsyncRequest[RequestAppData]]):
     def __next__(self) -> AsyncRequest[RequestAppData]:
         """Generates the next batch of asynchronous AppData requests.
 
+        Requeued requests go first, in page order, ahead of new pages.
+
         Returns:
             AsyncRequest: The next batch of requests.
 
         Raises:
             StopIteration: If no more requests can be generated.
         """
-
-        if self._request_count >= self._max_requests:
+        request = self.next_request()
+        if request is None:
             raise StopIteration
 
-        # Determine current batch size vis-a-vis remaining batches.
-        requests_remaining = self._max_requests - self._request_count
-        current_batch_size = min(self._batch_size, requests_remaining)
-        # Get batch start and stop indices
-        batch_start_page = self._page
-        batch_stop_page = batch_start_page + current_batch_size
         # Formulate list of requests
-        async_request: AsyncRequest = AsyncRequest(context=self._context)
-
-        for page in range(batch_start_page, batch_stop_page):
-            request = RequestAppData(context=self._context)
-            request.genreId = self._category_id
-            request.page = page
-            request.limit = self._limit
+        async_request: AsyncRequest = AsyncRequest(
+            context=self._context, request_gen=self
+        )
+        while request is not None:
             async_request.add_request(request=request)
-            self._page += 1
-            self._request_count += 1
+            if async_request.request_count >= self._batch_size:
+                break
+            request = self.next_request()
 
         # Create the Request Object
         return async_request
+
+    def create_request(self, page: int) -> RequestAppData:
+        """Creates the request for a page, e.g. to probe for the end of pagination.
+
+        Args:
+            page (int): The page to request.
+        """
+        return self._request_cls(spec=self._spec, page=page, genreId=self._category_id)
@@ -11,18 +11,20 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Monday August 26th 2024 10:23:34 pm                                                 #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 08:52:33 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Collection, Dict, Generic, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar
 
+from acquire.application.orchestration.context import JobContext
 from acquire.domain.artifact.base import Artifact
 
 # ------------------------------------------------------------------------------------------------ #
@@ -31,74 +33,151 @@ U = TypeVar("U", bound="AsyncRequest[Request]")
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
-class Request(Artifact):
+class RequestSpec:
     """
-    Abstract base class for individual HTTP requests, inheriting from the Artifact class.
+    The parts of a request shared by every page of a job.
 
-    This class provides a base structure for managing HTTP requests as artifacts within the system.
-    Each request is tied to a specific task via the `task_passport` and handles request-level attributes
-    like HTTP method, sent time, and abstract methods to define request-specific details like headers,
-    base URL, and parameters.
+    A request generator creates one spec and shares it among the requests it creates, so
+    the job context, the URL prefix and the parameters that do not vary by page are stored
+    and built once rather than per page.
 
-    Inherited Attributes from Artifact:
-        entype (DataType): The type of the entity, distinguishing between different stage types.
-        id (str): A unique identifier for the entity.
-        created (Optional[datetime]): The timestamp when the entity was initially created.
-        modified (Optional[datetime]): The timestamp when the entity was last modified.
-        environment (Optional[Env]): The environment in which the entity operates (e.g., Development, Production).
-        version (str): The version of the entity or schema, defaulting to "0.1.0".
-        tags (List[str]): A list of tags associated with the entity for categorization or labeling.
+    Args:
+        context (JobContext): The context of the job the requests belong to.
+        limit (int): The records requested per page.
+        scheme (str): The URL scheme. Defaults to "https".
+        host (str): The host, and optionally port, requested. Defaults to "itunes.apple.com".
+    """
+
+    __slots__ = ("context", "limit", "scheme", "host")
+
+    def __init__(
+        self,
+        context: JobContext,
+        limit: int,
+        scheme: str = "https",
+        host: str = "itunes.apple.com",
+    ) -> None:
+        self.context = context
+        self.limit = limit
+        self.scheme = scheme
+        self.host = host
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Request(ABC):
+    """
+    Abstract base class for the HTTP request for one page.
+
+    Requests are compact descriptors: each holds only its page and the outcome of its last
+    attempt, and refers to the `RequestSpec` it shares with the other pages of the job. The
+    headers, base URL and parameters are built on first access and cached, so the headers
+    chosen for a request are used for every attempt, and retries do not rebuild the URL.
+
+    Args:
+        spec (RequestSpec): The parts of the request shared by every page of the job.
+        page (int): The page requested.
 
     Attributes:
-        sent (Optional[datetime]): The datetime when the request was sent. Defaults to None.
-        method (str): The HTTP method used for the request (e.g., GET, POST). Defaults to "GET".
+        spec (RequestSpec): The shared parts of the request.
+        page (int): The page requested.
+        status (Optional[int]): The HTTP status of the last attempt, or None if no response was received.
+        requeues (int): The number of times the request missed a batch deadline and was requeued.
+        sent (Optional[datetime]): The datetime the last attempt was sent. Defaults to None.
+        method (str): The HTTP method used for the request. Always "GET".
 
     Abstract Methods:
-        headers: Returns a collection or dictionary representing the headers for the HTTP request.
-        baseurl: Returns the base URL for the HTTP request.
-        params: Returns a dictionary of parameters to be included in the HTTP request.
-        start_index: Returns the starting index for the request, if applicable.
-        end_index: Returns the ending index for the request, if applicable.
+        _build_headers: Returns the headers for the HTTP request.
+        _build_baseurl: Returns the base URL for the HTTP request.
+        _build_params: Returns the parameters to be included in the HTTP request.
     """
 
-    sent: Optional[datetime] = None  # Datetime the request was sent.
-    method: str = "GET"  # The HTTP method used (GET, POST, etc.) (default: 'GET')
+    __slots__ = (
+        "spec",
+        "page",
+        "status",
+        "requeues",
+        "sent",
+        "_headers",
+        "_baseurl",
+        "_params",
+    )
+
+    method: str = "GET"
+
+    def __init__(self, spec: RequestSpec, page: int = 0) -> None:
+        self.spec = spec
+        self.page = page
+        self.status: Optional[int] = None
+        self.requeues = 0
+        self.sent: Optional[datetime] = None
+        self._headers: Optional[Dict[str, Any]] = None
+        self._baseurl: Optional[str] = None
+        self._params: Optional[Dict[str, Any]] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(page={self.page}, status={self.status})"
 
     @property
-    @abstractmethod
-    def headers(self) -> Union[Collection[str], Dict[str, Any]]:
-        """Returns a collection or dictionary representing the headers for the HTTP request."""
+    def context(self) -> JobContext:
+        """Returns the context of the job the request belongs to."""
+        return self.spec.context
+
+    @property
+    def endpoint(self) -> str:
+        """Returns the class of endpoint requested, as host/request type, followed by the
+        storefront if the request has one, e.g. "itunes.apple.com/appdata/us"."""
+        request_type = getattr(self, "request_type", self.__class__.__name__.lower())
+        storefront = getattr(self.spec, "country", None)
+        endpoint = f"{self.spec.host}/{request_type}"
+        return f"{endpoint}/{storefront}" if storefront else endpoint
+
+    @property
+    def limit(self) -> int:
+        """Returns the records requested per page."""
+        return self.spec.limit
+
+    @property
+    def start_index(self) -> int:
+        """Returns the starting index for the current page (zero-based)."""
+        return self.page * self.spec.limit
+
+    @property
+    def end_index(self) -> int:
+        """Returns the ending index for the current page (zero-based)."""
+        return (self.page + 1) * self.spec.limit
+
+    @property
+    def headers(self) -> Dict[str, Any]:
+        """Returns the headers for the HTTP request, chosen once per request."""
+        if self._headers is None:
+            self._headers = self._build_headers()
+        return self._headers
 
     @property
-    @abstractmethod
     def baseurl(self) -> str:
         """Returns the base URL for the HTTP request."""
+        if self._baseurl is None:
+            self._baseurl = self._build_baseurl()
+        return self._baseurl
 
     @property
-    @abstractmethod
     def params(self) -> Dict[str, Any]:
         """Returns a dictionary of parameters to be included in the HTTP request."""
+        if self._params is None:
+            self._params = self._build_params()
+        return self._params
 
-    @property
     @abstractmethod
-    def start_index(self) -> int:
-        """Returns the starting index for the request, if applicable."""
+    def _build_headers(self) -> Dict[str, Any]:
+        """Returns a dictionary representing the headers for the HTTP request."""
 
-    @property
     @abstractmethod
-    def end_index(self) -> int:
-        """Returns the ending index for the request, if applicable."""
-
-    def __init__(self, *args: Any, **kwargs: Dict[str, Any]) -> None:
-        """
-        Initializes the Request object, inheriting from Artifact and associating the request with a task.
+    def _build_baseurl(self) -> str:
+        """Returns the base URL for the HTTP request."""
 
-        Args:
-            task_passport (TaskPassport): The passport of the task associated with this request.
-            *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
-        """
+    @abstractmethod
+    def _build_params(self) -> Dict[str, Any]:
+        """Returns a dictionary of parameters to be included in the HTTP request."""
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -121,26 +200,45 @@ class AsyncRequest(Artifact, Generic[T]):
         tags (List[str]): A list of tags associated with the entity for categorization or labeling.
 
     Attributes:
+        context (Optional[JobContext]): The context of the job the batch belongs to, or None
+            if the batch spans several jobs.
         request_count (int): The number of requests in the batch. Defaults to 0.
         requests (List[T]): A list of requests in the batch.
+        request_gen (Optional[RequestGen]): The generator that drew the batch, with which
+            requests that miss the batch deadline are requeued. None if the batch was
+            assembled by hand.
 
     Methods:
         add_request(request: T) -> None:
             Adds a new request to the list of requests and updates the modified timestamp.
     """
 
+    # A batch drawn across jobs, as by FairRequestGen, belongs to no single job.
+    context: Optional[JobContext] = None  # type: ignore[assignment]
     request_count: int = 0
     requests: List[T] = field(default_factory=list)
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        context: Optional[JobContext] = None,
+        request_gen: Optional[RequestGen[Any]] = None,
+    ) -> None:
         """
         Initializes the AsyncRequest object, associating it with a task.
 
         Args:
-            task_passport (TaskPassport): The passport of the task associated with this batch of requests.
-            *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments.
+            context (Optional[JobContext]): The context of the job associated with this batch of requests.
+            request_gen (Optional[RequestGen]): The generator that drew the batch.
         """
+        self.context = context
+        self.request_count = 0
+        self.requests = []
+        self._request_gen = request_gen
+
+    @property
+    def request_gen(self) -> Optional[RequestGen[Any]]:
+        """The generator that drew the batch, or None if the batch was assembled by hand."""
+        return self._request_gen
 
     def add_request(self, request: T) -> None:
         """
@@ -161,13 +259,17 @@ class RequestGen(ABC, Generic[U]):
 
     This class serves as a generator for requests, implementing the iterator protocol
     with `__iter__` and `__next__` methods that are meant to be implemented by subclasses.
-    It associates each generated request with a specific task via the `task_passport`.
+    Iterating yields batches of requests as `AsyncRequest` objects. Iterating asynchronously,
+    with `async for`, yields the individual requests on demand instead, so no batch is
+    materialized. Both forms draw from the same sequence of pages.
 
     Abstract Methods:
         __iter__() -> RequestGen[U]:
             Initializes the generation of requests, making the class iterable.
         __next__() -> U:
             Generates the next request in the sequence.
+        next_request() -> Optional[Request]:
+            Generates the next individual request, or None when there are no more.
     """
 
     @abstractmethod
@@ -177,3 +279,95 @@ class RequestGen(ABC, Generic[U]):
     @abstractmethod
     def __next__(self) -> U:
         """Generates the next request in the sequence."""
+
+    @abstractmethod
+    def next_request(self) -> Optional[Request]:
+        """Generates the next individual request, or None when there are no more."""
+
+    def __aiter__(self) -> RequestGen[U]:
+        """Returns the generator as an asynchronous iterator of individual requests."""
+        return self
+
+    async def __anext__(self) -> Request:
+        """Generates the next individual request.
+
+        Raises:
+            StopAsyncIteration: If no more requests can be generated.
+        """
+        request = self.next_request()
+        if request is None:
+            raise StopAsyncIteration
+        return request
+
+
+# ------------------------------------------------------------------------------------------------ #
+class PagedRequestGen(RequestGen[U]):
+    """
+    Abstract base class for generators that request consecutive pages from a start page.
+
+    Requests that missed a batch deadline are requeued, and go out again ahead of new pages,
+    in page order. Pages therefore complete out of order, and the bookmark is the earliest
+    page not yet fetched.
+
+    Generators that do not draw their requests from one sequence of pages, e.g.
+    `FairRequestGen`, derive from `RequestGen` directly, so that they neither accept
+    requeued requests nor are planned for pagination.
+
+    Args:
+        max_requests (int): The maximum number of new pages to request.
+        start_page (int): The page from which to start the requests.
+
+    Abstract Methods:
+        create_request(page: int) -> Request:
+            Creates the request for a page.
+    """
+
+    def __init__(self, max_requests: int = sys.maxsize, start_page: int = 0) -> None:
+        self._max_requests = max_requests
+        self._start_page = start_page
+        self._page = start_page
+        self._request_count = 0
+        self._requeued: Dict[int, Request] = {}
+
+    @property
+    def bookmark(self) -> int:
+        """Returns the page from which to resume: the earliest requeued page, if any, otherwise
+        the next new page. Pages complete out of order once stragglers are requeued."""
+        return min(self._requeued, default=self._page)
+
+    @property
+    def max_requests(self) -> int:
+        return self._max_requests
+
+    @abstractmethod
+    def create_request(self, page: int) -> Request:
+        """Creates the request for a page, e.g. to probe for the end of pagination.
+
+        Args:
+            page (int): The page to request.
+        """
+
+    def next_request(self) -> Optional[Request]:
+        """Generates the next request: the earliest requeued page, if any, otherwise the next new page.
+
+        Returns:
+            Optional[Request]: The request, or None if no more requests can be generated.
+        """
+        if self._requeued:
+            return self._requeued.pop(min(self._requeued))
+        if self._request_count >= self._max_requests:
+            return None
+        request = self.create_request(page=self._page)
+        self._page += 1
+        self._request_count += 1
+        return request
+
+    def requeue(self, requests: Iterable[Request]) -> None:
+        """Returns requests that missed a batch deadline, to be sent in the next batch.
+
+        Args:
+            requests (Iterable[Request]): The requests, e.g. `AsyncResponse.stragglers`.
+        """
+        for request in requests:
+            request.requeues += 1
+            self._requeued[request.page] = request
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/domain/artifact/request/fair.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:04:17 pm                                                #
+# Modified   : Friday October 16th 2026 08:50:03 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Weighted Fair Request Generator Module"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from acquire.core.data import DataClass
+from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+
+if TYPE_CHECKING:  # pragma: no cover
+    from acquire.domain.artifact.response.response import Response
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                         JOB STATS                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class JobStats(DataClass):
+    """Throughput of one job multiplexed with others over a session.
+
+    Attributes:
+        key (str): The job's name.
+        weight (float): The job's share of requests relative to the other jobs.
+        requests (int): Requests sent for the job, including probes.
+        responses (int): Successful responses.
+        failures (int): Requests that failed or were cancelled past the end of pagination.
+        bookmark (int): The page from which the job resumes.
+        duration (float): Seconds from the job's first request to its last completion.
+        throughput (float): Successful responses per second over `duration`.
+        finished (bool): Whether the job has no more requests.
+        error (str): Why the job was retired before it finished, e.g. it was short-circuited.
+    """
+
+    key: str
+    weight: float = 1.0
+    requests: int = 0
+    responses: int = 0
+    failures: int = 0
+    bookmark: int = 0
+    duration: float = 0.0
+    throughput: float = 0.0
+    finished: bool = False
+    error: str = ""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Lane:
+    """A job's request generator and its position in the fair schedule.
+
+    Args:
+        key (str): The job's name.
+        request_gen (RequestGen[AsyncRequest[Request]]): The job's request generator.
+        weight (float): The job's share of requests relative to the other jobs.
+    """
+
+    def __init__(
+        self, key: str, request_gen: RequestGen[AsyncRequest[Request]], weight: float
+    ) -> None:
+        self.key = key
+        self.request_gen = request_gen
+        self.stride = 1.0 / weight
+        self.stats = JobStats(key=key, weight=weight)
+        self.started: Optional[float] = None
+        self.completed: Optional[float] = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    FAIR REQUEST GEN                                              #
+# ------------------------------------------------------------------------------------------------ #
+class FairRequestGen(RequestGen[AsyncRequest[Request]]):
+    """Interleaves the requests of several jobs in proportion to their weights.
+
+    Requests are drawn by stride scheduling: each job advances a virtual clock by the
+    inverse of its weight with every request, and the next request comes from the job
+    whose clock is furthest behind. A job with weight 2 is therefore drawn from twice as
+    often as a job with weight 1, however many pages either has, so a large job cannot
+    starve small ones. When a job runs out of requests, or is finished early, e.g. at the
+    end of pagination, its share passes to the jobs that remain.
+
+    Requests are attributed to jobs by their `RequestSpec`, which each generator shares
+    among its own requests.
+
+    Args:
+        batch_size (int): The requests per batch when iterated in batches.
+    """
+
+    def __init__(self, batch_size: int = 100) -> None:
+        self._batch_size = batch_size
+        self._lanes: Dict[str, Lane] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._keys: Dict[int, str] = {}  # Job key by id of the request spec.
+        self._clock = 0.0
+
+    @property
+    def request_gens(self) -> Dict[str, RequestGen[AsyncRequest[Request]]]:
+        """Returns the request generators of the jobs, by job key."""
+        return {key: lane.request_gen for key, lane in self._lanes.items()}
+
+    @property
+    def stats(self) -> Dict[str, JobStats]:
+        """Returns the throughput of each job, by job key."""
+        for lane in self._lanes.values():
+            stats = lane.stats
+            stats.bookmark = lane.request_gen.bookmark  # type: ignore[attr-defined]
+            if lane.started is not None and lane.completed is not None:
+                stats.duration = lane.completed - lane.started
+                stats.throughput = (
+                    stats.responses / stats.duration if stats.duration > 0 else 0.0
+                )
+        return {key: lane.stats for key, lane in self._lanes.items()}
+
+    def add(
+        self,
+        key: str,
+        request_gen: RequestGen[AsyncRequest[Request]],
+        weight: float = 1.0,
+    ) -> None:
+        """Adds a job to the schedule.
+
+        Args:
+            key (str): A unique name for the job.
+            request_gen (RequestGen[AsyncRequest[Request]]): The job's request generator.
+            weight (float): The job's share of requests relative to the other jobs.
+
+        Raises:
+            ValueError: If the key is already scheduled or the weight is not positive.
+        """
+        if key in self._lanes:
+            raise ValueError(f"Job {key} is already scheduled.")
+        if weight <= 0:
+            raise ValueError(
+                f"Invalid weight for job {key}: {weight}. Weights must be positive."
+            )
+        lane = Lane(key=key, request_gen=request_gen, weight=weight)
+        self._lanes[key] = lane
+        # A job joins at the current virtual time, so it is not owed a backlog.
+        heapq.heappush(
+            self._schedule, (self._clock + lane.stride, len(self._lanes), key)
+        )
+
+    def key_of(self, request: Request) -> Optional[str]:
+        """Returns the key of the job a request belongs to."""
+        return self._keys.get(id(request.spec))
+
+    def register(self, key: str, request: Request) -> None:
+        """Counts a request created outside the schedule, e.g. a probe, against a job.
+
+        Args:
+            key (str): The job's key.
+            request (Request): The request.
+        """
+        lane = self._lanes[key]
+        self._keys[id(request.spec)] = key
+        lane.stats.requests += 1
+        if lane.started is None:
+            lane.started = time.perf_counter()
+
+    def finish(self, key: str) -> None:
+        """Draws no further requests from a job, e.g. once the end of its pages is known."""
+        lane = self._lanes.get(key)
+        if lane is not None and not lane.stats.finished and not lane.stats.error:
+            lane.stats.finished = True
+            self._unschedule(key=key)
+
+    def retire(self, key: str, error: str) -> None:
+        """Draws no further requests from a job that cannot succeed, leaving it unfinished.
+
+        The other jobs continue, and the retired job's share passes to them.
+
+        Args:
+            key (str): The job's key.
+            error (str): Why the job was retired, e.g. "404 rate 0.95".
+        """
+        lane = self._lanes.get(key)
+        if lane is not None and not lane.stats.finished and not lane.stats.error:
+            lane.stats.error = error
+            self._unschedule(key=key)
+
+    def complete(self, request: Request, response: Optional[Response]) -> None:
+        """Records the completion of a request against its job.
+
+        Args:
+            request (Request): The request.
+            response (Optional[Response]): The response, or None if the request failed.
+        """
+        key = self.key_of(request)
+        if key is None:
+            return
+        lane = self._lanes[key]
+        lane.completed = time.perf_counter()
+        if lane.started is None:
+            lane.started = lane.completed
+        if response is None:
+            lane.stats.failures += 1
+        else:
+            lane.stats.responses += 1
+
+    def _unschedule(self, key: str) -> None:
+        """Removes a job from the schedule."""
+        self._schedule = [entry for entry in self._schedule if entry[2] != key]
+        heapq.heapify(self._schedule)
+
+    def __iter__(self) -> FairRequestGen:
+        return self
+
+    def __next__(self) -> AsyncRequest[Request]:
+        request = self.next_request()
+        if request is None:
+            raise StopIteration
+        async_request: AsyncRequest[Request] = AsyncRequest()
+        while request is not None:
+            async_request.add_request(request=request)
+            if async_request.request_count >= self._batch_size:
+                break
+            request = self.next_request()
+        return async_request
+
+    def next_request(self) -> Optional[Request]:
+        """Draws the next request from the job furthest behind its fair share.
+
+        Returns:
+            Optional[Request]: The request, or None once every job is exhausted or finished.
+        """
+        while self._schedule:
+            clock, sequence, key = heapq.heappop(self._schedule)
+            lane = self._lanes[key]
+            request = lane.request_gen.next_request()
+            if request is None:
+                lane.stats.finished = True
+                continue
+            self._clock = clock
+            heapq.heappush(self._schedule, (clock + lane.stride, sequence, key))
+            self._keys[id(request.spec)] = key
+            lane.stats.requests += 1
+            if lane.started is None:
+                lane.started = time.perf_counter()
+            return request
+        return None
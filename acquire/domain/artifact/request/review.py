@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 27th 2024 12:26:33 am                                                #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 08:52:33 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -20,11 +20,16 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
-from typing import Any, Collection, Dict, Union
+from typing import Any, Dict, Optional
 
-from acquire.application.orchestration.job import Context
+from acquire.application.orchestration.context import JobContext
 from acquire.core.enum import DataType
-from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+from acquire.domain.artifact.request.base import (
+    AsyncRequest,
+    PagedRequestGen,
+    Request,
+    RequestSpec,
+)
 from acquire.infra.web.header import STOREFRONT
 
 # ------------------------------------------------------------------------------------------------ #
@@ -32,107 +37,124 @@ from acquire.infra.web.header import STOREFRONT
 
 
 # ------------------------------------------------------------------------------------------------ #
-@dataclass
+class AppReviewRequestSpec(RequestSpec):
+    """The parts of an app review request shared by every page of a job.
+
+    Args:
+        context (Optional[JobContext]): The context of the job the requests belong to.
+        limit (int): The reviews requested per page. Defaults to 400.
+        scheme (str): The URL scheme. Defaults to "https".
+        host (str): The host, and optionally port, requested. Defaults to "itunes.apple.com".
+        storefront (Optional[Dict[str, Any]]): The storefront whose reviews are requested, as its
+            country and the headers that select it. Defaults to the US storefront.
+    """
+
+    __slots__ = ("path", "country", "headers")
+
+    def __init__(
+        self,
+        context: Optional[JobContext],
+        limit: int = 400,
+        scheme: str = "https",
+        host: str = "itunes.apple.com",
+        storefront: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(context=context, limit=limit, scheme=scheme, host=host)
+        storefront = storefront or STOREFRONT
+        self.path = f"{scheme}://{host}/WebObjects/MZStore.woa/wa/userReviewsRow"
+        self.country = storefront["country"]
+        self.headers = storefront["headers"]
+
+
+# ------------------------------------------------------------------------------------------------ #
 class AppReviewRequest(Request):
-    """Represents a request for AppData.
+    """Represents a request for one page of an app's reviews.
 
-    Attributes:
-        baseurl (str): The base URL for the request.
-        param_list (list[Dict]): The list of parameters for the request.
-        header DefaultDict[str, str]: Header parameters
+    Args:
+        spec (AppReviewRequestSpec): The parts of the request shared by every page of the job.
+        page (int): The page requested.
+        app_id (int): The app whose reviews are requested.
     """
 
-    app_id: int = 0
-    page: int = 0
-    limit: int = 400
-    request_type: str = "review"
+    __slots__ = ("app_id",)
 
-    @property
-    def start_index(self) -> int:
-        """Returns the starting index for the current page (zero-based)."""
-        return self.page * self.limit  # Zero-based index
+    request_type: str = "review"
+    data_type: DataType = DataType.APPREVIEW
 
-    @property
-    def end_index(self) -> int:
-        """Returns the ending index for the current page (zero-based)."""
-        return (self.page + 1) * self.limit  # Zero-based index
+    def __init__(
+        self, spec: AppReviewRequestSpec, page: int = 0, app_id: int = 0
+    ) -> None:
+        super().__init__(spec=spec, page=page)
+        self.app_id = app_id
 
-    @property
-    def headers(self) -> Union[Collection[str], Dict[str, Any]]:
-        return STOREFRONT["headers"]
+    def _build_headers(self) -> Dict[str, Any]:
+        return self.spec.headers
 
-    @property
-    def baseurl(self) -> str:
-        return f"https://itunes.apple.com/WebObjects/MZStore.woa/wa/userReviewsRow?id={self.app_id}&displayable-kind=11&startIndex={self.start_index}&endIndex={self.end_index}&sort=1"
+    def _build_baseurl(self) -> str:
+        return f"{self.spec.path}?id={self.app_id}&displayable-kind=11&startIndex={self.start_index}&endIndex={self.end_index}&sort=1"
 
-    @property
-    def params(self) -> Dict[str, Any]:
+    def _build_params(self) -> Dict[str, Any]:
         """The AppReview Request has no parameters."""
         return {}
 
-    @property
-    def data_type(self) -> DataType:
-        return DataType.APPREVIEW
-
-    def __init__(self) -> None:
-        super().__init__()
-
 
 # ------------------------------------------------------------------------------------------------ #
 @dataclass
 class AsyncAppReviewRequest(AsyncRequest[AppReviewRequest]):
-
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        context: Optional[JobContext] = None,
+        request_gen: Optional[RequestGen[Any]] = None,
+    ) -> None:
+        super().__init__(context=context, request_gen=request_gen)
 
 
 # ------------------------------------------------------------------------------------------------ #
-class AppReviewRequestGen(RequestGen[AsyncRequest[AppReviewRequest]]):
+class AppReviewRequestGen(PagedRequestGen[AsyncRequest[AppReviewRequest]]):
     """Encapsulates an asynchronous AppData request generation.
 
     Args:
+        context (JobContext): The context of the job.
         app_id (int): App Identifier
         max_requests (int): Maximum number of apps to process.
         batch_size (int): Number of requests within an async call.
         start_page (int): Page from which to start the requests.
-        request_params_cls (type[AppDataRequestParams]): The request parameters
-        browser_header (BrowserHeader): Browser header iterator.
+        limit (int): The reviews requested per page.
+        storefront (Optional[Dict[str, Any]]): The storefront whose reviews are requested.
+            Defaults to the US storefront.
+        request_cls (type[AppReviewRequest]): The request class.
     """
 
     def __init__(
         self,
-        context: Context,
+        context: JobContext,
         app_id: int,
         max_requests: int = sys.maxsize,
         batch_size: int = 100,
         start_page: int = 0,
         limit: int = 400,
+        storefront: Optional[Dict[str, Any]] = None,
         request_cls: type[AppReviewRequest] = AppReviewRequest,
     ) -> None:
+        super().__init__(max_requests=max_requests, start_page=start_page)
         self._context = context
         self._app_id = app_id
 
-        self._max_requests = max_requests
         self._batch_size = batch_size
-        self._start_page = start_page
-        self._page = start_page
         self._limit = limit
 
         self._request_cls = request_cls
-
-        self._request_count = 0
-
-    @property
-    def bookmark(self) -> int:
-        return self._page
+        self._spec = AppReviewRequestSpec(
+            context=context, limit=limit, storefront=storefront
+        )
 
     @property
     def batchsize(self) -> int:
         return self._batch_size
 
     @property
-    def max_requests(self) -> int:
-        return self._max_requests
+    def limit(self) -> int:
+        return self._limit
 
     def __iter__(self) -> AppReviewRequestGen:
         """Returns an iterator object for the request generator.
@@ -146,34 +168,35 @@ class AppReviewRequestGen(RequestGen[AsyncRequest[AppReviewRequest]]):
     def __next__(self) -> AsyncRequest[AppReviewRequest]:
         """Generates the next batch of asynchronous AppData requests.
 
+        Requeued requests go first, in page order, ahead of new pages.
+
         Returns:
             AppDataAsyncRequest: The next batch of requests.
 
         Raises:
             StopIteration: If no more requests can be generated.
         """
-
-        if self._request_count >= self._max_requests:
+        request = self.next_request()
+        if request is None:
             raise StopIteration
 
-        # Determine current batch size vis-a-vis remaining batches.
-        requests_remaining = self._max_requests - self._request_count
-        current_batch_size = min(self._batch_size, requests_remaining)
-        # Get batch start and stop indices
-        batch_start_page = self._page
-        batch_stop_page = batch_start_page + current_batch_size
         # Formulate list of requests
         async_request: AsyncAppReviewRequest = AsyncAppReviewRequest(
-            context=self._context
+            context=self._context, request_gen=self
         )
-
-        for page in range(batch_start_page, batch_stop_page):
-            request = AppReviewRequest(context=self._context)
-            request.page = page
-            request.limit = self._limit
+        while request is not None:
             async_request.add_request(request=request)
-            self._page += 1
-            self._request_count += 1
+            if async_request.request_count >= self._batch_size:
+                break
+            request = self.next_request()
 
         # Create the Request Object
         return async_request
+
+    def create_request(self, page: int) -> AppReviewRequest:
+        """Creates the request for a page, e.g. to probe for the end of pagination.
+
+        Args:
+            page (int): The page to request.
+        """
+        return self._request_cls(spec=self._spec, page=page, app_id=self._app_id)
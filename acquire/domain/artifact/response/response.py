@@ -11,26 +11,31 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Tuesday August 27th 2024 10:27:49 am                                                #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 07:57:12 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
 
+import json
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
 
-from aiohttp import ClientResponse, ClientResponseError
-from pympler import asizeof
+from aiohttp import ClientResponse
 
 from acquire.application.orchestration.context import JobContext
 from acquire.core.data import DataClass
 from acquire.domain.artifact.base import Artifact
 from acquire.infra.base.config import Config
 
+if TYPE_CHECKING:  # pragma: no cover
+    from acquire.domain.artifact.request.base import Request
+    from acquire.infra.web.decoder import JSONDecoder
+
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 
@@ -53,6 +58,8 @@ class AsyncResponse(Artifact):
     responses : List[Response]
         A list of `Response` objects, each representing the result of an individual request in the asynchronous
         stage. Initialized as an empty list by default.
+    stragglers : List[Request]
+        The requests cancelled at the batch's soft deadline, to be requeued for a later batch.
     _config : Config
         A configuration object that holds settings related to the threshold of 404 responses.
     _404_threshold : float
@@ -60,7 +67,7 @@ class AsyncResponse(Artifact):
 
     Methods:
     --------
-    __init__(context: JobContext, config_cls=type[Config]) -> None
+    __init__(context: Optional[JobContext], config_cls: type[Config] = Config) -> None
         Initializes the `AsyncResponse` object with a `JobContext` and configuration class.
 
     add_responses(responses: List[Response]) -> None
@@ -71,16 +78,22 @@ class AsyncResponse(Artifact):
 
     Parameters:
     -----------
-    context : JobContext
+    context : Optional[JobContext]
         The context of the job, providing metadata about the job, stage, and related project.
+        None if the batch spans several jobs.
     config_cls : Type[Config], optional
         A configuration class used to retrieve the threshold for the percentage of 404 responses. Default is `Config`.
     """
 
+    # The responses to a batch drawn across jobs, as by FairRequestGen, belong to no single job.
+    context: Optional[JobContext] = None  # type: ignore[assignment]
     response_count: int = 0
     responses: List[Response] = field(default_factory=list)
+    stragglers: List[Request] = field(default_factory=list)
 
-    def __init__(self, context: JobContext, config_cls=type[Config]) -> None:
+    def __init__(
+        self, context: Optional[JobContext], config_cls: type[Config] = Config
+    ) -> None:
         """
         Initializes the `AsyncResponse` object with a given `JobContext` and a configuration class.
 
@@ -89,12 +102,16 @@ class AsyncResponse(Artifact):
 
         Parameters:
         -----------
-        context : JobContext
-            The context object that encapsulates the job's metadata and progress.
+        context : Optional[JobContext]
+            The context object that encapsulates the job's metadata and progress, or None if
+            the batch spans several jobs.
         config_cls : Type[Config], optional
             The configuration class used to fetch the threshold for 404 responses. Defaults to `Config`.
         """
-        super().__init__(context=context)
+        self.context = context
+        self.response_count = 0
+        self.responses = []
+        self.stragglers = []
         self._config = config_cls()
         self._404_threshold = self._config.extract.threshold_404
 
@@ -142,7 +159,7 @@ class ResponseHeaders(DataClass):
     A class to represent the HTTP response headers and related metadata from a server response.
 
     This class extracts and stores important server and response metadata, such as the server name,
-    the HTTP status code, the size of the response content, and the timestamps for when the request
+    the HTTP status code, the number of bytes transferred, and the timestamps for when the request
     was processed by the server and received by the client.
 
     Attributes:
@@ -155,8 +172,10 @@ class ResponseHeaders(DataClass):
         Information about how the connection was dispatched (e.g., keep-alive or close) (default: empty string).
     status : int
         The HTTP status code of the response (default: 0).
+    encoding : str
+        The content encoding of the body on the wire, e.g. gzip, or empty if uncompressed (default: empty string).
     size : int
-        The size of the content in the response, in bytes (default: 0).
+        The size of the body on the wire in bytes, i.e. compressed if `encoding` is set (default: 0).
     response_datetime : Optional[datetime]
         The datetime when the client received the response (default: None).
 
@@ -165,15 +184,16 @@ class ResponseHeaders(DataClass):
     __init__(response: ClientResponse) -> None
         Initializes the `ResponseHeaders` object by extracting relevant metadata from the given `ClientResponse` object.
 
+    from_values(status: int, headers: Mapping[str, str]) -> ResponseHeaders
+        Creates a `ResponseHeaders` object from a status code and header mapping, e.g. for a cached response.
+
     parse_date(date_str: str) -> Optional[datetime]
         A helper method to parse a date string from the response headers into a `datetime` object.
         If the date is not present or cannot be parsed, it returns `None`.
 
     parse_size(response: ClientResponse) -> int
-        A helper method to extract and calculate the size of the response content. It first attempts
-        to retrieve the size from the `Content-Length` header. If this is not present, it tries to
-        infer the size based on the JSON content or the response itself. If all else fails, it logs
-        a warning and returns 0.
+        A helper method to retrieve the size of the body on the wire from the `Content-Length` header.
+        Returns 0 if the header is absent, in which case the size is taken from the body once it is read.
     """
 
     # 1. Server Metadata
@@ -186,7 +206,8 @@ class ResponseHeaders(DataClass):
 
     # 2. Response Metadata
     status: int = 0  # The HTTP return code (default: 0)
-    size: int = 0  # Size of content in response in bytes (default: 0)
+    encoding: str = ""  # Content encoding on the wire, e.g. gzip (default: "")
+    size: int = 0  # Size of the body on the wire in bytes (default: 0)
     response_datetime: Optional[datetime] = (
         None  # Datetime the request was received (default: None)
     )
@@ -213,9 +234,42 @@ class ResponseHeaders(DataClass):
 
         # 2 Response Metadata
         self.status = response.status
+        self.encoding = response.headers.get("Content-Encoding", "")
         self.size = self.parse_size(response=response)
         self.response_datetime = datetime.now()
 
+    @classmethod
+    def from_values(cls, status: int, headers: Mapping[str, str]) -> ResponseHeaders:
+        """
+        Creates a `ResponseHeaders` object from a status code and header mapping.
+
+        This is used to rebuild the headers of a response served from the local cache, where
+        there is no `ClientResponse`. The size on the wire is 0 until the body is parsed.
+
+        Parameters:
+        -----------
+        status : int
+            The HTTP status code.
+        headers : Mapping[str, str]
+            The response headers.
+
+        Returns:
+        --------
+        ResponseHeaders
+            The headers object.
+        """
+        response_headers = cls.__new__(cls)
+        response_headers.server = headers.get("Server", "")
+        response_headers.server_datetime = response_headers.parse_date(
+            date_str=headers.get("Date", "")
+        )
+        response_headers.connection = headers.get("Connection", "")
+        response_headers.status = status
+        response_headers.encoding = ""
+        response_headers.size = 0
+        response_headers.response_datetime = datetime.now()
+        return response_headers
+
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """
         Parses the date from the response headers into a `datetime` object.
@@ -237,34 +291,25 @@ class ResponseHeaders(DataClass):
 
     def parse_size(self, response: ClientResponse) -> int:
         """
-        Extracts and calculates the size of the response content using Pympler's asizeof for accurate measurement.
+        Retrieves the size of the body on the wire from the `Content-Length` header.
 
         Parameters:
         -----------
         response : ClientResponse
-            The response object from which to calculate the size.
+            The response object from which to retrieve the size.
 
         Returns:
         --------
         int
-            The total size of the response content in bytes. It first tries to use the 'Content-Length'
-            header, and if that is missing, it calculates the full memory size of the response object
-            using Pympler's asizeof to include all referenced objects.
+            The size of the body on the wire in bytes, or 0 if the `Content-Length` header is absent
+            or invalid, e.g. for chunked responses. In that case the size is set from the body once
+            it is read.
         """
         try:
-            # First try to get size from Content-Length header
-            return int(response.headers["Content-Length"])
-        except KeyError:
-            # If Content-Length is not provided, calculate the full size using Pympler
-            try:
-                return int(asizeof.asizeof(response.json(content_type=None)))  # type: ignore
-            except ClientResponseError:
-                return int(
-                    asizeof.asizeof(response)  # type: ignore
-                )  # Fall back to full response object size
-            except Exception:
-                logger.warning("Content length not provided and could not be inferred.")
-                return 0
+            return int(response.headers.get("Content-Length", 0))
+        except ValueError:
+            logger.warning("Content-Length header could not be parsed.")
+            return 0
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -292,20 +337,30 @@ class Response(Artifact):
     latency : float
         The time difference (in seconds) between when the request was sent and when the response was received
         (default: 0).
+    decode_time : float
+        The time (in seconds) the event loop was blocked decoding the response body (default: 0).
+    size : int
+        The size of the decompressed response body in bytes (default: 0). The size on the wire is
+        held in `headers.size`.
+    cached : bool
+        Whether the response was served from the local cache without a request (default: False).
 
     Methods:
     --------
     __init__(stage_passport: StagePassport) -> None
         Initializes the `Response` object and links it to the given `StagePassport`, inheriting from `Artifact`.
 
-    async parse_response(response: ClientResponse) -> None
+    async parse_response(response: ClientResponse, decoder: Optional[JSONDecoder] = None) -> None
         Asynchronously parses both the headers and content of the `ClientResponse` and updates the `Response` object.
 
     _parse_header(response: ClientResponse) -> ResponseHeaders
         Extracts and returns the HTTP headers from the `ClientResponse` as a `ResponseHeaders` object.
 
-    async _parse_content(response: ClientResponse) -> Union[List[Dict[str, Any]], Dict[str, Any]]
-        Asynchronously parses and returns the content of the `ClientResponse`, which can be either a dictionary
+    async parse_cached(headers: Mapping[str, str], body: bytes, decoder: Optional[JSONDecoder] = None) -> None
+        Asynchronously rebuilds the `Response` from headers and a body served from the local cache.
+
+    async _parse_content(response: ClientResponse, decoder: Optional[JSONDecoder] = None) -> Union[List[Dict[str, Any]], Dict[str, Any]]
+        Asynchronously reads the raw body of the `ClientResponse` and decodes it, which can be either a dictionary
         or a list of dictionaries, depending on the response format.
 
     Parameters:
@@ -316,6 +371,10 @@ class Response(Artifact):
 
     headers: ResponseHeaders
     content: Union[List[Dict[str, Any]], Dict[str, Any]]
+    decode_time: float = 0.0
+    size: int = 0
+    latency: float = 0.0
+    cached: bool = False
 
     def __init__(self, context: JobContext) -> None:
         """
@@ -328,7 +387,9 @@ class Response(Artifact):
         """
         super().__init__(context=context)
 
-    async def parse_response(self, response: ClientResponse) -> None:
+    async def parse_response(
+        self, response: ClientResponse, decoder: Optional[JSONDecoder] = None
+    ) -> None:
         """
         Asynchronously parses the `ClientResponse` object, extracting both headers and content.
 
@@ -336,15 +397,41 @@ class Response(Artifact):
         -----------
         response : ClientResponse
             The HTTP response object to be parsed.
+        decoder : Optional[JSONDecoder]
+            The decoder used for the response body. If None, the body is decoded inline on the event loop.
 
         This method first parses the headers, then asynchronously parses the content of the response.
         """
         self.headers = self._parse_header(response=response)
         if self.headers.status == 200:
-            self.content = await self._parse_content(response=response)
+            self.content = await self._parse_content(response=response, decoder=decoder)
         else:
             self.content = {}
 
+    async def parse_cached(
+        self,
+        headers: Mapping[str, str],
+        body: bytes,
+        decoder: Optional[JSONDecoder] = None,
+    ) -> None:
+        """
+        Asynchronously rebuilds the response from headers and a body served from the local cache.
+
+        Parameters:
+        -----------
+        headers : Mapping[str, str]
+            The cached response headers.
+        body : bytes
+            The cached, decompressed response body.
+        decoder : Optional[JSONDecoder]
+            The decoder used for the response body. If None, the body is decoded inline on the event loop.
+
+        Nothing is transferred for a cached body, so the size on the wire is left at 0.
+        """
+        self.headers = ResponseHeaders.from_values(status=200, headers=headers)
+        self.size = len(body)
+        self.content = await self._decode_body(body=body, decoder=decoder)
+
     def _parse_header(self, response: ClientResponse) -> ResponseHeaders:
         """
         Parses the HTTP response headers and returns a `ResponseHeaders` object.
@@ -362,15 +449,22 @@ class Response(Artifact):
         return ResponseHeaders(response=response)
 
     async def _parse_content(
-        self, response: ClientResponse
+        self, response: ClientResponse, decoder: Optional[JSONDecoder] = None
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Asynchronously parses the content of the HTTP response and returns it as a dictionary or list of dictionaries.
 
+        The body is read as raw bytes and handed to the decoder, which moves large bodies off the
+        event loop. The time the event loop was blocked by decoding is recorded in `decode_time`,
+        and the body length is recorded in `size`. If the server did not send `Content-Length`
+        and the body was not compressed, the body length is also the size on the wire.
+
         Parameters:
         -----------
         response : ClientResponse
             The HTTP response object from which to extract content.
+        decoder : Optional[JSONDecoder]
+            The decoder used for the response body. If None, the body is decoded inline on the event loop.
 
         Returns:
         --------
@@ -378,7 +472,35 @@ class Response(Artifact):
             The parsed content of the response, which could be either a dictionary or a list of dictionaries,
             depending on the structure of the response body.
         """
-        content: Union[Dict[str, Any], List[Dict[str, Any]]] = await response.json(
-            content_type=None
-        )
+        body = await response.read()
+        self.size = len(body)
+        if not self.headers.size and not self.headers.encoding:
+            self.headers.size = self.size
+        return await self._decode_body(body=body, decoder=decoder)
+
+    async def _decode_body(
+        self, body: bytes, decoder: Optional[JSONDecoder] = None
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Decodes a raw JSON body, recording the time the event loop was blocked in `decode_time`.
+
+        Parameters:
+        -----------
+        body : bytes
+            The raw response body.
+        decoder : Optional[JSONDecoder]
+            The decoder used for the response body. If None, the body is decoded inline on the event loop.
+
+        Returns:
+        --------
+        Union[List[Dict[str, Any]], Dict[str, Any]]
+            The decoded content.
+        """
+        content: Union[Dict[str, Any], List[Dict[str, Any]]]
+        if decoder is not None:
+            content, self.decode_time = await decoder.decode(body)
+        else:
+            start = time.perf_counter()
+            content = json.loads(body) if body else {}
+            self.decode_time = time.perf_counter() - start
         return content
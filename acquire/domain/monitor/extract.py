@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday September 6th 2024 07:20:22 am                                               #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 07:28:45 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -49,4 +49,6 @@ class ExtractMetrics(DataClass):
     throughput_max: float = 0.0
     throughput_std: float = 0.0
     speedup: float = 0.0
-    size: float = 0.0
+    size: float = 0.0  # Decompressed body bytes
+    wire_size: int = 0  # Body bytes on the wire
+    decode_time: float = 0.0
@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday July 19th 2024 08:27:38 am                                                   #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 07:44:08 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -19,7 +19,7 @@
 """Configuration Classes."""
 import logging
 import os
-from typing import Any, Dict, Union, cast
+from typing import Any, Dict, List, Union, cast
 
 import yaml
 from dotenv import dotenv_values, load_dotenv
@@ -104,6 +104,30 @@ class Config:
         port = os.getenv("WEBSHARE_PORT")
         return f"http://{username}:{pwd}@{dns}:{port}"
 
+    #  ------------------------------------------------------------------------------------------- #
+    @property
+    def proxies(self) -> List[str]:
+        """
+        Returns the proxy pool endpoints.
+
+        Endpoints are read from WEBSHARE_ENDPOINTS as a comma-separated list of host:port
+        pairs, each combined with the WEBSHARE_USER and WEBSHARE_PWD credentials. If it is not
+        set, the single proxy given by WEBSHARE_DNS and WEBSHARE_PORT is used. If neither is
+        set, the list is empty and requests are not proxied.
+        """
+        username = os.getenv("WEBSHARE_USER")
+        pwd = os.getenv("WEBSHARE_PWD")
+        endpoints = os.getenv("WEBSHARE_ENDPOINTS")
+        if endpoints:
+            return [
+                f"http://{username}:{pwd}@{endpoint.strip()}"
+                for endpoint in endpoints.split(",")
+                if endpoint.strip()
+            ]
+        if os.getenv("WEBSHARE_DNS"):
+            return [self.proxy]
+        return []
+
     #  ------------------------------------------------------------------------------------------- #
     @property
     def current_environment(self) -> str:
@@ -115,6 +139,24 @@ class Config:
         config = self.load_config()
         return self.to_namespace(config["async_session"])
 
+    #  ------------------------------------------------------------------------------------------- #
+    @property
+    def circuit_breaker(self) -> NestedNamespace:
+        config = self.load_config()
+        return self.to_namespace(config["circuit_breaker"])
+
+    #  ------------------------------------------------------------------------------------------- #
+    @property
+    def runner(self) -> NestedNamespace:
+        config = self.load_config()
+        return self.to_namespace(config["runner"])
+
+    #  ------------------------------------------------------------------------------------------- #
+    @property
+    def loadtest(self) -> NestedNamespace:
+        config = self.load_config()
+        return self.to_namespace(config["loadtest"])
+
     #  ------------------------------------------------------------------------------------------- #
     @property
     def extract(self) -> NestedNamespace:
@@ -33,7 +33,7 @@ from sqlalchemy.exc import (
     IntegrityError,
     ProgrammingError,
     SQLAlchemyError,
-    StagealError,
+    OperationalError,
 )
 
 from acquire.core.data import NestedNamespace
@@ -381,7 +381,7 @@ class Feynman(DBA):
             self._logger.info(
                 f"Table {table_name} was dropped from the {self._database.name} database."
             )
-        except StagealError as e:
+        except OperationalError as e:
             self._logger.exception(e)
         except IntegrityError as e:
             self._logger.exception(e)
@@ -405,7 +405,7 @@ class Feynman(DBA):
                 self._logger.info(
                     f"Created table {table_name} in {self._database.name} database."
                 )
-        except StagealError as e:
+        except OperationalError as e:
             self._logger.exception(e)
         except IntegrityError as e:
             self._logger.exception(e)
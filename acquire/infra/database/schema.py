@@ -33,6 +33,7 @@ schema = {
         dt_modified DATETIME,
         last_job_status ENUM("Created", "Scheduled", "In Progress", "Completed", "Failed", "Cancelled"),
         project_status ENUM('Active', 'Idle'),
+        controller ENUM('exploit', 'pid') NOT NULL DEFAULT 'exploit',
         PRIMARY KEY (project_id, data_type),
         INDEX idx_data_type (data_type),
         INDEX idx_category_id (category_id),
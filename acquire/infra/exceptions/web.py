@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/exceptions/web.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:46:32 pm                                                #
+# Modified   : Friday October 16th 2026 08:46:32 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Custom Web exception class module."""
+
+
+# ------------------------------------------------------------------------------------------------ #
+class ShortCircuitError(Exception):
+    """
+    Raised when the circuit breaker short-circuits a job whose requests cannot succeed.
+
+    A job is short-circuited when its 404 or error rate shows that further requests are
+    wasted, e.g. every page is past the end of the data or the upstream rejects them all.
+    The job stops early, so it must not be reported as completed.
+
+    Args:
+        reason (str): Why the job was short-circuited, e.g. "404 rate 0.95".
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}: job short-circuited on {self.reason}"
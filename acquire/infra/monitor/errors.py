@@ -53,6 +53,13 @@ def log_error(repo: ErrorLogRepo) -> Callable[[F], F]:
                         context = kwarg
                         break
 
+            # Check the arguments for the context they carry, e.g. a request
+            if not context:
+                for arg in (*args, *kwargs.values()):
+                    if isinstance(getattr(arg, "context", None), JobContext):
+                        context = arg.context
+                        break
+
             # If no valid context, raise an unlogged exception
             if not context:
                 raise RuntimeError(
@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday September 6th 2024 03:51:20 pm                                               #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 07:28:45 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -23,8 +23,6 @@ from datetime import datetime
 from functools import wraps
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
-from pympler import asizeof  # type: ignore
-
 from acquire.domain.monitor.extract import ExtractMetrics
 from acquire.infra.repo.monitor.extract import ExtractMetricsRepo
 
@@ -48,7 +46,9 @@ class ExtractMonitorDecorator:
         self.task_id: Optional[int] = None
         self.latencies: List[float] = []
         self.instance_count = 0
-        self.sizes: List[float] = []
+        self.sizes: List[int] = []
+        self.wire_sizes: List[int] = []
+        self.decode_times: List[float] = []
         self.dt_started: Optional[datetime] = None
         self.dt_ended: Optional[datetime] = None
 
@@ -99,6 +99,11 @@ class ExtractMonitorDecorator:
             self.metrics.throughput_std = throughput_std
             self.metrics.speedup = speedup
             self.metrics.requests = self.instance_count
+            # Bytes received, decompressed and on the wire
+            self.metrics.size = sum(self.sizes)
+            self.metrics.wire_size = sum(self.wire_sizes)
+            # Event loop time spent decoding response bodies
+            self.metrics.decode_time = sum(self.decode_times)
 
         # Persist the metrics in the repository
         if self.metrics:
@@ -146,7 +151,12 @@ class ExtractMonitorDecorator:
 
             # Collect latencies
             self.latencies.append(latency)
-            self.sizes.append(asizeof.asizeof(result))  # Assuming result has a size
+            # Byte counts are captured when the body is read; failed requests return None.
+            if result is not None:
+                self.sizes.append(getattr(result, "size", 0))
+                headers = getattr(result, "headers", None)
+                self.wire_sizes.append(getattr(headers, "size", 0))
+                self.decode_times.append(getattr(result, "decode_time", 0.0))
 
             self.instance_count += 1
 
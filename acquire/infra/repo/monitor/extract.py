@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday September 6th 2024 07:42:43 am                                               #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 07:28:45 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -114,12 +114,12 @@ class ExtractMetricsRepo(Repo):
                     project_id, job_id,  task_id, data_type, stage_type, dt_started, dt_ended, duration, instances,
                     latency_min, latency_average, latency_median, latency_max, latency_std,
                     throughput_min, throughput_average, throughput_median, throughput_max, throughput_std,
-                    f1, f2
+                    f1, f2, f3, i1
                 ) VALUES (
                     :project_id, :job_id, :task_id, :data_type, :stage_type, :dt_started, :dt_ended, :duration, :requests,
                     :latency_min, :latency_average, :latency_median, :latency_max, :latency_std,
                     :throughput_min, :throughput_average, :throughput_median, :throughput_max, :throughput_std,
-                    :speedup, :size
+                    :speedup, :size, :decode_time, :wire_size
                 );"""
         params = metrics.as_dict()
 
@@ -164,7 +164,9 @@ class ExtractMetricsRepo(Repo):
                 throughput_max,
                 throughput_std,
                 f1,
-                f2
+                f2,
+                f3,
+                i1
       FROM metrics;
         """
         params: Dict[str, Any] = {}
@@ -175,6 +177,8 @@ class ExtractMetricsRepo(Repo):
                 columns={
                     "f1": "speedup",
                     "f2": "size",
+                    "f3": "decode_time",
+                    "i1": "wire_size",
                     "instances": "requests",
                 }
             )
@@ -215,7 +219,9 @@ class ExtractMetricsRepo(Repo):
                 throughput_max,
                 throughput_std,
                 f1,
-                f2
+                f2,
+                f3,
+                i1
       FROM metrics;
         WHERE job_id = :job_id;
         """
@@ -227,6 +233,8 @@ class ExtractMetricsRepo(Repo):
                 columns={
                     "f1": "speedup",
                     "f2": "size",
+                    "f3": "decode_time",
+                    "i1": "wire_size",
                     "instances": "requests",
                 }
             )
@@ -267,7 +275,9 @@ class ExtractMetricsRepo(Repo):
                 throughput_max,
                 throughput_std,
                 f1,
-                f2
+                f2,
+                f3,
+                i1
       FROM metrics;
         WHERE task_id = :task_id;
         """
@@ -279,6 +289,8 @@ class ExtractMetricsRepo(Repo):
                 columns={
                     "f1": "speedup",
                     "f2": "size",
+                    "f3": "decode_time",
+                    "i1": "wire_size",
                     "instances": "requests",
                 }
             )
@@ -319,7 +331,9 @@ class ExtractMetricsRepo(Repo):
                 throughput_max,
                 throughput_std,
                 f1,
-                f2
+                f2,
+                f3,
+                i1
       FROM metrics;
         WHERE data_type = :data_type;
         """
@@ -331,6 +345,8 @@ class ExtractMetricsRepo(Repo):
                 columns={
                     "f1": "speedup",
                     "f2": "size",
+                    "f3": "decode_time",
+                    "i1": "wire_size",
                     "instances": "requests",
                 }
             )
@@ -371,7 +387,9 @@ class ExtractMetricsRepo(Repo):
                 throughput_max,
                 throughput_std,
                 f1,
-                f2
+                f2,
+                f3,
+                i1
       FROM metrics;
         WHERE stage_type = :stage_type;
         """
@@ -383,6 +401,8 @@ class ExtractMetricsRepo(Repo):
                 columns={
                     "f1": "speedup",
                     "f2": "size",
+                    "f3": "decode_time",
+                    "i1": "wire_size",
                     "instances": "requests",
                 }
             )
@@ -418,7 +438,9 @@ class ExtractMetricsRepo(Repo):
                 throughput_max,
                 throughput_std,
                 f1,
-                f2
+                f2,
+                f3,
+                i1
       FROM metrics;
         """
         params: Dict[str, Any] = {}
@@ -429,6 +451,8 @@ class ExtractMetricsRepo(Repo):
                 columns={
                     "f1": "speedup",
                     "f2": "size",
+                    "f3": "decode_time",
+                    "i1": "wire_size",
                     "instances": "requests",
                 }
             )
@@ -117,7 +117,8 @@ class ProjectRepo(AppLayerRepo):
         UPDATE project
         SET dataset = :dataset, category_id = :category_id, category = :category,
             project_priority = :project_priority, bookmark = :bookmark, n_jobs = :n_jobs,
-            last_job_id = :last_job_id, dt_last_job = :dt_last_job, project_status = :project_status
+            last_job_id = :last_job_id, dt_last_job = :dt_last_job, project_status = :project_status,
+            controller = :controller
         WHERE project_id = :project_id
         """
         )
@@ -136,6 +137,7 @@ class ProjectRepo(AppLayerRepo):
             ),
             "last_job_status": project.last_job_status,
             "project_status": project.project_status.value,
+            "controller": project.controller,
             "project_id": project.project_id,
         }
         with self._database as conn:
@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday July 19th 2024 04:44:47 am                                                   #
-# Modified   : Wednesday September 11th 2024 09:33:00 pm                                           #
+# Modified   : Friday October 16th 2026 08:58:41 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -22,7 +22,7 @@ from __future__ import annotations
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 import numpy as np
 from dependency_injector.providers import ConfigurationOption
@@ -30,6 +30,8 @@ from dependency_injector.providers import ConfigurationOption
 from acquire.core.data import NestedNamespace
 from acquire.domain.artifact.request.base import AsyncRequest, Request
 from acquire.domain.artifact.response.response import Response
+from acquire.infra.web.limiter import ConcurrencyLimiter
+from acquire.infra.web.pacer import TokenBucketPacer
 from acquire.infra.web.profile import (
     SessionControl,
     SessionHistory,
@@ -37,6 +39,7 @@ from acquire.infra.web.profile import (
     SessionStats,
     StatisticalSnapshot,
 )
+from acquire.infra.web.warmstart import AdapterState
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -49,11 +52,15 @@ class Clock:
     useful for timing stages or managing delays in asynchronous processes.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, clock: Optional[Callable[[], float]] = None) -> None:
         """Initializes the Clock instance.
 
         The clock starts in a reset state with `_start_time` set to 0.0.
+
+        Args:
+            clock (Optional[Callable[[], float]]): The time source. Defaults to `time.time`.
         """
+        self._clock = clock or time.time
         self._start_time: Optional[float] = 0.0
 
     def start(self) -> None:
@@ -62,7 +69,7 @@ class Clock:
         Sets `_start_time` to the current time. This method can be called multiple
         times to restart the clock.
         """
-        self._start_time = time.time()
+        self._start_time = self._clock()
 
     def reset(self) -> None:
         """Resets the clock to zero.
@@ -82,7 +89,7 @@ class Clock:
         """
         if self._start_time is None:
             raise RuntimeError("Clock has not been started.")
-        return time.time() - self._start_time
+        return self._clock() - self._start_time
 
     def has_elapsed(self, response_time: float) -> bool:
         """Checks if a given response_time has elapsed.
@@ -203,6 +210,14 @@ class SessionControlValue:
             new_value += np.random.normal(loc=0, scale=self._temperature)
         self._value = max(new_value, self._min_value)
 
+    def scale_value(self, factor: float) -> None:
+        """Multiplies the control value by a factor, without noise, respecting constraints.
+
+        Args:
+            factor (float): The factor by which the value is multiplied.
+        """
+        self._value = min(max(self._value * factor, self._min_value), self._max_value)
+
     def reset_value(self) -> None:
         """Resets the control value to its initial value.
 
@@ -238,21 +253,27 @@ class Adapter:
     Attributes:
         _session_history (SessionHistory): Tracks the history of session metrics.
         _session_control (SessionControl): Manages the control values for the session, such as rate and concurrency.
+        _pacer (Optional[TokenBucketPacer]): The pacer that enforces the rate, if bound.
+        _limiter (Optional[ConcurrencyLimiter]): The limiter that enforces the concurrency, if bound.
         _logger (logging.Logger): Logger instance for the adapter.
         _stage (AdapterStage): The current stage in the adaptive process.
     """
 
     def __init__(
-        self, initial_stage: AdapterBaselineStage, history: SessionHistory
+        self, initial_stage: AdapterStage, history: SessionHistory
     ) -> None:
         """Initializes the Adapter with a starting stage.
 
         Args:
-            initial_stage (AdapterBaselineStage): The initial stage to start the adaptation process.
+            initial_stage (AdapterStage): The initial stage to start the adaptation process, e.g.
+                the baseline stage, or the gradient stage.
         """
-        self._profile = SessionProfile()
         self._session_history: SessionHistory = history
+        self._clock = history.clock
+        self._profile = SessionProfile(clock=self._clock)
         self._session_control: SessionControl = SessionControl()
+        self._pacer: Optional[TokenBucketPacer] = None
+        self._limiter: Optional[ConcurrencyLimiter] = None
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self.transition_to_stage(stage=initial_stage)
 
@@ -269,6 +290,9 @@ class Adapter:
     def session_control(self, session_control: SessionControl) -> None:
         """Sets the session control, ensuring it's a valid `SessionControl` object.
 
+        The rate and concurrency are applied to the bound pacer and limiter immediately,
+        so the change takes effect for requests already waiting.
+
         Args:
             session_control (SessionControl): The new session control object.
 
@@ -280,6 +304,36 @@ class Adapter:
             self._logger.exception(msg)
             raise TypeError(msg)
         self._session_control = session_control
+        self._session_history.add_session_control(session_control=session_control)
+        self._apply_session_control()
+
+    @property
+    def pacer(self) -> Optional[TokenBucketPacer]:
+        """Gets the pacer that enforces the request rate, if bound."""
+        return self._pacer
+
+    @pacer.setter
+    def pacer(self, pacer: TokenBucketPacer) -> None:
+        """Binds the pacer that enforces the request rate.
+
+        Args:
+            pacer (TokenBucketPacer): The pacer owned by the session.
+        """
+        self._pacer = pacer
+
+    @property
+    def limiter(self) -> Optional[ConcurrencyLimiter]:
+        """Gets the limiter that enforces the concurrency, if bound."""
+        return self._limiter
+
+    @limiter.setter
+    def limiter(self, limiter: ConcurrencyLimiter) -> None:
+        """Binds the limiter that enforces the concurrency.
+
+        Args:
+            limiter (ConcurrencyLimiter): The limiter owned by the session.
+        """
+        self._limiter = limiter
 
     @property
     def stage(self) -> AdapterStage:
@@ -306,27 +360,38 @@ class Adapter:
             raise TypeError(msg)
         self._stage = stage
 
+    @property
+    def clock(self) -> Callable[[], float]:
+        """Gets the clock that times the adapter's stages and metrics, from its session history."""
+        return self._clock
+
     @property
     def profile(self) -> SessionProfile:
         """Property that exposes a SessionProfile object"""
         return self._profile
 
-    def initialize(self, async_request: AsyncRequest[Request]) -> None:
+    def initialize(self, async_request: Optional[AsyncRequest[Request]]) -> None:
         """Initializes the adapter for an async request
 
         Args:
-            async_request (AsyncRequest[Request]) an asynchronous request
+            async_request (Optional[AsyncRequest[Request]]) an asynchronous request, or None
+                when requests are streamed and counted as they are submitted.
         """
-        self._profile = SessionProfile()
+        self._profile = SessionProfile(clock=self._clock)
         self._profile.requests = async_request.request_count if async_request else 0
 
     def update_profile(self, responses: List[Response]) -> None:
         """Updates the profile with latency information.
 
+        Responses served from the local cache are excluded.
+
         Args:
             responses (List[Response]): List of Response objects
         """
         for response in responses:
+            # Pages served from the local cache say nothing about the server.
+            if response.cached:
+                continue
             self._profile.responses += 1
             self._profile.add_latency(response.latency)
 
@@ -339,8 +404,19 @@ class Adapter:
             history (SessionHistory): The session history containing metrics for adaptation.
         """
         self._session_history.add_profile(profile=self._profile)
+        if self._limiter is not None:
+            self._session_history.add_limiter_counts(
+                in_flight=self._limiter.in_flight, queued=self._limiter.queued
+            )
         self._stage.adapt_requests()
 
+    def _apply_session_control(self) -> None:
+        """Pushes the current rate and concurrency to the bound pacer and limiter."""
+        if self._pacer is not None and self._session_control.rate > 0:
+            self._pacer.rate = self._session_control.rate
+        if self._limiter is not None and self._session_control.concurrency > 0:
+            self._limiter.resize(round(self._session_control.concurrency))
+
     def transition_to_stage(self, stage: AdapterStage) -> None:
         """Transitions to a new stage in the adaptive process.
 
@@ -366,6 +442,22 @@ class Adapter:
         """
         return self._session_history.get_latency_stats(time_window=time_window)
 
+    def get_latency_percentile(
+        self, percentile: float, time_window: Optional[int] = None
+    ) -> float:
+        """Retrieves a latency percentile over a given time window.
+
+        Args:
+            percentile (float): The percentile, between 0 and 100.
+            time_window (Optional[int]): The time window in seconds to consider. If None, uses the entire history.
+
+        Returns:
+            float: The latency percentile in seconds.
+        """
+        return self._session_history.get_latency_percentile(
+            percentile=percentile, time_window=time_window
+        )
+
     def get_snapshot(self, time_window: Optional[int] = None) -> StatisticalSnapshot:
         """Retrieves a statistical snapshot of session metrics over a given time window.
 
@@ -377,6 +469,76 @@ class Adapter:
         """
         return self._session_history.get_snapshot(time_window=time_window)
 
+    def get_attempts(self, time_window: Optional[int] = None) -> int:
+        """Retrieves the number of attempts, including failures, over a given time window.
+
+        Args:
+            time_window (Optional[int]): The time window in seconds to consider. If None, uses the entire history.
+
+        Returns:
+            int: The number of attempts whose status was recorded.
+        """
+        return self._session_history.get_attempts(time_window=time_window)
+
+    def get_error_rate(self, time_window: Optional[int] = None) -> float:
+        """Retrieves the fraction of attempts that failed over a given time window.
+
+        Args:
+            time_window (Optional[int]): The time window in seconds to consider. If None, uses the entire history.
+
+        Returns:
+            float: The error rate.
+        """
+        return self._session_history.get_error_rate(time_window=time_window)
+
+    def get_throttle_rate(self, time_window: Optional[int] = None) -> float:
+        """Retrieves the fraction of attempts throttled with a 429 or 503 over a given time window.
+
+        Args:
+            time_window (Optional[int]): The time window in seconds to consider. If None, uses the entire history.
+
+        Returns:
+            float: The throttle rate.
+        """
+        return self._session_history.get_throttle_rate(time_window=time_window)
+
+    def get_status_counts(self, time_window: Optional[int] = None) -> Dict[int, int]:
+        """Retrieves the count of each status over a given time window.
+
+        Args:
+            time_window (Optional[int]): The time window in seconds to consider. If None, uses the entire history.
+
+        Returns:
+            Dict[int, int]: The count of each status, with status 0 for no response.
+        """
+        return self._session_history.get_status_counts(time_window=time_window)
+
+    def get_state(self, key: str) -> Optional[AdapterState]:
+        """Returns the operating point the adapter converged on, to warm-start later sessions.
+
+        The adapter has converged once exploration is complete, i.e. in the exploit stage.
+
+        Args:
+            key (str): The upstream, as host/endpoint/proxy.
+
+        Returns:
+            Optional[AdapterState]: The state, or None if the adapter has not converged.
+        """
+        if not isinstance(self._stage, AdapterExploitStage):
+            return None
+        baseline = self._stage.baseline_latency_stats
+        if baseline.n == 0 or self._session_control.rate <= 0:
+            return None
+        return AdapterState(
+            key=key,
+            rate=float(self._session_control.rate),
+            concurrency=float(self._session_control.concurrency),
+            baseline=baseline,
+            error_rate=self._stage.baseline_error_rate,
+            throttle_rate=self._stage.baseline_throttle_rate,
+            saved=time.time(),
+        )
+
 
 # ------------------------------------------------------------------------------------------------ #
 #                                     ADAPTER STAGE                                                #
@@ -407,9 +569,10 @@ class AdapterStage(ABC):
         Args:
             config (ConfigurationOption): The configuration parameters for the stage.
         """
-        self._config = NestedNamespace(dictionary=dict(config))
+        self._options = config
+        self._config = NestedNamespace(dictionary=config)
         self._adapter: Optional[Adapter] = None
-        self._stage_clock = Clock()
+        self._stage_clock = Clock(clock=self._now)
 
         # Default Rate and Concurrency Values.
         self._rate = SessionControlValue(
@@ -470,6 +633,16 @@ class AdapterStage(ABC):
         """
         self._adapter = adapter
 
+    def clone(self) -> AdapterStage:
+        """Returns a new stage of the same class and configuration, with no adapter, state or next stage."""
+        return self.__class__(config=self._options)
+
+    def _now(self) -> float:
+        """Returns the current time from the adapter's clock, or `time.time` before an adapter is set."""
+        if isinstance(self._adapter, Adapter):
+            return self._adapter.clock()
+        return time.time()
+
     def adapt_requests(self) -> None:
         """Executes the adapter methods for the current stage.
 
@@ -729,7 +902,21 @@ class AdapterBaselineStage(AdapterStage):
 #                            ADAPTER EXPLORE EXPLOIT STAGE                                         #
 # ------------------------------------------------------------------------------------------------ #
 class AdapterExploreExploitStage(AdapterStage, ABC):
-    """Abstract base class for stages that explore values of rate and concurrency."""
+    """Abstract base class for stages that explore values of rate and concurrency.
+
+    The system is stable while latency stays within `threshold` times its baseline. By
+    default, the test is on the mean and coefficient of variation of latency. With
+    `latency_metric` set to p90, p95 or p99, the test is on that latency percentile
+    instead, so a growing tail destabilizes the system even while the mean holds.
+
+    Failed requests have no latency, so a wave of errors or throttling would otherwise look
+    fast and stable. Before each adaptation, the error and throttle rates over the last
+    `error_window` seconds are compared with their rates over the baseline window. If
+    either has risen by more than `error_threshold` or `throttle_threshold`, with at least
+    `error_min_requests` attempts in the window, the stage backs off at once: the rate is
+    multiplied by `backoff`, and a stabilization period begins. It does not back off again
+    until the window has passed, so it is not judged twice on the same errors.
+    """
 
     def __init__(self, config: ConfigurationOption) -> None:
         super().__init__(config=config)
@@ -738,26 +925,103 @@ class AdapterExploreExploitStage(AdapterStage, ABC):
         self._baseline_latency_stats = SessionStats()
         self._baseline_latency_ave_threshold: float = 0.0
         self._baseline_latency_cv_threshold: float = 0.0
+        self._baseline_latency_tail_threshold: float = 0.0
+        self._latency_metric: str = getattr(self._config, "latency_metric", "average")
+        if self._latency_metric not in ("average", "p90", "p95", "p99"):
+            msg = f"Invalid latency metric: {self._latency_metric}. Expected average, p90, p95 or p99."
+            self._logger.error(msg)
+            raise ValueError(msg)
+
+        # Error and throttle rates, and the thresholds over their baselines, for back-off.
+        self._error_window: int = int(getattr(self._config, "error_window", 10))
+        self._error_threshold: float = float(getattr(self._config, "error_threshold", 0.05))
+        self._throttle_threshold: float = float(
+            getattr(self._config, "throttle_threshold", 0.01)
+        )
+        self._error_min_requests: int = int(getattr(self._config, "error_min_requests", 20))
+        self._backoff: float = float(getattr(self._config, "backoff", 0.5))
+        if not 0 < self._backoff <= 1:
+            msg = f"Invalid backoff: {self._backoff}. The backoff must be greater than 0 and at most 1."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        if self._error_threshold < 0 or self._throttle_threshold < 0:
+            msg = f"Invalid error or throttle threshold: {self._error_threshold}, {self._throttle_threshold}. Thresholds must not be negative."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._baseline_error_rate: float = 0.0
+        self._baseline_throttle_rate: float = 0.0
+        self._backed_off_at: Optional[float] = None
 
         # Step clock that monitors stabilization periods.
-        self._step_clock = Clock()
+        self._step_clock = Clock(clock=self._now)
         self._stabilization_period: bool = False
 
+        # Whether the baseline was restored from a saved state rather than measured.
+        self._warm_started: bool = False
+
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+    @property
+    def baseline_latency_stats(self) -> SessionStats:
+        """Returns the baseline latency statistics against which stability is tested."""
+        return self._baseline_latency_stats
+
+    @property
+    def baseline_error_rate(self) -> float:
+        """Returns the baseline error rate over which a rise backs off."""
+        return self._baseline_error_rate
+
+    @property
+    def baseline_throttle_rate(self) -> float:
+        """Returns the baseline throttle rate over which a rise backs off."""
+        return self._baseline_throttle_rate
+
     @abstractmethod
     def execute_session(self) -> SessionControl:
         """This method must be implemented by subclasses to execute the session logic."""
         pass
 
     def adapt_requests(self) -> None:
-        """Optional override for subclasses to adapt requests during the session."""
-        super().adapt_requests()
+        """Backs off if errors or throttling are rising, and otherwise executes the session."""
+        self.begin_session()
+        if self.errors_rising():
+            session_control = self.back_off()
+        else:
+            session_control = self.execute_session()
+        self.end_session(session_control=session_control)
 
     def begin_stage(self) -> None:
-        """Optional override for subclasses to initialize the stage."""
+        """Optional override for subclasses to initialize the stage.
+
+        The baselines are measured from the adapter's history, unless the stage was
+        warm-started, in which case the saved baselines are kept. Either way, the latency
+        thresholds are computed from the baseline, so a warm-started stage backs off on the
+        same latencies, errors and throttling as one that measured the same baselines.
+        """
         super().begin_stage()
-        self.set_baseline_latency_stats()
+        if self._warm_started:
+            self._warm_started = False
+        else:
+            self.set_baseline_latency_stats()
+            self.set_baseline_error_rates()
+        self._set_latency_thresholds()
+
+    def warm_start(
+        self, baseline: SessionStats, error_rate: float = 0.0, throttle_rate: float = 0.0
+    ) -> None:
+        """Begins the next run of the stage with saved baselines rather than measured ones.
+
+        Args:
+            baseline (SessionStats): The baseline latency statistics.
+            error_rate (float): The baseline error rate. Defaults to 0.0.
+            throttle_rate (float): The baseline throttle rate. Defaults to 0.0.
+        """
+        self._baseline_latency_stats = baseline
+        self._baseline_error_rate = error_rate
+        self._baseline_throttle_rate = throttle_rate
+        self._set_latency_thresholds()
+        self._warm_started = True
+        self._stage_clock.reset()
 
     def initialize_session_control(self) -> None:
         """Optional override for subclasses to set up session control parameters."""
@@ -787,6 +1051,48 @@ class AdapterExploreExploitStage(AdapterStage, ABC):
             self._log_unstable_system(current_latency_stats)
         return stable
 
+    def errors_rising(self) -> bool:
+        """Returns whether the error or throttle rate has risen over its baseline."""
+        if not isinstance(self._adapter, Adapter):
+            return False
+        if (
+            self._backed_off_at is not None
+            and self._now() - self._backed_off_at < self._error_window
+        ):
+            return False
+        attempts = self._adapter.get_attempts(time_window=self._error_window)
+        if attempts < self._error_min_requests:
+            return False
+        error_rate = self._adapter.get_error_rate(time_window=self._error_window)
+        throttle_rate = self._adapter.get_throttle_rate(time_window=self._error_window)
+        rising = (
+            error_rate > self._baseline_error_rate + self._error_threshold
+            or throttle_rate > self._baseline_throttle_rate + self._throttle_threshold
+        )
+        if rising:
+            self._logger.debug(
+                f"System is not stable. Error rate is {round(error_rate, 4)} against a baseline of "
+                f"{round(self._baseline_error_rate, 4)} and throttle rate is {round(throttle_rate, 4)} "
+                f"against a baseline of {round(self._baseline_throttle_rate, 4)} over {attempts} attempts."
+            )
+        return rising
+
+    def back_off(self) -> SessionControl:
+        """Multiplies the rate by the backoff and begins a stabilization period.
+
+        Returns:
+            SessionControl: The session control with the reduced rate.
+        """
+        rate = self._rate.value
+        self._rate.scale_value(self._backoff)
+        self._backed_off_at = self._now()
+        self._step_clock.start()
+        self._stabilization_period = True
+        self._logger.info(
+            f"{self.__class__.__name__} backing off on errors: rate {round(rate, 2)} -> {round(self._rate.value, 2)}."
+        )
+        return SessionControl(rate=self._rate.value, concurrency=self._concurrency.value)
+
     def get_current_latency_stats(
         self, time_window: Optional[int] = None
     ) -> SessionStats:
@@ -821,21 +1127,51 @@ class AdapterExploreExploitStage(AdapterStage, ABC):
 
         self._logger.debug(f"\nBaseline Latency\n{self._baseline_latency_stats}")
 
+    def set_baseline_error_rates(self) -> None:
+        """Obtains the baseline error and throttle rates from the adapter."""
+        if isinstance(self._adapter, Adapter):
+            self._baseline_error_rate = self._adapter.get_error_rate(
+                time_window=self._config.window_size
+            )
+            self._baseline_throttle_rate = self._adapter.get_throttle_rate(
+                time_window=self._config.window_size
+            )
+
     def _set_latency_thresholds(self) -> None:
+        # Stages that do not test stability, such as exploit, have no threshold.
+        threshold = getattr(self._config, "threshold", None)
+        if threshold is None:
+            return
         self._baseline_latency_ave_threshold = (
-            self._baseline_latency_stats.average * self._config.threshold
-        )
-        self._baseline_latency_cv_threshold = (
-            self._baseline_latency_stats.cv * self._config.threshold
+            self._baseline_latency_stats.average * threshold
         )
+        self._baseline_latency_cv_threshold = self._baseline_latency_stats.cv * threshold
+        if self._latency_metric != "average":
+            self._baseline_latency_tail_threshold = (
+                getattr(self._baseline_latency_stats, self._latency_metric) * threshold
+            )
 
     def _is_latency_within_threshold(self, stats: SessionStats) -> bool:
+        if self._latency_metric != "average":
+            return (
+                getattr(stats, self._latency_metric)
+                <= self._baseline_latency_tail_threshold
+            )
         return (
             stats.average <= self._baseline_latency_ave_threshold
             and stats.cv <= self._baseline_latency_cv_threshold
         )
 
     def _log_unstable_system(self, stats: SessionStats) -> None:
+        if self._latency_metric != "average" and self._baseline_latency_tail_threshold:
+            latency_tail_pct = (
+                (getattr(stats, self._latency_metric) - self._baseline_latency_tail_threshold)
+                / self._baseline_latency_tail_threshold
+            ) * 100
+            self._logger.debug(
+                f"System is not stable. Latency {self._latency_metric} is {round(latency_tail_pct, 2)}% above threshold."
+            )
+            return
         latency_ave_pct = (
             (stats.average - self._baseline_latency_ave_threshold)
             / self._baseline_latency_ave_threshold
@@ -1246,6 +1582,16 @@ class AdapterConcurrencyExploreStage(AdapterExploreExploitStage):
 
         self._logger.debug(f"\n\n{self.__class__.__name__} in a stabilization period.")
 
+    def back_off(self) -> SessionControl:
+        """
+        Multiplies the concurrency, as well as the rate, by the backoff.
+
+        Returns:
+            SessionControl: The session control with the reduced rate and concurrency.
+        """
+        self._concurrency.scale_value(self._backoff)
+        return super().back_off()
+
     def _stabilize(self) -> None:
         """
         Applies noise to the rate during the stabilization period.
@@ -1345,7 +1691,7 @@ class AdapterExploitStage(AdapterExploreExploitStage):
                 max_value=float(self._config.concurrency.max),
             )
             self._rate = SessionControlValue(
-                initial_value=float(self._adapter.session_control.concurrency),
+                initial_value=float(self._adapter.session_control.rate),
                 min_value=float(self._config.rate.min),
                 max_value=float(self._config.rate.max),
             )
@@ -1442,6 +1788,286 @@ class AdapterExploitStage(AdapterExploreExploitStage):
             raise TypeError(msg)
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                  ADAPTER PID STAGE                                               #
+# ------------------------------------------------------------------------------------------------ #
+class AdapterPIDStage(AdapterExploitStage):
+    """
+    Exploits the explored rate with a PID controller that holds a latency SLO.
+
+    The SLO is that no more than `error_budget` of requests take longer than
+    `target_latency`, so with the default budget of 5%, the controlled latency is the p95
+    over `window_size` seconds. The error is the headroom under the target, relative to the
+    target, and the controller output is a log-scale adjustment to the rate the stage
+    entered with:
+
+        error = (target_latency - latency) / target_latency
+        output = kp * error + ki * integral(error) dt - kd * d(latency / target_latency) / dt
+        rate = reference_rate * exp(output)
+
+    The derivative is taken on the latency rather than the error, so it does not kick when
+    the target changes. The integral is clamped to `integral_limit`, and is not accumulated
+    while the rate is held at a limit by the error that drives it there (anti-windup). The
+    rate moves by at most `max_step` of its value per adaptation, and stays within the
+    configured bounds.
+
+    Otherwise, the stage behaves as the exploit stage: it begins with the rate and
+    concurrency of the prior stage, and after `response_time` returns to the baseline.
+
+    The configured gains were tuned only against the step response in the PID unit test.
+    They have not been tuned against a real upstream or the simulator.
+
+    Args:
+        config (ConfigurationOption): Configuration with the exploit settings, and
+            `target_latency`, `error_budget`, `kp`, `ki`, `kd`, `integral_limit` and `max_step`.
+
+    Raises:
+        ValueError: If the target latency is not positive, or the error budget is not
+            between 0 and 1.
+    """
+
+    def __init__(self, config: ConfigurationOption) -> None:
+        super().__init__(config=config)
+        self._target_latency: float = float(self._config.target_latency)
+        self._error_budget: float = float(self._config.error_budget)
+        if self._target_latency <= 0:
+            msg = f"Invalid target latency: {self._target_latency}. The target must be positive."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        if not 0 < self._error_budget < 1:
+            msg = f"Invalid error budget: {self._error_budget}. The budget must be between 0 and 1."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._percentile: float = 100 * (1 - self._error_budget)
+
+        self._kp: float = float(self._config.kp)
+        self._ki: float = float(self._config.ki)
+        self._kd: float = float(self._config.kd)
+        self._integral_limit: float = float(self._config.integral_limit)
+        self._max_step: float = float(self._config.max_step)
+
+        self._reference_rate: float = self._rate.value
+        self._integral: float = 0.0
+        self._previous_latency: Optional[float] = None
+        self._updated: Optional[float] = None
+
+    @property
+    def integral(self) -> float:
+        """Returns the integral term of the controller."""
+        return self._integral
+
+    def initialize_session_control(self) -> None:
+        """
+        Begins with the rate and concurrency of the prior stage, and resets the controller.
+        """
+        super().initialize_session_control()
+        rate = float(self._config.rate.base)
+        if isinstance(self._adapter, Adapter) and self._adapter.session_control.rate > 0:
+            rate = float(self._adapter.session_control.rate)
+        self._rate.value = min(
+            max(rate, float(self._config.rate.min)), float(self._config.rate.max)
+        )
+        self._reference_rate = self._rate.value
+        self._integral = 0.0
+        self._previous_latency = None
+        self._updated = None
+
+    def execute_session(self) -> SessionControl:
+        """
+        Adjusts the rate towards the latency target.
+
+        Returns:
+            SessionControl: The session control object containing the updated rate and concurrency.
+        """
+        latency = (
+            self._adapter.get_latency_percentile(
+                percentile=self._percentile, time_window=self._config.window_size
+            )
+            if isinstance(self._adapter, Adapter)
+            else 0.0
+        )
+        if latency <= 0:
+            # Nothing observed within the window yet.
+            return SessionControl(rate=self._rate.value, concurrency=self._concurrency.value)
+
+        now = self._now()
+        elapsed = now - self._updated if self._updated is not None else 0.0
+        error = (self._target_latency - latency) / self._target_latency
+
+        proportional = self._kp * error
+        integral = self._integral + self._ki * error * elapsed
+        integral = min(max(integral, -self._integral_limit), self._integral_limit)
+        derivative = 0.0
+        if self._previous_latency is not None and elapsed > 0:
+            derivative = (
+                -self._kd
+                * (latency - self._previous_latency)
+                / self._target_latency
+                / elapsed
+            )
+        output = proportional + integral + derivative
+
+        desired = self._reference_rate * float(np.exp(output))
+        rate = self._rate.value
+        limited = min(max(desired, rate * (1 - self._max_step)), rate * (1 + self._max_step))
+        limited = min(max(limited, float(self._config.rate.min)), float(self._config.rate.max))
+        # Anti-windup: the integral only accumulates while it can move the rate.
+        saturated = not np.isclose(limited, desired)
+        if not saturated or (desired > limited) != (error > 0):
+            self._integral = integral
+
+        self._previous_latency = latency
+        self._updated = now
+        self._rate.value = limited
+
+        self._logger.debug(
+            f"PID p{round(self._percentile, 1)} latency {round(latency, 4)} against target "
+            f"{self._target_latency}: error {round(error, 3)}, P {round(proportional, 3)}, "
+            f"I {round(self._integral, 3)}, D {round(derivative, 3)}, rate {round(rate, 1)} "
+            f"-> {round(limited, 1)}{' (limited)' if saturated else ''}."
+        )
+        return SessionControl(rate=self._rate.value, concurrency=self._concurrency.value)
+
+    def back_off(self) -> SessionControl:
+        """
+        Backs off, and resumes control from the reduced rate with the controller reset.
+
+        Returns:
+            SessionControl: The session control with the reduced rate.
+        """
+        session_control = super().back_off()
+        self._reference_rate = self._rate.value
+        self._integral = 0.0
+        self._previous_latency = None
+        self._updated = None
+        return session_control
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                 ADAPTER GRADIENT STAGE                                           #
+# ------------------------------------------------------------------------------------------------ #
+class AdapterGradientStage(AdapterStage):
+    """
+    Adjusts concurrency continuously from the gradient of round-trip times, as in TCP Vegas.
+
+    Unlike the staged strategy, there is no baseline or exploration period: concurrency is
+    adjusted at every adaptation. The short-window RTT is the minimum latency observed since
+    the last adaptation, which is the least queued request in the window. The long-window RTT
+    is an exponential average of the short-window RTT over `long_window` seconds, and stands
+    in for the RTT without queueing. Their ratio is the gradient:
+
+        gradient = clamp(tolerance * long_rtt / short_rtt, 0.5, 1)
+        limit = limit * gradient + sqrt(limit)
+
+    While requests queue no more than `tolerance` allows, the gradient is 1 and the limit
+    grows by its square root, which probes for more capacity. As queueing grows, the
+    gradient falls, and the limit shrinks towards what the upstream sustains, by at most
+    half per adaptation. Each new limit is blended with the previous one by `smoothing`.
+    When the short-window RTT falls well below the long-window RTT, e.g. once a period of
+    congestion passes, the long-window RTT is decayed so that it recovers quickly.
+
+    The rate follows the limit by Little's law, at `rate_headroom` times the throughput
+    the limit sustains at the long-window RTT, so the pacer smooths bursts without
+    becoming the bottleneck.
+
+    The stage is its own next stage: it runs for as long as the adapter does.
+
+    Args:
+        config (ConfigurationOption): Configuration with the rate and concurrency bounds,
+            `tolerance`, `smoothing`, `long_window` and `rate_headroom`.
+    """
+
+    def __init__(self, config: ConfigurationOption) -> None:
+        super().__init__(config=config)
+        self._tolerance: float = float(self._config.tolerance)
+        self._smoothing: float = float(self._config.smoothing)
+        self._long_window: float = float(self._config.long_window)
+        self._rate_headroom: float = float(self._config.rate_headroom)
+        self._long_rtt: Optional[float] = None
+        self._updated: float = 0.0
+
+    @property
+    def next_stage(self) -> Optional[AdapterStage]:
+        """Returns None. The gradient stage does not transition."""
+        return None
+
+    @next_stage.setter
+    def next_stage(self, next_stage: AdapterStage) -> None:
+        """The gradient stage does not transition, so the next stage is ignored."""
+        pass
+
+    @property
+    def long_rtt(self) -> Optional[float]:
+        """Returns the long-window RTT in seconds, or None before the first adaptation."""
+        return self._long_rtt
+
+    def execute_session(self) -> SessionControl:
+        """
+        Adjusts the concurrency from the gradient of the short- and long-window RTTs, and
+        the rate from the concurrency.
+
+        Returns:
+            SessionControl: The session control object containing the updated rate and concurrency.
+        """
+        latencies = (
+            [latency for _, _, latency in self._adapter.profile.get_latencies()]
+            if isinstance(self._adapter, Adapter)
+            else []
+        )
+        if not latencies:
+            # Nothing was learned since the last adaptation, e.g. every page was cached.
+            return SessionControl(rate=self._rate.value, concurrency=self._concurrency.value)
+
+        short_rtt = min(latencies)
+        now = self._now()
+        if self._long_rtt is None:
+            self._long_rtt = short_rtt
+        else:
+            weight = min((now - self._updated) / self._long_window, 1.0)
+            self._long_rtt += weight * (short_rtt - self._long_rtt)
+            if self._long_rtt > 2 * short_rtt:
+                self._long_rtt *= 0.95
+        self._updated = now
+
+        limit = self._concurrency.value
+        gradient = max(0.5, min(1.0, self._tolerance * self._long_rtt / short_rtt))
+        estimate = limit * gradient + limit**0.5
+        limit = limit * (1 - self._smoothing) + estimate * self._smoothing
+        self._concurrency.value = min(
+            max(limit, float(self._config.concurrency.min)),
+            float(self._config.concurrency.max),
+        )
+        rate = self._concurrency.value / self._long_rtt * self._rate_headroom
+        self._rate.value = min(
+            max(rate, float(self._config.rate.min)), float(self._config.rate.max)
+        )
+
+        self._logger.debug(
+            f"Gradient {round(gradient, 3)} from short RTT {round(short_rtt, 4)} and long RTT "
+            f"{round(self._long_rtt, 4)}: concurrency {round(self._concurrency.value, 1)}, "
+            f"rate {round(self._rate.value, 1)}."
+        )
+        return SessionControl(rate=self._rate.value, concurrency=self._concurrency.value)
+
+    def end_session(self, session_control: SessionControl) -> None:
+        """
+        Applies the session control to the adapter. The stage never ends.
+
+        Args:
+            session_control (SessionControl): The session control object containing the updated rate and concurrency.
+        """
+        if isinstance(self._adapter, Adapter):
+            self._adapter.session_control = session_control
+
+    def transition_to_stage(self) -> None:
+        """The gradient stage does not transition."""
+        pass
+
+    def _validate_next_stage(self) -> None:
+        """The gradient stage has no next stage to validate."""
+        pass
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                     ADAPTER FACTORY                                              #
 # ------------------------------------------------------------------------------------------------ #
@@ -1457,9 +2083,13 @@ class AdapterFactory:
         explore_rate (AdapterRateExploreStage): The stage responsible for exploring request rates and adjusting based on performance metrics.
         explore_concurrency (AdapterConcurrencyExploreStage): The stage responsible for exploring concurrency levels to optimize performance.
         exploit (AdapterExploitStage): The stage that exploits the learned metrics to maximize performance after exploration.
+        gradient (Optional[AdapterGradientStage]): The stage that adjusts concurrency continuously, for the gradient strategy.
+        strategy (str): "staged" for the baseline, explore and exploit stages, or "gradient" for the gradient stage.
+        pid (Optional[AdapterPIDStage]): The stage that exploits the explored rate with a PID controller.
+        controller (str): The stage that follows exploration in the staged strategy: "exploit" or "pid".
 
     Methods:
-        create() -> Adapter:
+        create(isolated) -> Adapter:
             Sets up the transitions between the stages, then creates and returns an initialized Adapter with the baseline stage and session history.
     """
 
@@ -1471,6 +2101,10 @@ class AdapterFactory:
         explore_rate: AdapterRateExploreStage,
         explore_concurrency: AdapterConcurrencyExploreStage,
         exploit: AdapterExploitStage,
+        gradient: Optional[AdapterGradientStage] = None,
+        strategy: str = "staged",
+        pid: Optional[AdapterPIDStage] = None,
+        controller: str = "exploit",
     ) -> None:
         """
         Initializes the AdapterFactory with the necessary stages and session history.
@@ -1482,6 +2116,10 @@ class AdapterFactory:
             explore_rate (AdapterRateExploreStage): The stage responsible for exploring request rates.
             explore_concurrency (AdapterConcurrencyExploreStage): The stage responsible for exploring concurrency levels.
             exploit (AdapterExploitStage): The stage responsible for exploiting the metrics to maximize performance.
+            gradient (Optional[AdapterGradientStage]): The stage for the gradient strategy.
+            strategy (str): The adaptation strategy, "staged" or "gradient". Defaults to "staged".
+            pid (Optional[AdapterPIDStage]): The stage for the PID controller.
+            controller (str): The stage that follows exploration, "exploit" or "pid". Defaults to "exploit".
         """
         self._adapter = adapter
         self._history = history
@@ -1489,50 +2127,115 @@ class AdapterFactory:
         self._explore_rate = explore_rate
         self._explore_concurrency = explore_concurrency
         self._exploit = exploit
+        self._gradient = gradient
+        self._strategy = strategy
+        self._pid = pid
+        self._controller = controller
 
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
         # Validate the input types
         self._validate_input()
 
-    def create(self) -> Adapter:
+    def create(self, isolated: bool = False) -> Adapter:
         """
         Creates and returns an Adapter instance with the appropriate stage transitions.
 
-        The stages are linked sequentially: baseline -> explore_rate -> explore_concurrency -> exploit.
-        Once all the transitions are set, the Adapter is instantiated with the baseline stage and the session history.
+        The stages are linked sequentially: baseline -> explore_rate -> explore_concurrency -> exploit,
+        where the exploit stage is the PID stage if the controller is "pid". Once all the transitions are set, the Adapter is instantiated with the baseline stage and the session history.
+
+        With the gradient strategy, the Adapter is instantiated with the gradient stage alone.
+
+        An isolated Adapter has its own session history and copies of the stages, so that
+        adapters created for different endpoints share neither latencies nor stage state.
+
+        Args:
+            isolated (bool): Whether the Adapter is created with its own history and stages,
+                rather than the factory's. Defaults to False.
 
         Returns:
             Adapter: A fully initialized Adapter with its stages set up for state transitions.
         """
-        self._baseline.next_stage = self._explore_rate
-        self._explore_rate.next_stage = self._explore_concurrency
-        self._explore_concurrency.next_stage = self._exploit
-        self._exploit.next_stage = self._baseline
-        adapter = self._adapter(initial_stage=self._baseline, history=self._history)
-
-        self._validate(adapter)
+        history = self._history.clone() if isolated else self._history
+        if self._strategy == "gradient":
+            gradient = self._gradient.clone() if isolated else self._gradient  # type: ignore[union-attr]
+            adapter = self._adapter(initial_stage=gradient, history=history)  # type: ignore[arg-type]
+            self._logger.info("Adapter created with the gradient strategy.")
+            return adapter
+
+        exploit = self._pid if self._controller == "pid" else self._exploit
+        stages: List[Optional[AdapterStage]] = [
+            self._baseline,
+            self._explore_rate,
+            self._explore_concurrency,
+            exploit,
+        ]
+        if isolated:
+            stages = [stage.clone() for stage in stages]  # type: ignore[union-attr]
+        for stage, next_stage in zip(stages, stages[1:] + stages[:1]):
+            stage.next_stage = next_stage  # type: ignore[union-attr]
+        adapter = self._adapter(initial_stage=stages[0], history=history)  # type: ignore[arg-type]
+
+        self._validate(adapter, stages=stages)  # type: ignore[arg-type]
         return adapter
 
-    def _validate(self, adapter: Adapter) -> None:
+    def warm_start(self, adapter: Adapter, state: AdapterState) -> None:
+        """
+        Moves an Adapter straight to its exploit stage, at a saved operating point.
+
+        The exploit stage, or the PID stage if the controller is "pid", begins with the saved
+        rate, concurrency and baselines, rather than after the baseline and exploration stages.
+        Once the exploit stage ends, the Adapter recalibrates from the baseline as usual. The
+        gradient strategy has no exploration to skip, so its Adapter is left as is.
+
+        Args:
+            adapter (Adapter): An Adapter created by this factory.
+            state (AdapterState): The saved operating point.
+        """
+        if self._strategy == "gradient":
+            return
+        # The Adapter's own exploit stage, which is a copy if the Adapter is isolated.
+        exploit = adapter.stage
+        while not isinstance(exploit, AdapterExploitStage):
+            exploit = exploit.next_stage  # type: ignore[assignment]
+        exploit.warm_start(
+            baseline=state.baseline,
+            error_rate=state.error_rate,
+            throttle_rate=state.throttle_rate,
+        )
+        adapter.session_control = SessionControl(
+            rate=state.rate, concurrency=state.concurrency
+        )
+        adapter.transition_to_stage(exploit)
+        self._logger.info(
+            f"Adapter warm-started for {state.key} at rate {round(state.rate, 1)} and "
+            f"concurrency {round(state.concurrency, 1)}, saved {round(state.age)} seconds ago."
+        )
+
+    def _validate(self, adapter: Adapter, stages: List[AdapterStage]) -> None:
         """
         Validates the Adapter and its stages to ensure they are properly set up.
         Raises a ValueError if any validation fails.
+
+        Args:
+            adapter (Adapter): The Adapter created.
+            stages (List[AdapterStage]): Its baseline, explore rate, explore concurrency and exploit stages.
         """
+        baseline, explore_rate, explore_concurrency, exploit = stages
         # Ensure that all stages have their next stage set
-        if not self._baseline.next_stage:
+        if not baseline.next_stage:
             raise ValueError("Baseline stage does not have a next stage set.")
-        if not self._explore_rate.next_stage:
+        if not explore_rate.next_stage:
             raise ValueError("Explore rate stage does not have a next stage set.")
-        if not self._explore_concurrency.next_stage:
+        if not explore_concurrency.next_stage:
             raise ValueError(
                 "Explore concurrency stage does not have a next stage set."
             )
-        if not self._exploit.next_stage:
+        if exploit is None or not exploit.next_stage:
             raise ValueError("Exploit stage does not have a next stage set.")
 
         # Check adapter's initial state
-        if adapter.current_stage is not self._baseline:
+        if adapter.stage is not baseline:
             raise ValueError("Adapter was not initialized with the baseline stage.")
 
         self._logger.info("Adapter validation passed.")
@@ -1566,3 +2269,21 @@ class AdapterFactory:
             raise TypeError(
                 f"Expected AdapterExploitStage for exploit, but got {type(self._exploit).__name__}"
             )
+        if self._strategy not in ("staged", "gradient"):
+            raise ValueError(
+                f"Invalid adapter strategy: {self._strategy}. Valid values are 'staged' and 'gradient'."
+            )
+        if self._strategy == "gradient" and not isinstance(
+            self._gradient, AdapterGradientStage
+        ):
+            raise TypeError(
+                f"Expected AdapterGradientStage for gradient, but got {type(self._gradient).__name__}"
+            )
+        if self._controller not in ("exploit", "pid"):
+            raise ValueError(
+                f"Invalid adapter controller: {self._controller}. Valid values are 'exploit' and 'pid'."
+            )
+        if self._controller == "pid" and not isinstance(self._pid, AdapterPIDStage):
+            raise TypeError(
+                f"Expected AdapterPIDStage for pid, but got {type(self._pid).__name__}"
+            )
@@ -11,30 +11,96 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Friday July 19th 2024 04:42:55 am                                                   #
-# Modified   : Wednesday September 11th 2024 09:18:14 pm                                           #
+# Modified   : Friday October 16th 2026 08:59:50 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 import asyncio
+import copy
+import functools
 import logging
-from typing import Awaitable, List, Optional
+import os
+import time
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 import aiohttp
 
-from acquire.container import AppVoCAIContainer
-from acquire.domain.artifact.request.base import AsyncRequest, Request
+from acquire.core.enum import CircuitState
+from acquire.domain.artifact.request.base import AsyncRequest, Request, RequestGen
+from acquire.domain.artifact.request.fair import FairRequestGen
 from acquire.domain.artifact.response.response import AsyncResponse, Response
 from acquire.infra.base.config import Config
+from acquire.infra.exceptions.web import ShortCircuitError
 from acquire.infra.monitor.extract import ExtractMonitorDecorator
-from acquire.infra.web.adapter import AdapterFactor
+from acquire.infra.web.adapter import Adapter, AdapterFactory
+from acquire.infra.web.breaker import CircuitBreaker, ShortCircuit
+from acquire.infra.web.cache import CacheEntry, ResponseCache
+from acquire.infra.web.decoder import JSONDecoder
+from acquire.infra.web.endpoint import Endpoint, EndpointRegistry
 from acquire.infra.web.header import BrowserHeaders
+from acquire.infra.web.pagination import PaginationPlanner
+from acquire.infra.web.proxy import ProxyPool
+from acquire.infra.web.retry import RetryPolicy, RetryScheduler
+from acquire.infra.web.warmstart import AdapterStateStore
 
 # ------------------------------------------------------------------------------------------------ #
 logger = logging.getLogger(__name__)
 # ------------------------------------------------------------------------------------------------ #
-monitor: ExtractMonitorDecorator = AppVoCAIContainer.monitor.metrics_extract()
-log_error = AppVoCAIContainer.monitor.error()
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        MONITOR                                                   #
+# ------------------------------------------------------------------------------------------------ #
+def _container() -> Any:
+    """Returns the framework container, imported here because the container imports AsyncSession."""
+    from acquire.container import AppVoCAIContainer
+
+    return AppVoCAIContainer
+
+
+def _deferred(resolve: Callable[[], Callable[[F], F]]) -> Callable[[F], F]:
+    """Returns a decorator that applies the decorator from `resolve` when the method is first called.
+
+    The monitor decorators are provided by the container, which cannot be imported while this
+    module is being imported, so they are resolved on first use.
+
+    Args:
+        resolve (Callable[[], Callable[[F], F]]): Returns the decorator to apply.
+    """
+
+    def decorator(func: F) -> F:
+        decorated: List[F] = []
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not decorated:
+                decorated.append(resolve()(func))
+            return await decorated[0](*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+monitor_stage = _deferred(lambda: _container().monitor.metrics_extract().stage)
+monitor_event = _deferred(lambda: _container().monitor.metrics_extract().event)
+log_error = _deferred(lambda: _container().monitor.error())
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -58,17 +124,28 @@ class AsyncSession:
         _connector (aiohttp.TCPConnector): Stores the provided TCP connector.
         _timeout (aiohttp.ClientTimeout): Stores the timeout settings from the configuration.
         _cookie_jar (aiohttp.DummyCookieJar): Stores the provided cookie jar for session management.
-        _adapter (Adapter): The adapter used to control rate limiting and concurrency.
         _config (Config): The extracted configuration instance.
         _session_request_limit (int): The maximum number of requests allowed before the session is reset.
         _retries (int): The number of retry attempts allowed for failed requests.
-        _concurrency (int): The initial concurrency level for the session.
-        _proxies (dict): The proxy settings from the configuration.
+        _window (int): The maximum number of in-flight requests when streaming.
+        _adapt_interval (int): The number of completed requests between adapter updates when streaming.
+        _pagination (NestedNamespace): Settings for detecting the end of pagination when streaming.
+        _proxies (ProxyPool): Routes requests across proxies by health and latency.
+        _proxy_fault_statuses (frozenset): Statuses counted as proxy failures.
+        _endpoints (EndpointRegistry): The adapter of each class of endpoint, with the pacer that
+            spreads its requests evenly at its rate, the limiter that caps them at its concurrency
+            and the policy that hedges its slow requests, all within a combined rate and
+            concurrency budget for the session.
+        _retry (RetryScheduler): Holds failed requests out of the limiter while they back off.
+        _decoder (JSONDecoder): Decodes response bodies, moving large bodies off the event loop.
+        _cache (Optional[ResponseCache]): The local response cache, if enabled.
+        _breaker (CircuitBreaker): Fails requests fast while the upstream is failing.
+        _states (Optional[AdapterStateStore]): Saved adapter states by upstream, if warm starts are enabled.
+        _deadline (NestedNamespace): Settings for the soft deadline on each batch in `get`.
         _session_request_count (int): Tracks the number of requests made in the current session.
         _session_active (bool): Indicates whether a session is currently active.
         _session (Optional[aiohttp.ClientSession]): The current aiohttp client session.
         _headers (BrowserHeaders): An iterator for cycling through browser headers.
-        _passport (Optional[StagePassport]): The passport object used for tracking stage details.
         _logger (logging.Logger): Logger instance for the session.
 
     """
@@ -77,7 +154,7 @@ class AsyncSession:
         self,
         connector: aiohttp.TCPConnector,
         cookie_jar: aiohttp.DummyCookieJar,
-        adapter_factor: AdapterFactor,
+        adapter_factory: AdapterFactory,
         config_cls: type[Config] = Config,
     ) -> None:
         """
@@ -96,15 +173,60 @@ class AsyncSession:
             total=self._config.async_session.timeout
         )
         self._cookie_jar = cookie_jar
-        self._adapter = adapter_factor.create()
-        self.monitor = monitor
+        self._adapter_factory = adapter_factory
 
         self._session_request_limit: int = (
             self._config.async_session.session_request_limit
         )
         self._retries: int = self._config.async_session.retries
-        self._concurrency: int = self._config.async_session.concurrency
-        self._proxies = self._config.proxy
+        self._window: int = self._config.async_session.stream.window
+        self._adapt_interval: int = self._config.async_session.stream.adapt_interval
+        self._pagination = self._config.async_session.stream.pagination
+        proxy = self._config.async_session.proxy
+        self._proxies = ProxyPool(
+            urls=self._config.proxies,
+            window=proxy.window,
+            min_samples=proxy.min_samples,
+            error_threshold=proxy.error_threshold,
+            latency_factor=proxy.latency_factor,
+            ejection_time=proxy.ejection_time,
+            max_ejection_time=proxy.max_ejection_time,
+        )
+        self._proxy_fault_statuses = frozenset(proxy.fault_statuses)
+        self._endpoints = EndpointRegistry(
+            adapter_factory=adapter_factory,
+            rate=self._config.async_session.pacer.rate,
+            burst=self._config.async_session.pacer.burst,
+            concurrency=self._config.async_session.concurrency,
+            max_rate=self._config.async_session.endpoints.rate,
+            max_concurrency=self._config.async_session.endpoints.concurrency,
+            isolated=self._config.async_session.endpoints.isolated,
+            hedge=self._config.async_session.hedge,
+        )
+        retry = self._config.async_session.retry
+        self._retry = RetryScheduler(
+            policy=RetryPolicy(
+                attempts=self._retries,
+                base=retry.base,
+                cap=retry.cap,
+                retry_after_cap=retry.retry_after_cap,
+                no_retry=retry.no_retry,
+                backoff=retry.backoff,
+            ),
+            priority=retry.priority,
+        )
+        self._decoder = JSONDecoder(
+            threshold=self._config.async_session.decoder.threshold,
+            executor=self._config.async_session.decoder.executor,
+            max_workers=self._config.async_session.decoder.max_workers,
+            backend=self._config.async_session.decoder.backend,
+        )
+        self._cache: Optional[ResponseCache] = self._create_cache()
+        self._breaker = CircuitBreaker.from_config(self._config.circuit_breaker)
+        # The short circuit of each job fetched in batches, by job id.
+        self._job_short_circuits: Dict[str, ShortCircuit] = {}
+        self._deadline = self._config.async_session.deadline
+        self._states: Optional[AdapterStateStore] = self._create_state_store()
 
         self._session_request_count: int = 0
         self._session_active = False
@@ -113,6 +235,27 @@ class AsyncSession:
 
         self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+    @property
+    def monitor(self) -> ExtractMonitorDecorator:
+        """Returns the extract monitor that records the session's metrics."""
+        return cast(ExtractMonitorDecorator, _container().monitor.metrics_extract())
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Returns the circuit breaker, e.g. to check whether the job was short-circuited."""
+        return self._breaker
+
+    @property
+    def adapter(self) -> Adapter:
+        """Returns the adapter of the first endpoint requested, e.g. to report the stage and
+        session control it settled on."""
+        return self._endpoints.primary.adapter
+
+    @property
+    def endpoints(self) -> EndpointRegistry:
+        """Returns the endpoints, e.g. to export their metrics or attach a rate budget shared across processes."""
+        return self._endpoints
+
     async def __enter__(self) -> None:
         """
         Asynchronous context manager entry point. Initializes the aiohttp client session.
@@ -130,134 +273,968 @@ class AsyncSession:
         if self._session:
             await self._session.close()
             self._session_active = False
+        self._decoder.close()
+        if self._cache is not None:
+            self._cache.close()
+        metrics = self._breaker.metrics
+        if metrics.transitions or metrics.short_circuit:
+            self._logger.info(f"Circuit breaker: {metrics}")
+        for endpoint in self._endpoints:
+            self._logger.info(f"Endpoint: {endpoint.metrics}")
+            if endpoint.hedge.metrics.hedges:
+                self._logger.info(f"Hedging {endpoint.key}: {endpoint.hedge.metrics}")
+            self._save_state(endpoint=endpoint)
 
     async def get(self, async_request: AsyncRequest[Request]) -> AsyncResponse:
         """
         Executes asynchronous HTTP GET requests and processes the responses.
 
         This method manages the rate and concurrency adaptation and processes multiple requests concurrently
-        using the adapter and semaphore to throttle concurrency.
+        using the adapter and the concurrency limiter to throttle concurrency.
+
+        The batch is given a soft deadline derived from the current latency distribution. Requests
+        still pending at the deadline are cancelled and requeued with the generator that drew the
+        batch, so that one slow page does not hold up the batch and is fetched in a later one.
+        They are also returned as stragglers on the response. A request that has already been
+        requeued `max_requeues` times is awaited until it completes or the client timeout
+        expires. A batch that has no generator to requeue with gets no deadline, so no page is
+        dropped.
+
+        A batch is drawn from one request generator, so it is adapted as one class of endpoint,
+        that of its first request.
+
+        Each job has a short circuit of its own, kept across the batches it is fetched in, so
+        one job's run of 404s or errors does not stop the jobs that follow it on the session.
+        The job is identified by the batch's context, and a batch without one is a job of its
+        own. Once the short circuit trips, the job's remaining requests are rejected, the trip
+        is logged, and the job's next batch raises `ShortCircuitError`.
 
         Args:
             async_request (AsyncRequest[Request]): The asynchronous request object containing multiple requests.
 
         Returns:
-            AsyncResponse: The response object containing all processed responses and related metadata.
-        """
-        # Create a passport for this stage
-        self._passport = async_request.passport.creator
+            AsyncResponse: The response object containing all processed responses, the stragglers,
+                and related metadata.
 
+        Raises:
+            ShortCircuitError: If the circuit breaker short-circuited the batch's job.
+        """
+        short_circuit = self._job_short_circuit(async_request=async_request)
+        if short_circuit.tripped:
+            raise ShortCircuitError(reason=str(short_circuit.reason))
         # Initialize the adapter for automatic rate limiting and concurrency throttling
-        self._adapter.initialize(async_request=async_request)
-        # Create a semaphore with the current concurrency value.
-        semaphore = asyncio.Semaphore(self._concurrency)
+        endpoint = (
+            self._endpoint(async_request.requests[0])
+            if async_request.requests
+            else self._endpoints.primary
+        )
+        endpoint.adapter.initialize(async_request=async_request)
         # Assemble the async tasks from the requests
-        tasks = [
-            self.make_request(request, semaphore) for request in async_request.requests
-        ]
+        tasks = {
+            asyncio.ensure_future(
+                self._send(request, short_circuit=short_circuit)
+            ): request
+            for request in async_request.requests
+        }
+        # Stragglers can only be cancelled if there is a generator to requeue them with
+        requeue = getattr(async_request.request_gen, "requeue", None)
+        deadline = (
+            self._batch_deadline(endpoint=endpoint, requests=len(tasks))
+            if requeue is not None
+            else None
+        )
         # Make the requests
-        responses = await self._make_async_request(tasks)
+        responses = await self._make_async_request(
+            tasks, endpoint=endpoint, deadline=deadline
+        )
         # Execute rate and concurrency adaption
-        await self._adapt_rate_concurrency(responses=responses)
+        await self._adapt_rate_concurrency(endpoint=endpoint, responses=responses)
 
         # Package the responses for the trip back
-        async_response = AsyncResponse(stage_passport=self._passport)
+        async_response = AsyncResponse(context=async_request.context)
         async_response.add_responses(responses=responses)
+        async_response.stragglers = [
+            request for task, request in tasks.items() if task.cancelled()
+        ]
+        if async_response.stragglers and requeue is not None:
+            requeue(async_response.stragglers)
+            self._logger.debug(
+                f"{len(async_response.stragglers)} requests missed the batch deadline and were requeued."
+            )
+
+        if short_circuit.tripped:
+            self._logger.warning(
+                f"Job {self._job_id(async_request)} short-circuited: {short_circuit.reason}."
+            )
 
         # Increment the number of requests processed. The session
         # will be recreated once a threshold of requests is reached.
         self._session_request_count += async_request.request_count
 
         # Check if it's time to rotate / reset sessions
-        if self._reset_session_if_expired():
-            await self._create_session()
+        await self._reset_session_if_expired()
 
         return async_response
 
-    @monitor.stage
+    async def stream(
+        self,
+        request_gen: RequestGen[AsyncRequest[Request]],
+        planner: Optional[PaginationPlanner] = None,
+    ) -> AsyncIterator[Response]:
+        """
+        Streams responses through a bounded in-flight window as they complete.
+
+        Unlike `get`, there is no per-batch barrier. Requests are drawn lazily from the
+        request generator and submitted whenever the number of in-flight requests falls
+        below the window, and each response is yielded as soon as it completes. Rate and
+        concurrency adaptation runs every `adapt_interval` completed requests. Sessions are
+        rotated only once the window has drained, so in-flight requests are never orphaned.
+
+        While the circuit breaker is not closed, one request is sent at a time and the stream
+        waits for the breaker rather than drawing requests only to fail them fast. Each stream
+        is a new job for the breaker's short circuit, so a job short-circuited earlier in the
+        session does not stop it. If the breaker short-circuits the job, no further requests
+        are drawn and, once the in-flight requests complete, `ShortCircuitError` is raised,
+        so a job cut short is not mistaken for one that finished.
+
+        Each completed page is classified by the pagination planner. Before streaming, the
+        planner probes for the last page, and the probed pages with data are yielded rather
+        than requested again. Once the end is known, no further requests are drawn and the
+        in-flight requests for pages past the end are cancelled.
+
+        Given a `FairRequestGen`, the jobs it multiplexes share the window. Each job is probed
+        and planned separately, concurrently, and a job whose end is known is finished while
+        the others continue. Each job also has a short circuit of its own: a job that trips
+        it is retired, unfinished, with the reason as its error, and the others continue.
+        `ShortCircuitError` is only raised for a single request generator.
+
+        Each class of endpoint is adapted separately: its requests pass through its own pacer
+        and limiter, and it adapts every `adapt_interval` of its own completed requests.
+
+        Args:
+            request_gen (RequestGen[AsyncRequest[Request]]): The request generator, e.g.
+                `RequestAppDataGen`, `AppReviewRequestGen` or `FairRequestGen`.
+            planner (Optional[PaginationPlanner]): Detects the end of pagination. Defaults to
+                a planner created from the configuration, if enabled and supported by the
+                request generator.
+
+        Yields:
+            Response: Each successful response, in completion order.
+
+        Raises:
+            ShortCircuitError: If the circuit breaker short-circuited the job.
+        """
+        if not self._session_active:
+            await self._create_session()
+        self._breaker.reset_short_circuit()
+
+        # A fair request generator multiplexes several jobs, each with its own planner.
+        fair = request_gen if isinstance(request_gen, FairRequestGen) else None
+        request_gens: Dict[Optional[str], RequestGen[AsyncRequest[Request]]] = {
+            None: request_gen
+        }
+        if fair is not None:
+            request_gens = {key: gen for key, gen in fair.request_gens.items()}
+        planners: Dict[Optional[str], PaginationPlanner] = {}
+        for key, gen in request_gens.items():
+            lane_planner = planner if fair is None else None
+            lane_planner = lane_planner or self._create_planner(request_gen=gen)
+            if lane_planner is not None:
+                planners[key] = lane_planner
+
+        # Each job of a fair request generator is short-circuited separately.
+        short_circuits: Dict[Optional[str], ShortCircuit] = {
+            key: (
+                self._breaker.create_short_circuit()
+                if fair is not None
+                else self._breaker.short_circuit
+            )
+            for key in request_gens
+        }
+        retired: Set[Optional[str]] = set()
+
+        probed: Set[Tuple[Optional[str], int]] = set()
+        lanes = [key for key, lane_planner in planners.items() if lane_planner.rounds]
+        results = await asyncio.gather(
+            *(
+                self._probe(
+                    request_gen=request_gens[key],
+                    planner=planners[key],
+                    short_circuit=short_circuits[key],
+                )
+                for key in lanes
+            )
+        )
+        for key, pages in zip(lanes, results):
+            for page, (probe, response) in sorted(pages.items()):
+                probed.add((key, page))
+                if fair is not None:
+                    fair.register(key=str(key), request=probe)
+                    fair.complete(request=probe, response=response)
+                if response is not None and not planners[key].is_past_end(page):
+                    yield response
+
+        requests = self._iter_requests(request_gen=request_gen)
+        pending: Dict[asyncio.Future[Optional[Response]], Request] = {}
+        # The responses and completed requests since each endpoint last adapted.
+        responses: Dict[Endpoint, List[Response]] = {}
+        completed: Dict[Endpoint, int] = {}
+        exhausted = False
+
+        try:
+            while pending or not exhausted:
+                # Rotate the session once the in-flight window has drained past the request limit.
+                if not pending and await self._reset_session_if_expired():
+                    self._logger.debug("Session rotated while streaming.")
+
+                if fair is None and self._breaker.short_circuited and not exhausted:
+                    self._logger.warning(
+                        f"Stream short-circuited: {self._breaker.short_circuit.reason}."
+                    )
+                    exhausted = True
+                if fair is not None:
+                    for key, short_circuit in short_circuits.items():
+                        if short_circuit.tripped and key not in retired:
+                            retired.add(key)
+                            self._logger.warning(
+                                f"Job {key} short-circuited: {short_circuit.reason}."
+                            )
+                            fair.retire(
+                                key=str(key),
+                                error=f"Short-circuited: {short_circuit.reason}",
+                            )
+
+                # While the breaker is open or probing, send one request at a time.
+                window = self._window
+                if self._breaker.state != CircuitState.CLOSED:
+                    window = 1
+                    if not pending and not exhausted:
+                        await self._breaker.wait()
+
+                # Top up the in-flight window from the request stream.
+                while (
+                    not exhausted
+                    and len(pending) < window
+                    and self._session_request_count <= self._session_request_limit
+                ):
+                    request = next(requests, None)
+                    if request is None:
+                        exhausted = True
+                        break
+                    key = fair.key_of(request) if fair is not None else None
+                    lane_planner = planners.get(key)
+                    if lane_planner is not None and lane_planner.is_past_end(
+                        request.page
+                    ):
+                        if fair is None:
+                            exhausted = True
+                            break
+                        fair.finish(key=str(key))
+                        continue
+                    if (key, request.page) in probed:
+                        continue
+                    endpoint = self._endpoint(request)
+                    if endpoint not in completed:
+                        endpoint.adapter.initialize(async_request=None)
+                        endpoint.adapter.profile.send()
+                        responses[endpoint] = []
+                        completed[endpoint] = 0
+                    pending[
+                        asyncio.ensure_future(
+                            self._send(request, short_circuit=short_circuits[key])
+                        )
+                    ] = request
+                    endpoint.adapter.profile.requests += 1
+                    self._session_request_count += 1
+
+                if not pending:
+                    continue
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                ended = False
+                for task in done:
+                    request = pending.pop(task)
+                    endpoint = self._endpoint(request)
+                    completed[endpoint] += 1
+                    response = task.result()
+                    key = None
+                    if fair is not None:
+                        key = fair.key_of(request)
+                        fair.complete(request=request, response=response)
+                    lane_planner = planners.get(key)
+                    if lane_planner is not None:
+                        end = lane_planner.end
+                        lane_planner.observe(
+                            page=request.page, status=request.status, response=response
+                        )
+                        ended = ended or lane_planner.end != end
+                        if lane_planner.is_past_end(request.page):
+                            continue
+                    if response is not None:
+                        responses[endpoint].append(response)
+                        yield response
+
+                if ended:
+                    self._cancel_past_end(pending=pending, planners=planners, fair=fair)
+
+                # Adapt rate and concurrency on a rolling basis.
+                for endpoint, count in completed.items():
+                    if count >= self._adapt_interval:
+                        await self._adapt_stream(
+                            endpoint=endpoint, responses=responses[endpoint]
+                        )
+                        responses[endpoint] = []
+                        completed[endpoint] = 0
+
+            for endpoint, count in completed.items():
+                if count:
+                    await self._adapt_stream(
+                        endpoint=endpoint, responses=responses[endpoint]
+                    )
+
+            if fair is None and self._breaker.short_circuited:
+                raise ShortCircuitError(reason=str(self._breaker.short_circuit.reason))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _probe(
+        self,
+        request_gen: RequestGen[AsyncRequest[Request]],
+        planner: PaginationPlanner,
+        short_circuit: Optional[ShortCircuit] = None,
+    ) -> Dict[int, Tuple[Request, Optional[Response]]]:
+        """
+        Locates the end of pagination with rounds of concurrent probes before streaming.
+
+        Args:
+            request_gen (RequestGen[AsyncRequest[Request]]): The request generator, which
+                creates the request for each probed page.
+            planner (PaginationPlanner): The planner that chooses the pages to probe.
+            short_circuit (Optional[ShortCircuit]): The short circuit of the job. Defaults to
+                that of the current job.
+
+        Returns:
+            Dict[int, Tuple[Request, Optional[Response]]]: The request and response for each
+                probed page, by page. The response is None for pages that failed.
+        """
+        probed: Dict[int, Tuple[Request, Optional[Response]]] = {}
+        for _ in range(planner.rounds):
+            pages = [page for page in planner.next_probes() if page not in probed]
+            if not pages:
+                break
+            requests = [request_gen.create_request(page=page) for page in pages]  # type: ignore[attr-defined]
+            results = await asyncio.gather(
+                *(
+                    self.make_request(request, probe=True, short_circuit=short_circuit)
+                    for request in requests
+                )
+            )
+            self._session_request_count += len(requests)
+            for request, response in zip(requests, results):
+                planner.observe(
+                    page=request.page, status=request.status, response=response
+                )
+                if response is not None or request.status == 404:
+                    probed[request.page] = (request, response)
+        self._logger.debug(
+            f"Probed {len(probed)} pages. End of pagination: {planner.end}."
+        )
+        return probed
+
+    def _cancel_past_end(
+        self,
+        pending: Dict[asyncio.Future[Optional[Response]], Request],
+        planners: Dict[Optional[str], PaginationPlanner],
+        fair: Optional[FairRequestGen] = None,
+    ) -> None:
+        """
+        Cancels the in-flight requests for pages past the end of pagination.
+
+        Args:
+            pending (Dict[asyncio.Future[Optional[Response]], Request]): The in-flight
+                requests, by task. Cancelled tasks are removed.
+            planners (Dict[Optional[str], PaginationPlanner]): The planner of each job, by
+                job key, or by None for a single request generator.
+            fair (Optional[FairRequestGen]): The fair request generator the requests were
+                drawn from, if any, which attributes each request to its job.
+        """
+        cancelled = []
+        for task, request in pending.items():
+            key = fair.key_of(request) if fair is not None else None
+            lane_planner = planners.get(key)
+            if lane_planner is not None and lane_planner.is_past_end(request.page):
+                cancelled.append(task)
+        for task in cancelled:
+            task.cancel()
+            request = pending.pop(task)
+            if fair is not None:
+                fair.complete(request=request, response=None)
+        if cancelled:
+            self._logger.debug(
+                f"Cancelled {len(cancelled)} requests past the end of pagination."
+            )
+
+    def _create_planner(
+        self, request_gen: RequestGen[AsyncRequest[Request]]
+    ) -> Optional[PaginationPlanner]:
+        """
+        Creates a pagination planner for a request generator, if enabled.
+
+        Returns:
+            Optional[PaginationPlanner]: The planner, or None if pagination planning is
+                disabled or the request generator cannot create requests for arbitrary pages.
+        """
+        if not self._pagination.enabled or not hasattr(request_gen, "create_request"):
+            return None
+        return PaginationPlanner.from_config(
+            config=self._pagination,
+            start_page=request_gen.bookmark,  # type: ignore[attr-defined]
+            limit=request_gen.limit,  # type: ignore[attr-defined]
+            max_pages=request_gen.max_requests,  # type: ignore[attr-defined]
+        )
+
+    def _iter_requests(
+        self, request_gen: RequestGen[AsyncRequest[Request]]
+    ) -> Iterator[Request]:
+        """
+        Draws requests from a request generator one at a time, without materializing batches.
+
+        Args:
+            request_gen (RequestGen[AsyncRequest[Request]]): The request generator.
+
+        Returns:
+            Iterator[Request]: The requests to submit, in order.
+        """
+        return iter(request_gen.next_request, None)
+
+    async def _adapt_stream(
+        self, endpoint: Endpoint, responses: List[Response]
+    ) -> None:
+        """
+        Closes the current streaming profile, adapts the rate and concurrency, and opens the next profile.
+
+        Args:
+            endpoint (Endpoint): The endpoint to adapt.
+            responses (List[Response]): The successful responses since the last adaptation.
+        """
+        endpoint.adapter.profile.recv()
+        await self._adapt_rate_concurrency(endpoint=endpoint, responses=responses)
+
+        endpoint.adapter.initialize(async_request=None)
+        endpoint.adapter.profile.send()
+
+    @monitor_stage
     async def _make_async_request(
-        self, tasks: List[Awaitable[Response]]
+        self,
+        tasks: Dict[asyncio.Future[Optional[Response]], Request],
+        endpoint: Endpoint,
+        deadline: Optional[float] = None,
     ) -> List[Response]:
         """
-        Executes a list of asynchronous HTTP requests concurrently.
+        Executes a batch of asynchronous HTTP requests concurrently, subject to a soft deadline.
 
         Args:
-            tasks (List[Awaitable[Response]]): A list of asynchronous tasks to gather and execute concurrently.
+            tasks (Dict[asyncio.Future[Optional[Response]], Request]): The request tasks, mapped
+                to their requests.
+            endpoint (Endpoint): The endpoint whose profile times the batch.
+            deadline (Optional[float]): Seconds after which pending requests that may still be
+                requeued are cancelled. If None, every request is awaited.
 
         Returns:
-            List[Response]: A list of responses from the executed requests.
+            List[Response]: The successful responses from the requests that completed.
         """
-        self._adapter.profile.send()
-        responses = await asyncio.gather(*tasks)
-        self._adapter.profile.recv()
-        return responses
+        endpoint.adapter.profile.send()
+        pending = set(tasks)
+        if deadline is not None and pending:
+            _, pending = await asyncio.wait(pending, timeout=deadline)
+            stragglers = {
+                task
+                for task in pending
+                if tasks[task].requeues < self._deadline.max_requeues
+            }
+            for task in stragglers:
+                task.cancel()
+            pending -= stragglers
+        # Awaits the remaining requests and lets the cancellations release their slots.
+        await asyncio.gather(*tasks, return_exceptions=True)
+        endpoint.adapter.profile.recv()
+        return [
+            response
+            for response in (task.result() for task in tasks if not task.cancelled())
+            if response is not None
+        ]
 
-    async def _adapt_rate_concurrency(self, responses: List[Response]) -> None:
+    def _batch_deadline(self, endpoint: Endpoint, requests: int) -> Optional[float]:
         """
-        Adapts the request rate and concurrency based on response performance.
+        Computes the soft deadline for a batch from the current latency distribution.
+
+        The deadline allows for the batch to be sent at the lesser of the pacer's rate and the
+        throughput the concurrency limit allows at the median latency, plus `factor` times the
+        configured latency percentile for the last requests to complete.
 
         Args:
+            endpoint (Endpoint): The endpoint requested by the batch.
+            requests (int): The number of requests in the batch.
+
+        Returns:
+            Optional[float]: The deadline in seconds, or None if deadlines are disabled or there
+                is no latency history yet.
+        """
+        if not self._deadline.enabled or not requests:
+            return None
+        latency = endpoint.adapter.get_latency_percentile(
+            percentile=self._deadline.percentile, time_window=self._deadline.window
+        )
+        median = endpoint.adapter.get_latency_percentile(
+            percentile=50, time_window=self._deadline.window
+        )
+        if latency <= 0 or median <= 0:
+            return None
+        throughput = min(endpoint.pacer.rate, endpoint.limiter.limit / median)
+        send_time = requests / throughput if throughput > 0 else 0.0
+        return max(
+            self._deadline.min_deadline, send_time + self._deadline.factor * latency
+        )
+
+    async def _adapt_rate_concurrency(
+        self, endpoint: Endpoint, responses: List[Response]
+    ) -> None:
+        """
+        Adapts the request rate and concurrency of an endpoint based on response performance.
+
+        The adapter applies the new rate to the endpoint's pacer and the new concurrency to
+        its limiter immediately, so requests already waiting are admitted under the new settings.
+
+        Args:
+            endpoint (Endpoint): The endpoint the responses came from.
             responses (List[Response]): The list of responses from the executed requests.
         """
-        self._adapter.update_profile(responses=responses)
-        self._adapter.adapt_requests()
-        delay = self._adapter.session_control.delay
-        await asyncio.sleep(delay)
-        self._concurrency = int(self._adapter.session_control.concurrency)
+        endpoint.adapter.update_profile(responses=responses)
+        endpoint.adapter.adapt_requests()
+        hedge = endpoint.hedge
+        if hedge.enabled:
+            hedge.update(
+                latency=endpoint.adapter.get_latency_percentile(
+                    percentile=hedge.percentile, time_window=hedge.window
+                )
+            )
+
+    async def _send(
+        self, request: Request, short_circuit: Optional[ShortCircuit] = None
+    ) -> Optional[Response]:
+        """
+        Makes a request, hedging it if it is outstanding for longer than its endpoint's hedge delay.
+
+        A hedge is a duplicate of the request, sent once the original has been in flight for
+        the hedge delay, measured from when its current attempt was sent. Each class of
+        endpoint has its own hedge delay, tracking its own latency percentile, and its own budget.
+        The first successful response wins and the other request is cancelled. If the first
+        to complete fails, the other is awaited. Hedges are counted as requests in the
+        adapter's profile and the session's request count, and are capped by the hedge budget.
+        A hedge takes its token from the endpoint's pacer before it is sent. If no token is
+        available at once, the request is not hedged, so hedges never exceed the rate.
+
+        Args:
+            request (Request): The request object containing the request details.
+            short_circuit (Optional[ShortCircuit]): The short circuit of the request's job.
+                Defaults to that of the current job.
+
+        Returns:
+            Optional[Response]: The first successful response, or None if every request failed.
+        """
+        endpoint = self._endpoint(request)
+        hedge = endpoint.hedge
+        if not hedge.enabled:
+            return await self.make_request(request, short_circuit=short_circuit)
+
+        hedge.send()
+        primary = asyncio.ensure_future(
+            self.make_request(request, short_circuit=short_circuit)
+        )
+        tasks = {primary}
+        try:
+            delay = hedge.delay
+            if delay is None:
+                return await primary
+            # Time spent waiting for the pacer or limiter does not count towards the delay.
+            while True:
+                elapsed = (
+                    (datetime.now() - request.sent).total_seconds()
+                    if request.sent
+                    else 0.0
+                )
+                if request.sent and elapsed >= delay:
+                    break
+                done, _ = await asyncio.wait(tasks, timeout=delay - elapsed)
+                if done:
+                    return primary.result()
+            if not hedge.acquire():
+                return await primary
+            if not endpoint.pacer.try_acquire():
+                hedge.throttle()
+                return await primary
+
+            duplicate = copy.copy(request)
+            duplicate_task = asyncio.ensure_future(
+                self.make_request(duplicate, hedge=True, short_circuit=short_circuit)
+            )
+            tasks.add(duplicate_task)
+            endpoint.adapter.profile.requests += 1
+            self._session_request_count += 1
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    response = task.result()
+                    if response is not None:
+                        if task is duplicate_task:
+                            hedge.win()
+                            request.status = duplicate.status
+                        return response
+            return None
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     @log_error
-    @monitor.event
+    @monitor_event
     async def make_request(
-        self, request: Request, semaphore: asyncio.Semaphore
+        self,
+        request: Request,
+        hedge: bool = False,
+        probe: bool = False,
+        short_circuit: Optional[ShortCircuit] = None,
     ) -> Optional[Response]:
         """
         Makes an individual HTTP GET request and processes the response.
 
-        This method uses the provided semaphore to limit the number of concurrent requests.
-        It retries the request based on the configured retry policy if necessary.
+        Each attempt holds a slot from the concurrency limiter of the request's endpoint to cap
+        the number of in-flight requests, and acquires a token from its pacer so that requests
+        are spread evenly at the endpoint's current rate. The slot and the token are also taken
+        from the session's combined budget, shared by every endpoint. A failed attempt releases its slot before backing off, so
+        requests that are waiting to retry do not consume the concurrency budget. Whether and
+        when to retry is decided by the retry policy: statuses that cannot succeed, such as
+        404, are not retried, and throttling responses honor `Retry-After`. Retries re-enter
+        the limiter at a lower priority than fresh requests. Each attempt is routed through the
+        proxy pool, and its outcome is recorded against the proxy that carried it. The status
+        of every attempt sent, including failures, is counted in the endpoint adapter's
+        profile, so errors and throttling feed back into adaptation.
+
+        Every attempt passes through the circuit breaker. While the breaker is open, or
+        half-open and not due a probe, the request fails fast without being sent, so a
+        failing upstream does not consume retries and backoff. The 404s of pagination probes
+        are expected, so they do not count towards short-circuiting the job.
+
+        If the response cache is enabled, a fresh cached page is returned without a request, and
+        a stale one is revalidated with `If-None-Match` / `If-Modified-Since`; on a 304 the cached
+        body is returned.
+
+        A hedge is admitted by the limiter ahead of other requests. Its first attempt is sent
+        on the pacer token that `_send` reserved for it, without waiting behind the queued
+        requests, since it only helps if it is sent at once. Its retries wait for the pacer
+        like any other request. The hedge budget bounds the extra load.
 
         Args:
             request (Request): The request object containing the request details.
-            semaphore (asyncio.Semaphore): Semaphore to limit concurrent requests.
+            hedge (bool): Whether the request duplicates a slow request. Defaults to False.
+            probe (bool): Whether the request probes for the end of pagination. Defaults to False.
+            short_circuit (Optional[ShortCircuit]): The short circuit of the request's job.
+                Defaults to that of the current job.
 
         Returns:
-            Optional[Response]: The response object if the request is successful; None if all retries are exhausted.
+            Optional[Response]: The response object if the request is successful; None if the
+                request failed and is not retried.
         """
-        headers = request.headers or next(self._headers)
-        attempts = 0
+        endpoint = self._endpoint(request)
+        base_headers = request.headers or next(self._headers)
+        headers = base_headers
+        attempt = 0
+        priority = -1 if hedge else 0
+
+        key = ""
+        entry: Optional[CacheEntry] = None
+        if self._cache is not None:
+            key = self._cache.make_key(url=request.baseurl, params=request.params)
+            entry = self._cache.get(key)
+            if entry is not None and entry.is_fresh(ttl=self._cache.ttl):
+                response = await self._serve_cached(request=request, entry=entry)
+                if response is not None:
+                    response.cached = True
+                    self._cache.hits += 1
+                    request.status = 200
+                    return response
+                entry = None
+            if entry is not None:
+                headers = {**headers, **self._cache.conditional_headers(entry)}
 
-        async with semaphore:
-            while attempts < self._retries:
+        while True:
+            if not self._breaker.allow(short_circuit=short_circuit):
+                self._logger.debug(
+                    f"Circuit breaker is {self._breaker.state.value.lower()}. Failing fast after {attempt} attempt(s)."
+                )
+                return None
+            async with endpoint.slot(priority=priority):
+                proxy = self._proxies.select()
                 try:
                     if self._session:
+                        # The first attempt of a hedge was paced when it was reserved.
+                        if not (hedge and attempt == 0):
+                            await endpoint.pacer.acquire()
+                        endpoint.requests += 1
+                        start = time.perf_counter()
+                        request.sent = datetime.now()
                         async with self._session.get(
                             headers=headers,
                             url=request.baseurl,
-                            proxy=self._proxies,
+                            proxy=proxy.url if proxy else None,
                             params=request.params,
                         ) as resp:
                             resp.raise_for_status()
-                            if self.passport:
-                                response = Response(stage_passport=self.passport)
+                            if resp.status == 304 and entry is not None:
+                                response = await self._revalidate(
+                                    request=request, entry=entry, resp=resp
+                                )
+                                if response is None:
+                                    # The cached body was lost, so fetch the page in full.
+                                    entry, headers = None, base_headers
+                                    continue
                             else:
-                                msg = (
-                                    "The passport is None. Expected type StagePassport."
+                                response = Response(context=request.context)
+                                await response.parse_response(
+                                    response=resp, decoder=self._decoder
                                 )
-                                self._logger.exception(msg)
-                                raise RuntimeError(msg)
-                            await response.parse_response(response=resp)
+                                if self._cache is not None and resp.status == 200:
+                                    self._cache.put(
+                                        key=key,
+                                        body=await resp.read(),
+                                        headers=resp.headers,
+                                    )
+                            response.latency = time.perf_counter() - start
+                            self._proxies.record(
+                                proxy=proxy, latency=response.latency, failed=False
+                            )
+                            self._breaker.record(
+                                status=resp.status,
+                                short_circuit=short_circuit,
+                                probe=probe,
+                            )
+                            request.status = resp.status
+                            endpoint.adapter.profile.add_status(resp.status)
+                            endpoint.responses += 1
                             return response
                     else:
                         msg = "Session object is None"
                         self._logger.exception(msg)
                         raise TypeError(msg)
 
-                except Exception:
-                    attempts += 1
-                    await asyncio.sleep(2**attempts)  # Exponential backoff
+                except Exception as e:
+                    error = e
+                    self._proxies.record(
+                        proxy=proxy, latency=None, failed=self._is_proxy_fault(e)
+                    )
+                    request.status = RetryPolicy.classify(e)[0]
+                    self._breaker.record(
+                        status=request.status, short_circuit=short_circuit, probe=probe
+                    )
+                    endpoint.adapter.profile.add_status(request.status)
+
+            # The slot is released while backing off.
+            attempt += 1
+            if not await self._retry.backoff(exc=error, attempt=attempt):
+                # Probes and 404s past the end of pagination are expected, so they are not errors.
+                level = (
+                    logging.DEBUG if probe or request.status == 404 else logging.ERROR
+                )
+                self._logger.log(
+                    level,
+                    f"Request failed after {attempt} attempt(s). Returning to calling environment.\n{error}",
+                )
+                return None
+            priority = self._retry.priority
+
+    def _is_proxy_fault(self, error: Exception) -> bool:
+        """
+        Returns whether a failed attempt is attributable to the proxy rather than the server.
+
+        Connection errors and timeouts, and statuses such as 407 and 429 that depend on the
+        exit address, count against the proxy. Other statuses, such as 404, do not.
+
+        Args:
+            error (Exception): The exception raised by the attempt.
+        """
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in self._proxy_fault_statuses
+        return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+    async def _serve_cached(
+        self, request: Request, entry: CacheEntry
+    ) -> Optional[Response]:
+        """
+        Builds a response from a cached page.
+
+        Args:
+            request (Request): The request the page answers.
+            entry (CacheEntry): The cache entry for the page.
+
+        Returns:
+            Optional[Response]: The response, or None if the cached body could not be read.
+        """
+        if self._cache is None:
+            return None
+        body = self._cache.read(entry)
+        if body is None:
+            return None
+        response = Response(context=request.context)
+        await response.parse_cached(
+            headers=entry.headers, body=body, decoder=self._decoder
+        )
+        return response
+
+    async def _revalidate(
+        self, request: Request, entry: CacheEntry, resp: aiohttp.ClientResponse
+    ) -> Optional[Response]:
+        """
+        Serves a cached page after the server confirmed it is unchanged with a 304.
+
+        Args:
+            request (Request): The request the page answers.
+            entry (CacheEntry): The revalidated cache entry.
+            resp (aiohttp.ClientResponse): The 304 response.
+
+        Returns:
+            Optional[Response]: The response built from the cached page, or None if the cached
+                body was lost after the request was sent.
+        """
+        if self._cache is not None:
+            self._cache.refresh(entry=entry, headers=resp.headers)
+        response = await self._serve_cached(request=request, entry=entry)
+        if response is not None and self._cache is not None:
+            self._cache.revalidated += 1
+        return response
+
+    def _create_state_store(self) -> Optional[AdapterStateStore]:
+        """
+        Creates the store of adapter states under the OPS_DIRECTORY directory, if enabled.
+
+        Returns:
+            Optional[AdapterStateStore]: The store, or None if warm starts are disabled.
+
+        Raises:
+            EnvironmentError: If warm starts are enabled and OPS_DIRECTORY is not set.
+        """
+        config = self._config.async_session.warm_start
+        if not config.enabled:
+            return None
+        directory = os.getenv("OPS_DIRECTORY")
+        if not directory:
+            msg = "Environment variable OPS_DIRECTORY is not set."
+            self._logger.error(msg)
+            raise EnvironmentError(msg)
+        return AdapterStateStore(
+            directory=os.path.join(directory, config.directory), max_age=config.max_age
+        )
+
+    def _endpoint(self, request: Request) -> Endpoint:
+        """
+        Returns the endpoint that serves a request, warm-starting its adapter from the state
+        saved for it, if any, and fresh, the first time the class of endpoint is requested.
+
+        Args:
+            request (Request): The request.
+        """
+        key = request.endpoint
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints.add(key)
+            if endpoint.key == key:
+                self._warm_start(endpoint=endpoint)
+        return endpoint
+
+    def _job_short_circuit(self, async_request: AsyncRequest[Request]) -> ShortCircuit:
+        """
+        Returns the short circuit of the job a batch belongs to, created with the job's first batch.
+
+        Args:
+            async_request (AsyncRequest[Request]): The batch. A batch without a context is a
+                job of its own.
+        """
+        job_id = self._job_id(async_request)
+        if job_id is None:
+            return self._breaker.create_short_circuit()
+        short_circuit = self._job_short_circuits.get(job_id)
+        if short_circuit is None:
+            short_circuit = self._breaker.create_short_circuit()
+            self._job_short_circuits[job_id] = short_circuit
+        return short_circuit
 
-            self._logger.error("Exhausted retries. Returning to calling environment.")
+    @staticmethod
+    def _job_id(async_request: AsyncRequest[Request]) -> Optional[str]:
+        """Returns the id of the job a batch belongs to, or None if it has no context."""
+        context = async_request.context
+        return context.job_id if context is not None else None
+
+    def _state_key(self, endpoint: Endpoint) -> str:
+        """Returns the upstream of an endpoint, as host/request type/storefront/proxy."""
+        return f"{endpoint.key}/{self._proxies.name}"
+
+    def _warm_start(self, endpoint: Endpoint) -> None:
+        """
+        Warm-starts the adapter of an endpoint from the state saved for its upstream, if any, and fresh.
+
+        Args:
+            endpoint (Endpoint): The endpoint, when first requested.
+        """
+        if self._states is None:
+            return
+        state = self._states.get(self._state_key(endpoint))
+        if state is not None:
+            self._adapter_factory.warm_start(adapter=endpoint.adapter, state=state)
+
+    def _save_state(self, endpoint: Endpoint) -> None:
+        """Saves the operating point of an endpoint's adapter for its upstream, if it has converged."""
+        if self._states is None or endpoint.key is None:
+            return
+        key = self._state_key(endpoint)
+        state = endpoint.adapter.get_state(key=key)
+        if state is None:
+            return
+        try:
+            self._states.set(state)
+        except OSError as e:
+            self._logger.warning(f"Adapter state for {key} was not saved: {e}")
+
+    def _create_cache(self) -> Optional[ResponseCache]:
+        """
+        Creates the local response cache under the OPS_DIRECTORY directory, if enabled.
+
+        Returns:
+            Optional[ResponseCache]: The cache, or None if caching is disabled.
+
+        Raises:
+            EnvironmentError: If caching is enabled and OPS_DIRECTORY is not set.
+        """
+        config = self._config.async_session.cache
+        if not config.enabled:
             return None
+        directory = os.getenv("OPS_DIRECTORY")
+        if not directory:
+            msg = "Environment variable OPS_DIRECTORY is not set."
+            self._logger.error(msg)
+            raise EnvironmentError(msg)
+        return ResponseCache(
+            directory=os.path.join(directory, config.directory),
+            ttl=config.ttl,
+            max_bytes=config.max_bytes,
+            flush_every=config.flush_every,
+        )
 
     async def _create_session(self) -> None:
         """
@@ -275,13 +1252,14 @@ class AsyncSession:
                 self._session = aiohttp.ClientSession(
                     connector=self._connector,
                     timeout=self._timeout,
-                    trust_env=self._config.async_session.trust_env,
-                    raise_for_status=self._config.async_session.raise_for_status,
+                    trust_env=self._config.async_session.session.trust_env,
+                    raise_for_status=self._config.async_session.session.raise_for_status,
+                    connector_owner=self._config.async_session.session.connector_owner,
                     cookie_jar=self._cookie_jar,
                 )
                 self._session_request_count = 0
                 self._session_active = True
-                break
+                return
             except aiohttp.ClientError as e:
                 attempt += 1
                 msg = f"Attempt to create an aiohttp.ClientSession failed.\n{e}\nRetry #: {attempt}"
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/breaker.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:43:17 pm                                                #
+# Modified   : Friday October 16th 2026 08:48:06 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Circuit Breaker Module"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from acquire.core.data import DataClass
+from acquire.core.enum import CircuitState
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  CIRCUIT BREAKER METRICS                                         #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CircuitBreakerMetrics(DataClass):
+    """State transition metrics for a circuit breaker.
+
+    Attributes:
+        state (str): The current state.
+        transitions (Dict[str, int]): The number of transitions, keyed by e.g. "Closed->Open".
+        requests (int): Attempts recorded while closed or half-open.
+        probes (int): Attempts admitted while half-open.
+        rejected (int): Attempts failed fast while open or half-open. These are the
+            requests the breaker saved.
+        seconds_open (float): Total seconds spent open or half-open.
+        short_circuit (Optional[str]): Why the most recent job was short-circuited, if it was.
+    """
+
+    state: str = CircuitState.CLOSED.value
+    transitions: Dict[str, int] = field(default_factory=dict)
+    requests: int = 0
+    probes: int = 0
+    rejected: int = 0
+    seconds_open: float = 0.0
+    short_circuit: Optional[str] = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     OUTCOME WINDOW                                               #
+# ------------------------------------------------------------------------------------------------ #
+class OutcomeWindow:
+    """Counts flagged outcomes over the last `span` seconds.
+
+    Running counts keep recording and reading the rate O(1) amortized, since the breaker
+    updates its windows on every attempt.
+
+    Args:
+        span (float): The window length in seconds.
+    """
+
+    def __init__(self, span: float) -> None:
+        self._span = span
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._flagged = 0
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    def add(self, now: float, flagged: bool) -> None:
+        """Records an outcome and drops those older than the window."""
+        self._outcomes.append((now, flagged))
+        self._flagged += int(flagged)
+        while self._outcomes and self._outcomes[0][0] < now - self._span:
+            self._flagged -= int(self._outcomes.popleft()[1])
+
+    def rate(self) -> float:
+        """Returns the proportion of outcomes in the window that are flagged."""
+        return self._flagged / len(self._outcomes) if self._outcomes else 0.0
+
+    def clear(self) -> None:
+        self._outcomes.clear()
+        self._flagged = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      SHORT CIRCUIT                                               #
+# ------------------------------------------------------------------------------------------------ #
+class ShortCircuit:
+    """Decides from one job's 404 and error rates that its requests cannot succeed.
+
+    A short circuit is scoped to a job, so one job's run of 404s or errors does not stop
+    the jobs that follow it on the same session, or run alongside it. Once tripped, it
+    stays tripped; the job's remaining requests are rejected and the job should stop.
+
+    Args:
+        not_found_threshold (float): The 404 rate above which the job is short-circuited.
+        not_found_window_size (float): Seconds of outcomes over which the 404 rate is computed.
+        errors_threshold (float): The error rate above which the job is short-circuited.
+        errors_window_size (float): Seconds of outcomes over which the error rate is computed.
+        min_requests (int): The outcomes required in a window before its rate is acted upon.
+    """
+
+    def __init__(
+        self,
+        not_found_threshold: float,
+        not_found_window_size: float,
+        errors_threshold: float,
+        errors_window_size: float,
+        min_requests: int,
+    ) -> None:
+        self._404s_threshold = not_found_threshold
+        self._errors_threshold = errors_threshold
+        self._min_requests = min_requests
+        self._404s = OutcomeWindow(span=not_found_window_size)
+        self._errors = OutcomeWindow(span=errors_window_size)
+        self._reason: Optional[str] = None
+
+    @property
+    def tripped(self) -> bool:
+        """Returns whether the job has been short-circuited."""
+        return self._reason is not None
+
+    @property
+    def reason(self) -> Optional[str]:
+        """Returns why the job was short-circuited, or None if it was not."""
+        return self._reason
+
+    def record(
+        self, now: float, not_found: bool, error: bool, probe: bool = False
+    ) -> bool:
+        """Records the outcome of an attempt.
+
+        Args:
+            now (float): The clock time of the outcome.
+            not_found (bool): Whether the attempt returned a 404.
+            error (bool): Whether the attempt failed.
+            probe (bool): Whether the attempt probed for the end of pagination. Probes look
+                for the last page, so their 404s are expected and are not counted.
+
+        Returns:
+            bool: Whether this outcome tripped the short circuit.
+        """
+        if self.tripped:
+            return False
+        if not probe:
+            self._404s.add(now=now, flagged=not_found)
+        self._errors.add(now=now, flagged=error)
+        if (
+            len(self._404s) >= self._min_requests
+            and self._404s.rate() > self._404s_threshold
+        ):
+            self._reason = f"404 rate {round(self._404s.rate(), 2)}"
+        elif (
+            len(self._errors) >= self._min_requests
+            and self._errors.rate() > self._errors_threshold
+        ):
+            self._reason = f"error rate {round(self._errors.rate(), 2)}"
+        return self.tripped
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     CIRCUIT BREAKER                                              #
+# ------------------------------------------------------------------------------------------------ #
+class CircuitBreaker:
+    """Fails requests fast while the upstream is failing, and stops jobs that cannot succeed.
+
+    The breaker starts closed, passing every request. Each attempt's outcome is recorded
+    over time-based windows. Once closed for `closed_burnin_period` seconds, the breaker
+    opens if the error rate over the last `closed_window_size` seconds exceeds
+    `closed_failure_rate_threshold`.
+
+    While open, every attempt is rejected without a request being sent, so failing
+    requests do not burn their retries and backoff. After `open_cooldown_period` seconds
+    the breaker goes half-open and admits one probe every `half_open_delay` seconds,
+    rejecting the rest. Once `min_requests` probes have been recorded within the last
+    `half_open_window_size` seconds, it closes if their error rate is at most
+    `half_open_failure_rate_threshold`, and opens again otherwise.
+
+    Independently of state, the breaker short-circuits a job when, over their windows,
+    the 404 rate exceeds `short_circuit_404s_failure_rate_threshold` or the error rate
+    exceeds `short_circuit_errors_failure_rate_threshold`. A short-circuited job's attempts
+    are all rejected; the job should stop. Short circuits are scoped to a job: attempts are
+    recorded against the breaker's current `ShortCircuit`, or one passed for the job, e.g.
+    from `create_short_circuit`. `reset_short_circuit` begins a new job, so one job's
+    outcomes do not stop the jobs that follow it on the same session.
+
+    404s are tracked separately from errors. They mark the end of the data rather than an
+    unhealthy upstream, so they do not open the breaker.
+
+    Args:
+        closed_burnin_period (float): Seconds after closing before the breaker may open.
+        closed_failure_rate_threshold (float): The error rate above which a closed breaker opens.
+        closed_window_size (float): Seconds of outcomes over which a closed breaker's error rate is computed.
+        half_open_delay (float): Seconds between probes while half-open.
+        half_open_failure_rate_threshold (float): The probe error rate above which a half-open breaker reopens.
+        half_open_window_size (float): Seconds of probes over which the half-open error rate is computed.
+        open_cooldown_period (float): Seconds the breaker stays open before probing.
+        short_circuit_404s_failure_rate_threshold (float): The 404 rate above which the job is short-circuited.
+        short_circuit_404s_window_size (float): Seconds of outcomes over which the 404 rate is computed.
+        short_circuit_errors_failure_rate_threshold (float): The error rate above which the job is short-circuited.
+        short_circuit_errors_window_size (float): Seconds of outcomes over which that error rate is computed.
+        min_requests (int): The outcomes required in a window before its rate is acted upon. Defaults to 20.
+        clock (Optional[Callable[[], float]]): A monotonic clock. Defaults to `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        closed_burnin_period: float,
+        closed_failure_rate_threshold: float,
+        closed_window_size: float,
+        half_open_delay: float,
+        half_open_failure_rate_threshold: float,
+        half_open_window_size: float,
+        open_cooldown_period: float,
+        short_circuit_404s_failure_rate_threshold: float,
+        short_circuit_404s_window_size: float,
+        short_circuit_errors_failure_rate_threshold: float,
+        short_circuit_errors_window_size: float,
+        min_requests: int = 20,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        self._closed_burnin_period = closed_burnin_period
+        self._closed_threshold = closed_failure_rate_threshold
+        self._half_open_delay = half_open_delay
+        self._half_open_threshold = half_open_failure_rate_threshold
+        self._open_cooldown_period = open_cooldown_period
+        self._404s_threshold = short_circuit_404s_failure_rate_threshold
+        self._404s_window_size = short_circuit_404s_window_size
+        self._errors_threshold = short_circuit_errors_failure_rate_threshold
+        self._errors_window_size = short_circuit_errors_window_size
+        self._min_requests = min_requests
+        self._clock = clock or time.monotonic
+
+        self._closed = OutcomeWindow(span=closed_window_size)
+        self._probes = OutcomeWindow(span=half_open_window_size)
+        self._short_circuit = self.create_short_circuit()
+
+        self._state = CircuitState.CLOSED
+        self._since = self._clock()
+        self._next_probe = 0.0
+        self._metrics = CircuitBreakerMetrics()
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @classmethod
+    def from_config(cls, config: object) -> CircuitBreaker:
+        """Creates a breaker from the `circuit_breaker` configuration section.
+
+        Args:
+            config (object): The section, e.g. `Config().circuit_breaker`.
+        """
+        return cls(**vars(config))
+
+    @property
+    def state(self) -> CircuitState:
+        """Returns the current state, moving from open to half-open once the cooldown has elapsed."""
+        self._refresh(self._clock())
+        return self._state
+
+    @property
+    def short_circuit(self) -> ShortCircuit:
+        """Returns the short circuit of the current job."""
+        return self._short_circuit
+
+    @property
+    def short_circuited(self) -> bool:
+        """Returns whether the current job has been short-circuited."""
+        return self._short_circuit.tripped
+
+    @property
+    def retry_at(self) -> float:
+        """Returns the clock time at which the breaker will next admit a request."""
+        now = self._clock()
+        self._refresh(now)
+        if self._state == CircuitState.OPEN:
+            return self._since + self._open_cooldown_period
+        if self._state == CircuitState.HALF_OPEN:
+            return max(self._next_probe, now)
+        return now
+
+    @property
+    def metrics(self) -> CircuitBreakerMetrics:
+        """Returns the state transition metrics."""
+        now = self._clock()
+        self._refresh(now)
+        seconds_open = self._metrics.seconds_open
+        if self._state != CircuitState.CLOSED:
+            seconds_open += now - self._since
+        return replace(
+            self._metrics,
+            state=self._state.value,
+            transitions=dict(self._metrics.transitions),
+            seconds_open=seconds_open,
+        )
+
+    def create_short_circuit(self) -> ShortCircuit:
+        """Returns a new short circuit with the breaker's thresholds, e.g. for a job run
+        alongside others."""
+        return ShortCircuit(
+            not_found_threshold=self._404s_threshold,
+            not_found_window_size=self._404s_window_size,
+            errors_threshold=self._errors_threshold,
+            errors_window_size=self._errors_window_size,
+            min_requests=self._min_requests,
+        )
+
+    def reset_short_circuit(self) -> None:
+        """Begins a new job with a short circuit of its own.
+
+        The state is kept, since it describes the upstream rather than the job.
+        """
+        self._short_circuit = self.create_short_circuit()
+        self._metrics.short_circuit = None
+
+    def allow(self, short_circuit: Optional[ShortCircuit] = None) -> bool:
+        """Returns whether the next attempt may be sent, counting it as rejected if not.
+
+        Args:
+            short_circuit (Optional[ShortCircuit]): The short circuit of the attempt's job.
+                Defaults to that of the current job.
+        """
+        if (short_circuit or self._short_circuit).tripped:
+            self._metrics.rejected += 1
+            return False
+        now = self._clock()
+        self._refresh(now)
+        if self._state == CircuitState.CLOSED:
+            return True
+        if self._state == CircuitState.HALF_OPEN and now >= self._next_probe:
+            self._next_probe = now + self._half_open_delay
+            self._metrics.probes += 1
+            return True
+        self._metrics.rejected += 1
+        return False
+
+    async def wait(self) -> None:
+        """Waits until the breaker will next admit a request."""
+        delay = self.retry_at - self._clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record(
+        self,
+        status: Optional[int],
+        short_circuit: Optional[ShortCircuit] = None,
+        probe: bool = False,
+    ) -> None:
+        """Records the outcome of an attempt.
+
+        Args:
+            status (Optional[int]): The HTTP status code, or None if the attempt produced no
+                response, e.g. a timeout or connection error.
+            short_circuit (Optional[ShortCircuit]): The short circuit of the attempt's job.
+                Defaults to that of the current job.
+            probe (bool): Whether the attempt probed for the end of pagination, so that its
+                404 is expected and does not count towards short-circuiting the job.
+        """
+        now = self._clock()
+        self._refresh(now)
+        not_found = status == 404
+        error = status is None or (status >= 400 and not not_found)
+        self._metrics.requests += 1
+        short_circuit = short_circuit or self._short_circuit
+        if short_circuit.record(now=now, not_found=not_found, error=error, probe=probe):
+            self._metrics.short_circuit = short_circuit.reason
+            self._logger.warning(
+                f"Circuit breaker short-circuited the job: {short_circuit.reason}."
+            )
+
+        if self._state == CircuitState.HALF_OPEN:
+            self._record_probe(now=now, error=error)
+        elif self._state == CircuitState.CLOSED:
+            self._closed.add(now=now, flagged=error)
+            rate = self._closed.rate()
+            if (
+                now - self._since >= self._closed_burnin_period
+                and len(self._closed) >= self._min_requests
+                and rate > self._closed_threshold
+            ):
+                self._transition(CircuitState.OPEN, now, f"error rate {round(rate, 2)}")
+
+    def _record_probe(self, now: float, error: bool) -> None:
+        """Closes or reopens a half-open breaker once enough probes have been recorded."""
+        self._probes.add(now=now, flagged=error)
+        if len(self._probes) < self._min_requests:
+            return
+        rate = self._probes.rate()
+        if rate > self._half_open_threshold:
+            self._transition(
+                CircuitState.OPEN, now, f"probe error rate {round(rate, 2)}"
+            )
+        else:
+            self._transition(
+                CircuitState.CLOSED, now, f"probe error rate {round(rate, 2)}"
+            )
+
+    def _refresh(self, now: float) -> None:
+        """Moves an open breaker to half-open once its cooldown has elapsed."""
+        if (
+            self._state == CircuitState.OPEN
+            and now - self._since >= self._open_cooldown_period
+        ):
+            self._transition(CircuitState.HALF_OPEN, now, "cooldown elapsed")
+
+    def _transition(self, state: CircuitState, now: float, reason: str) -> None:
+        """Moves to a new state, recording the transition."""
+        key = f"{self._state.value}->{state.value}"
+        self._metrics.transitions[key] = self._metrics.transitions.get(key, 0) + 1
+        if self._state != CircuitState.CLOSED:
+            self._metrics.seconds_open += now - self._since
+        if state == CircuitState.OPEN:
+            self._logger.warning(f"Circuit breaker opened: {reason}.")
+        else:
+            self._logger.info(f"Circuit breaker {state.value.lower()}: {reason}.")
+        self._state = state
+        self._since = now
+        self._next_probe = now
+        self._probes.clear()
+        if state == CircuitState.CLOSED:
+            # Outcomes from before the breaker opened no longer describe the upstream.
+            self._closed.clear()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/cache.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:29:40 pm                                                #
+# Modified   : Friday October 16th 2026 07:29:40 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""HTTP Response Cache Module"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shelve
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+from acquire.core.data import DataClass
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       CACHE ENTRY                                                #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class CacheEntry(DataClass):
+    """An index entry mapping a request key to a stored response body.
+
+    Attributes:
+        key (str): The request key, derived from the URL and parameters.
+        digest (str): The SHA-256 digest of the body, which addresses the blob on disk.
+        size (int): The size of the body in bytes.
+        headers (Dict[str, str]): The response headers needed to rebuild and revalidate the response.
+        stored (float): The epoch time the body was stored or last revalidated.
+        accessed (float): The epoch time the entry was last read.
+    """
+
+    key: str
+    digest: str
+    size: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored: float = 0.0
+    accessed: float = 0.0
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Returns the entity tag used for revalidation, if the server sent one."""
+        return self.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Returns the last modified date used for revalidation, if the server sent one."""
+        return self.headers.get("Last-Modified")
+
+    def is_fresh(self, ttl: float, now: Optional[float] = None) -> bool:
+        """Returns whether the entry may be served without revalidation.
+
+        Args:
+            ttl (float): The time to live in seconds.
+            now (Optional[float]): The current epoch time. Defaults to now.
+        """
+        now = time.time() if now is None else now
+        return (now - self.stored) < ttl
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      RESPONSE CACHE                                              #
+# ------------------------------------------------------------------------------------------------ #
+class ResponseCache:
+    """A local, content-addressed cache of response bodies with TTL, revalidation and LRU eviction.
+
+    Bodies are stored once per SHA-256 digest under `blobs/`, so identical pages fetched under
+    different keys share a blob. A shelve index maps each request key, derived from the URL and
+    parameters, to a `CacheEntry`. Entries younger than `ttl` are served without a request. Older
+    entries are revalidated with `If-None-Match` / `If-Modified-Since` when the server supplied an
+    `ETag` or `Last-Modified`, so an unchanged page costs a 304 rather than a full body. When the
+    total size of the stored blobs exceeds `max_bytes`, the least recently used entries are evicted.
+
+    Changes to the index are held in memory and written to the shelve in batches of `flush_every`,
+    and on `close`, so the event loop does not open the index for every response. A crash loses at
+    most the last batch of index changes, which only costs fetching those pages again.
+
+    Args:
+        directory (str): The directory holding the index and blobs.
+        ttl (float): Seconds an entry is served without revalidation.
+        max_bytes (int): The maximum total size of the stored blobs in bytes.
+        flush_every (int): The number of index changes held before they are written. Defaults to 100.
+
+    Attributes:
+        _directory (str): The cache directory.
+        _blob_directory (str): The directory holding the blobs.
+        _index_file (str): The shelve file holding the index.
+        _ttl (float): The time to live in seconds.
+        _max_bytes (int): The byte budget.
+        _entries (OrderedDict[str, CacheEntry]): The index, ordered from least to most recently used.
+        _refcounts (Dict[str, int]): The number of entries referencing each blob.
+        _blob_sizes (Dict[str, int]): The size of each blob in bytes.
+        _bytes (int): The total size of the stored blobs.
+        _flush_every (int): The number of index changes held before they are written.
+        _changes (Dict[str, Optional[CacheEntry]]): Index changes not yet written, by key. None
+            marks a removed entry.
+        hits (int): Entries served without a request.
+        revalidated (int): Entries served after a 304.
+        misses (int): Lookups that found no entry.
+    """
+
+    def __init__(
+        self, directory: str, ttl: float, max_bytes: int, flush_every: int = 100
+    ) -> None:
+        self._directory = directory
+        self._blob_directory = os.path.join(directory, "blobs")
+        self._index_file = os.path.join(directory, "index")
+        self._ttl = float(ttl)
+        self._max_bytes = int(max_bytes)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._refcounts: Dict[str, int] = {}
+        self._blob_sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._flush_every = max(1, int(flush_every))
+        self._changes: Dict[str, Optional[CacheEntry]] = {}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+        os.makedirs(self._blob_directory, exist_ok=True)
+        self._load()
+
+    @property
+    def ttl(self) -> float:
+        """Returns the time to live in seconds."""
+        return self._ttl
+
+    @property
+    def size(self) -> int:
+        """Returns the total size of the stored blobs in bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Derives the cache key for a request from its URL and parameters.
+
+        Parameters are sorted so that equivalent requests map to the same key.
+
+        Args:
+            url (str): The request URL.
+            params (Optional[Mapping[str, Any]]): The query parameters.
+        """
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry for a key, marking it as recently used.
+
+        Args:
+            key (str): The request key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        entry.accessed = time.time()
+        self._entries.move_to_end(key)
+        return entry
+
+    def conditional_headers(self, entry: CacheEntry) -> Dict[str, str]:
+        """Returns the request headers that revalidate an entry.
+
+        Args:
+            entry (CacheEntry): The stale entry.
+        """
+        headers: Dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def read(self, entry: CacheEntry) -> Optional[bytes]:
+        """Reads the body of an entry, dropping the entry if its blob is missing.
+
+        Args:
+            entry (CacheEntry): The entry to read.
+
+        Returns:
+            Optional[bytes]: The body, or None if the blob could not be read.
+        """
+        try:
+            with open(self._blob_path(entry.digest), "rb") as file:
+                return file.read()
+        except OSError as e:
+            self._logger.warning(f"Cache blob {entry.digest} could not be read.\n{e}")
+            self._remove(entry.key)
+            return None
+
+    def put(self, key: str, body: bytes, headers: Mapping[str, str]) -> CacheEntry:
+        """Stores a response body under a key, evicting older entries if over budget.
+
+        If the key already holds the same body, e.g. when its TTL expired and the server sent no
+        validators, the entry is refreshed in place and keeps its blob.
+
+        Args:
+            key (str): The request key.
+            body (bytes): The decompressed response body.
+            headers (Mapping[str, str]): The response headers.
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        current = self._entries.get(key)
+        if current is not None and current.digest == digest:
+            current.headers = self._select_headers(headers)
+            current.stored = now
+            current.accessed = now
+            self._entries.move_to_end(key)
+            self._persist(current)
+            return current
+        # The old entry is removed first, so a blob it shared is only kept if still referenced.
+        if current is not None:
+            self._remove(key)
+        if digest not in self._refcounts:
+            self._write_blob(digest=digest, body=body)
+
+        entry = CacheEntry(
+            key=key,
+            digest=digest,
+            size=len(body),
+            headers=self._select_headers(headers),
+            stored=now,
+            accessed=now,
+        )
+        self._add(entry)
+        self._evict()
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Restarts the TTL of an entry after the server confirmed it with a 304.
+
+        Args:
+            entry (CacheEntry): The revalidated entry.
+            headers (Mapping[str, str]): The headers of the 304 response, which may update the validators.
+        """
+        entry.headers.update(self._select_headers(headers))
+        entry.stored = time.time()
+        self._persist(entry)
+        return entry
+
+    def flush(self) -> None:
+        """Writes the pending index changes to the shelve."""
+        if not self._changes:
+            return
+        with shelve.open(self._index_file) as index:
+            for key, entry in self._changes.items():
+                if entry is None:
+                    index.pop(key, None)
+                else:
+                    index[key] = entry
+        self._changes.clear()
+
+    def close(self) -> None:
+        """Writes the pending index changes and the access times, so LRU order survives a restart."""
+        self._changes.update(self._entries)
+        self.flush()
+
+    def _add(self, entry: CacheEntry) -> None:
+        """Adds an entry to the in-memory and persisted index."""
+        self._entries[entry.key] = entry
+        self._refcounts[entry.digest] = self._refcounts.get(entry.digest, 0) + 1
+        if entry.digest not in self._blob_sizes:
+            self._blob_sizes[entry.digest] = entry.size
+            self._bytes += entry.size
+        self._persist(entry)
+
+    def _remove(self, key: str) -> None:
+        """Removes an entry, deleting its blob once no entry references it."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._changes[key] = None
+        self._maybe_flush()
+        self._refcounts[entry.digest] -= 1
+        if self._refcounts[entry.digest] <= 0:
+            del self._refcounts[entry.digest]
+            self._bytes -= self._blob_sizes.pop(entry.digest, 0)
+            try:
+                os.remove(self._blob_path(entry.digest))
+            except OSError:
+                pass
+
+    def _evict(self) -> None:
+        """Evicts least recently used entries until the blobs fit within the byte budget."""
+        while self._bytes > self._max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._logger.debug(f"Evicting cache entry {key}.")
+            self._remove(key)
+
+    def _persist(self, entry: CacheEntry) -> None:
+        """Records an entry for the next write of the shelve index."""
+        self._changes[entry.key] = entry
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        """Writes the pending index changes once a batch has accumulated."""
+        if len(self._changes) >= self._flush_every:
+            self.flush()
+
+    def _load(self) -> None:
+        """Loads the index from disk in least to most recently used order."""
+        with shelve.open(self._index_file) as index:
+            entries = sorted(index.values(), key=lambda entry: entry.accessed)
+        for entry in entries:
+            self._entries[entry.key] = entry
+            self._refcounts[entry.digest] = self._refcounts.get(entry.digest, 0) + 1
+            if entry.digest not in self._blob_sizes:
+                self._blob_sizes[entry.digest] = entry.size
+                self._bytes += entry.size
+        self._evict()
+
+    def _write_blob(self, digest: str, body: bytes) -> None:
+        """Writes a blob atomically, so a crash never leaves a partial body behind."""
+        path = self._blob_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp = f"{path}.tmp"
+        with open(temp, "wb") as file:
+            file.write(body)
+        os.replace(temp, path)
+
+    def _blob_path(self, digest: str) -> str:
+        """Returns the path of a blob, fanned out by the first two hex digits."""
+        return os.path.join(self._blob_directory, digest[:2], digest)
+
+    @staticmethod
+    def _select_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+        """Keeps the headers needed to rebuild the response and revalidate it."""
+        keep = ("Server", "Date", "Connection", "ETag", "Last-Modified")
+        return {name: headers[name] for name in keep if name in headers}
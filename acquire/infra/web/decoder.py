@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/decoder.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:27:41 pm                                                #
+# Modified   : Friday October 16th 2026 07:27:41 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Response Decoder Module"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+try:  # pragma: no cover
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      JSON DECODER                                                #
+# ------------------------------------------------------------------------------------------------ #
+class JSONDecoder:
+    """Decodes JSON response bodies, moving large bodies off the event loop.
+
+    Bodies smaller than `threshold` bytes are decoded inline, where the cost of a handoff
+    to a worker exceeds the cost of decoding. Larger bodies, such as review pages at
+    `limit=400`, are decoded in a thread or process pool. This keeps the event loop free
+    to service other in-flight requests. The decoding backend is pluggable; `orjson` is
+    used when it is installed, and the standard library `json` module otherwise.
+
+    Each call to `decode` reports the time the event loop was blocked by decoding. For
+    inline decoding, this is the decoding time. For pooled decoding, it is only the time
+    taken to hand the body to the pool.
+
+    Args:
+        threshold (int): The body size in bytes at and above which decoding is moved off the loop.
+        executor (str): The pool used for large bodies, either "thread" or "process".
+            Defaults to "thread".
+        max_workers (Optional[int]): The maximum number of pool workers. Defaults to the
+            executor's own default.
+        backend (str): The decoding backend, one of "auto", "orjson" or "json". Defaults to "auto".
+
+    Attributes:
+        _threshold (int): The off-loop size threshold in bytes.
+        _executor_type (str): The pool type.
+        _max_workers (Optional[int]): The maximum number of pool workers.
+        _loads (Callable[[bytes], Any]): The decoding function.
+        _executor (Optional[Executor]): The pool, created on first use.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        backend: str = "auto",
+    ) -> None:
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        if executor not in ("thread", "process"):
+            msg = f"Invalid executor: {executor}. Valid values are 'thread' and 'process'."
+            self._logger.error(msg)
+            raise ValueError(msg)
+        self._threshold = int(threshold)
+        self._executor_type = executor
+        self._max_workers = max_workers
+        self._loads = self._select_backend(backend=backend)
+        self._executor: Optional[Executor] = None
+
+    @property
+    def backend(self) -> str:
+        """Returns the name of the decoding backend in use."""
+        return (
+            "orjson" if orjson is not None and self._loads is orjson.loads else "json"
+        )
+
+    async def decode(self, body: bytes) -> Tuple[Any, float]:
+        """Decodes a JSON body.
+
+        Args:
+            body (bytes): The raw response body.
+
+        Returns:
+            Tuple[Any, float]: The decoded content and the seconds the event loop was blocked.
+        """
+        if not body:
+            return {}, 0.0
+
+        start = time.perf_counter()
+        if len(body) < self._threshold:
+            content = self._loads(body)
+            return content, time.perf_counter() - start
+
+        future = asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self._loads, body
+        )
+        loop_time = time.perf_counter() - start
+        content = await future
+        return content, loop_time
+
+    def close(self) -> None:
+        """Shuts down the pool, if one was created."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        """Returns the pool, creating it on first use."""
+        if self._executor is None:
+            if self._executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="decoder"
+                )
+        return self._executor
+
+    def _select_backend(self, backend: str) -> Callable[[bytes], Any]:
+        """Returns the decoding function for the requested backend.
+
+        Args:
+            backend (str): One of "auto", "orjson" or "json".
+
+        Raises:
+            ValueError: If the backend is unknown, or "orjson" is requested but not installed.
+        """
+        if backend == "json":
+            return json.loads
+        if backend in ("auto", "orjson") and orjson is not None:
+            return orjson.loads
+        if backend == "auto":
+            return json.loads
+        if backend == "orjson":
+            msg = "The orjson backend was requested but orjson is not installed."
+        else:
+            msg = f"Invalid backend: {backend}. Valid values are 'auto', 'orjson' and 'json'."
+        self._logger.error(msg)
+        raise ValueError(msg)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/endpoint.py                                                      #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:29:24 pm                                                #
+# Modified   : Friday October 16th 2026 08:56:20 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Endpoint Adapter Module"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from acquire.core.data import DataClass
+from acquire.infra.web.adapter import Adapter, AdapterFactory
+from acquire.infra.web.hedge import HedgePolicy
+from acquire.infra.web.limiter import ConcurrencyLimiter
+from acquire.infra.web.pacer import SharedTokenBucket, TokenBucketPacer
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    ENDPOINT METRICS                                              #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class EndpointMetrics(DataClass):
+    """The adapter settings and performance of one class of endpoint.
+
+    Attributes:
+        key (str): The endpoint, as host/request type/storefront, e.g. "itunes.apple.com/appdata/us".
+        stage (str): The adapter stage.
+        rate (float): The rate in requests per second.
+        concurrency (float): The concurrency limit.
+        requests (int): Requests sent, including retries and hedges.
+        responses (int): Successful responses.
+        latency_average (float): The average latency over the adapter's history, in seconds.
+        latency_p95 (float): The 95th percentile latency over the adapter's history, in seconds.
+        error_rate (float): The fraction of attempts that failed over the adapter's history.
+        throttle_rate (float): The fraction of attempts throttled over the adapter's history.
+        statuses (Dict[int, int]): The count of each status over the adapter's history.
+        in_flight (int): Requests holding a concurrency slot.
+        queued (int): Requests waiting for a concurrency slot.
+    """
+
+    key: str
+    stage: str = ""
+    rate: float = 0.0
+    concurrency: float = 0.0
+    requests: int = 0
+    responses: int = 0
+    latency_average: float = 0.0
+    latency_p95: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    in_flight: int = 0
+    queued: int = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        ENDPOINT                                                  #
+# ------------------------------------------------------------------------------------------------ #
+class Endpoint:
+    """The adapter of one class of endpoint, with the pacer and limiter it controls and the
+    policy that hedges its slow requests against its own latency.
+
+    Args:
+        adapter (Adapter): The adapter.
+        pacer (TokenBucketPacer): The pacer that enforces the adapter's rate. Its budget
+            caps the rate of every endpoint combined.
+        limiter (ConcurrencyLimiter): The limiter that enforces the adapter's concurrency.
+        shared_limiter (Optional[ConcurrencyLimiter]): The limiter that caps the concurrency
+            of every endpoint combined, if any.
+        hedge (Optional[HedgePolicy]): The hedge delay and budget of the endpoint. Defaults to
+            hedging disabled.
+
+    Attributes:
+        requests (int): Requests sent to the endpoint.
+        responses (int): Successful responses from the endpoint.
+    """
+
+    def __init__(
+        self,
+        adapter: Adapter,
+        pacer: TokenBucketPacer,
+        limiter: ConcurrencyLimiter,
+        shared_limiter: Optional[ConcurrencyLimiter] = None,
+        hedge: Optional[HedgePolicy] = None,
+    ) -> None:
+        self._key: Optional[str] = None
+        self._adapter = adapter
+        self._pacer = pacer
+        self._limiter = limiter
+        self._shared_limiter = shared_limiter
+        self._hedge = hedge or HedgePolicy()
+        # The adapter applies each new rate and concurrency to these directly.
+        self._adapter.pacer = pacer
+        self._adapter.limiter = limiter
+        self.requests = 0
+        self.responses = 0
+
+    @property
+    def key(self) -> Optional[str]:
+        """Returns the endpoint, or None until the first request is routed to it."""
+        return self._key
+
+    @key.setter
+    def key(self, key: str) -> None:
+        """Sets the endpoint the adapter serves.
+
+        Args:
+            key (str): The endpoint, as host/request type/storefront.
+        """
+        self._key = key
+
+    @property
+    def adapter(self) -> Adapter:
+        """Returns the adapter."""
+        return self._adapter
+
+    @property
+    def pacer(self) -> TokenBucketPacer:
+        """Returns the pacer."""
+        return self._pacer
+
+    @property
+    def limiter(self) -> ConcurrencyLimiter:
+        """Returns the concurrency limiter."""
+        return self._limiter
+
+    @property
+    def hedge(self) -> HedgePolicy:
+        """Returns the hedge policy, whose delay tracks the endpoint's own latency percentile."""
+        return self._hedge
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0) -> AsyncIterator[None]:
+        """Holds a slot from the endpoint's limiter, then one from the shared limiter if any,
+        for the duration of the context.
+
+        Args:
+            priority (int): The admission priority. Lower values are admitted first.
+                Defaults to 0.
+        """
+        async with self._limiter.slot(priority=priority):
+            if self._shared_limiter is None:
+                yield
+            else:
+                async with self._shared_limiter.slot(priority=priority):
+                    yield
+
+    @property
+    def metrics(self) -> EndpointMetrics:
+        """Returns the current adapter settings and performance of the endpoint."""
+        stats = self._adapter.get_latency_stats()
+        return EndpointMetrics(
+            key=self._key or "",
+            stage=self._adapter.stage.__class__.__name__,
+            rate=self._adapter.session_control.rate,
+            concurrency=self._adapter.session_control.concurrency,
+            requests=self.requests,
+            responses=self.responses,
+            latency_average=stats.average,
+            latency_p95=self._adapter.get_latency_percentile(percentile=95),
+            error_rate=self._adapter.get_error_rate(),
+            throttle_rate=self._adapter.get_throttle_rate(),
+            statuses=self._adapter.get_status_counts(),
+            in_flight=self._limiter.in_flight,
+            queued=self._limiter.queued,
+        )
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   ENDPOINT REGISTRY                                              #
+# ------------------------------------------------------------------------------------------------ #
+class EndpointRegistry:
+    """Holds an adapter, pacer and limiter for each class of endpoint a session requests.
+
+    App search and review pages, and the storefronts of each, have very different latency
+    profiles. With `isolated` set, each is adapted separately: its adapter has its own
+    session history and stage machine, and its rate and concurrency apply only to its own
+    requests, so a slow endpoint does not throttle the others. Its slow requests are also
+    hedged against its own latency percentile, within its own hedge budget. Otherwise every
+    endpoint shares one adapter, pacer, limiter and hedge policy.
+
+    However many endpoints are requested, the session's total load stays within one budget.
+    The registry holds a pacer at `max_rate` that is the budget of every endpoint's pacer,
+    and a limiter at `max_concurrency` that every request holds a slot from as well as its
+    endpoint's. The endpoints split this budget by demand: each sends at up to its own
+    adapted rate and concurrency while the combined load is within the budget, and waits
+    for the budget otherwise.
+
+    The first endpoint requested is served by the primary endpoint, created up front with
+    the factory's own history and stages, so a session requesting a single class of
+    endpoint behaves as with one adapter.
+
+    Args:
+        adapter_factory (AdapterFactory): Creates the adapter of each endpoint.
+        rate (float): The initial rate of each endpoint's pacer in requests per second.
+        burst (float): The burst of each pacer.
+        concurrency (int): The initial limit of each endpoint's concurrency limiter.
+        max_rate (float): The combined rate of every endpoint in requests per second. A
+            non-positive rate leaves the combined rate uncapped, other than by a budget
+            shared with other processes.
+        max_concurrency (int): The combined in-flight requests of every endpoint.
+        isolated (bool): Whether each class of endpoint is adapted separately. Defaults to True.
+        hedge (Optional[Any]): The `async_session.hedge` configuration from which the hedge
+            policy of each endpoint is created. Defaults to hedging disabled.
+    """
+
+    def __init__(
+        self,
+        adapter_factory: AdapterFactory,
+        rate: float,
+        burst: float,
+        concurrency: int,
+        max_rate: float,
+        max_concurrency: int,
+        isolated: bool = True,
+        hedge: Optional[Any] = None,
+    ) -> None:
+        self._adapter_factory = adapter_factory
+        self._hedge = hedge
+        self._rate = rate
+        self._burst = burst
+        self._concurrency = concurrency
+        self._isolated = isolated
+        self._pacer = TokenBucketPacer(rate=max_rate, burst=burst)
+        self._limiter = ConcurrencyLimiter(limit=max_concurrency)
+        self._primary = self._create(isolated=False)
+        self._endpoints: Dict[str, Endpoint] = {}
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def primary(self) -> Endpoint:
+        """Returns the primary endpoint, which serves the first endpoint requested."""
+        return self._primary
+
+    @property
+    def isolated(self) -> bool:
+        """Returns whether each class of endpoint is adapted separately."""
+        return self._isolated
+
+    @property
+    def pacer(self) -> TokenBucketPacer:
+        """Returns the pacer that caps the combined rate of every endpoint."""
+        return self._pacer
+
+    @property
+    def limiter(self) -> ConcurrencyLimiter:
+        """Returns the limiter that caps the combined concurrency of every endpoint."""
+        return self._limiter
+
+    @property
+    def budget(self) -> Optional[SharedTokenBucket]:
+        """Returns the rate budget shared with other processes, if any."""
+        return self._pacer.budget  # type: ignore[return-value]
+
+    @budget.setter
+    def budget(self, budget: Optional[SharedTokenBucket]) -> None:
+        """Attaches a rate budget shared with other processes to the registry's pacer, so it
+        applies to every endpoint.
+
+        Args:
+            budget (Optional[SharedTokenBucket]): The budget, or None to detach it.
+        """
+        self._pacer.budget = budget
+
+    @property
+    def metrics(self) -> Dict[str, EndpointMetrics]:
+        """Returns the metrics of each endpoint requested, by endpoint."""
+        metrics = (endpoint.metrics for endpoint in self)
+        return {endpoint_metrics.key: endpoint_metrics for endpoint_metrics in metrics}
+
+    def __iter__(self) -> Iterator[Endpoint]:
+        """Iterates over the endpoints requested, in the order they were first requested.
+        An endpoint shared by several keys is returned once."""
+        distinct: Dict[int, Endpoint] = {}
+        for endpoint in self._endpoints.values():
+            distinct.setdefault(id(endpoint), endpoint)
+        return iter(distinct.values())
+
+    def __len__(self) -> int:
+        """Returns the number of keys requested."""
+        return len(self._endpoints)
+
+    def get(self, key: str) -> Optional[Endpoint]:
+        """Returns the endpoint that serves a key, or None if it has not been requested.
+
+        Args:
+            key (str): The endpoint, as host/request type/storefront.
+        """
+        return self._endpoints.get(key)
+
+    def add(self, key: str) -> Endpoint:
+        """Routes a key that has not been requested before to an endpoint.
+
+        The first key is routed to the primary endpoint. Later keys are given endpoints of
+        their own if isolated, and otherwise share the primary endpoint.
+
+        Args:
+            key (str): The endpoint, as host/request type/storefront.
+
+        Returns:
+            Endpoint: The endpoint, whose key is `key` unless it is shared.
+        """
+        if self._primary.key is None:
+            endpoint = self._primary
+            endpoint.key = key
+        elif self._isolated:
+            endpoint = self._create(isolated=True)
+            endpoint.key = key
+            self._logger.debug(f"Created an isolated adapter for {key}.")
+        else:
+            endpoint = self._primary
+        self._endpoints[key] = endpoint
+        return endpoint
+
+    def _create(self, isolated: bool) -> Endpoint:
+        """Creates an endpoint with a new adapter, pacer, limiter and hedge policy, within the
+        registry's budget."""
+        return Endpoint(
+            adapter=self._adapter_factory.create(isolated=isolated),
+            pacer=TokenBucketPacer(
+                rate=self._rate, burst=self._burst, budget=self._pacer
+            ),
+            limiter=ConcurrencyLimiter(limit=self._concurrency),
+            shared_limiter=self._limiter,
+            hedge=HedgePolicy.from_config(self._hedge)
+            if self._hedge is not None
+            else None,
+        )
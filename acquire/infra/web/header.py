@@ -90,7 +90,7 @@ SKIP_AUTO_HEADERS = {
 # ------------------------------------------------------------------------------------------------ #
 #                               APPSTORE STOREFRONT HEADER                                         #
 # ------------------------------------------------------------------------------------------------ #
-STOREFRONT = {
+STOREFRONT: Dict[str, Any] = {
     "country": "us",
     "headers": {"X-Apple-Store-Front": "143441-1,29"},
 }
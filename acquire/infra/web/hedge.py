@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/hedge.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:49:15 pm                                                #
+# Modified   : Friday October 16th 2026 08:54:16 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Request Hedging Module"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Any, Optional
+
+from acquire.core.data import DataClass
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      HEDGE METRICS                                               #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class HedgeMetrics(DataClass):
+    """Counts of hedged requests.
+
+    Attributes:
+        requests (int): Primary requests sent while hedging was enabled.
+        hedges (int): Duplicate requests sent for slow primaries.
+        wins (int): Hedges that completed before their primary.
+        denied (int): Slow primaries not hedged because the budget was spent.
+        throttled (int): Slow primaries not hedged because the pacer had no token to spare.
+        delay (Optional[float]): The current hedge delay in seconds, if known.
+    """
+
+    requests: int = 0
+    hedges: int = 0
+    wins: int = 0
+    denied: int = 0
+    throttled: int = 0
+    delay: Optional[float] = None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                       HEDGE POLICY                                               #
+# ------------------------------------------------------------------------------------------------ #
+class HedgePolicy:
+    """Decides when a slow request is duplicated, and how many duplicates may be sent.
+
+    A request outstanding for longer than the hedge delay is duplicated. The delay tracks a
+    live latency percentile, e.g. the p95 from the adapter's session history, and is refreshed
+    whenever the adapter adapts. No request is hedged until `min_samples` requests have
+    been sent, so the percentile is not estimated from a handful of latencies.
+
+    The budget caps hedges at a fraction of primary requests. Hedges pass through the limiter
+    like any other request and take a token from the pacer, so they are counted against the
+    adapter's rate, and the budget keeps that extra load small. A hedge only helps if it is
+    sent at once, so if the pacer has no token to spare the hedge is not sent and is returned
+    to the budget.
+
+    Args:
+        enabled (bool): Whether requests are hedged.
+        percentile (float): The latency percentile, between 0 and 100, after which a request is hedged.
+        budget (float): The maximum hedges as a fraction of primary requests, e.g. 0.05 for 5%.
+        min_samples (int): The requests sent before requests are hedged.
+        min_delay (float): The minimum hedge delay in seconds.
+        window (int): The seconds of recent latencies from which the percentile is computed.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        percentile: float = 95,
+        budget: float = 0.05,
+        min_samples: int = 100,
+        min_delay: float = 0.05,
+        window: int = 60,
+    ) -> None:
+        self._enabled = enabled
+        self._percentile = percentile
+        self._budget = budget
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._window = window
+        self._metrics = HedgeMetrics()
+
+    @classmethod
+    def from_config(cls, config: Any) -> HedgePolicy:
+        """Creates a hedge policy from the `async_session.hedge` configuration."""
+        return cls(**vars(config))
+
+    @property
+    def enabled(self) -> bool:
+        """Returns whether requests are hedged."""
+        return self._enabled
+
+    @property
+    def percentile(self) -> float:
+        """Returns the latency percentile after which a request is hedged."""
+        return self._percentile
+
+    @property
+    def window(self) -> int:
+        """Returns the seconds of recent latencies from which the percentile is computed."""
+        return self._window
+
+    @property
+    def delay(self) -> Optional[float]:
+        """Returns the seconds after which a request is hedged, or None if it is not yet known."""
+        return self._metrics.delay
+
+    @property
+    def metrics(self) -> HedgeMetrics:
+        """Returns a copy of the hedge metrics."""
+        return replace(self._metrics)
+
+    def update(self, latency: float) -> None:
+        """Sets the hedge delay from the latest latency percentile.
+
+        Args:
+            latency (float): The latency percentile in seconds.
+        """
+        if self._metrics.requests < self._min_samples or latency <= 0:
+            return
+        self._metrics.delay = max(latency, self._min_delay)
+
+    def send(self) -> None:
+        """Counts a primary request against which hedges are budgeted."""
+        self._metrics.requests += 1
+
+    def acquire(self) -> bool:
+        """Returns whether a slow request may be hedged, counting the hedge if so."""
+        if self._metrics.hedges + 1 > self._budget * self._metrics.requests:
+            self._metrics.denied += 1
+            return False
+        self._metrics.hedges += 1
+        return True
+
+    def throttle(self) -> None:
+        """Returns a hedge to the budget because the pacer had no token to send it at once."""
+        self._metrics.hedges -= 1
+        self._metrics.throttled += 1
+
+    def win(self) -> None:
+        """Counts a hedge that completed before its primary."""
+        self._metrics.wins += 1
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/limiter.py                                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:23:36 pm                                                #
+# Modified   : Friday October 16th 2026 07:26:32 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Concurrency Limiter Module"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import AsyncIterator, List, Optional, Tuple, Type
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  CONCURRENCY LIMITER                                             #
+# ------------------------------------------------------------------------------------------------ #
+class ConcurrencyLimiter:
+    """A semaphore-like limiter whose limit can be changed while requests are in flight.
+
+    Unlike `asyncio.Semaphore`, the limit is not fixed at construction. Growing the limit
+    immediately admits queued callers; shrinking it admits no new callers until enough
+    in-flight requests have released their slots. Waiters are admitted in priority order,
+    lowest value first, and in FIFO order within a priority. This lets retries re-enter
+    the pipeline behind fresh requests.
+
+    Args:
+        limit (int): The maximum number of concurrent holders. Values below one are raised to one.
+
+    Attributes:
+        _limit (int): The current limit.
+        _in_flight (int): The number of callers currently holding a slot.
+        _waiters (List[Tuple[int, int, asyncio.Future[None]]]): A heap of callers waiting
+            for a slot, keyed by priority and arrival order.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = max(int(limit), 1)
+        self._in_flight = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def limit(self) -> int:
+        """Returns the current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Returns the number of callers currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Returns the number of callers waiting for a slot."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def resize(self, limit: int) -> None:
+        """Changes the limit, admitting queued callers if capacity has grown.
+
+        Args:
+            limit (int): The new limit. Values below one are raised to one.
+        """
+        limit = max(int(limit), 1)
+        if limit != self._limit:
+            self._logger.debug(
+                f"Concurrency limit resized from {self._limit} to {limit}."
+            )
+        self._limit = limit
+        self._wake()
+
+    async def acquire(self, priority: int = 0) -> None:
+        """Waits for and takes a slot.
+
+        Args:
+            priority (int): The admission priority. Lower values are admitted first.
+                Defaults to 0.
+        """
+        if self._in_flight < self._limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._sequence), waiter)
+        heapq.heappush(self._waiters, entry)
+        # Capacity may be free behind waiters that were granted but have not yet resumed.
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # If the slot was granted as the caller was cancelled, hand it on.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            # Granted waiters have already left the heap; cancelled ones are removed here.
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+
+    def release(self) -> None:
+        """Returns a slot and admits the next waiter if capacity allows."""
+        if self._in_flight <= 0:
+            msg = "ConcurrencyLimiter released more times than it was acquired."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Grants slots to waiters, in priority order, while capacity allows."""
+        while self._waiters and self._in_flight < self._limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = 0) -> AsyncIterator[None]:
+        """Holds a slot for the duration of the context, acquired at the given priority.
+
+        Args:
+            priority (int): The admission priority. Lower values are admitted first.
+                Defaults to 0.
+        """
+        await self.acquire(priority=priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.release()
@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/mock.py                                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:40:55 pm                                                #
+# Modified   : Friday October 16th 2026 07:40:55 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Mock App Store Server Module"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing as mp
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+from acquire.core.data import DataClass
+
+# ------------------------------------------------------------------------------------------------ #
+SEARCH_PATH = "/search"
+REVIEW_PATH = "/WebObjects/MZStore.woa/wa/userReviewsRow"
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     MOCK PROFILE                                                 #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class MockProfile(DataClass):
+    """Describes how the mock App Store behaves.
+
+    Latencies are drawn from a lognormal distribution. Throttling and slowdowns occur in
+    periodic windows measured from server start, so a run of a given length sees the same
+    pattern of bursts every time.
+
+    Attributes:
+        latency_median (float): The median server latency in seconds.
+        latency_sigma (float): The lognormal shape parameter. Larger values give a longer tail.
+        apps_per_genre (int): The number of apps in each genre. Search pages past this are empty.
+        reviews_per_app (int): The number of reviews for each app. Review pages past this are empty.
+        end_status (int): The status served past the end of the data: 200 for an empty page, or e.g. 404.
+        not_found_rate (float): The probability that any request is answered with a 404.
+        throttle_interval (float): Seconds between the starts of throttling bursts. 0 disables throttling.
+        throttle_duration (float): Seconds each throttling burst lasts.
+        throttle_status (int): The status served during a burst, e.g. 429 or 503.
+        retry_after (Optional[int]): The `Retry-After` seconds sent with throttled responses, if any.
+        slowdown_interval (float): Seconds between the starts of slowdowns. 0 disables slowdowns.
+        slowdown_duration (float): Seconds each slowdown lasts.
+        slowdown_factor (float): The multiple applied to latencies during a slowdown.
+        seed (int): The random seed for latencies and 404s.
+    """
+
+    latency_median: float = 0.05
+    latency_sigma: float = 0.5
+    apps_per_genre: int = 10000
+    reviews_per_app: int = 10000
+    end_status: int = 200
+    not_found_rate: float = 0.0
+    throttle_interval: float = 0.0
+    throttle_duration: float = 0.0
+    throttle_status: int = 429
+    retry_after: Optional[int] = 1
+    slowdown_interval: float = 0.0
+    slowdown_duration: float = 0.0
+    slowdown_factor: float = 5.0
+    seed: int = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    MOCK APP STORE                                                #
+# ------------------------------------------------------------------------------------------------ #
+class MockAppStore:
+    """A local stand-in for the App Store search and review endpoints.
+
+    Serves synthetic JSON shaped like the responses from `itunes.apple.com/search` and
+    `userReviewsRow`, with the latencies, 404s, throttling bursts and slowdowns described
+    by a `MockProfile`. Requests are pointed at the server by setting their scheme and
+    host, e.g. `http` and `127.0.0.1:8080`. Pages are deterministic, so two runs against
+    the same profile fetch the same bytes.
+
+    Args:
+        profile (MockProfile): The server behavior.
+        host (str): The interface to bind. Defaults to 127.0.0.1.
+        port (int): The port to bind. Defaults to 0, which picks a free port.
+
+    Attributes:
+        counts (Counter): The number of responses served by status code.
+    """
+
+    def __init__(
+        self, profile: MockProfile, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self._profile = profile
+        self._host = host
+        self._port = port
+        self._rng = random.Random(profile.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._started = 0.0
+        self.counts: Counter = Counter()
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def host(self) -> str:
+        """Returns the host and port to set on requests, e.g. 127.0.0.1:8080."""
+        return f"{self._host}:{self._port}"
+
+    async def start(self) -> str:
+        """Starts serving and returns the host and port."""
+        app = web.Application()
+        app.router.add_get(SEARCH_PATH, self._search)
+        app.router.add_get(REVIEW_PATH, self._reviews)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host=self._host, port=self._port)
+        await site.start()
+        # Resolve the port when bound to port 0.
+        self._port = self._runner.addresses[0][1]
+        self._started = time.monotonic()
+        self._logger.debug(f"Mock App Store serving on {self.host}.")
+        return self.host
+
+    async def stop(self) -> None:
+        """Stops serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> MockAppStore:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    async def _search(self, request: web.Request) -> web.Response:
+        """Serves a page of search results."""
+        genre_id = int(request.query.get("genreId", 0))
+        limit = int(request.query.get("limit", 200))
+        offset = int(request.query.get("offset", 0))
+        past_end = offset >= self._profile.apps_per_genre
+        limit = max(min(limit, self._profile.apps_per_genre - offset), 0)
+        return await self._respond(
+            past_end=past_end,
+            render=lambda: render_search_page(
+                genre_id=genre_id, offset=offset, limit=limit
+            ),
+        )
+
+    async def _reviews(self, request: web.Request) -> web.Response:
+        """Serves a page of reviews."""
+        app_id = int(request.query.get("id", 0))
+        start = int(request.query.get("startIndex", 0))
+        end = min(
+            int(request.query.get("endIndex", start)), self._profile.reviews_per_app
+        )
+        past_end = start >= self._profile.reviews_per_app
+        return await self._respond(
+            past_end=past_end,
+            render=lambda: render_review_page(
+                app_id=app_id, start=start, end=max(end, start)
+            ),
+        )
+
+    async def _respond(self, past_end: bool, render: Any) -> web.Response:
+        """Applies the profile's throttling, 404s and latency, then serves the page."""
+        profile = self._profile
+        elapsed = time.monotonic() - self._started
+
+        if self._in_window(
+            elapsed, profile.throttle_interval, profile.throttle_duration
+        ):
+            headers = {}
+            if profile.retry_after is not None:
+                headers["Retry-After"] = str(profile.retry_after)
+            return self._count(
+                web.Response(status=profile.throttle_status, headers=headers)
+            )
+
+        latency = (
+            self._rng.lognormvariate(0, profile.latency_sigma) * profile.latency_median
+        )
+        if self._in_window(
+            elapsed, profile.slowdown_interval, profile.slowdown_duration
+        ):
+            latency *= profile.slowdown_factor
+        await asyncio.sleep(latency)
+
+        if self._rng.random() < profile.not_found_rate:
+            return self._count(web.Response(status=404))
+        if past_end and profile.end_status != 200:
+            return self._count(web.Response(status=profile.end_status))
+        return self._count(web.Response(body=render(), content_type="application/json"))
+
+    def _count(self, response: web.Response) -> web.Response:
+        self.counts[response.status] += 1
+        return response
+
+    @staticmethod
+    def _in_window(elapsed: float, interval: float, duration: float) -> bool:
+        """Returns whether a periodic window of `duration` every `interval` seconds is open."""
+        return interval > 0 and (elapsed % interval) < duration
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                  MOCK APP STORE PROCESS                                          #
+# ------------------------------------------------------------------------------------------------ #
+class MockAppStoreProcess:
+    """Runs a `MockAppStore` in a separate process.
+
+    Serving from another process keeps the server's CPU out of the client's measurements
+    and stops the server's event loop from competing with the client's.
+
+    Args:
+        profile (MockProfile): The server behavior.
+        host (str): The interface to bind. Defaults to 127.0.0.1.
+        port (int): The port to bind. Defaults to 0, which picks a free port.
+        timeout (float): Seconds to wait for the server to start or stop. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        profile: MockProfile,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        timeout: float = 10.0,
+    ) -> None:
+        self._profile = profile
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._context = mp.get_context("spawn")
+        self._conn: Any = None
+        self._stop: Any = None
+        self._process: Optional[mp.process.BaseProcess] = None
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    def start(self) -> str:
+        """Starts the server process and returns the host and port it serves on.
+
+        Raises:
+            RuntimeError: If the server does not start within the timeout.
+        """
+        self._conn, child = self._context.Pipe()
+        self._stop = self._context.Event()
+        self._process = self._context.Process(
+            target=_serve,
+            args=(self._profile, self._host, self._port, child, self._stop),
+            daemon=True,
+        )
+        self._process.start()
+        if not self._conn.poll(self._timeout):
+            self._process.terminate()
+            msg = f"The mock App Store did not start within {self._timeout} seconds."
+            self._logger.error(msg)
+            raise RuntimeError(msg)
+        return self._conn.recv()
+
+    def stop(self) -> Dict[int, int]:
+        """Stops the server process.
+
+        Returns:
+            Dict[int, int]: The number of responses served by status code.
+        """
+        if self._process is None:
+            return {}
+        self._stop.set()
+        counts: Dict[int, int] = {}
+        if self._conn.poll(self._timeout):
+            counts = self._conn.recv()
+        self._process.join(self._timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process = None
+        return counts
+
+    def __enter__(self) -> str:
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+def _serve(profile: MockProfile, host: str, port: int, conn: Any, stop: Any) -> None:
+    """Serves the mock App Store until `stop` is set. Runs in the server process."""
+
+    async def serve() -> None:
+        async with MockAppStore(profile=profile, host=host, port=port) as server:
+            conn.send(server.host)
+            while not stop.is_set():
+                await asyncio.sleep(0.05)
+            conn.send(dict(server.counts))
+
+    asyncio.run(serve())
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                    SYNTHETIC CONTENT                                             #
+# ------------------------------------------------------------------------------------------------ #
+@lru_cache(maxsize=1024)
+def render_search_page(genre_id: int, offset: int, limit: int) -> bytes:
+    """Renders a page of search results shaped like `itunes.apple.com/search` responses."""
+    results = [
+        _app(genre_id=genre_id, index=index) for index in range(offset, offset + limit)
+    ]
+    return json.dumps({"resultCount": len(results), "results": results}).encode()
+
+
+@lru_cache(maxsize=1024)
+def render_review_page(app_id: int, start: int, end: int) -> bytes:
+    """Renders a page of reviews shaped like `userReviewsRow` responses."""
+    reviews = [_review(app_id=app_id, index=index) for index in range(start, end)]
+    return json.dumps({"userReviewList": reviews}).encode()
+
+
+def _app(genre_id: int, index: int) -> Dict[str, Any]:
+    app_id = genre_id * 10_000_000 + index
+    developer_id = 100_000 + index % 997
+    # Whole-star averages, since the domain model stores ratings as integers.
+    rating = float(1 + index * 7919 % 5)
+    name = f"Synthetic App {app_id}"
+    artwork = f"https://is1-ssl.mzstatic.com/image/thumb/{app_id}"
+    screenshots: List[str] = [f"{artwork}/screenshot{i}.jpg" for i in range(5)]
+    return {
+        "trackId": app_id,
+        "trackName": name,
+        "trackCensoredName": name,
+        "bundleId": f"com.synthetic.app{app_id}",
+        "description": f"{name} is a synthetic app used for load testing. " * 20,
+        "primaryGenreId": genre_id,
+        "primaryGenreName": f"Genre {genre_id}",
+        "genreIds": [str(genre_id), "6000"],
+        "genres": [f"Genre {genre_id}", "Business"],
+        "price": 0.0 if index % 4 else 2.99,
+        "formattedPrice": "Free" if index % 4 else "$2.99",
+        "currency": "USD",
+        "averageUserRating": rating,
+        "averageUserRatingForCurrentVersion": rating,
+        "userRatingCount": index * 31 % 100_000 + 1,
+        "userRatingCountForCurrentVersion": index * 31 % 100_000 + 1,
+        "artistId": developer_id,
+        "artistName": f"Synthetic Developer {developer_id}",
+        "artistViewUrl": f"https://apps.apple.com/us/developer/id{developer_id}",
+        "sellerName": f"Synthetic Developer {developer_id}",
+        "sellerUrl": f"https://developer{developer_id}.example.com",
+        "releaseDate": "2015-06-01T07:00:00Z",
+        "currentVersionReleaseDate": "2024-06-01T07:00:00Z",
+        "trackContentRating": "4+",
+        "contentAdvisoryRating": "4+",
+        "fileSizeBytes": str(50_000_000 + index),
+        "minimumOsVersion": "15.0",
+        "version": f"{index % 10}.{index % 7}.0",
+        "releaseNotes": "Bug fixes and performance improvements. " * 5,
+        "trackViewUrl": f"https://apps.apple.com/us/app/id{app_id}",
+        "artworkUrl60": f"{artwork}/60x60bb.jpg",
+        "artworkUrl100": f"{artwork}/100x100bb.jpg",
+        "artworkUrl512": f"{artwork}/512x512bb.jpg",
+        "screenshotUrls": screenshots,
+        "ipadScreenshotUrls": screenshots,
+        "supportedDevices": ["iPhone15-iPhone15", "iPadPro11-iPadPro11"],
+        "kind": "software",
+        "wrapperType": "software",
+    }
+
+
+def _review(app_id: int, index: int) -> Dict[str, Any]:
+    review_id = app_id * 100_000 + index
+    return {
+        "userReviewId": str(review_id),
+        "body": f"Synthetic review {index} for app {app_id}. " * 8,
+        "date": "2024-06-01T07:00:00Z",
+        "name": f"Reviewer {index % 5000}",
+        "rating": 1 + index % 5,
+        "title": f"Review {index}",
+        "voteCount": index % 13,
+        "voteSum": index % 7,
+        "isEdited": index % 11 == 0,
+        "viewUsersUserReviewsUrl": f"https://itunes.apple.com/reviews/id{review_id}",
+        "voteUrl": f"https://itunes.apple.com/vote/id{review_id}",
+        "customerType": "Customers",
+    }
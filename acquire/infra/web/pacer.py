@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/pacer.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:22:20 pm                                                #
+# Modified   : Friday October 16th 2026 08:56:20 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Request Pacer Module"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from typing import Any, Callable, Optional, Union
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   TOKEN BUCKET PACER                                             #
+# ------------------------------------------------------------------------------------------------ #
+class TokenBucketPacer:
+    """Paces requests at a target rate using a token bucket driven by the event loop clock.
+
+    Tokens accrue continuously at `rate` tokens per second up to a capacity of `burst`
+    tokens. Each request consumes one token, and callers wait in FIFO order until a token
+    is available. With a burst of one, requests are spread evenly at 1 / rate seconds apart.
+    The rate may be changed at any time; tokens accrued at the old rate are kept and the
+    waiting caller is woken to recompute its wait at the new rate.
+
+    Args:
+        rate (float): The target rate in requests per second. A non-positive rate disables pacing.
+        burst (float): The bucket capacity, i.e. the maximum number of requests that may be
+            sent back-to-back after an idle period. Defaults to 1.0.
+        clock (Optional[Callable[[], float]]): A monotonic clock returning seconds. Defaults
+            to the running event loop's clock.
+        budget (Optional[Union[SharedTokenBucket, TokenBucketPacer]]): A rate budget shared
+            with other pacers, e.g. those of the other endpoints of a session, or of other
+            processes. If set, each request also takes a token from the budget, so the
+            combined rate of all the pacers stays within it. A pacer may itself be the budget
+            of others, and takes a token from its own budget in turn.
+
+    Attributes:
+        _rate (float): The current rate in requests per second.
+        _burst (float): The bucket capacity in tokens.
+        _tokens (float): The tokens currently available.
+        _updated (Optional[float]): The clock time at which tokens were last refilled.
+        _lock (asyncio.Lock): Serializes waiters so tokens are granted in FIFO order.
+        _rate_changed (asyncio.Event): Wakes the waiting caller when the rate changes.
+        _budget (Optional[Union[SharedTokenBucket, TokenBucketPacer]]): The rate budget
+            shared with other pacers.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Optional[Callable[[], float]] = None,
+        budget: Optional[Union[SharedTokenBucket, TokenBucketPacer]] = None,
+    ) -> None:
+        self._rate = float(rate)
+        self._burst = max(float(burst), 1.0)
+        self._clock = clock
+        self._tokens = self._burst
+        self._updated: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._rate_changed: Optional[asyncio.Event] = None
+        self._budget = budget
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def rate(self) -> float:
+        """Returns the current rate in requests per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        """Sets the rate, crediting tokens accrued at the prior rate first.
+
+        Args:
+            rate (float): The new rate in requests per second.
+        """
+        self._refill()
+        self._rate = float(rate)
+        if self._rate_changed is not None:
+            self._rate_changed.set()
+
+    @property
+    def burst(self) -> float:
+        """Returns the bucket capacity in tokens."""
+        return self._burst
+
+    @property
+    def budget(self) -> Optional[Union[SharedTokenBucket, TokenBucketPacer]]:
+        """Returns the rate budget shared with other pacers, if any."""
+        return self._budget
+
+    @budget.setter
+    def budget(
+        self, budget: Optional[Union[SharedTokenBucket, TokenBucketPacer]]
+    ) -> None:
+        """Sets the rate budget shared with other pacers.
+
+        Args:
+            budget (Optional[Union[SharedTokenBucket, TokenBucketPacer]]): The shared budget,
+                or None to pace locally only.
+        """
+        self._budget = budget
+
+    @property
+    def tokens(self) -> float:
+        """Returns the tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> None:
+        """Waits until a token is available, and one from the shared budget if set, and
+        consumes them."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._rate_changed = asyncio.Event()
+
+        async with self._lock:
+            while True:
+                wait = self.reserve()
+                if wait <= 0:
+                    break
+                await self._sleep(wait)
+
+    def reserve(self) -> float:
+        """Consumes a token, and one from the shared budget if set, if both are available.
+
+        Neither token is consumed unless both are available, so a pacer waiting on its
+        budget does not hold back tokens from its own callers.
+
+        Returns:
+            float: Zero if the tokens were consumed, otherwise the seconds to wait before
+                one becomes available at the current rates.
+        """
+        if self._rate > 0:
+            self._refill()
+            if self._tokens < 1.0:
+                return (1.0 - self._tokens) / self._rate
+        if self._budget is not None:
+            wait = self._budget.reserve()
+            if wait > 0:
+                return wait
+        if self._rate > 0:
+            self._tokens -= 1.0
+        return 0.0
+
+    def try_acquire(self) -> bool:
+        """Consumes a token, and one from the shared budget if set, only if both are available at once.
+
+        Callers that would rather not send than wait, such as hedges, use this instead of
+        `acquire`. It does not queue behind the waiting callers.
+
+        Returns:
+            bool: Whether the tokens were consumed.
+        """
+        return self.reserve() <= 0
+
+    async def _sleep(self, wait: float) -> None:
+        """Sleeps for the given seconds or until the rate changes, whichever is first.
+
+        Args:
+            wait (float): The seconds to sleep.
+        """
+        if self._rate_changed is None:
+            await asyncio.sleep(wait)
+            return
+
+        self._rate_changed.clear()
+        try:
+            await asyncio.wait_for(self._rate_changed.wait(), timeout=wait)
+        except asyncio.TimeoutError:
+            pass
+
+    def _refill(self) -> None:
+        """Credits the tokens accrued since the last refill, up to the bucket capacity."""
+        now = self._now()
+        if self._updated is not None and self._rate > 0:
+            elapsed = max(now - self._updated, 0.0)
+            self._tokens = min(self._tokens + elapsed * self._rate, self._burst)
+        self._updated = now
+
+    def _now(self) -> float:
+        """Returns the current time from the configured clock or the event loop."""
+        if self._clock is not None:
+            return self._clock()
+        try:
+            return asyncio.get_running_loop().time()
+        except RuntimeError:
+            # Outside a running loop, fall back to the monotonic clock the loop uses.
+            return time.monotonic()
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   SHARED TOKEN BUCKET                                            #
+# ------------------------------------------------------------------------------------------------ #
+class SharedTokenBucket:
+    """A token bucket held in shared memory, so several processes draw on one rate budget.
+
+    The bucket state lives in `multiprocessing` shared values guarded by a process-safe lock,
+    so it must be created in the parent process and handed to child processes when they are
+    started. It is not awaited directly; each process's `TokenBucketPacer` calls `reserve`
+    and sleeps on its own event loop. The clock is `time.monotonic`, which is system-wide,
+    so all processes see the same time.
+
+    Args:
+        rate (float): The combined rate for all processes in requests per second. A
+            non-positive rate disables the budget.
+        burst (float): The bucket capacity in tokens. Defaults to 1.0.
+        context (Optional[Any]): The multiprocessing context used to create the shared state.
+            Defaults to the default context.
+
+    Attributes:
+        _rate (multiprocessing.Value): The combined rate in requests per second.
+        _burst (float): The bucket capacity in tokens.
+        _tokens (multiprocessing.Value): The tokens currently available.
+        _updated (multiprocessing.Value): The clock time at which tokens were last refilled.
+        _lock (multiprocessing.Lock): Guards the shared state.
+    """
+
+    def __init__(
+        self, rate: float, burst: float = 1.0, context: Optional[Any] = None
+    ) -> None:
+        context = context or multiprocessing.get_context()
+        self._burst = max(float(burst), 1.0)
+        self._rate = context.Value("d", float(rate), lock=False)
+        self._tokens = context.Value("d", self._burst, lock=False)
+        self._updated = context.Value("d", time.monotonic(), lock=False)
+        self._lock = context.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Returns the combined rate in requests per second."""
+        return self._rate.value
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        """Sets the combined rate for all processes.
+
+        Args:
+            rate (float): The new rate in requests per second.
+        """
+        with self._lock:
+            self._refill()
+            self._rate.value = float(rate)
+
+    @property
+    def burst(self) -> float:
+        """Returns the bucket capacity in tokens."""
+        return self._burst
+
+    def reserve(self) -> float:
+        """Consumes a token if one is available.
+
+        Returns:
+            float: Zero if a token was consumed, otherwise the seconds to wait before
+                one becomes available at the current rate.
+        """
+        with self._lock:
+            if self._rate.value <= 0:
+                return 0.0
+            self._refill()
+            if self._tokens.value >= 1.0:
+                self._tokens.value -= 1.0
+                return 0.0
+            return (1.0 - self._tokens.value) / self._rate.value
+
+    def _refill(self) -> None:
+        """Credits the tokens accrued since the last refill. The caller must hold the lock."""
+        now = time.monotonic()
+        if self._rate.value > 0:
+            elapsed = max(now - self._updated.value, 0.0)
+            self._tokens.value = min(
+                self._tokens.value + elapsed * self._rate.value, self._burst
+            )
+        self._updated.value = now
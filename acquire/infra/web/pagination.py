@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/pagination.py                                                    #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:46:45 pm                                                #
+# Modified   : Friday October 16th 2026 07:46:45 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Pagination Planner Module"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from typing import TYPE_CHECKING, Any, List, Optional, Set
+
+if TYPE_CHECKING:  # pragma: no cover
+    from acquire.domain.artifact.response.response import Response
+
+
+# ------------------------------------------------------------------------------------------------ #
+def count_records(response: Optional[Response]) -> int:
+    """Returns the number of records on a page of App Store search or review results.
+
+    Args:
+        response (Optional[Response]): The response, or None if the request failed.
+    """
+    if response is None:
+        return 0
+    content = response.content
+    if isinstance(content, list):
+        return len(content)
+    if isinstance(content, dict):
+        for key in ("results", "userReviewList"):
+            records = content.get(key)
+            if isinstance(records, list):
+                return len(records)
+    return 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   PAGINATION PLANNER                                             #
+# ------------------------------------------------------------------------------------------------ #
+class PaginationPlanner:
+    """Locates the last page of a paginated category from the pages observed so far.
+
+    Pages are classified as they complete. A full page (`limit` records) has data. A short
+    page (fewer than `limit` records) is the last page. An empty page, or a 404, is past the
+    end. Requests that failed for other reasons carry no information.
+
+    The end of pagination is the first page past the last page with data. It is known once a
+    short page is seen, or once `confirm` consecutive pages past the last known page with data
+    are empty. Requiring confirmation keeps a sporadic 404 in the middle of a category from
+    truncating it.
+
+    Before the category is streamed, the end can be located with rounds of concurrent probes:
+    exponential offsets from the start page until an empty page is found, then evenly spaced
+    offsets between the last page with data and the first empty page, narrowing the interval
+    by a factor of `fanout` + 1 each round, and finally the pages that confirm the end.
+
+    Args:
+        start_page (int): The first page of the category to be requested.
+        limit (int): The records requested per page.
+        max_pages (int): The number of pages the generator will request. Defaults to unbounded.
+        fanout (int): The number of probes sent concurrently in each round.
+        rounds (int): The maximum number of probe rounds. Zero disables probing.
+        confirm (int): The consecutive empty pages that confirm the end.
+        short_pages (bool): Whether a short page marks the end.
+    """
+
+    def __init__(
+        self,
+        start_page: int = 0,
+        limit: int = 200,
+        max_pages: int = sys.maxsize,
+        fanout: int = 8,
+        rounds: int = 8,
+        confirm: int = 2,
+        short_pages: bool = True,
+    ) -> None:
+        self._start_page = start_page
+        self._limit = limit
+        self._stop_page = start_page + max_pages
+        self._fanout = max(fanout, 1)
+        self._rounds = rounds
+        self._confirm = max(confirm, 1)
+        self._short_pages = short_pages
+
+        self._lower = start_page  # Pages below this have data.
+        self._short: Optional[int] = None
+        self._empty: Set[int] = set()
+        self._gallop = 0  # The next exponent of the exponential probes.
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @classmethod
+    def from_config(
+        cls, config: Any, start_page: int, limit: int, max_pages: int
+    ) -> PaginationPlanner:
+        """Creates a planner from the `async_session.stream.pagination` configuration."""
+        return cls(
+            start_page=start_page,
+            limit=limit,
+            max_pages=max_pages,
+            fanout=config.fanout,
+            rounds=config.rounds,
+            confirm=config.confirm,
+            short_pages=config.short_pages,
+        )
+
+    @property
+    def rounds(self) -> int:
+        """Returns the maximum number of probe rounds."""
+        return self._rounds
+
+    @property
+    def end(self) -> Optional[int]:
+        """Returns the first page past the end of pagination, or None if it is not yet known."""
+        if self._short is not None and self._short >= self._lower:
+            return self._short
+        candidate = self._candidate
+        if candidate is not None and all(
+            candidate + i in self._empty or candidate + i >= self._stop_page
+            for i in range(1, self._confirm)
+        ):
+            return candidate
+        if self._lower >= self._stop_page:
+            return self._stop_page
+        return None
+
+    @property
+    def resolved(self) -> bool:
+        """Returns whether the end is known and every page before it is known to have data."""
+        return self.end == self._lower
+
+    @property
+    def _candidate(self) -> Optional[int]:
+        """Returns the first empty page past the last known page with data, if any."""
+        empty = [page for page in self._empty if page >= self._lower]
+        return min(empty) if empty else None
+
+    def is_past_end(self, page: int) -> bool:
+        """Returns whether a page is known to be past the end of pagination."""
+        end = self.end
+        return end is not None and page >= end
+
+    def observe(
+        self, page: int, status: Optional[int], response: Optional[Response]
+    ) -> None:
+        """Classifies a completed page.
+
+        Args:
+            page (int): The page requested.
+            status (Optional[int]): The status of the last attempt, or None if no response
+                was received.
+            response (Optional[Response]): The response, or None if the request failed.
+        """
+        end = self.end
+        if response is None:
+            if status == 404:
+                self._empty.add(page)
+        else:
+            records = count_records(response)
+            if records == 0:
+                self._empty.add(page)
+            else:
+                self._lower = max(self._lower, page + 1)
+                if self._short_pages and records < self._limit:
+                    self._short = (
+                        page + 1 if self._short is None else min(self._short, page + 1)
+                    )
+        if self.end != end and self.end is not None:
+            self._logger.debug(f"End of pagination detected at page {self.end}.")
+
+    def next_probes(self) -> List[int]:
+        """Returns the pages to probe in the next round, or an empty list if the end is resolved."""
+        if self.resolved or self._lower >= self._stop_page:
+            return []
+
+        candidate = self._candidate
+        if candidate is None:
+            # Gallop: probe exponentially increasing offsets from the start page.
+            pages: List[int] = []
+            while len(pages) < self._fanout:
+                page = self._start_page + 2**self._gallop - 1
+                self._gallop += 1
+                if page >= self._stop_page:
+                    pages.append(self._stop_page - 1)
+                    break
+                if page >= self._lower:
+                    pages.append(page)
+            return sorted(set(pages))
+
+        if candidate > self._lower:
+            # Search the pages between the last page with data and the first empty page.
+            span = candidate - self._lower
+            if span <= self._fanout:
+                return list(range(self._lower, candidate))
+            step = span / (self._fanout + 1)
+            return sorted(
+                {self._lower + int(step * i) for i in range(1, self._fanout + 1)}
+            )
+
+        # Confirm the end with the pages that follow the first empty page.
+        return [
+            page
+            for page in range(
+                candidate + 1, min(candidate + self._confirm, self._stop_page)
+            )
+            if page not in self._empty
+        ]
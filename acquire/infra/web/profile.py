@@ -11,24 +11,29 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Wednesday August 21st 2024 06:48:22 am                                              #
-# Modified   : Monday September 9th 2024 04:57:55 pm                                               #
+# Modified   : Friday October 16th 2026 08:59:31 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
 # ================================================================================================ #
 from __future__ import annotations
 
+import heapq
 import logging
-import statistics
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Deque, Optional, Tuple
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Tuple
 from uuid import uuid4
 
 import numpy as np
 
 from acquire.core.data import DataClass
+from acquire.infra.web.sketch import WindowedQuantileSketch
+
+# ------------------------------------------------------------------------------------------------ #
+# Statuses with which a server asks the client to slow down.
+THROTTLE_STATUSES = frozenset({429, 503})
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -51,6 +56,9 @@ class SessionProfile(DataClass):
         requests (int): The total number of requests sent during the session.
         throughput (float): The calculated throughput of requests per second.
         latencies (deque): A deque to store latencies associated with each request.
+        statuses (Dict[int, int]): The count of each HTTP status returned during the session,
+            with requests that received no response counted under status 0.
+        clock (Callable[[], float]): The clock that timestamps the session. Defaults to `time.time`.
     """
 
     session_id: str = ""
@@ -59,6 +67,8 @@ class SessionProfile(DataClass):
     send_timestamp: float = 0
     recv_timestamp: float = 0
     latencies: Deque[Tuple[str, float, float]] = field(default_factory=deque)
+    statuses: Dict[int, int] = field(default_factory=dict)
+    clock: Callable[[], float] = field(default=time.time, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.session_id = str(uuid4())
@@ -87,16 +97,40 @@ class SessionProfile(DataClass):
     def speedup(self) -> float:
         return self.latency_total / self.response_time
 
+    @property
+    def attempts(self) -> int:
+        """Returns the number of attempts whose status was recorded."""
+        return sum(self.statuses.values())
+
+    @property
+    def errors(self) -> int:
+        """Returns the attempts that failed: no response, or a 4xx or 5xx status other than
+        404, which the App Store returns for pages past the end of a listing."""
+        return sum(
+            count
+            for status, count in self.statuses.items()
+            if status == 0 or (status >= 400 and status != 404)
+        )
+
+    @property
+    def throttles(self) -> int:
+        """Returns the attempts the server throttled, with a 429 or 503 status."""
+        return sum(
+            count
+            for status, count in self.statuses.items()
+            if status in THROTTLE_STATUSES
+        )
+
     def send(self) -> None:
         """Record the current time as the send timestamp."""
-        self.send_timestamp = time.time()
+        self.send_timestamp = self.clock()
 
     def recv(self) -> None:
         """Record the current time as the receive timestamp and calculate response_time.
 
         The response_time is calculated as the difference between the receive and send timestamps.
         """
-        self.recv_timestamp = time.time()
+        self.recv_timestamp = self.clock()
 
     def add_latency(self, latency: float) -> None:
         """Add a latency value to the latencies deque.
@@ -131,9 +165,14 @@ class SessionProfile(DataClass):
         )
         return (self.session_id, self.send_timestamp, self.throughput)
 
-    def log_error(self, return_code: int) -> None:
-        self.error_codes.append(return_code)
-        self.errors += 1
+    def add_status(self, status: Optional[int]) -> None:
+        """Count the HTTP status of an attempt.
+
+        Args:
+            status (Optional[int]): The HTTP status, or None if no response was received.
+        """
+        status = status or 0
+        self.statuses[status] = self.statuses.get(status, 0) + 1
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -156,6 +195,9 @@ class SessionStats(DataClass):
         std (float): The standard deviation of the recorded data.
         cv (float): The coefficient of variation, calculated as the ratio of
             the standard deviation to the average.
+        p90 (float): The 90th percentile, for latencies, estimated by a streaming sketch.
+        p95 (float): The 95th percentile, for latencies, estimated by a streaming sketch.
+        p99 (float): The 99th percentile, for latencies, estimated by a streaming sketch.
     """
 
     n: int = 0
@@ -165,6 +207,9 @@ class SessionStats(DataClass):
     average: float = 0
     std: float = 0
     cv: float = 0
+    p90: float = 0
+    p95: float = 0
+    p99: float = 0
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -196,36 +241,561 @@ class SessionControl:
             self.delay = 0  # Set to 0 if rate or concurrency is non-positive
 
 
+# ------------------------------------------------------------------------------------------------ #
+#                                   WINDOW AGGREGATES                                              #
+# ------------------------------------------------------------------------------------------------ #
+class WindowAggregates:
+    """Running aggregates of a sliding window over the entries of a `MetricSeries`.
+
+    Entries are identified by their position, the number of entries added to the series
+    before them. The window holds the entries from `start` to `end`, exclusive. Entries
+    enter at the end and leave at the start, so the window slides forward as time passes.
+
+    The sum and sum of squares are kept relative to a shift, the first value entered, so
+    that the variance does not lose precision to cancellation. The minimum and maximum are
+    kept by monotonic deques, and the median by a max-heap of the lower half and a min-heap
+    of the upper half, from which entries that have left are dropped lazily. An entry
+    enters and leaves in O(log n) amortized, and the window is summarized in O(1).
+    """
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.end = start
+        self.removed = 0  # Entries removed since the sums were last recomputed.
+        self._shift: Optional[float] = None
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        self._low: List[
+            Tuple[float, int]
+        ] = []  # Negated (value, position): a max-heap.
+        self._high: List[Tuple[float, int]] = []
+        self._low_size = 0
+        self._high_size = 0
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def push(self, value: float) -> None:
+        """Enters the entry at the end of the window."""
+        position = self.end
+        self.end += 1
+        if self._shift is None:
+            self._shift = value
+        shifted = value - self._shift
+        self._sum += shifted
+        self._sumsq += shifted * shifted
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((position, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((position, value))
+        self._prune()
+        if self._low_size and (value, position) > self._low_top():
+            heapq.heappush(self._high, (value, position))
+            self._high_size += 1
+        else:
+            heapq.heappush(self._low, (-value, -position))
+            self._low_size += 1
+        self._rebalance()
+
+    def pop(self, value: float) -> None:
+        """Removes the entry at the start of the window.
+
+        Args:
+            value (float): The value of the entry at the start.
+        """
+        position = self.start
+        self._prune()
+        if self._low_size and (value, position) <= self._low_top():
+            self._low_size -= 1
+        else:
+            self._high_size -= 1
+        self.start += 1
+        self.removed += 1
+        shifted = value - (self._shift or 0.0)
+        self._sum -= shifted
+        self._sumsq -= shifted * shifted
+        if self._min and self._min[0][0] < self.start:
+            self._min.popleft()
+        if self._max and self._max[0][0] < self.start:
+            self._max.popleft()
+        self._rebalance()
+        self._compact()
+
+    def recompute(self, values: np.ndarray) -> None:
+        """Recomputes the sums from the window's values, to shed accumulated rounding error."""
+        shifted = values - (self._shift or 0.0)
+        self._sum = float(shifted.sum())
+        self._sumsq = float((shifted * shifted).sum())
+        self.removed = 0
+
+    def summarize(self) -> SessionStats:
+        """Returns the statistics of the entries in the window."""
+        stats = SessionStats()
+        n = len(self)
+        if n == 0:
+            return stats
+        self._prune()
+        mean = self._sum / n
+        m2 = max(self._sumsq - self._sum * mean, 0.0)
+        mean += self._shift or 0.0
+        stats.n = n
+        stats.min = self._min[0][1]
+        stats.max = self._max[0][1]
+        if self._low_size > self._high_size:
+            stats.median = self._low_top()[0]
+        else:
+            stats.median = (self._low_top()[0] + self._high[0][0]) / 2
+        stats.average = mean
+        stats.std = (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+        stats.cv = (m2 / n) ** 0.5 / mean if mean else 0.0
+        return stats
+
+    def total(self) -> float:
+        """Returns the sum of the entries in the window."""
+        return self._sum + len(self) * (self._shift or 0.0)
+
+    def _low_top(self) -> Tuple[float, int]:
+        """Returns the largest (value, position) of the lower half."""
+        value, position = self._low[0]
+        return -value, -position
+
+    def _prune(self) -> None:
+        """Drops the entries that have left the window from the tops of the heaps."""
+        while self._low and -self._low[0][1] < self.start:
+            heapq.heappop(self._low)
+        while self._high and self._high[0][1] < self.start:
+            heapq.heappop(self._high)
+
+    def _rebalance(self) -> None:
+        """Keeps the lower half equal in size to the upper half, or larger by one."""
+        while self._low_size > self._high_size + 1:
+            self._prune()
+            value, position = heapq.heappop(self._low)
+            heapq.heappush(self._high, (-value, -position))
+            self._low_size -= 1
+            self._high_size += 1
+        while self._high_size > self._low_size:
+            self._prune()
+            value, position = heapq.heappop(self._high)
+            heapq.heappush(self._low, (-value, -position))
+            self._high_size -= 1
+            self._low_size += 1
+
+    def _compact(self) -> None:
+        """Rebuilds a heap once most of its entries have left the window, bounding its memory."""
+        if len(self._low) > 2 * self._low_size + 64:
+            self._low = [entry for entry in self._low if -entry[1] >= self.start]
+            heapq.heapify(self._low)
+        if len(self._high) > 2 * self._high_size + 64:
+            self._high = [entry for entry in self._high if entry[1] >= self.start]
+            heapq.heapify(self._high)
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     METRIC SERIES                                                #
+# ------------------------------------------------------------------------------------------------ #
+class MetricSeries:
+    """A ring buffer of timestamped values with a running mean and variance.
+
+    Timestamps and values are held in preallocated NumPy arrays. Each entry is written twice,
+    at its slot and at its slot plus the capacity, so the entries from any position to the
+    newest are always one contiguous view, and windows are summarized without copying. The
+    buffer starts small and doubles as it fills, up to `capacity`, after which the oldest
+    entry is overwritten, so the memory held is bounded at 32 bytes per entry of capacity.
+
+    Timestamps are kept in non-decreasing order, clamping any that run backwards, e.g. after
+    a clock adjustment, so a time window is located by binary search.
+
+    The mean and sum of squared deviations of all entries are maintained with Welford's
+    algorithm as entries are added and, in reverse, as they are evicted, so the mean, standard
+    deviation and coefficient of variation of the whole series cost O(1). They are recomputed
+    from the buffer once per `capacity` evictions to shed accumulated rounding error.
+
+    A sliding window, e.g. the last 60 seconds, is summarized from `WindowAggregates` kept
+    for it under a key, e.g. its length. The aggregates are brought up to date when the
+    window is summarized, or when entries they hold are evicted, so each entry enters and
+    leaves them once, and a window is summarized in O(log n) amortized, however many
+    entries it spans. At most `max_windows` windows are kept, the least recently used
+    being dropped.
+
+    Args:
+        capacity (int): The maximum number of entries retained.
+        initial_capacity (int): The number of entries allocated up front.
+        max_windows (int): The maximum number of windows whose aggregates are kept.
+    """
+
+    def __init__(
+        self, capacity: int = 2**17, initial_capacity: int = 1024, max_windows: int = 8
+    ) -> None:
+        self._capacity = max(capacity, 1)
+        self._allocated = min(max(initial_capacity, 1), self._capacity)
+        self._times = np.zeros(2 * self._allocated)
+        self._values = np.zeros(2 * self._allocated)
+        self._head = 0  # Slot of the oldest entry.
+        self._size = 0
+        self._mean = 0.0
+        self._m2 = 0.0  # Sum of squared deviations from the mean.
+        self._evicted = 0  # Evictions since the moments were last recomputed.
+        self._added = 0  # Entries ever added, i.e. the position of the next entry.
+        self._max_windows = max(max_windows, 1)
+        self._windows: Dict[Hashable, WindowAggregates] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of entries retained."""
+        return self._capacity
+
+    @property
+    def times(self) -> np.ndarray:
+        """Returns the timestamps, oldest first, as a view of the buffer."""
+        return self._times[self._head : self._head + self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Returns the values, oldest first, as a view of the buffer."""
+        return self._values[self._head : self._head + self._size]
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Adds an entry, evicting the oldest entry if the series is at capacity.
+
+        Args:
+            timestamp (float): The time of the observation, in seconds since the epoch.
+            value (float): The observed value.
+        """
+        if self._size == self._allocated:
+            if self._allocated < self._capacity:
+                self._grow(self._size + 1)
+            else:
+                self.evict(1)
+        if self._size:
+            timestamp = max(timestamp, self._times[self._head + self._size - 1])
+        slot = (self._head + self._size) % self._allocated
+        self._times[slot] = self._times[slot + self._allocated] = timestamp
+        self._values[slot] = self._values[slot + self._allocated] = value
+        self._size += 1
+        self._added += 1
+        delta = value - self._mean
+        self._mean += delta / self._size
+        self._m2 += delta * (value - self._mean)
+
+    def extend(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """Adds entries in bulk, evicting the oldest entries as needed.
+
+        Args:
+            timestamps (np.ndarray): The times of the observations.
+            values (np.ndarray): The observed values.
+        """
+        timestamps = np.asarray(timestamps, dtype=float)[-self._capacity :]
+        values = np.asarray(values, dtype=float)[-self._capacity :]
+        n = len(values)
+        if n == 0:
+            return
+        timestamps = np.maximum.accumulate(
+            np.maximum(timestamps, self._times[self._head + self._size - 1])
+            if self._size
+            else timestamps
+        )
+        if self._size + n > self._allocated:
+            if self._allocated < self._capacity:
+                self._grow(self._size + n)
+            overflow = self._size + n - self._allocated
+            if overflow > 0:
+                self.evict(overflow)
+        slots = (self._head + self._size + np.arange(n)) % self._allocated
+        for offset in (0, self._allocated):
+            self._times[slots + offset] = timestamps
+            self._values[slots + offset] = values
+        # Merge the moments of the new entries with those of the series (Chan et al.).
+        mean = float(values.mean())
+        m2 = float(((values - mean) ** 2).sum())
+        total = self._size + n
+        delta = mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += m2 + delta**2 * self._size * n / total
+        self._size = total
+        self._added += n
+
+    def evict(self, n: int) -> None:
+        """Removes the oldest entries.
+
+        Args:
+            n (int): The number of entries to remove.
+        """
+        n = min(n, self._size)
+        if n == 0:
+            return
+        if n == self._size:
+            self.clear()
+            return
+        removed = self._values[self._head : self._head + n]
+        self._evict_windows(n)
+        mean = float(removed.mean())
+        m2 = float(((removed - mean) ** 2).sum())
+        # Reverse the merge of the removed entries into the moments of the series.
+        remaining = self._size - n
+        retained_mean = (self._size * self._mean - n * mean) / remaining
+        delta = mean - retained_mean
+        self._m2 = max(self._m2 - m2 - delta**2 * remaining * n / self._size, 0.0)
+        self._mean = retained_mean
+        self._head = (self._head + n) % self._allocated
+        self._size = remaining
+        self._evicted += n
+        if self._evicted >= self._capacity:
+            self._recompute()
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self._head = 0
+        self._size = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evicted = 0
+        self._added = 0
+        self._windows.clear()
+
+    def count(self, since: Optional[float] = None) -> int:
+        """Returns the number of entries at or after a time.
+
+        Args:
+            since (Optional[float]): The earliest timestamp counted. If None, every entry is counted.
+        """
+        return self._size - self._offset(since)
+
+    def total(
+        self, since: Optional[float] = None, window: Optional[Hashable] = None
+    ) -> float:
+        """Returns the sum of the entries at or after a time.
+
+        Args:
+            since (Optional[float]): The earliest timestamp summed. If None, every entry is summed.
+            window (Optional[Hashable]): The key of the sliding window the entries are summed
+                over, e.g. its length. If None, the entries are summed directly, in O(n).
+        """
+        offset = self._offset(since)
+        if offset == self._size:
+            return 0.0
+        if window is not None:
+            return self._slide(key=window, offset=offset).total()
+        return float(self._values[self._head + offset : self._head + self._size].sum())
+
+    def evict_before(self, cutoff: float) -> None:
+        """Removes the entries older than a time.
+
+        Args:
+            cutoff (float): The earliest timestamp retained.
+        """
+        self.evict(self._offset(cutoff))
+
+    def summarize(
+        self, since: Optional[float] = None, window: Optional[Hashable] = None
+    ) -> SessionStats:
+        """Summarizes the whole series, or the entries at or after a time.
+
+        Args:
+            since (Optional[float]): The earliest timestamp summarized. If None, or before the
+                oldest entry, the whole series is summarized from its running moments.
+            window (Optional[Hashable]): The key of the sliding window summarized, e.g. its
+                length. If given, the entries are summarized from the window's running
+                aggregates, and otherwise directly, in O(n).
+
+        Returns:
+            SessionStats: The statistics of the entries.
+        """
+        stats = SessionStats()
+        offset = self._offset(since)
+        if offset == self._size:
+            return stats
+        if window is not None:
+            stats = self._slide(key=window, offset=offset).summarize()
+            if offset == 0:
+                stats.average = self._mean
+                stats.std = (
+                    (self._m2 / (self._size - 1)) ** 0.5 if self._size > 1 else 0.0
+                )
+                stats.cv = (
+                    (self._m2 / self._size) ** 0.5 / self._mean if self._mean else 0.0
+                )
+            return stats
+        values = self._values[self._head + offset : self._head + self._size]
+        if offset == 0:
+            n, mean, m2 = self._size, self._mean, self._m2
+        else:
+            n = len(values)
+            mean = float(values.mean())
+            m2 = float(((values - mean) ** 2).sum())
+        stats.n = n
+        stats.min = float(values.min())
+        stats.max = float(values.max())
+        stats.median = float(np.median(values))
+        stats.average = mean
+        stats.std = (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+        stats.cv = (m2 / n) ** 0.5 / mean if mean else 0.0
+        return stats
+
+    def _slide(self, key: Hashable, offset: int) -> WindowAggregates:
+        """Slides the aggregates of a window to begin at an offset and end at the newest entry.
+
+        The aggregates are created for a window first summarized, or one that begins before
+        the window's previous start, and the least recently used window is dropped if there
+        are more than `max_windows`.
+
+        Args:
+            key (Hashable): The key of the window.
+            offset (int): The position of the window's first entry in the series.
+        """
+        head = self._added - self._size
+        start = head + offset
+        aggregates = self._windows.pop(key, None)
+        if aggregates is None or aggregates.start > start or aggregates.end <= start:
+            aggregates = WindowAggregates(start=start)
+        self._windows[key] = aggregates
+        if len(self._windows) > self._max_windows:
+            del self._windows[next(iter(self._windows))]
+        values = self._values
+        while aggregates.start < start:
+            aggregates.pop(float(values[self._head + aggregates.start - head]))
+        for position in range(aggregates.end, self._added):
+            aggregates.push(float(values[self._head + position - head]))
+        if aggregates.removed >= self._capacity:
+            aggregates.recompute(values[self._head + offset : self._head + self._size])
+        return aggregates
+
+    def _evict_windows(self, n: int) -> None:
+        """Removes the oldest `n` entries from the aggregates of every window that holds them."""
+        head = self._added - self._size
+        cutoff = head + n
+        for key, aggregates in self._windows.items():
+            if aggregates.start >= cutoff:
+                continue
+            if aggregates.end <= cutoff:
+                self._windows[key] = WindowAggregates(start=cutoff)
+                continue
+            while aggregates.start < cutoff:
+                aggregates.pop(
+                    float(self._values[self._head + aggregates.start - head])
+                )
+
+    def _offset(self, since: Optional[float]) -> int:
+        """Returns the position of the first entry at or after a time, by binary search."""
+        if since is None or self._size == 0 or since <= self._times[self._head]:
+            return 0
+        return int(np.searchsorted(self.times, since, side="left"))
+
+    def _grow(self, size: int) -> None:
+        """Reallocates the buffer to hold at least `size` entries, up to the capacity."""
+        allocated = self._allocated
+        while allocated < size and allocated < self._capacity:
+            allocated *= 2
+        allocated = min(allocated, self._capacity)
+        times = np.zeros(2 * allocated)
+        values = np.zeros(2 * allocated)
+        for array, current in ((times, self.times), (values, self.values)):
+            array[: self._size] = current
+            array[allocated : allocated + self._size] = current
+        self._times, self._values = times, values
+        self._allocated = allocated
+        self._head = 0
+
+    def _recompute(self) -> None:
+        """Recomputes the running moments from the buffer."""
+        values = self.values
+        self._mean = float(values.mean())
+        self._m2 = float(((values - self._mean) ** 2).sum())
+        self._evicted = 0
+
+
 # ------------------------------------------------------------------------------------------------ #
 #                                    SESSION HISTORY                                               #
 # ------------------------------------------------------------------------------------------------ #
 class SessionHistory:
-    """A class to manage and store metrics for sessions, including latencies and throughputs."""
+    """A class to manage and store metrics for sessions, including latencies and throughputs.
+
+    Each metric is a `MetricSeries`, so recording a metric is O(1), and the statistics of a
+    metric over a time window are computed from running aggregates kept for that window,
+    rather than from every entry it spans.
+
+    Time windows are in seconds: a window selects the entries recorded within that many
+    seconds of now, located by binary search over the timestamps. Every metric is pruned to
+    `max_history` seconds, and holds at most `capacity` entries, so memory stays flat over
+    long runs whatever the request rate.
 
-    def __init__(self, max_history: int = 3600) -> None:
+    Latency percentiles are estimated by a `WindowedQuantileSketch`, within a relative
+    error of `relative_accuracy`, so the tail is tracked without sorting the latencies.
+
+    Failed requests have no latency, so the attempts, errors and throttles of each session
+    are recorded separately, with the count of each status, and error and throttle rates
+    are computed over the attempts within a window.
+    """
+
+    def __init__(
+        self,
+        max_history: int = 3600,
+        capacity: int = 2**17,
+        relative_accuracy: float = 0.01,
+        sketch_interval: float = 10.0,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
         """Initialize a SessionHistory instance.
 
         Args:
             max_history (int, optional): The maximum time window for retaining metrics history.
                                           Defaults to 3600 seconds.
+            capacity (int, optional): The maximum entries retained for each metric.
+                                          Defaults to 131072.
+            relative_accuracy (float, optional): The relative error of latency percentiles.
+                                          Defaults to 0.01.
+            sketch_interval (float, optional): The seconds spanned by each slice of the latency
+                                          sketch, to which time windows are resolved. Defaults to 10.
+            clock (Optional[Callable[[], float]]): The clock that timestamps the metrics, e.g. a
+                                          virtual clock in simulation. Defaults to `time.time`.
         """
+        self._clock = clock or time.time
         # Maximum time to retain metrics history
         self._max_history = max_history
+        self._capacity = capacity
+        self._relative_accuracy = relative_accuracy
+        self._sketch_interval = sketch_interval
         # Store latencies per request
-        self._latencies: Deque[Tuple[str, float, float]] = deque()
+        self._latencies = MetricSeries(capacity=capacity)
+        # Estimate latency percentiles per time slice
+        self._latency_sketch = WindowedQuantileSketch(
+            interval=sketch_interval, relative_accuracy=relative_accuracy
+        )
         # Store throughputs per session
-        self._throughputs: Deque[Tuple[str, float, float]] = deque()
+        self._throughputs = MetricSeries(capacity=capacity)
         # Store request rate per session from adapter
-        self._rates: Deque[Tuple[str, float, float]] = deque()
+        self._rates = MetricSeries(capacity=capacity)
         # Store delay per session from adapter
-        self._delays: Deque[Tuple[str, float, float]] = deque()
+        self._delays = MetricSeries(capacity=capacity)
         # Store concurrency per session from adapter
-        self._concurrencies: Deque[Tuple[str, float, float]] = deque()
+        self._concurrencies = MetricSeries(capacity=capacity)
+        # Store in-flight request counts per session from the concurrency limiter
+        self._in_flight = MetricSeries(capacity=capacity)
+        # Store queued request counts per session from the concurrency limiter
+        self._queued = MetricSeries(capacity=capacity)
+        # Store attempt, error and throttle counts per session
+        self._attempts = MetricSeries(capacity=capacity)
+        self._errors = MetricSeries(capacity=capacity)
+        self._throttles = MetricSeries(capacity=capacity)
+        # Store the count of each status per session
+        self._statuses: Deque[Tuple[float, Dict[int, int]]] = deque(maxlen=capacity)
         # Store the current session ID
         self._current_session_id: str = ""
         # Logging object for the class.
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
 
+    @property
+    def clock(self) -> Callable[[], float]:
+        """Returns the clock that timestamps the metrics."""
+        return self._clock
+
     @property
     def requests(self) -> int:
         """Returns the number of requests in history."""
@@ -236,6 +806,16 @@ class SessionHistory:
         """Returns the number of async request sessions."""
         return len(self._throughputs)
 
+    def clone(self) -> SessionHistory:
+        """Returns an empty history with the same retention, accuracy and clock."""
+        return SessionHistory(
+            max_history=self._max_history,
+            capacity=self._capacity,
+            relative_accuracy=self._relative_accuracy,
+            sketch_interval=self._sketch_interval,
+            clock=self._clock,
+        )
+
     def add_profile(self, profile: SessionProfile) -> None:
         """Update the metrics with data from the profile.
 
@@ -245,9 +825,23 @@ class SessionHistory:
         # Update current session ID
         self._current_session_id = profile.session_id
         # Add latencies from the profile
-        self._latencies.extend(profile.get_latencies())
+        latencies = profile.get_latencies()
+        if latencies:
+            entries = np.array([(sent, latency) for _, sent, latency in latencies])
+            self._latencies.extend(timestamps=entries[:, 0], values=entries[:, 1])
+            self._latency_sketch.add(
+                timestamp=profile.send_timestamp, values=entries[:, 1]
+            )
         # Add throughput from the profile
-        self._throughputs.append(profile.get_throughput())
+        _, timestamp, throughput = profile.get_throughput()
+        self._throughputs.append(timestamp=timestamp, value=throughput)
+        # Add status counts from the profile, as of the end of the session
+        if profile.statuses:
+            timestamp = self._clock()
+            self._attempts.append(timestamp=timestamp, value=profile.attempts)
+            self._errors.append(timestamp=timestamp, value=profile.errors)
+            self._throttles.append(timestamp=timestamp, value=profile.throttles)
+            self._statuses.append((timestamp, dict(profile.statuses)))
         # Remove outdated metrics
         self._prune()
 
@@ -257,19 +851,29 @@ class SessionHistory:
         Args:
             session_control (SessionControl): The session control instance containing rate, concurrency, and delay.
         """
+        timestamp = self._clock()
         # Add current rate to history
-        self._rates.append(
-            (self._current_session_id, time.time(), session_control.rate)
-        )
+        self._rates.append(timestamp=timestamp, value=session_control.rate)
         # Add current delay to history
-        self._delays.append(
-            (self._current_session_id, time.time(), session_control.delay)
-        )
+        self._delays.append(timestamp=timestamp, value=session_control.delay)
         # Add current concurrency to history
         self._concurrencies.append(
-            (self._current_session_id, time.time(), session_control.concurrency)
+            timestamp=timestamp, value=session_control.concurrency
         )
 
+    def add_limiter_counts(self, in_flight: int, queued: int) -> None:
+        """Add concurrency limiter counts to the history.
+
+        Args:
+            in_flight (int): The number of requests holding a concurrency slot.
+            queued (int): The number of requests waiting for a concurrency slot.
+        """
+        timestamp = self._clock()
+        # Add current in-flight count to history
+        self._in_flight.append(timestamp=timestamp, value=in_flight)
+        # Add current queued count to history
+        self._queued.append(timestamp=timestamp, value=queued)
+
     def get_requests(self, time_window: Optional[int] = None) -> int:
         """Returns total number of requests or the request count within a time window.
 
@@ -278,18 +882,8 @@ class SessionHistory:
 
         Returns: int
         """
-
         # A latency measure represents one request, we'll use that as a proxy for requests count.
-        latencies = (
-            [latency for _, _, latency in self._latencies][
-                -time_window:
-            ]  # Get latencies in the specified time window
-            if time_window and time_window <= len(self._latencies)
-            else [
-                latency for _, _, latency in self._latencies
-            ]  # Otherwise, get all latencies
-        )
-        return len(latencies)
+        return self._latencies.count(since=self._since(time_window))
 
     def get_sessions(self, time_window: Optional[int] = None) -> int:
         """Returns total number of sessions or the session count within a time window.
@@ -298,18 +892,70 @@ class SessionHistory:
 
         Returns: int
         """
-
         # A throughput measure represents one session, we'll use that as a proxy for session count.
-        throughputs = (
-            [throughput for _, _, throughput in self._throughputs][
-                -time_window:
-            ]  # Get latencies in the specified time window
-            if time_window and time_window <= len(self._throughputs)
-            else [
-                throughput for _, _, throughput in self._throughputs
-            ]  # Otherwise, get all latencies
+        return self._throughputs.count(since=self._since(time_window))
+
+    def get_attempts(self, time_window: Optional[int] = None) -> int:
+        """Returns the number of attempts, including failures, within a time window.
+
+        Args:
+            time_window (int, optional): The time window in seconds to count attempts for.
+
+        Returns: int
+        """
+        return int(
+            self._attempts.total(
+                since=self._since(time_window), window=self._window(time_window)
+            )
         )
-        return len(throughputs)
+
+    def get_error_rate(self, time_window: Optional[int] = None) -> float:
+        """Returns the fraction of attempts that failed within a time window.
+
+        Args:
+            time_window (int, optional): The time window in seconds to compute the rate for.
+
+        Returns:
+            float: The error rate, or 0 if there were no attempts.
+        """
+        return self._ratio(
+            self._errors,
+            since=self._since(time_window),
+            window=self._window(time_window),
+        )
+
+    def get_throttle_rate(self, time_window: Optional[int] = None) -> float:
+        """Returns the fraction of attempts the server throttled within a time window.
+
+        Args:
+            time_window (int, optional): The time window in seconds to compute the rate for.
+
+        Returns:
+            float: The throttle rate, or 0 if there were no attempts.
+        """
+        return self._ratio(
+            self._throttles,
+            since=self._since(time_window),
+            window=self._window(time_window),
+        )
+
+    def get_status_counts(self, time_window: Optional[int] = None) -> Dict[int, int]:
+        """Returns the count of each status within a time window.
+
+        Args:
+            time_window (int, optional): The time window in seconds to count statuses for.
+
+        Returns:
+            Dict[int, int]: The count of each status, with status 0 for no response.
+        """
+        since = self._since(time_window)
+        counts: Dict[int, int] = {}
+        for timestamp, statuses in reversed(self._statuses):
+            if since is not None and timestamp < since:
+                break
+            for status, count in statuses.items():
+                counts[status] = counts.get(status, 0) + count
+        return dict(sorted(counts.items()))
 
     def get_latency_stats(self, time_window: Optional[int] = None) -> SessionStats:
         """Create a statistical snapshot of performance within the specified time window.
@@ -318,194 +964,127 @@ class SessionHistory:
             time_window (int, optional): The time window in seconds to compute stats for.
 
         Returns:
-            StatisticalSnapshot: The computed stats for latencies and throughputs
-                and session control parameters.
+            SessionStats: The computed stats for latencies.
         """
-        # Create a SessionStats object for latencies
-        stats = SessionStats()
-
-        # Obtain all latencies or those for the time window
-        latencies = (
-            [latency for _, _, latency in self._latencies][
-                -time_window:
-            ]  # Get latencies in the specified time window
-            if time_window and time_window <= len(self._latencies)
-            else [
-                latency for _, _, latency in self._latencies
-            ]  # Otherwise, get all latencies
+        return self._summarize_latencies(
+            since=self._since(time_window), window=self._window(time_window)
         )
 
-        if latencies:
-            # Compute statistical metrics for latencies
-            stats.n = len(latencies)
-            stats.min = min(latencies)
-            stats.max = max(latencies)
-            stats.median = statistics.median(latencies)
-            stats.average = sum(latencies) / len(latencies)
-            stats.std = statistics.stdev(latencies)
-            try:
-                stats.cv = (
-                    (sum((x - stats.average) ** 2 for x in latencies) / len(latencies))
-                    ** 0.5
-                ) / stats.average
-            except ZeroDivisionError:
-                msg = "Coefficient of variation for latency is underfined for zero mean. Returning zero."
-                self._logger.warning(msg)
-                stats.cv = 0
-        return stats
+    def get_latency_percentile(
+        self, percentile: float, time_window: Optional[int] = None
+    ) -> float:
+        """Returns a percentile of the latencies within the specified time window.
+
+        Args:
+            percentile (float): The percentile, between 0 and 100, e.g. 95 for the p95 latency.
+            time_window (int, optional): The time window in seconds to consider.
+
+        Returns:
+            float: The latency percentile in seconds, or 0 if there are no latencies.
+        """
+        return self._latency_sketch.quantiles(
+            [percentile / 100], since=self._since(time_window)
+        )[0]
 
     def get_throughput_stats(self, time_window: Optional[int] = None) -> SessionStats:
-        # Create a SessionStats object for throughput
-        stats = SessionStats()
-        # Compute Throughput Stats
-        throughputs = (
-            [throughput for _, _, throughput in self._throughputs][
-                -time_window:
-            ]  # Get throughputs in the specified time window
-            if time_window and time_window <= len(self._throughputs)
-            else [
-                throughput for _, _, throughput in self._throughputs
-            ]  # Otherwise, get all throughputs
+        return self._throughputs.summarize(
+            since=self._since(time_window), window=self._window(time_window)
         )
 
-        if throughputs:
-            # Compute statistical metrics for throughputs
-            stats.n = len(throughputs)
-            stats.min = min(throughputs)
-            stats.max = max(throughputs)
-            stats.median = statistics.median(throughputs)
-            stats.std = statistics.stdev(throughputs)
-            stats.average = sum(throughputs) / len(throughputs)
-            try:
-                stats.cv = (
-                    (
-                        sum((x - stats.average) ** 2 for x in throughputs)
-                        / len(throughputs)
-                    )
-                    ** 0.5
-                ) / stats.average
-            except ZeroDivisionError:
-                msg = "Coefficient of variation for throughput is underfined for zero mean. Returning zero."
-                self._logger.warning(msg)
-                stats.cv = 0
-        return stats
-
     def get_rate_stats(self, time_window: Optional[int] = None) -> SessionStats:
-        # Create a SessionStats object for rates
-        stats = SessionStats()
-        # Compute Throughput Stats
-        rates = (
-            [rate for _, _, rate in self._rates][
-                -time_window:
-            ]  # Get rates in the specified time window
-            if time_window and time_window <= len(self._rates)
-            else [rate for _, _, rate in self._rates]  # Otherwise, get all rates
+        return self._rates.summarize(
+            since=self._since(time_window), window=self._window(time_window)
         )
 
-        if rates:
-            # Compute statistical metrics for rates
-            stats.n = len(rates)
-            stats.min = min(rates)
-            stats.max = max(rates)
-            stats.median = statistics.median(rates)
-            stats.std = statistics.stdev(rates)
-            stats.average = sum(rates) / len(rates)
-            try:
-                stats.cv = (
-                    (sum((x - stats.average) ** 2 for x in rates) / len(rates)) ** 0.5
-                ) / stats.average
-            except ZeroDivisionError:
-                msg = "Coefficient of variation for request rate is underfined for zero mean. Returning zero."
-                self._logger.warning(msg)
-                stats.cv = 0
-
-        return stats
-
     def get_delay_stats(self, time_window: Optional[int] = None) -> SessionStats:
-        # Create a SessionStats object for delays
-        stats = SessionStats()
-        # Compute Throughput Stats
-        delays = (
-            [delay for _, _, delay in self._delays][
-                -time_window:
-            ]  # Get delays in the specified time window
-            if time_window and time_window <= len(self._delays)
-            else [delay for _, _, delay in self._delays]  # Otherwise, get all delays
+        return self._delays.summarize(
+            since=self._since(time_window), window=self._window(time_window)
         )
 
-        if delays:
-            # Compute statistical metrics for delays
-            stats.n = len(delays)
-            stats.min = min(delays)
-            stats.max = max(delays)
-            stats.median = statistics.median(delays)
-            stats.std = statistics.stdev(delays)
-            stats.average = sum(delays) / len(delays)
-            try:
-                stats.cv = (
-                    (sum((x - stats.average) ** 2 for x in delays) / len(delays)) ** 0.5
-                ) / stats.average
-            except ZeroDivisionError:
-                msg = "Coefficient of variation for delay is underfined for zero mean. Returning zero."
-                self._logger.warning(msg)
-                stats.cv = 0
-        return stats
-
     def get_concurrency_stats(self, time_window: Optional[int] = None) -> SessionStats:
-        # Create a SessionStats object for concurrencies
-        stats = SessionStats()
-        # Compute Throughput Stats
-        concurrencies = (
-            [concurrency for _, _, concurrency in self._concurrencies][
-                -time_window:
-            ]  # Get concurrencies in the specified time window
-            if time_window and time_window <= len(self._concurrencies)
-            else [
-                concurrency for _, _, concurrency in self._concurrencies
-            ]  # Otherwise, get all concurrencies
+        return self._concurrencies.summarize(
+            since=self._since(time_window), window=self._window(time_window)
         )
 
-        if concurrencies:
-            # Compute statistical metrics for concurrencies
-            stats.n = len(concurrencies)
-            stats.min = min(concurrencies)
-            stats.max = max(concurrencies)
-            stats.median = statistics.median(concurrencies)
-            stats.std = statistics.stdev(concurrencies)
-            stats.average = sum(concurrencies) / len(concurrencies)
-            try:
-                stats.cv = (
-                    (
-                        sum((x - stats.average) ** 2 for x in concurrencies)
-                        / len(concurrencies)
-                    )
-                    ** 0.5
-                ) / stats.average
-            except ZeroDivisionError:
-                msg = "Coefficient of variation for latency is underfined for zero mean. Returning zero."
-                self._logger.warning(msg)
-                stats.cv = 0
+    def get_in_flight_stats(self, time_window: Optional[int] = None) -> SessionStats:
+        return self._in_flight.summarize(
+            since=self._since(time_window), window=self._window(time_window)
+        )
 
-        return stats
+    def get_queued_stats(self, time_window: Optional[int] = None) -> SessionStats:
+        return self._queued.summarize(
+            since=self._since(time_window), window=self._window(time_window)
+        )
 
     def get_snapshot(self, time_window: Optional[int] = None) -> StatisticalSnapshot:
-        requests = self.get_requests(time_window=time_window)
-        sessions = self.get_sessions(time_window=time_window)
-        latencies = self.get_latency_stats(time_window=time_window)
-        throughputs = self.get_throughput_stats(time_window=time_window)
-        rates = self.get_rate_stats(time_window=time_window)
-        delays = self.get_delay_stats(time_window=time_window)
-        concurrency = self.get_concurrency_stats(time_window=time_window)
-        snapshot = StatisticalSnapshot(
-            requests=requests,
-            sessions=sessions,
+        """Summarizes every metric within the specified time window in a single pass.
+
+        The start of the window is computed once, each series is summarized once from the
+        running aggregates of the window, and the attempts are totalled once for both the
+        error and throttle rates. The request and session counts are taken from the latency
+        and throughput summaries rather than computed separately.
+
+        Args:
+            time_window (int, optional): The time window in seconds to compute stats for.
+
+        Returns:
+            StatisticalSnapshot: The stats of every metric.
+        """
+        since = self._since(time_window)
+        window = self._window(time_window)
+        latencies = self._summarize_latencies(since=since, window=window)
+        throughputs = self._throughputs.summarize(since=since, window=window)
+        attempts = self._attempts.total(since=since, window=window)
+        return StatisticalSnapshot(
+            requests=latencies.n,
+            sessions=throughputs.n,
             latency_stats=latencies,
             throughput_stats=throughputs,
-            rate_stats=rates,
-            delay_stats=delays,
-            concurrency_stats=concurrency,
+            rate_stats=self._rates.summarize(since=since, window=window),
+            delay_stats=self._delays.summarize(since=since, window=window),
+            concurrency_stats=self._concurrencies.summarize(since=since, window=window),
+            in_flight_stats=self._in_flight.summarize(since=since, window=window),
+            queued_stats=self._queued.summarize(since=since, window=window),
+            attempts=int(attempts),
+            error_rate=self._ratio(
+                self._errors, since=since, window=window, attempts=attempts
+            ),
+            throttle_rate=self._ratio(
+                self._throttles, since=since, window=window, attempts=attempts
+            ),
         )
-        return snapshot
+
+    def _summarize_latencies(
+        self, since: Optional[float] = None, window: int = 0
+    ) -> SessionStats:
+        """Summarizes the latencies since a time, with percentiles from the sketch."""
+        stats = self._latencies.summarize(since=since, window=window)
+        if stats.n:
+            stats.p90, stats.p95, stats.p99 = self._latency_sketch.quantiles(
+                [0.90, 0.95, 0.99], since=since
+            )
+        return stats
+
+    def _ratio(
+        self,
+        series: MetricSeries,
+        since: Optional[float] = None,
+        window: int = 0,
+        attempts: Optional[float] = None,
+    ) -> float:
+        """Returns the total of a count series since a time as a fraction of the attempts."""
+        if attempts is None:
+            attempts = self._attempts.total(since=since, window=window)
+        return series.total(since=since, window=window) / attempts if attempts else 0.0
+
+    def _since(self, time_window: Optional[int] = None) -> Optional[float]:
+        """Returns the start of the specified time window, or None for the entire history."""
+        return self._clock() - time_window if time_window else None
+
+    @staticmethod
+    def _window(time_window: Optional[int] = None) -> int:
+        """Returns the key of the running aggregates of a time window, 0 for the entire history."""
+        return time_window or 0
 
     def _prune(self, time_window: Optional[int] = None) -> None:
         """Prune metrics that fall outside the specified time window.
@@ -514,23 +1093,29 @@ class SessionHistory:
             time_window (int, optional): The time window in seconds to retain metrics.
                                           If not provided, defaults to max_history.
 
-        This method removes metrics from the deques (latencies, requests)
-        that are older than the specified time window.
+        This method removes the entries of every metric that are older than the
+        specified time window.
         """
-        current_time = time.time()  # Get the current time
-        time_window = (
+        cutoff = self._clock() - (
             time_window or self._max_history
         )  # Use provided time window or default
 
-        # Prune latencies
-        while self._latencies and (current_time - self._latencies[0][1]) > time_window:
-            self._latencies.popleft()  # Remove oldest latency entry
-
-        # Prune throughputs
-        while (
-            self._throughputs and (current_time - self._throughputs[0][1]) > time_window
+        for series in (
+            self._latencies,
+            self._throughputs,
+            self._rates,
+            self._delays,
+            self._concurrencies,
+            self._in_flight,
+            self._queued,
+            self._attempts,
+            self._errors,
+            self._throttles,
         ):
-            self._throughputs.popleft()  # Remove oldest throughput entry
+            series.evict_before(cutoff)
+        self._latency_sketch.evict_before(cutoff)
+        while self._statuses and self._statuses[0][0] < cutoff:
+            self._statuses.popleft()
 
 
 # ------------------------------------------------------------------------------------------------ #
@@ -540,8 +1125,13 @@ class SessionHistory:
 class StatisticalSnapshot(DataClass):
     requests: int = 0
     sessions: int = 0
-    latency_stats: SessionStats = SessionStats()
-    throughput_stats: SessionStats = SessionStats()
-    rate_stats: SessionStats = SessionStats()
-    delay_stats: SessionStats = SessionStats()
-    concurrency_stats: SessionStats = SessionStats()
+    latency_stats: SessionStats = field(default_factory=SessionStats)
+    throughput_stats: SessionStats = field(default_factory=SessionStats)
+    rate_stats: SessionStats = field(default_factory=SessionStats)
+    delay_stats: SessionStats = field(default_factory=SessionStats)
+    concurrency_stats: SessionStats = field(default_factory=SessionStats)
+    in_flight_stats: SessionStats = field(default_factory=SessionStats)
+    queued_stats: SessionStats = field(default_factory=SessionStats)
+    attempts: int = 0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/proxy.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:34:07 pm                                                #
+# Modified   : Friday October 16th 2026 08:21:43 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Proxy Pool Module"""
+
+from __future__ import annotations
+
+import logging
+import random
+import statistics
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+from acquire.infra.web.profile import SessionStats
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                          PROXY                                                   #
+# ------------------------------------------------------------------------------------------------ #
+class Proxy:
+    """A proxy endpoint with latency and error statistics over a window of recent requests.
+
+    Like `SessionHistory`, statistics are computed over the last `window` observations.
+    Running sums keep the mean latency and error rate O(1) to read, since they are
+    consulted on every routing decision.
+
+    Args:
+        url (str): The proxy URL, including credentials.
+        window (int): The number of recent requests over which statistics are computed.
+
+    Attributes:
+        _latencies (Deque[float]): Latencies of recent successful requests in seconds.
+        _outcomes (Deque[bool]): Outcomes of recent requests, True for failures.
+        _latency_sum (float): The sum of `_latencies`.
+        _failures (int): The number of failures in `_outcomes`.
+        ejected_until (float): The clock time until which the proxy is ejected, or 0.
+        ejections (int): Consecutive ejections, which lengthen the next ejection.
+    """
+
+    def __init__(self, url: str, window: int) -> None:
+        self.url = url
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._latency_sum = 0.0
+        self._failures = 0
+        self.ejected_until = 0.0
+        self.ejections = 0
+
+    def __repr__(self) -> str:
+        # Credentials are not logged.
+        host = self.url.rsplit("@", 1)[-1]
+        return f"Proxy({host}, latency={round(self.latency, 3)}, error_rate={round(self.error_rate, 3)})"
+
+    @property
+    def samples(self) -> int:
+        """Returns the number of requests in the window."""
+        return len(self._outcomes)
+
+    @property
+    def latency(self) -> float:
+        """Returns the mean latency of recent successful requests, or 0 if there are none."""
+        return self._latency_sum / len(self._latencies) if self._latencies else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Returns the proportion of recent requests that failed."""
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def stats(self) -> SessionStats:
+        """Returns latency statistics for recent successful requests."""
+        stats = SessionStats()
+        latencies = list(self._latencies)
+        if latencies:
+            stats.n = len(latencies)
+            stats.min = min(latencies)
+            stats.max = max(latencies)
+            stats.median = statistics.median(latencies)
+            stats.average = self.latency
+            stats.std = statistics.stdev(latencies) if len(latencies) > 1 else 0
+            stats.cv = stats.std / stats.average if stats.average else 0
+        return stats
+
+    def is_ejected(self, now: float) -> bool:
+        """Returns whether the proxy is ejected at the given clock time."""
+        return now < self.ejected_until
+
+    def record(self, latency: Optional[float], failed: bool) -> None:
+        """Records the outcome of a request.
+
+        Args:
+            latency (Optional[float]): The latency in seconds, recorded for successful requests.
+            failed (bool): Whether the failure is attributable to the proxy.
+        """
+        if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(failed)
+        self._failures += int(failed)
+
+        if not failed and latency is not None:
+            if len(self._latencies) == self._latencies.maxlen:
+                self._latency_sum -= self._latencies[0]
+            self._latencies.append(latency)
+            self._latency_sum += latency
+
+    def reset(self) -> None:
+        """Clears the window, e.g. when the proxy is re-admitted after an ejection."""
+        self._latencies.clear()
+        self._outcomes.clear()
+        self._latency_sum = 0.0
+        self._failures = 0
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                        PROXY POOL                                                #
+# ------------------------------------------------------------------------------------------------ #
+class ProxyPool:
+    """Routes requests across proxies in proportion to their health and speed.
+
+    Each request is routed to a proxy drawn at random with weight inversely proportional
+    to its recent mean latency and discounted by its error rate. Faster, healthier proxies
+    therefore carry most of the traffic, while slower ones still receive enough to keep
+    their statistics current. Proxies with fewer than `min_samples` requests are weighted
+    at the pool's median latency, so new and re-admitted proxies are explored.
+
+    A proxy is ejected when, over at least `min_samples` requests, its error rate exceeds
+    `error_threshold` or its mean latency exceeds `latency_factor` times the median of the
+    other proxies. An ejected proxy receives no traffic for `ejection_time` seconds, doubling
+    with each consecutive ejection up to `max_ejection_time`. It is then re-admitted with a
+    cleared window. If every proxy is ejected, the one due back soonest is used.
+
+    Args:
+        urls (Sequence[str]): The proxy URLs. If empty, requests are not proxied.
+        window (int): The number of recent requests over which each proxy's statistics are computed.
+        min_samples (int): The requests required before a proxy can be ejected.
+        error_threshold (float): The error rate above which a proxy is ejected.
+        latency_factor (float): The multiple of the other proxies' median latency above which a
+            proxy is ejected.
+        ejection_time (float): Seconds a proxy is ejected for the first time.
+        max_ejection_time (float): The maximum seconds a proxy is ejected.
+        clock (Optional[Callable[[], float]]): A monotonic clock. Defaults to `time.monotonic`.
+        rng (Optional[random.Random]): The random number generator used for routing.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        window: int = 50,
+        min_samples: int = 10,
+        error_threshold: float = 0.3,
+        latency_factor: float = 3.0,
+        ejection_time: float = 30.0,
+        max_ejection_time: float = 600.0,
+        clock: Optional[Callable[[], float]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._proxies = [Proxy(url=url, window=window) for url in dict.fromkeys(urls)]
+        self._min_samples = min_samples
+        self._error_threshold = error_threshold
+        self._latency_factor = latency_factor
+        self._ejection_time = ejection_time
+        self._max_ejection_time = max_ejection_time
+        self._clock = clock or time.monotonic
+        self._rng = rng or random.Random()
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    @property
+    def proxies(self) -> List[Proxy]:
+        """Returns the proxies in the pool."""
+        return self._proxies
+
+    @property
+    def name(self) -> str:
+        """Returns a name for the pool from its proxy hosts, without credentials, or "direct" if empty."""
+        if not self._proxies:
+            return "direct"
+        hosts = sorted(
+            {urlsplit(proxy.url).netloc.rpartition("@")[2] for proxy in self._proxies}
+        )
+        return "+".join(hosts)
+
+    @property
+    def admitted(self) -> List[Proxy]:
+        """Returns the proxies currently eligible for traffic."""
+        now = self._clock()
+        return [proxy for proxy in self._proxies if not proxy.is_ejected(now)]
+
+    def select(self) -> Optional[Proxy]:
+        """Chooses the proxy for the next request.
+
+        Returns:
+            Optional[Proxy]: The proxy, or None if the pool is empty.
+        """
+        if not self._proxies:
+            return None
+        if len(self._proxies) == 1:
+            return self._proxies[0]
+
+        candidates = self.admitted
+        if not candidates:
+            return min(self._proxies, key=lambda proxy: proxy.ejected_until)
+
+        median = self._median_latency(candidates)
+        weights = []
+        for proxy in candidates:
+            latency = proxy.latency if proxy.samples >= self._min_samples else median
+            health = max(1.0 - proxy.error_rate, 0.01)
+            weights.append(health / latency if latency > 0 else health)
+        return self._rng.choices(candidates, weights=weights, k=1)[0]
+
+    def record(
+        self, proxy: Optional[Proxy], latency: Optional[float], failed: bool
+    ) -> None:
+        """Records the outcome of a request and ejects the proxy if it has become unhealthy.
+
+        Args:
+            proxy (Optional[Proxy]): The proxy the request was routed through.
+            latency (Optional[float]): The latency in seconds, for successful requests.
+            failed (bool): Whether the failure is attributable to the proxy.
+        """
+        if proxy is None or len(self._proxies) == 1:
+            return
+        now = self._clock()
+        if proxy.is_ejected(now):
+            # Requests in flight at ejection should not extend it.
+            return
+        if proxy.ejected_until:
+            # First outcome since re-admission: start from a clean window.
+            proxy.ejected_until = 0.0
+            proxy.reset()
+        proxy.record(latency=latency, failed=failed)
+
+        if proxy.samples < self._min_samples:
+            return
+        if proxy.error_rate > self._error_threshold:
+            self._eject(proxy, now, reason=f"error rate {round(proxy.error_rate, 2)}")
+            return
+        # Compare against the other proxies, so a slow proxy does not raise its own bar.
+        median = self._median_latency([p for p in self.admitted if p is not proxy])
+        if median and proxy.latency > self._latency_factor * median:
+            self._eject(proxy, now, reason=f"latency {round(proxy.latency, 3)}s")
+            return
+        if not failed:
+            proxy.ejections = 0
+
+    def _eject(self, proxy: Proxy, now: float, reason: str) -> None:
+        """Ejects a proxy, backing off exponentially for consecutive ejections."""
+        duration = min(
+            self._ejection_time * 2**proxy.ejections, self._max_ejection_time
+        )
+        proxy.ejections += 1
+        proxy.ejected_until = now + duration
+        self._logger.info(f"Ejected {proxy} for {round(duration)} seconds: {reason}.")
+
+    def _median_latency(self, proxies: List[Proxy]) -> float:
+        """Returns the median latency of the proxies with enough samples, or 0 if none have."""
+        latencies = [
+            proxy.latency for proxy in proxies if proxy.samples >= self._min_samples
+        ]
+        return statistics.median(latencies) if latencies else 0.0
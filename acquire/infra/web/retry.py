@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/retry.py                                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:26:15 pm                                                #
+# Modified   : Friday October 16th 2026 07:26:15 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Retry Policy Module"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Mapping, Optional
+
+import aiohttp
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      RETRY POLICY                                                #
+# ------------------------------------------------------------------------------------------------ #
+class RetryPolicy:
+    """Decides whether a failed request is retried and how long to back off first.
+
+    Status codes in `no_retry` fail immediately, since a retry cannot succeed. Status codes
+    in `backoff` signal that the server is throttling or overloaded; for these, a
+    `Retry-After` header is honored, up to `retry_after_cap` seconds. Other server
+    errors, timeouts and connection errors are retried with jittered exponential backoff.
+    The backoff uses "full jitter": the delay is drawn uniformly between zero and the
+    exponential ceiling. This spreads retries out, so a burst of failures does not come
+    back as a synchronized burst of retries.
+
+    Args:
+        attempts (int): The maximum number of attempts per request, including the first.
+        base (float): The backoff ceiling for the first retry, in seconds.
+        cap (float): The maximum backoff ceiling, in seconds.
+        retry_after_cap (float): The maximum delay honored from a `Retry-After` header, in seconds.
+        no_retry (Collection[int]): Status codes that are never retried.
+        backoff (Collection[int]): Status codes that signal throttling and honor `Retry-After`.
+        rng (Optional[random.Random]): The random number generator used for jitter.
+
+    Attributes:
+        _attempts (int): The maximum number of attempts per request.
+        _base (float): The backoff ceiling for the first retry.
+        _cap (float): The maximum backoff ceiling.
+        _retry_after_cap (float): The maximum delay honored from a `Retry-After` header.
+        _no_retry (frozenset): Status codes that are never retried.
+        _backoff (frozenset): Status codes that honor `Retry-After`.
+    """
+
+    def __init__(
+        self,
+        attempts: int,
+        base: float = 1.0,
+        cap: float = 60.0,
+        retry_after_cap: float = 300.0,
+        no_retry: Collection[int] = (400, 401, 403, 404, 410),
+        backoff: Collection[int] = (429, 503),
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._attempts = max(int(attempts), 1)
+        self._base = float(base)
+        self._cap = float(cap)
+        self._retry_after_cap = float(retry_after_cap)
+        self._no_retry = frozenset(no_retry)
+        self._backoff = frozenset(backoff)
+        self._rng = rng or random.Random()
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def attempts(self) -> int:
+        """Returns the maximum number of attempts per request."""
+        return self._attempts
+
+    def should_retry(self, status: Optional[int], attempt: int) -> bool:
+        """Returns whether a request that failed on the given attempt should be retried.
+
+        Args:
+            status (Optional[int]): The HTTP status code, or None for timeouts and connection errors.
+            attempt (int): The number of attempts made so far, starting at one.
+        """
+        if attempt >= self._attempts:
+            return False
+        if status is None or status in self._backoff:
+            return True
+        if status in self._no_retry:
+            return False
+        # Other client errors will not succeed on retry; server errors may.
+        return status >= 500
+
+    def delay(
+        self, status: Optional[int], attempt: int, retry_after: Optional[float] = None
+    ) -> float:
+        """Returns the seconds to wait before the next attempt.
+
+        Args:
+            status (Optional[int]): The HTTP status code, or None for timeouts and connection errors.
+            attempt (int): The number of attempts made so far, starting at one.
+            retry_after (Optional[float]): The delay requested by the server, in seconds.
+        """
+        ceiling = min(self._cap, self._base * 2 ** (attempt - 1))
+        delay = self._rng.uniform(0, ceiling)
+        if status in self._backoff and retry_after is not None:
+            # Wait at least as long as the server asked, plus jitter to avoid a thundering herd.
+            delay += min(max(retry_after, 0.0), self._retry_after_cap)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        """Parses a `Retry-After` header given as delay-seconds or an HTTP-date.
+
+        Args:
+            headers (Optional[Mapping[str, str]]): The response headers.
+
+        Returns:
+            Optional[float]: The requested delay in seconds, or None if absent or unparseable.
+        """
+        value = headers.get("Retry-After") if headers else None
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(tz=timezone.utc)).total_seconds(), 0.0)
+
+    @staticmethod
+    def classify(exc: BaseException) -> tuple[Optional[int], Optional[float]]:
+        """Extracts the status code and `Retry-After` delay from a request exception.
+
+        Args:
+            exc (BaseException): The exception raised by the request.
+
+        Returns:
+            tuple[Optional[int], Optional[float]]: The status code, or None if the request
+                did not produce a response, and the `Retry-After` delay in seconds, if any.
+        """
+        if isinstance(exc, aiohttp.ClientResponseError):
+            return exc.status, RetryPolicy.parse_retry_after(exc.headers)
+        return None, None
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      RETRY SCHEDULER                                             #
+# ------------------------------------------------------------------------------------------------ #
+class RetryScheduler:
+    """Holds failed requests out of the pipeline while they back off.
+
+    Requests that are backing off hold no concurrency slot. When a retry is due it re-enters
+    the concurrency limiter at `priority`, which is behind fresh requests.
+
+    Args:
+        policy (RetryPolicy): The policy that decides whether and when to retry.
+        priority (int): The limiter priority at which retries re-enter. Defaults to 1.
+
+    Attributes:
+        _policy (RetryPolicy): The retry policy.
+        _priority (int): The limiter priority for retries.
+        _backing_off (int): The number of requests currently backing off.
+        _scheduled (int): The total number of retries scheduled.
+        _abandoned (int): The total number of requests abandoned without further retries.
+    """
+
+    def __init__(self, policy: RetryPolicy, priority: int = 1) -> None:
+        self._policy = policy
+        self._priority = priority
+        self._backing_off = 0
+        self._scheduled = 0
+        self._abandoned = 0
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def policy(self) -> RetryPolicy:
+        """Returns the retry policy."""
+        return self._policy
+
+    @property
+    def priority(self) -> int:
+        """Returns the limiter priority at which retries re-enter the pipeline."""
+        return self._priority
+
+    @property
+    def backing_off(self) -> int:
+        """Returns the number of requests currently backing off."""
+        return self._backing_off
+
+    @property
+    def scheduled(self) -> int:
+        """Returns the total number of retries scheduled."""
+        return self._scheduled
+
+    @property
+    def abandoned(self) -> int:
+        """Returns the total number of requests abandoned without further retries."""
+        return self._abandoned
+
+    async def backoff(self, exc: BaseException, attempt: int) -> bool:
+        """Waits out the backoff for a request that failed on the given attempt.
+
+        The caller must not hold a concurrency slot while awaiting this method.
+
+        Args:
+            exc (BaseException): The exception raised by the request.
+            attempt (int): The number of attempts made so far, starting at one.
+
+        Returns:
+            bool: True once the retry is due, or False immediately if the request
+                should not be retried.
+        """
+        status, retry_after = self._policy.classify(exc)
+        if not self._policy.should_retry(status=status, attempt=attempt):
+            self._abandoned += 1
+            self._logger.debug(
+                f"Not retrying after attempt {attempt} with status {status}: {exc}"
+            )
+            return False
+
+        self._scheduled += 1
+        delay = self._policy.delay(
+            status=status, attempt=attempt, retry_after=retry_after
+        )
+        self._backing_off += 1
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._backing_off -= 1
+        return True
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/sketch.py                                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:12:22 pm                                                #
+# Modified   : Friday October 16th 2026 08:12:22 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Streaming Quantile Sketch Module"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                     QUANTILE SKETCH                                              #
+# ------------------------------------------------------------------------------------------------ #
+class QuantileSketch:
+    """Estimates quantiles of a stream of positive values within a relative error (DDSketch).
+
+    Values are counted in logarithmic buckets: bucket i holds the values in
+    (gamma^(i-1), gamma^i], where gamma = (1 + a) / (1 - a) for a relative accuracy a, and a
+    quantile is estimated from the bucket holding its rank. Any quantile is then within a
+    relative error of a of the true value, without keeping or sorting the samples. Sketches
+    with the same accuracy merge exactly by adding their bucket counts.
+
+    The counts are a dense NumPy array spanning the buckets seen. If the span exceeds
+    `max_buckets`, the lowest buckets are collapsed into one, which only coarsens the
+    lowest quantiles.
+
+    Args:
+        relative_accuracy (float): The relative error of the quantile estimates, e.g. 0.01 for 1%.
+        max_buckets (int): The maximum number of buckets.
+        min_value (float): Values at or below this are counted as zero.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        max_buckets: int = 2048,
+        min_value: float = 1e-9,
+    ) -> None:
+        self._relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max(max_buckets, 1)
+        self._min_value = min_value
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._offset = 0  # The bucket index of the first count.
+        self._zero = 0  # Values at or below min_value.
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        """Returns the number of values added."""
+        return self._count
+
+    @property
+    def relative_accuracy(self) -> float:
+        """Returns the relative error of the quantile estimates."""
+        return self._relative_accuracy
+
+    def add(self, values: Union[float, Iterable[float], np.ndarray]) -> None:
+        """Adds one or more values.
+
+        Args:
+            values (Union[float, Iterable[float], np.ndarray]): The values.
+        """
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        if len(values) == 0:
+            return
+        positive = values[values > self._min_value]
+        self._zero += len(values) - len(positive)
+        self._count += len(values)
+        if len(positive) == 0:
+            return
+        indices = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+        self._reserve(low=int(indices.min()), high=int(indices.max()))
+        indices = np.maximum(indices, self._offset) - self._offset
+        self._counts += np.bincount(indices, minlength=len(self._counts))
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Adds the values counted by another sketch with the same accuracy.
+
+        Args:
+            other (QuantileSketch): The sketch to merge.
+
+        Raises:
+            ValueError: If the sketches have different accuracies.
+        """
+        if other._gamma != self._gamma:
+            raise ValueError(
+                "Only sketches with the same relative accuracy can be merged."
+            )
+        self._zero += other._zero
+        self._count += other._count
+        if not other._counts.any():
+            return
+        self._reserve(low=other._offset, high=other._offset + len(other._counts) - 1)
+        start = other._offset - self._offset
+        if start >= 0:
+            self._counts[start : start + len(other._counts)] += other._counts
+        else:
+            # Buckets below the collapsed range are counted in the lowest bucket.
+            self._counts[0] += other._counts[:-start].sum()
+            self._counts[: len(other._counts) + start] += other._counts[-start:]
+
+    def quantile(self, q: float) -> float:
+        """Returns the estimate of a quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1, e.g. 0.95.
+
+        Returns:
+            float: The estimate, or 0 if no values have been added.
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Returns the estimates of several quantiles from one pass over the buckets.
+
+        Args:
+            qs (Iterable[float]): The quantiles, each between 0 and 1.
+
+        Returns:
+            List[float]: The estimates, or zeros if no values have been added.
+        """
+        qs = list(qs)
+        if self._count == 0:
+            return [0.0] * len(qs)
+        cumulative = np.cumsum(self._counts)
+        estimates = []
+        for q in qs:
+            rank = min(max(q, 0.0), 1.0) * (self._count - 1)
+            if rank < self._zero:
+                estimates.append(0.0)
+                continue
+            bucket = int(np.searchsorted(cumulative, rank - self._zero, side="right"))
+            bucket = min(bucket, len(cumulative) - 1)
+            index = self._offset + bucket
+            estimates.append(2 * self._gamma**index / (self._gamma + 1))
+        return estimates
+
+    def _reserve(self, low: int, high: int) -> None:
+        """Extends the buckets to span `low` to `high`, collapsing the lowest if too many."""
+        if len(self._counts) == 0:
+            low = max(low, high - self._max_buckets + 1)
+            self._counts = np.zeros(high - low + 1, dtype=np.int64)
+            self._offset = low
+            return
+        current_high = self._offset + len(self._counts) - 1
+        new_low = min(low, self._offset)
+        new_high = max(high, current_high)
+        new_low = max(new_low, new_high - self._max_buckets + 1)
+        if new_low == self._offset and new_high == current_high:
+            return
+        counts = np.zeros(new_high - new_low + 1, dtype=np.int64)
+        start = self._offset - new_low
+        if start >= 0:
+            counts[start : start + len(self._counts)] = self._counts
+        else:
+            counts[0] = self._counts[: -start + 1].sum()
+            counts[1 : len(self._counts) + start] = self._counts[-start + 1 :]
+        self._counts = counts
+        self._offset = new_low
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                WINDOWED QUANTILE SKETCH                                          #
+# ------------------------------------------------------------------------------------------------ #
+class WindowedQuantileSketch:
+    """Estimates quantiles of the values observed within a time window.
+
+    Values are counted in one `QuantileSketch` per time slice of `interval` seconds. The
+    quantiles of a window merge the slices that overlap it, so a window is resolved to the
+    slice, and expired slices are dropped whole.
+
+    Args:
+        interval (float): The seconds spanned by each slice.
+        relative_accuracy (float): The relative error of the quantile estimates.
+        max_buckets (int): The maximum number of buckets in each slice.
+    """
+
+    def __init__(
+        self,
+        interval: float = 10.0,
+        relative_accuracy: float = 0.01,
+        max_buckets: int = 2048,
+    ) -> None:
+        self._interval = interval
+        self._relative_accuracy = relative_accuracy
+        self._max_buckets = max_buckets
+        self._slices: Deque[Tuple[float, QuantileSketch]] = deque()
+
+    @property
+    def count(self) -> int:
+        """Returns the number of values in the retained slices."""
+        return sum(sketch.count for _, sketch in self._slices)
+
+    def add(
+        self, timestamp: float, values: Union[float, Iterable[float], np.ndarray]
+    ) -> None:
+        """Adds values observed at a time.
+
+        Args:
+            timestamp (float): The time of the observations, in seconds since the epoch.
+            values (Union[float, Iterable[float], np.ndarray]): The values.
+        """
+        start = math.floor(timestamp / self._interval) * self._interval
+        if not self._slices or self._slices[-1][0] < start:
+            sketch = QuantileSketch(
+                relative_accuracy=self._relative_accuracy, max_buckets=self._max_buckets
+            )
+            self._slices.append((start, sketch))
+        # Values observed out of order are counted in the latest slice.
+        self._slices[-1][1].add(values)
+
+    def quantiles(
+        self, qs: Iterable[float], since: Optional[float] = None
+    ) -> List[float]:
+        """Returns the estimates of several quantiles within a time window.
+
+        Args:
+            qs (Iterable[float]): The quantiles, each between 0 and 1.
+            since (Optional[float]): The start of the window. If None, every slice is merged.
+
+        Returns:
+            List[float]: The estimates, or zeros if there are no values in the window.
+        """
+        slices = [
+            sketch
+            for start, sketch in self._slices
+            if since is None or start + self._interval > since
+        ]
+        if len(slices) == 1:
+            return slices[0].quantiles(qs)
+        merged = QuantileSketch(
+            relative_accuracy=self._relative_accuracy, max_buckets=self._max_buckets
+        )
+        for sketch in slices:
+            merged.merge(sketch)
+        return merged.quantiles(qs)
+
+    def evict_before(self, cutoff: float) -> None:
+        """Drops the slices that end at or before a time.
+
+        Args:
+            cutoff (float): The earliest time retained.
+        """
+        while self._slices and self._slices[0][0] + self._interval <= cutoff:
+            self._slices.popleft()
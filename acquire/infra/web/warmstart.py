@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /acquire/infra/web/warmstart.py                                                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:19:57 pm                                                #
+# Modified   : Friday October 16th 2026 08:58:41 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+"""Adapter Warm Start Module"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from acquire.core.data import DataClass
+from acquire.infra.web.profile import SessionStats
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                      ADAPTER STATE                                               #
+# ------------------------------------------------------------------------------------------------ #
+@dataclass
+class AdapterState(DataClass):
+    """The operating point an adapter converged on for an upstream.
+
+    Attributes:
+        key (str): The upstream, as host/endpoint/proxy, e.g. "itunes.apple.com/appdata/direct".
+        rate (float): The rate in requests per second.
+        concurrency (float): The concurrency.
+        baseline (SessionStats): The baseline latency statistics the rate was explored against.
+        error_rate (float): The baseline error rate over which a rise backs off.
+        throttle_rate (float): The baseline throttle rate over which a rise backs off.
+        saved (float): When the state was saved, in seconds since the epoch.
+    """
+
+    key: str
+    rate: float
+    concurrency: float
+    baseline: SessionStats = field(default_factory=SessionStats)
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    saved: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """Returns the seconds since the state was saved."""
+        return time.time() - self.saved
+
+
+# ------------------------------------------------------------------------------------------------ #
+#                                   ADAPTER STATE STORE                                            #
+# ------------------------------------------------------------------------------------------------ #
+class AdapterStateStore:
+    """Persists adapter states by upstream, so new sessions start from the last operating point.
+
+    Each state is a small JSON file, replaced atomically, so sessions in several worker
+    processes can save their states concurrently. A state older than `max_age` is stale:
+    the upstream may have changed since, so it is not returned, and the adapter falls back
+    to its baseline stage.
+
+    Args:
+        directory (str): The directory holding the state files.
+        max_age (float): The seconds for which a saved state is fresh.
+    """
+
+    def __init__(self, directory: str, max_age: float = 86400) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._max_age = max_age
+        self._logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+
+    def get(self, key: str) -> Optional[AdapterState]:
+        """Returns the state saved for an upstream, if any, and fresh.
+
+        Args:
+            key (str): The upstream.
+
+        Returns:
+            Optional[AdapterState]: The state, or None if none is saved, it is unreadable, or stale.
+        """
+        try:
+            with open(self._filepath(key), encoding="utf-8") as file:
+                data = json.load(file)
+            state = AdapterState(
+                key=data["key"],
+                rate=float(data["rate"]),
+                concurrency=float(data["concurrency"]),
+                baseline=SessionStats(**data["baseline"]),
+                error_rate=float(data.get("error_rate", 0.0)),
+                throttle_rate=float(data.get("throttle_rate", 0.0)),
+                saved=float(data["saved"]),
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self._logger.warning(f"Unreadable adapter state for {key}: {e}")
+            return None
+
+        if state.age > self._max_age:
+            self._logger.info(
+                f"Adapter state for {key} is stale, saved {round(state.age)} seconds ago."
+            )
+            return None
+        return state
+
+    def set(self, state: AdapterState) -> None:
+        """Saves the state for its upstream, replacing any saved before.
+
+        Args:
+            state (AdapterState): The state.
+        """
+        filepath = self._filepath(state.key)
+        temp = f"{filepath}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(state.as_dict(), file)
+        os.replace(temp, filepath)
+
+    def _filepath(self, key: str) -> str:
+        """Returns the state file for a key: the readable part of the key, and a digest of it."""
+        name = re.sub(r"[^A-Za-z0-9._-]+", "_", key)[:64]
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self._directory, f"{name}-{digest}.json")
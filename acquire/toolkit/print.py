@@ -11,7 +11,7 @@
 # URL        : https://github.com/variancexplained/appvocai-acquire                                #
 # ------------------------------------------------------------------------------------------------ #
 # Created    : Monday May 6th 2024 11:07:56 pm                                                     #
-# Modified   : Sunday September 1st 2024 06:17:01 pm                                               #
+# Modified   : Friday October 16th 2026 09:00:01 pm                                                #
 # ------------------------------------------------------------------------------------------------ #
 # License    : MIT License                                                                         #
 # Copyright  : (c) 2024 John James                                                                 #
@@ -83,7 +83,7 @@ class Printer:
         trailer = f"\n\n# {breadth * '='} #\n"
         print(trailer)
 
-    def print_dict(self, title: str, data: Dict[str,Any]) -> None:
+    def print_dict(self, title: str, data: Dict[str, Any]) -> None:
         """
         Prints a dictionary in a formatted manner.
 
@@ -101,6 +101,19 @@ class Printer:
         s += "\n\n"
         print(s)
 
+    def print_dataframe(self, df: pd.DataFrame, title: str) -> None:
+        """
+        Prints a DataFrame as a table, without its index.
+
+        Args:
+            df (pd.DataFrame): A pandas DataFrame object.
+            title (str): The title to be printed above the table.
+        """
+        s = f"\n\n{title.center(self._width, ' ')}\n\n"
+        s += df.to_string(index=False)
+        s += "\n\n"
+        print(s)
+
     def print_dataframe_as_dict(
         self, df: pd.DataFrame, title: str, list_index: int = 0
     ) -> None:
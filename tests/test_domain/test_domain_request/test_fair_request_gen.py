@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_domain/test_domain_request/test_fair_request_gen.py                     #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:06:29 pm                                                #
+# Modified   : Friday October 16th 2026 08:50:03 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from acquire.domain.artifact.request.fair import FairRequestGen
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+class Spec:
+    pass
+
+
+class Page:
+    def __init__(self, spec, page):
+        self.spec = spec
+        self.page = page
+
+
+class PageGen:
+    def __init__(self, pages):
+        self._spec = Spec()
+        self._pages = pages
+        self._page = 0
+
+    @property
+    def bookmark(self):
+        return self._page
+
+    def next_request(self):
+        if self._page >= self._pages:
+            return None
+        self._page += 1
+        return Page(spec=self._spec, page=self._page - 1)
+
+
+@pytest.mark.domain
+@pytest.mark.fair
+class TestFairRequestGen:  # pragma: no cover
+    # ============================================================================================ #
+    def test_shares(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        request_gen = FairRequestGen()
+        request_gen.add(key="games", request_gen=PageGen(pages=1000), weight=2)
+        request_gen.add(key="books", request_gen=PageGen(pages=1000))
+        request_gen.add(key="weather", request_gen=PageGen(pages=10))
+        with pytest.raises(ValueError):
+            request_gen.add(key="books", request_gen=PageGen(pages=10))
+        with pytest.raises(ValueError):
+            request_gen.add(key="news", request_gen=PageGen(pages=10), weight=0)
+
+        # Requests are drawn in proportion to weight, so the small job is not starved.
+        drawn = Counter(
+            request_gen.key_of(request_gen.next_request()) for _ in range(40)
+        )
+        assert drawn == {"games": 20, "books": 10, "weather": 10}
+
+        # Once a job is exhausted, its share passes to the jobs that remain.
+        drawn = Counter(
+            request_gen.key_of(request_gen.next_request()) for _ in range(30)
+        )
+        assert drawn == {"games": 20, "books": 10}
+        assert request_gen.stats["weather"].finished
+
+        # A finished job is drawn from no further.
+        request_gen.finish(key="games")
+        request = request_gen.next_request()
+        assert request_gen.key_of(request) == "books"
+        request_gen.complete(request=request, response=None)
+        stats = request_gen.stats
+        assert stats["books"].requests == 21
+        assert stats["books"].failures == 1
+        assert stats["games"].bookmark == 40
+
+        # A job that cannot succeed is retired, unfinished, and the others run on.
+        request_gen.retire(key="books", error="Short-circuited: 404 rate 0.95")
+        assert request_gen.next_request() is None
+        request_gen.finish(key="books")
+        stats = request_gen.stats
+        assert not stats["books"].finished
+        assert stats["books"].error == "Short-circuited: 404 rate 0.95"
+        assert stats["games"].finished and not stats["games"].error
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_domain/test_domain_request/test_request.py                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:02:54 pm                                                #
+# Modified   : Friday October 16th 2026 09:00:27 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import copy
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.domain.artifact.request import appdata
+from acquire.domain.artifact.request.appdata import RequestAppDataGen
+from acquire.domain.artifact.request.review import AppReviewRequestGen
+from acquire.infra.web.header import STOREFRONT
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+CONTEXT = SimpleNamespace(category=SimpleNamespace(value=6014))
+
+
+@pytest.mark.domain
+@pytest.mark.request
+class TestRequest:  # pragma: no cover
+    # ============================================================================================ #
+    def test_params(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        request = RequestAppDataGen(
+            context=CONTEXT, start_page=2, limit=200
+        ).next_request()
+        assert request.page == 2
+        assert request.context is CONTEXT
+        assert request.baseurl == "https://itunes.apple.com/search?"
+        assert request.params == {
+            "media": "software",
+            "genreId": 6014,
+            "term": "app",
+            "country": "us",
+            "lang": "en-us",
+            "explicit": "yes",
+            "limit": 200,
+            "offset": 400,
+        }
+        assert request.endpoint == "itunes.apple.com/appdata/us"
+
+        request = AppReviewRequestGen(
+            context=CONTEXT, app_id=1234, start_page=3, limit=400
+        ).next_request()
+        assert request.page == 3
+        assert request.baseurl == (
+            "https://itunes.apple.com/WebObjects/MZStore.woa/wa/userReviewsRow"
+            "?id=1234&displayable-kind=11&startIndex=1200&endIndex=1600&sort=1"
+        )
+        assert request.params == {}
+        assert request.headers == STOREFRONT["headers"]
+        assert request.endpoint == "itunes.apple.com/review/us"
+
+        # Each storefront's reviews are a separate endpoint, selected by the storefront header.
+        storefront = {
+            "country": "gb",
+            "headers": {"X-Apple-Store-Front": "143444-2,29"},
+        }
+        request = AppReviewRequestGen(
+            context=CONTEXT, app_id=1234, storefront=storefront
+        ).next_request()
+        assert request.headers == storefront["headers"]
+        assert request.endpoint == "itunes.apple.com/review/gb"
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_headers(self, monkeypatch, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Each draw from the header rotation is distinct, so a redraw would show.
+        monkeypatch.setattr(
+            appdata, "headers", iter({"User-Agent": str(i)} for i in range(10))
+        )
+        request_gen = RequestAppDataGen(context=CONTEXT)
+        request, other = request_gen.next_request(), request_gen.next_request()
+
+        # The headers are chosen once per request, and used for every attempt and any hedge.
+        headers = request.headers
+        assert headers == {"User-Agent": "0"}
+        assert request.headers is headers
+        assert copy.copy(request).headers is headers
+        # Requeueing keeps the headers too.
+        request_gen.requeue([request])
+        assert request_gen.next_request().headers is headers
+        # Other requests draw their own.
+        assert other.headers == {"User-Agent": "1"}
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_max_requests(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Batches stop at max_requests, with a short final batch.
+        for request_gen in (
+            RequestAppDataGen(
+                context=CONTEXT, max_requests=5, batch_size=2, start_page=10
+            ),
+            AppReviewRequestGen(
+                context=CONTEXT,
+                app_id=1234,
+                max_requests=5,
+                batch_size=2,
+                start_page=10,
+            ),
+        ):
+            batches = [
+                [request.page for request in batch.requests] for batch in request_gen
+            ]
+            assert batches == [[10, 11], [12, 13], [14]]
+            assert request_gen.bookmark == 15
+            with pytest.raises(StopIteration):
+                next(request_gen)
+
+        # Iterating asynchronously yields the same pages, one request at a time.
+        async def pages(request_gen) -> list:
+            return [request.page async for request in request_gen]
+
+        for request_gen in (
+            RequestAppDataGen(context=CONTEXT, max_requests=5, start_page=10),
+            AppReviewRequestGen(
+                context=CONTEXT, app_id=1234, max_requests=5, start_page=10
+            ),
+        ):
+            assert asyncio.run(pages(request_gen)) == [10, 11, 12, 13, 14]
+            assert request_gen.next_request() is None
+
+        # Requeued requests are drawn again, earliest page first, before any new page.
+        for request_gen in (
+            RequestAppDataGen(context=CONTEXT, max_requests=5),
+            AppReviewRequestGen(context=CONTEXT, app_id=1234, max_requests=5),
+        ):
+            drawn = [request_gen.next_request() for _ in range(3)]
+            request_gen.requeue([drawn[2], drawn[0]])
+            assert [request_gen.next_request().page for _ in range(4)] == [0, 2, 3, 4]
+            assert request_gen.next_request() is None
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_breaker.py                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:43:17 pm                                                #
+# Modified   : Friday October 16th 2026 08:48:06 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import functools
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.application.orchestration.context import JobContext
+from acquire.application.orchestration.loadtest import LoadTestRequestGen
+from acquire.application.orchestration.runner import default_session_factory
+from acquire.core.enum import Category, CircuitState, DataType
+from acquire.infra.exceptions.web import ShortCircuitError
+from acquire.infra.web.asession import AsyncSession
+from acquire.infra.web.breaker import CircuitBreaker
+from acquire.infra.web.mock import MockAppStore, MockProfile
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+CONFIG = {
+    "closed_burnin_period": 10,
+    "closed_failure_rate_threshold": 0.5,
+    "closed_window_size": 30,
+    "half_open_delay": 2,
+    "half_open_failure_rate_threshold": 0.3,
+    "half_open_window_size": 60,
+    "open_cooldown_period": 30,
+    "short_circuit_404s_failure_rate_threshold": 0.7,
+    "short_circuit_404s_window_size": 20,
+    "short_circuit_errors_failure_rate_threshold": 0.9,
+    "short_circuit_errors_window_size": 20,
+    "min_requests": 5,
+}
+
+
+def context(job_id: str) -> JobContext:
+    return JobContext(
+        job_id=job_id,
+        category=Category.BUSINESS,
+        data_type=DataType.APPDATA,
+        description="Short circuit test",
+        dt_created=datetime.now(),
+    )
+
+
+def profile(apps_per_genre: int) -> MockProfile:
+    return MockProfile(
+        latency_median=0.005,
+        apps_per_genre=apps_per_genre,
+        end_status=404,
+        throttle_interval=3600,
+        throttle_duration=0,
+    )
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.web
+@pytest.mark.breaker
+class TestCircuitBreaker:  # pragma: no cover
+    # ============================================================================================ #
+    def test_states(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = Clock()
+        breaker = CircuitBreaker(**CONFIG, clock=clock)
+        # Failures during the burn-in period do not open the breaker.
+        for status in (200, 503, 503, 503, 503):
+            assert breaker.allow()
+            breaker.record(status=status)
+        assert breaker.state == CircuitState.CLOSED
+        # After burn-in, an error rate above the threshold opens it.
+        clock.now = 10
+        breaker.record(status=None)
+        assert breaker.state == CircuitState.OPEN
+        # While open, requests fail fast.
+        assert not breaker.allow()
+        assert breaker.retry_at == 40
+        # After the cooldown, one probe is admitted every half_open_delay seconds.
+        clock.now = 40
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+        breaker.record(status=503)
+        for _ in range(4):
+            clock.now += 2
+            assert breaker.allow()
+            breaker.record(status=200)
+        # One failed probe in five is within the half-open threshold, so the breaker closes.
+        assert breaker.state == CircuitState.CLOSED
+        metrics = breaker.metrics
+        assert metrics.transitions == {
+            "Closed->Open": 1,
+            "Open->Half-Open": 1,
+            "Half-Open->Closed": 1,
+        }
+        assert metrics.rejected == 2
+        assert metrics.probes == 5
+        assert metrics.seconds_open == 38
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_short_circuit(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = Clock()
+        breaker = CircuitBreaker(**CONFIG, clock=clock)
+        for status in (200, 404, 404, 404, 404):
+            breaker.record(status=status)
+        # 404s do not open the breaker, but a high 404 rate short-circuits the job.
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.short_circuited
+        assert "404" in breaker.metrics.short_circuit
+        assert not breaker.allow()
+        # A new job is judged on its own outcomes.
+        breaker.reset_short_circuit()
+        assert not breaker.short_circuited
+        assert breaker.allow()
+        # The 404s of pagination probes are expected, and do not short-circuit the job.
+        for _ in range(10):
+            breaker.record(status=404, probe=True)
+        assert not breaker.short_circuited
+        # A job with a short circuit of its own is stopped without stopping the others.
+        job = breaker.create_short_circuit()
+        for _ in range(5):
+            breaker.record(status=None, short_circuit=job)
+        assert job.tripped and "error" in job.reason
+        assert not breaker.allow(short_circuit=job)
+        assert not breaker.short_circuited
+        assert breaker.allow()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_batch_jobs(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        async def run():
+            # The first job's genre is empty, so each of its pages is not found.
+            async with MockAppStore(profile=profile(apps_per_genre=0)) as empty:
+                async with MockAppStore(profile=profile(apps_per_genre=10000)) as full:
+                    s = default_session_factory()
+                    s._states = None
+                    # The extract monitor records its metrics in the database, so the batches run without it.
+                    s._make_async_request = functools.partial(
+                        AsyncSession._make_async_request.__wrapped__, s
+                    )
+                    await s.__enter__()
+                    try:
+                        first = LoadTestRequestGen(
+                            host=empty.host,
+                            data_type="appdata",
+                            pages=60,
+                            limit=10,
+                            batch_size=30,
+                            context=context("empty"),
+                        )
+                        second = LoadTestRequestGen(
+                            host=full.host,
+                            data_type="appdata",
+                            pages=30,
+                            limit=10,
+                            batch_size=30,
+                            context=context("full"),
+                        )
+                        tripped = await s.get(async_request=next(first))
+                        with pytest.raises(ShortCircuitError) as error:
+                            await s.get(async_request=next(first))
+                        responses = await s.get(async_request=next(second))
+                        return tripped, error.value, responses, empty.counts
+                    finally:
+                        await s.__exit__()
+
+        tripped, error, responses, counts = asyncio.run(run())
+        # The first job trips its short circuit on its first batch and is stopped on its next.
+        assert tripped.response_count == 0
+        assert counts[404] <= 30
+        assert "404" in error.reason
+        # The job that follows on the same session is judged on its own outcomes.
+        assert responses.response_count == 30
+        assert any("Job empty short-circuited" in r.message for r in caplog.records)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_cache.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:30:45 pm                                                #
+# Modified   : Friday October 16th 2026 07:30:45 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.infra.web.cache import ResponseCache
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+URL = "https://itunes.apple.com/search"
+PAGE_SIZE = 100
+
+
+@pytest.mark.web
+@pytest.mark.cache
+class TestResponseCache:  # pragma: no cover
+    # ============================================================================================ #
+    def test_cache(self, tmp_path, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = ResponseCache(directory=str(tmp_path), ttl=60, max_bytes=3 * PAGE_SIZE)
+        keys = [
+            ResponseCache.make_key(URL, {"offset": i, "genreId": 6000})
+            for i in range(4)
+        ]
+        # Keys ignore parameter order.
+        assert keys[0] == ResponseCache.make_key(URL, {"genreId": 6000, "offset": 0})
+        assert cache.get(keys[0]) is None
+
+        entry = cache.put(
+            keys[0], b"a" * PAGE_SIZE, {"ETag": '"v1"', "Last-Modified": "x"}
+        )
+        assert cache.read(cache.get(keys[0])) == b"a" * PAGE_SIZE
+        assert entry.is_fresh(ttl=cache.ttl)
+        assert not entry.is_fresh(ttl=cache.ttl, now=entry.stored + 61)
+        assert cache.conditional_headers(entry) == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "x",
+        }
+        # Identical bodies share a blob.
+        cache.put(keys[1], b"a" * PAGE_SIZE, {})
+        assert cache.size == PAGE_SIZE
+        # Beyond the byte budget, the least recently used entry is evicted.
+        cache.put(keys[2], b"b" * PAGE_SIZE, {})
+        cache.put(keys[3], b"c" * PAGE_SIZE, {})
+        assert cache.size == 3 * PAGE_SIZE
+        cache.get(keys[0])
+        cache.put(keys[1], b"d" * PAGE_SIZE, {})
+        assert cache.get(keys[2]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.size <= 3 * PAGE_SIZE
+        cache.close()
+        # The index survives a restart.
+        reopened = ResponseCache(
+            directory=str(tmp_path), ttl=60, max_bytes=3 * PAGE_SIZE
+        )
+        assert len(reopened) == len(cache)
+        assert reopened.size == cache.size
+        assert reopened.read(reopened.get(keys[0])) == b"a" * PAGE_SIZE
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_put_same_body(self, tmp_path, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = ResponseCache(directory=str(tmp_path), ttl=60, max_bytes=3 * PAGE_SIZE)
+        key = ResponseCache.make_key(URL, {"offset": 0})
+        first = cache.put(key, b"a" * PAGE_SIZE, {})
+        # Storing the same body again, as when the TTL expires without validators, keeps the blob.
+        second = cache.put(key, b"a" * PAGE_SIZE, {"Server": "x"})
+        assert second.stored >= first.stored
+        assert second.headers == {"Server": "x"}
+        assert len(cache) == 1
+        assert cache.size == PAGE_SIZE
+        assert cache.read(cache.get(key)) == b"a" * PAGE_SIZE
+        # A different body under a shared blob's key leaves the blob for the other entry.
+        other = ResponseCache.make_key(URL, {"offset": 1})
+        cache.put(other, b"a" * PAGE_SIZE, {})
+        cache.put(key, b"b" * PAGE_SIZE, {})
+        assert cache.read(cache.get(other)) == b"a" * PAGE_SIZE
+        assert cache.read(cache.get(key)) == b"b" * PAGE_SIZE
+        assert cache.size == 2 * PAGE_SIZE
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_flush(self, tmp_path, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        cache = ResponseCache(
+            directory=str(tmp_path), ttl=60, max_bytes=10 * PAGE_SIZE, flush_every=3
+        )
+        keys = [ResponseCache.make_key(URL, {"offset": i}) for i in range(4)]
+        for i, key in enumerate(keys[:2]):
+            cache.put(key, bytes([i]) * PAGE_SIZE, {})
+        # Index changes are held until a batch accumulates.
+        assert (
+            len(
+                ResponseCache(directory=str(tmp_path), ttl=60, max_bytes=10 * PAGE_SIZE)
+            )
+            == 0
+        )
+        cache.put(keys[2], b"c" * PAGE_SIZE, {})
+        assert (
+            len(
+                ResponseCache(directory=str(tmp_path), ttl=60, max_bytes=10 * PAGE_SIZE)
+            )
+            == 3
+        )
+        # Closing writes the rest, including removals.
+        cache.put(keys[3], b"d" * PAGE_SIZE, {})
+        cache.put(keys[0], b"e" * PAGE_SIZE, {})
+        cache.close()
+        reopened = ResponseCache(
+            directory=str(tmp_path), ttl=60, max_bytes=10 * PAGE_SIZE
+        )
+        assert len(reopened) == 4
+        assert reopened.read(reopened.get(keys[0])) == b"e" * PAGE_SIZE
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_deadline.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:57:12 pm                                                #
+# Modified   : Friday October 16th 2026 08:52:33 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import functools
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.domain.artifact.request.appdata import RequestAppDataGen
+from acquire.infra.web.asession import AsyncSession
+from acquire.infra.web.breaker import ShortCircuit
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+# ------------------------------------------------------------------------------------------------ #
+async def noop(*args, **kwargs) -> None:
+    pass
+
+
+def endpoint(p95: float = 0.4, p50: float = 0.2, rate: float = 10, limit: int = 4):
+    """Returns an endpoint whose adapter reports the given latency percentiles."""
+    latencies = {95: p95, 50: p50}
+    return SimpleNamespace(
+        adapter=SimpleNamespace(
+            initialize=lambda async_request: None,
+            get_latency_percentile=lambda percentile, time_window: latencies[
+                percentile
+            ],
+            profile=SimpleNamespace(send=lambda: None, recv=lambda: None),
+        ),
+        pacer=SimpleNamespace(rate=rate),
+        limiter=SimpleNamespace(limit=limit),
+    )
+
+
+def session(enabled: bool = True, slow: tuple = ()) -> AsyncSession:
+    """Returns a session whose requests complete at once, except for the slow pages."""
+
+    async def send(request, short_circuit=None):
+        await asyncio.sleep(1 if request.page in slow else 0)
+        return SimpleNamespace(page=request.page)
+
+    session = AsyncSession.__new__(AsyncSession)
+    session._logger = logger
+    session._deadline = SimpleNamespace(
+        enabled=enabled,
+        percentile=95,
+        factor=2,
+        min_deadline=0.1,
+        max_requeues=2,
+        window=60,
+    )
+    session._breaker = SimpleNamespace(
+        create_short_circuit=lambda: ShortCircuit(
+            not_found_threshold=0.7,
+            not_found_window_size=180,
+            errors_threshold=0.9,
+            errors_window_size=180,
+            min_requests=20,
+        )
+    )
+    session._job_short_circuits = {}
+    session._session_request_count = 0
+    session._send = send
+    session._adapt_rate_concurrency = noop
+    session._reset_session_if_expired = noop
+    # The extract monitor records its metrics in the database, so the batch runs without it.
+    session._make_async_request = functools.partial(
+        AsyncSession._make_async_request.__wrapped__, session
+    )
+    return session
+
+
+@pytest.mark.web
+@pytest.mark.deadline
+class TestBatchDeadline:  # pragma: no cover
+    # ============================================================================================ #
+    def test_batch_deadline(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Sent at the pacer's rate, the lesser of 10/s and 4 / 0.2s, plus twice the p95.
+        assert session()._batch_deadline(
+            endpoint=endpoint(), requests=20
+        ) == pytest.approx(2.8)
+        # Sent at the concurrency limit's throughput, 1 / 0.2s, when that is the lesser.
+        assert session()._batch_deadline(
+            endpoint=endpoint(limit=1), requests=20
+        ) == pytest.approx(4.8)
+        # Never less than the minimum deadline.
+        assert (
+            session()._batch_deadline(
+                endpoint=endpoint(p95=0.01, p50=0.01, rate=1000), requests=1
+            )
+            == 0.1
+        )
+        # No deadline when disabled, for an empty batch, or without latency history.
+        assert (
+            session(enabled=False)._batch_deadline(endpoint=endpoint(), requests=20)
+            is None
+        )
+        assert session()._batch_deadline(endpoint=endpoint(), requests=0) is None
+        assert (
+            session()._batch_deadline(endpoint=endpoint(p95=0, p50=0), requests=20)
+            is None
+        )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_stragglers(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        requests = [SimpleNamespace(page=page, requeues=0) for page in range(4)]
+        # Page 3 has been requeued as often as allowed, so it is awaited despite the deadline.
+        requests[3].requeues = 2
+
+        async def run(deadline):
+            s = session(slow=(1, 3))
+            tasks = {
+                asyncio.ensure_future(s._send(request)): request for request in requests
+            }
+            responses = await s._make_async_request(
+                tasks, endpoint=endpoint(), deadline=deadline
+            )
+            return responses, {tasks[task].page for task in tasks if task.cancelled()}
+
+        responses, cancelled = asyncio.run(run(deadline=0.1))
+        assert cancelled == {1}
+        assert sorted(response.page for response in responses) == [0, 2, 3]
+        # Without a deadline, every request is awaited.
+        responses, cancelled = asyncio.run(run(deadline=None))
+        assert not cancelled
+        assert len(responses) == 4
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_requeue(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        context = SimpleNamespace(
+            job_id="requeue", category=SimpleNamespace(value=6000)
+        )
+        request_gen = RequestAppDataGen(context=context, max_requests=6, batch_size=4)
+        s = session(slow=(1,))
+        s._endpoint = lambda request: endpoint(p95=0.01, p50=0.01, rate=1000, limit=100)
+
+        # Page 1 misses the deadline and is requeued with the generator that drew the batch.
+        async_response = asyncio.run(s.get(next(request_gen)))
+        assert [request.page for request in async_response.stragglers] == [1]
+        assert sorted(response.page for response in async_response.responses) == [
+            0,
+            2,
+            3,
+        ]
+        assert async_response.stragglers[0].requeues == 1
+        # Pages complete out of order, so the bookmark stays on the earliest requeued page.
+        assert request_gen.bookmark == 1
+        # The requeued page leads the next batch, ahead of the new pages.
+        async_request = next(request_gen)
+        assert [request.page for request in async_request.requests] == [1, 4, 5]
+        assert request_gen.bookmark == 6
+        with pytest.raises(StopIteration):
+            next(request_gen)
+
+        # A batch with no generator to requeue with is awaited in full, so no page is lost.
+        async_request.requests[0].requeues = 0
+        async_request._request_gen = None
+        async_response = asyncio.run(s.get(async_request))
+        assert not async_response.stragglers
+        assert sorted(response.page for response in async_response.responses) == [
+            1,
+            4,
+            5,
+        ]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_decoder.py                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:28:16 pm                                                #
+# Modified   : Friday October 16th 2026 07:28:16 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import json
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.infra.web.decoder import JSONDecoder
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+SMALL = json.dumps({"results": [{"id": 1}]}).encode()
+LARGE = json.dumps(
+    {"results": [{"id": i, "description": "x" * 1000} for i in range(200)]}
+).encode()
+
+
+@pytest.mark.web
+@pytest.mark.decoder
+class TestJSONDecoder:  # pragma: no cover
+    # ============================================================================================ #
+    def test_decode(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+
+        async def decode(decoder: JSONDecoder) -> list:
+            try:
+                return [await decoder.decode(body) for body in (SMALL, LARGE, b"")]
+            finally:
+                decoder.close()
+
+        for executor in ("thread", "process"):
+            decoder = JSONDecoder(threshold=len(SMALL) + 1, executor=executor)
+            (small, _), (large, large_time), (empty, empty_time) = asyncio.run(
+                decode(decoder)
+            )
+            assert small == json.loads(SMALL)
+            assert large == json.loads(LARGE)
+            assert empty == {}
+            assert large_time >= 0
+            assert empty_time == 0
+
+        assert JSONDecoder(threshold=0, backend="json").backend == "json"
+        with pytest.raises(ValueError):
+            JSONDecoder(threshold=0, executor="fiber")
+        with pytest.raises(ValueError):
+            JSONDecoder(threshold=0, backend="yaml")
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_endpoint.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:31:06 pm                                                #
+# Modified   : Friday October 16th 2026 08:56:20 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.infra.web.adapter import (
+    Adapter,
+    AdapterBaselineStage,
+    AdapterConcurrencyExploreStage,
+    AdapterExploitStage,
+    AdapterFactory,
+    AdapterRateExploreStage,
+)
+from acquire.infra.web.endpoint import EndpointRegistry
+from acquire.infra.web.pacer import SharedTokenBucket
+from acquire.infra.web.profile import SessionHistory
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+SEARCH = "itunes.apple.com/appdata/gb"
+REVIEW = "itunes.apple.com/review/us"
+DEFAULTS = {
+    "rate": {"base": 50, "min": 10, "max": 500},
+    "concurrency": {"base": 50, "min": 10, "max": 200},
+    "window_size": 300,
+    "temperature": 0.0,
+    "response_time": 3600,
+}
+EXPLORE = {
+    "step_increase": 10,
+    "step_decrease": 0.9,
+    "step_response_time": 60,
+    "threshold": 1.2,
+}
+
+
+HEDGE = SimpleNamespace(
+    enabled=True, percentile=95, budget=1.0, min_samples=1, min_delay=0.01, window=60
+)
+
+
+def registry(isolated: bool = True) -> EndpointRegistry:
+    factory = AdapterFactory(
+        adapter=Adapter,
+        history=SessionHistory(),
+        baseline=AdapterBaselineStage(config=DEFAULTS),
+        explore_rate=AdapterRateExploreStage(config={**DEFAULTS, **EXPLORE}),
+        explore_concurrency=AdapterConcurrencyExploreStage(
+            config={**DEFAULTS, **EXPLORE}
+        ),
+        exploit=AdapterExploitStage(config={**DEFAULTS, "k": 0.1, "m": 0.05}),
+    )
+    return EndpointRegistry(
+        adapter_factory=factory,
+        rate=50,
+        burst=1,
+        concurrency=50,
+        max_rate=80,
+        max_concurrency=60,
+        isolated=isolated,
+        hedge=HEDGE,
+    )
+
+
+def adapt(adapter: Adapter, latency: float) -> None:
+    adapter.initialize(async_request=None)
+    adapter.profile.send()
+    for _ in range(20):
+        adapter.profile.add_latency(latency)
+    adapter.adapt_requests()
+
+
+@pytest.mark.web
+@pytest.mark.endpoint
+class TestEndpointRegistry:  # pragma: no cover
+    # ============================================================================================ #
+    def test_isolated(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        endpoints = registry()
+        primary = endpoints.primary
+        assert endpoints.get(SEARCH) is None
+        # The first endpoint requested is served by the primary endpoint.
+        assert endpoints.add(SEARCH) is primary
+        other = endpoints.add(REVIEW)
+        assert endpoints.get(REVIEW) is other
+        assert other is not primary
+
+        # Each endpoint has its own history, stages, pacer and limiter.
+        assert other.adapter.stage is not primary.adapter.stage
+        assert other.pacer is not primary.pacer
+        assert other.limiter is not primary.limiter
+        adapt(primary.adapter, 0.1)
+        adapt(other.adapter, 2.0)
+        assert primary.adapter.get_latency_stats().average == pytest.approx(0.1)
+        assert other.adapter.get_latency_stats().average == pytest.approx(2.0)
+
+        # Every pacer, including those of later endpoints, draws on the registry's pacer,
+        # which draws on the rate budget shared with other processes.
+        budget = SharedTokenBucket(rate=100)
+        endpoints.budget = budget
+        storefront = endpoints.add("itunes.apple.com/appdata/us")
+        assert {endpoint.pacer.budget for endpoint in endpoints} == {endpoints.pacer}
+        assert storefront.pacer.budget is endpoints.pacer
+        assert endpoints.budget is budget
+        assert endpoints.pacer.budget is budget
+
+        # Metrics are exported per endpoint.
+        metrics = endpoints.metrics
+        assert list(metrics) == [SEARCH, REVIEW, "itunes.apple.com/appdata/us"]
+        assert metrics[REVIEW].latency_average == pytest.approx(2.0)
+        assert metrics[REVIEW].stage == "AdapterBaselineStage"
+
+        # Each endpoint hedges against its own latency, within its own budget.
+        assert other.hedge is not primary.hedge
+        for endpoint, latency in ((primary, 0.1), (other, 2.0)):
+            endpoint.hedge.send()
+            endpoint.hedge.update(latency=latency)
+        assert primary.hedge.delay == pytest.approx(0.1)
+        assert other.hedge.delay == pytest.approx(2.0)
+        assert other.hedge.acquire()
+        assert not other.hedge.acquire()
+        assert primary.hedge.metrics.hedges == 0
+
+        # Without isolation, every endpoint shares the primary endpoint.
+        endpoints = registry(isolated=False)
+        assert endpoints.add(SEARCH) is endpoints.primary
+        assert endpoints.add(REVIEW) is endpoints.primary
+        assert list(endpoints.metrics) == [SEARCH]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_budget(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        endpoints = registry()
+        search, review = endpoints.add(SEARCH), endpoints.add(REVIEW)
+
+        async def paced() -> float:
+            # Each endpoint paces at 50/s, but together they are held to 80/s.
+            loop = asyncio.get_running_loop()
+            began = loop.time()
+            await asyncio.gather(
+                *[
+                    endpoint.pacer.acquire()
+                    for endpoint in (search, review)
+                    for _ in range(24)
+                ]
+            )
+            return loop.time() - began
+
+        elapsed = asyncio.run(paced())
+        assert elapsed >= 47 / 80 * 0.9
+
+        async def held() -> tuple:
+            # Each endpoint admits 50 requests, but together they are held to 60.
+            release = asyncio.Event()
+
+            async def hold(endpoint) -> None:
+                async with endpoint.slot():
+                    await release.wait()
+
+            tasks = [
+                asyncio.ensure_future(hold(endpoint))
+                for endpoint in (search, review)
+                for _ in range(40)
+            ]
+            await asyncio.sleep(0.01)
+            counts = (
+                endpoints.limiter.in_flight,
+                endpoints.limiter.queued,
+                search.limiter.in_flight,
+            )
+            release.set()
+            await asyncio.gather(*tasks)
+            return counts
+
+        assert asyncio.run(held()) == (60, 20, 40)
+        assert endpoints.limiter.in_flight == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
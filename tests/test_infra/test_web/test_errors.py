@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_errors.py                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:38:03 pm                                                #
+# Modified   : Friday October 16th 2026 08:38:03 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.infra.web.adapter import (
+    Adapter,
+    AdapterConcurrencyExploreStage,
+    AdapterRateExploreStage,
+)
+from acquire.infra.web.profile import SessionHistory, SessionProfile
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+CONFIG = {
+    "rate": {"base": 50, "min": 10, "max": 500},
+    "concurrency": {"base": 50, "min": 10, "max": 200},
+    "window_size": 300,
+    "temperature": 0.0,
+    "response_time": 3600,
+    "step_increase": 10,
+    "step_decrease": 0.9,
+    "step_response_time": 60,
+    "threshold": 1.2,
+    "error_window": 10,
+    "error_threshold": 0.05,
+    "throttle_threshold": 0.01,
+    "error_min_requests": 20,
+    "backoff": 0.5,
+}
+
+
+@pytest.mark.web
+@pytest.mark.errors
+class TestErrorAwareAdaptation:  # pragma: no cover
+    # ============================================================================================ #
+    def test_status_counts(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = SimpleNamespace(now=1e9)
+        history = SessionHistory(clock=lambda: clock.now)
+
+        profile = SessionProfile(clock=lambda: clock.now)
+        for status in [200] * 14 + [404, None, 500, 429, 429, 503]:
+            profile.add_status(status)
+        # 404s mark the end of a listing and are not errors; no response counts as status 0.
+        assert profile.attempts == 20
+        assert profile.errors == 5
+        assert profile.throttles == 3
+        history.add_profile(profile)
+
+        assert history.get_attempts() == 20
+        assert history.get_error_rate() == pytest.approx(0.25)
+        assert history.get_throttle_rate() == pytest.approx(0.15)
+        assert history.get_status_counts() == {
+            0: 1,
+            200: 14,
+            404: 1,
+            429: 2,
+            500: 1,
+            503: 1,
+        }
+
+        # Rates are computed over the attempts within the window.
+        clock.now += 60
+        profile = SessionProfile(clock=lambda: clock.now)
+        for _ in range(20):
+            profile.add_status(200)
+        history.add_profile(profile)
+        assert history.get_error_rate(time_window=10) == 0
+        assert history.get_error_rate() == pytest.approx(0.125)
+        assert history.get_status_counts(time_window=10) == {200: 20}
+        assert history.get_snapshot(time_window=10).attempts == 20
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_back_off(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = SimpleNamespace(now=1e9)
+
+        stage = AdapterRateExploreStage(config=CONFIG)
+        stage.next_stage = AdapterConcurrencyExploreStage(config=CONFIG)
+        adapter = Adapter(
+            initial_stage=stage, history=SessionHistory(clock=lambda: clock.now)
+        )
+
+        def adapt(throttled: int, elapsed: float = 1) -> float:
+            adapter.initialize(async_request=None)
+            adapter.profile.send()
+            for _ in range(20 - throttled):
+                adapter.profile.add_latency(0.1)
+                adapter.profile.add_status(200)
+            # Throttled requests are fast, and have no latency.
+            for _ in range(throttled):
+                adapter.profile.add_status(429)
+            adapter.adapt_requests()
+            clock.now += elapsed
+            return adapter.session_control.rate
+
+        # While every request succeeds, the rate rises.
+        rate = adapt(throttled=0, elapsed=60)
+        assert rate > CONFIG["rate"]["base"]
+        assert adapt(throttled=0) >= rate
+        rate = adapter.session_control.rate
+
+        # A wave of 429s halves the rate at once, although latency is steady.
+        assert adapt(throttled=10) == pytest.approx(rate * 0.5)
+        # Within the error window, the same errors do not back off again.
+        assert adapt(throttled=10, elapsed=10) == pytest.approx(rate * 0.5)
+        # Once the window has passed, continued throttling backs off again.
+        assert adapt(throttled=10) == pytest.approx(rate * 0.25)
+
+        # Invalid backoffs are rejected.
+        with pytest.raises(ValueError):
+            AdapterRateExploreStage(config={**CONFIG, "backoff": 1.5})
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_gradient.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:15:58 pm                                                #
+# Modified   : Friday October 16th 2026 08:15:58 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.infra.web.adapter import Adapter, AdapterGradientStage
+from acquire.infra.web.profile import SessionHistory
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+CONFIG = {
+    "rate": {"base": 50, "min": 10, "max": 500},
+    "concurrency": {"base": 50, "min": 10, "max": 200},
+    "temperature": 0.0,
+    "tolerance": 1.5,
+    "smoothing": 0.2,
+    "long_window": 600,
+    "rate_headroom": 1.5,
+}
+
+
+def adapt(adapter: Adapter, latencies) -> None:
+    adapter.initialize(async_request=None)
+    for latency in latencies:
+        adapter.profile.add_latency(latency)
+    adapter.adapt_requests()
+
+
+@pytest.mark.web
+@pytest.mark.gradient
+class TestAdapterGradientStage:  # pragma: no cover
+    # ============================================================================================ #
+    def test_gradient(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        stage = AdapterGradientStage(config=CONFIG)
+        adapter = Adapter(initial_stage=stage, history=SessionHistory())
+
+        # While latencies hold at the long-window RTT, concurrency grows.
+        previous = CONFIG["concurrency"]["base"]
+        for _ in range(5):
+            adapt(adapter, [0.1, 0.12, 0.15])
+            assert adapter.stage is stage
+            assert adapter.session_control.concurrency > previous
+            previous = adapter.session_control.concurrency
+        assert stage.long_rtt == pytest.approx(0.1)
+        # The rate follows the concurrency at the long-window RTT.
+        assert adapter.session_control.rate == pytest.approx(
+            min(previous / 0.1 * 1.5, 500)
+        )
+
+        # Once requests queue well beyond the tolerance, concurrency shrinks, at most by half.
+        adapt(adapter, [0.5, 0.6])
+        assert adapter.session_control.concurrency < previous
+        assert adapter.session_control.concurrency >= previous * 0.5
+
+        # Without latencies, e.g. when every page was cached, the controls are unchanged.
+        session_control = adapter.session_control
+        adapt(adapter, [])
+        assert adapter.session_control.concurrency == session_control.concurrency
+        assert adapter.session_control.rate == session_control.rate
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_hedge.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:53:09 pm                                                #
+# Modified   : Friday October 16th 2026 08:54:16 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+import time
+from datetime import datetime
+
+import pytest
+
+from acquire.application.orchestration.context import JobContext
+from acquire.application.orchestration.loadtest import LoadTestRequestGen
+from acquire.application.orchestration.runner import default_session_factory
+from acquire.core.enum import Category, DataType
+from acquire.infra.web.hedge import HedgePolicy
+from acquire.infra.web.mock import MockAppStore, MockProfile
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+CONTEXT = JobContext(
+    job_id="hedge",
+    category=Category.BUSINESS,
+    data_type=DataType.APPDATA,
+    description="Hedge test",
+    dt_created=datetime.now(),
+)
+
+
+class SlowFirstAppStore(MockAppStore):
+    """Holds the first request for each page, so a hedge of it completes first."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.seen: set = set()
+
+    async def _search(self, request):
+        offset = request.query.get("offset")
+        if offset not in self.seen:
+            self.seen.add(offset)
+            await asyncio.sleep(2)
+        return await super()._search(request)
+
+
+@pytest.mark.web
+@pytest.mark.hedge
+class TestHedgePolicy:  # pragma: no cover
+    # ============================================================================================ #
+    def test_budget(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        policy = HedgePolicy(enabled=True, budget=0.1, min_samples=20, min_delay=0.05)
+        # No delay until enough requests have been sent.
+        for _ in range(10):
+            policy.send()
+        policy.update(latency=0.5)
+        assert policy.delay is None
+        for _ in range(90):
+            policy.send()
+        policy.update(latency=0.5)
+        assert policy.delay == 0.5
+        policy.update(latency=0.01)
+        assert policy.delay == 0.05
+        # Hedges are capped at 10% of requests.
+        hedges = sum(policy.acquire() for _ in range(50))
+        assert hedges == 10
+        assert policy.metrics.denied == 40
+        for _ in range(10):
+            policy.send()
+        assert policy.acquire()
+        assert not policy.acquire()
+        # A hedge the pacer could not send at once is returned to the budget.
+        policy.throttle()
+        assert policy.metrics.throttled == 1
+        assert policy.acquire()
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.web
+@pytest.mark.hedge
+class TestHedge:  # pragma: no cover
+    # ============================================================================================ #
+    def test_hedge_wins(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        async def run():
+            profile = MockProfile(
+                latency_median=0.005, throttle_interval=3600, throttle_duration=0
+            )
+            async with SlowFirstAppStore(profile=profile) as server:
+                s = default_session_factory()
+                s._states = None
+                await s.__enter__()
+                try:
+                    request_gen = LoadTestRequestGen(
+                        host=server.host,
+                        data_type="appdata",
+                        pages=1,
+                        limit=10,
+                        context=CONTEXT,
+                    )
+                    request = next(request_gen).requests[0]
+                    endpoint = s._endpoint(request)
+                    # Hedge after 50ms, with a budget of one hedge per request.
+                    endpoint._hedge = HedgePolicy(
+                        enabled=True, budget=1.0, min_samples=1, min_delay=0.05
+                    )
+                    endpoint.hedge.send()
+                    endpoint.hedge.update(latency=0.05)
+                    started = time.perf_counter()
+                    response = await s._send(request)
+                    return (
+                        response,
+                        request,
+                        endpoint.hedge.metrics,
+                        time.perf_counter() - started,
+                    )
+                finally:
+                    await s.__exit__()
+
+        response, request, metrics, elapsed = asyncio.run(run())
+        # The original is held by the server, so the hedge answers and the original is cancelled.
+        assert response is not None
+        assert len(response.content["results"]) == 10
+        assert request.status == 200
+        assert metrics.hedges == 1
+        assert metrics.wins == 1
+        assert elapsed < 1
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_limiter.py                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:25:21 pm                                                #
+# Modified   : Friday October 16th 2026 07:27:00 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.infra.web.limiter import ConcurrencyLimiter
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.web
+@pytest.mark.limiter
+class TestConcurrencyLimiter:  # pragma: no cover
+    # ============================================================================================ #
+    def test_resize(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+
+        async def run() -> None:
+            limiter = ConcurrencyLimiter(limit=2)
+            tasks = [asyncio.ensure_future(limiter.acquire()) for _ in range(6)]
+            await asyncio.sleep(0)
+            assert limiter.in_flight == 2
+            assert limiter.queued == 4
+            # Growing the limit admits queued callers immediately.
+            limiter.resize(4)
+            await asyncio.sleep(0)
+            assert limiter.in_flight == 4
+            assert limiter.queued == 2
+            # Shrinking the limit admits no one until in-flight requests drain below it.
+            limiter.resize(1)
+            for _ in range(3):
+                limiter.release()
+            await asyncio.sleep(0)
+            assert limiter.in_flight == 1
+            assert limiter.queued == 2
+            limiter.release()
+            await asyncio.sleep(0)
+            assert limiter.in_flight == 1
+            assert limiter.queued == 1
+            # Cancelled waiters give up their place.
+            tasks[-1].cancel()
+            await asyncio.sleep(0)
+            assert limiter.queued == 0
+            limiter.release()
+            assert limiter.in_flight == 0
+            with pytest.raises(RuntimeError):
+                limiter.release()
+
+        asyncio.run(run())
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_priority(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+
+        async def run() -> list:
+            limiter = ConcurrencyLimiter(limit=1)
+            admitted = []
+
+            async def request(name: str, priority: int) -> None:
+                async with limiter.slot(priority=priority):
+                    admitted.append(name)
+                    await asyncio.sleep(0)
+
+            await limiter.acquire()
+            tasks = [
+                asyncio.ensure_future(request("retry", 1)),
+                asyncio.ensure_future(request("fresh-1", 0)),
+                asyncio.ensure_future(request("fresh-2", 0)),
+            ]
+            await asyncio.sleep(0)
+            limiter.release()
+            await asyncio.gather(*tasks)
+            return admitted
+
+        # Retries queue behind fresh requests; fresh requests keep their arrival order.
+        assert asyncio.run(run()) == ["fresh-1", "fresh-2", "retry"]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_loadtest.py                                         #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 10:12:05 pm                                                #
+# Modified   : Friday October 16th 2026 10:12:05 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.application.orchestration.loadtest import LoadTest
+from acquire.infra.web.mock import MockProfile
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+def profile() -> MockProfile:
+    return MockProfile(
+        latency_median=0.001,
+        apps_per_genre=1000,
+        reviews_per_app=1000,
+        end_status=404,
+        throttle_interval=3600,
+        throttle_duration=0,
+    )
+
+
+@pytest.mark.web
+@pytest.mark.loadtest
+class TestLoadTest:  # pragma: no cover
+    # ============================================================================================ #
+    @pytest.mark.parametrize("data_type", ["appdata", "review"])
+    def test_load_test(self, data_type, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # The configured AsyncSession streams every page from the mock App Store and the records
+        # on each page are transformed.
+        result = LoadTest(
+            profile=profile(), data_type=data_type, pages=5, limit=200
+        ).run()
+        assert result.responses == 5
+        assert result.failures == 0
+        assert result.records == 1000
+        assert result.invalid == 0
+        assert result.status_counts[200] >= 5
+        assert result.cpu_per_page > 0
+        assert result.stage
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_mock.py                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:40:54 pm                                                #
+# Modified   : Friday October 16th 2026 07:40:54 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+
+import aiohttp
+import pytest
+
+from acquire.infra.web.mock import REVIEW_PATH, SEARCH_PATH, MockAppStore, MockProfile
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.web
+@pytest.mark.mock
+class TestMockAppStore:  # pragma: no cover
+    # ============================================================================================ #
+    def test_mock(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        profile = MockProfile(
+            latency_median=0.001,
+            apps_per_genre=250,
+            reviews_per_app=150,
+            end_status=404,
+            throttle_interval=3600,
+            throttle_duration=0,
+        )
+
+        async def run() -> None:
+            async with MockAppStore(profile=profile) as server:
+                base = f"http://{server.host}"
+                async with aiohttp.ClientSession() as session:
+                    params = {"genreId": 6014, "limit": 200, "offset": 200}
+                    async with session.get(base + SEARCH_PATH, params=params) as resp:
+                        assert resp.status == 200
+                        page = await resp.json()
+                    # The last page is short, and pages past the end take the end status.
+                    assert page["resultCount"] == 50
+                    assert page["results"][0]["primaryGenreId"] == 6014
+                    params["offset"] = 400
+                    async with session.get(base + SEARCH_PATH, params=params) as resp:
+                        assert resp.status == 404
+
+                    params = {"id": 1, "startIndex": 100, "endIndex": 200}
+                    async with session.get(base + REVIEW_PATH, params=params) as resp:
+                        reviews = (await resp.json())["userReviewList"]
+                    assert len(reviews) == 50
+                assert server.counts == {200: 2, 404: 1}
+
+            # Throttling bursts answer every request with the throttle status and Retry-After.
+            profile.throttle_duration = 3600
+            async with MockAppStore(profile=profile) as server:
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(
+                        f"http://{server.host}{SEARCH_PATH}"
+                    ) as resp:
+                        assert resp.status == 429
+                        assert resp.headers["Retry-After"] == "1"
+
+        asyncio.run(run())
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
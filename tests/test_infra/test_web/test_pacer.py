@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_pacer.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:22:54 pm                                                #
+# Modified   : Friday October 16th 2026 08:54:16 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.infra.web.pacer import SharedTokenBucket, TokenBucketPacer
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+RATE = 100
+REQUESTS = 21
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.web
+@pytest.mark.pacer
+class TestTokenBucketPacer:  # pragma: no cover
+    # ============================================================================================ #
+    def test_reserve(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = FakeClock()
+        pacer = TokenBucketPacer(rate=RATE, burst=2, clock=clock)
+        # The full burst is available immediately.
+        assert pacer.reserve() == 0
+        assert pacer.reserve() == 0
+        # The next token accrues after 1 / rate seconds.
+        assert pacer.reserve() == pytest.approx(1 / RATE)
+        clock.now += 1 / RATE
+        assert pacer.reserve() == 0
+        # Tokens never exceed the burst capacity.
+        clock.now += 10
+        assert pacer.tokens == 2
+        # A rate change applies to the next reservation.
+        pacer.reserve()
+        pacer.reserve()
+        pacer.rate = RATE * 10
+        assert pacer.reserve() == pytest.approx(1 / (RATE * 10))
+        # A non-positive rate disables pacing.
+        pacer.rate = 0
+        assert pacer.reserve() == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_try_acquire(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = FakeClock()
+        pacer = TokenBucketPacer(rate=RATE, burst=2, clock=clock)
+        assert pacer.try_acquire()
+        assert pacer.try_acquire()
+        # No token is available at once, so none is taken and the caller does not wait.
+        assert not pacer.try_acquire()
+        clock.now += 1 / RATE
+        assert pacer.try_acquire()
+        # The shared budget must have a token to spare too. If not, the local token is returned.
+        clock.now += 10
+        pacer.budget = SharedTokenBucket(rate=1e-6, burst=1)
+        assert pacer.try_acquire()
+        assert not pacer.try_acquire()
+        assert pacer.tokens == 1
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_acquire(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+
+        async def paced() -> float:
+            loop = asyncio.get_running_loop()
+            pacer = TokenBucketPacer(rate=RATE)
+            began = loop.time()
+            await asyncio.gather(*[pacer.acquire() for _ in range(REQUESTS)])
+            return loop.time() - began
+
+        elapsed = asyncio.run(paced())
+        # The first request goes immediately; the remainder are spaced at 1 / rate.
+        assert elapsed >= (REQUESTS - 1) / RATE * 0.9
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_shared_budget(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        budget = SharedTokenBucket(rate=RATE, burst=2)
+        assert budget.reserve() == 0
+        assert budget.reserve() == 0
+        assert 0 < budget.reserve() <= 1 / RATE
+
+        async def paced() -> float:
+            loop = asyncio.get_running_loop()
+            # The local pacer is unpaced, so the shared budget sets the rate.
+            pacer = TokenBucketPacer(rate=0, budget=budget)
+            began = loop.time()
+            await asyncio.gather(*[pacer.acquire() for _ in range(REQUESTS)])
+            return loop.time() - began
+
+        elapsed = asyncio.run(paced())
+        assert elapsed >= (REQUESTS - 2) / RATE * 0.9
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_pagination.py                                       #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:48:22 pm                                                #
+# Modified   : Friday October 16th 2026 07:48:22 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.infra.web.pagination import PaginationPlanner
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+def page(records: int) -> SimpleNamespace:
+    return SimpleNamespace(content={"resultCount": records, "results": [{}] * records})
+
+
+def probe(
+    planner: PaginationPlanner, last: int, limit: int, missing: tuple = ()
+) -> int:
+    """Runs the probe rounds against a category whose last page with data is `last`."""
+    requests = 0
+    for _ in range(planner.rounds):
+        pages = planner.next_probes()
+        if not pages:
+            break
+        for p in pages:
+            requests += 1
+            if p in missing or p > last:
+                planner.observe(page=p, status=404, response=None)
+            else:
+                planner.observe(page=p, status=200, response=page(limit))
+    return requests
+
+
+@pytest.mark.web
+@pytest.mark.pagination
+class TestPaginationPlanner:  # pragma: no cover
+    # ============================================================================================ #
+    def test_probe(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        for last in (0, 1, 49, 50, 777, 5000):
+            planner = PaginationPlanner(limit=10, fanout=8, rounds=20)
+            requests = probe(planner, last=last, limit=10)
+            assert planner.resolved
+            assert planner.end == last + 1
+            assert not planner.is_past_end(last) and planner.is_past_end(last + 1)
+            assert requests < 60
+        # A sporadic 404 inside the category does not truncate it.
+        planner = PaginationPlanner(limit=10, fanout=8, rounds=20)
+        probe(planner, last=100, limit=10, missing=(63,))
+        assert planner.end == 101
+        # The generator's page limit bounds the search.
+        planner = PaginationPlanner(start_page=5, max_pages=20, limit=10, rounds=20)
+        probe(planner, last=1000, limit=10)
+        assert planner.end == 25
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_stream_signals(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # A short page ends the category immediately.
+        planner = PaginationPlanner(limit=10, rounds=0)
+        planner.observe(page=0, status=200, response=page(10))
+        planner.observe(page=3, status=200, response=page(4))
+        assert planner.end == 4
+        assert planner.is_past_end(4) and not planner.is_past_end(3)
+        # Failures other than 404 carry no information.
+        planner = PaginationPlanner(limit=10, rounds=0)
+        planner.observe(page=7, status=503, response=None)
+        planner.observe(page=8, status=None, response=None)
+        assert planner.end is None
+        # One empty page is not enough; a second consecutive one confirms the end.
+        planner.observe(page=5, status=200, response=page(0))
+        assert planner.end is None
+        planner.observe(page=6, status=404, response=None)
+        assert planner.end == 5
+        # Data past a presumed end moves it.
+        planner.observe(page=6, status=200, response=page(10))
+        assert planner.end is None
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
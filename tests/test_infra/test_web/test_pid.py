@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_pid.py                                              #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:18:55 pm                                                #
+# Modified   : Friday October 16th 2026 08:26:42 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.infra.web.adapter import Adapter, AdapterBaselineStage, AdapterPIDStage
+from acquire.infra.web.profile import SessionHistory
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+CONFIG = {
+    "rate": {"base": 50, "min": 10, "max": 100},
+    "concurrency": {"base": 50, "min": 10, "max": 200},
+    "temperature": 0.0,
+    "window_size": 3600,
+    "response_time": 3600,
+    "target_latency": 0.5,
+    "error_budget": 0.05,
+    "kp": 0.5,
+    "ki": 0.05,
+    "kd": 0.5,
+    "integral_limit": 1.0,
+    "max_step": 0.1,
+}
+
+
+@pytest.mark.web
+@pytest.mark.pid
+class TestAdapterPIDStage:  # pragma: no cover
+    # ============================================================================================ #
+    def test_pid(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = SimpleNamespace(now=1e9)
+
+        stage = AdapterPIDStage(config=CONFIG)
+        stage.next_stage = AdapterBaselineStage(config=CONFIG)
+        adapter = Adapter(
+            initial_stage=stage, history=SessionHistory(clock=lambda: clock.now)
+        )
+
+        def adapt(latencies) -> float:
+            rate = adapter.session_control.rate or CONFIG["rate"]["base"]
+            adapter.initialize(async_request=None)
+            adapter.profile.send()
+            for latency in latencies:
+                adapter.profile.add_latency(latency)
+            adapter.adapt_requests()
+            clock.now += 1
+            # The rate never moves by more than the step limit.
+            assert abs(adapter.session_control.rate - rate) <= rate * 0.1 + 1e-9
+            return adapter.session_control.rate
+
+        # With the p95 well under the target, the rate rises to its maximum.
+        rates = [adapt([0.1] * 20) for _ in range(15)]
+        assert rates == sorted(rates)
+        assert rates[-1] == CONFIG["rate"]["max"]
+
+        # Held at the maximum, the integral does not wind up.
+        integral = stage.integral
+        for _ in range(10):
+            adapt([0.1] * 20)
+        assert stage.integral == integral
+
+        # Once the p95 exceeds the target, the rate falls at once.
+        rates = [adapt([2.0] * 200) for _ in range(5)]
+        assert rates == sorted(rates, reverse=True)
+        assert rates[-1] < CONFIG["rate"]["max"] * 0.9**4
+
+        # Invalid SLOs are rejected.
+        with pytest.raises(ValueError):
+            AdapterPIDStage(config={**CONFIG, "error_budget": 1.5})
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
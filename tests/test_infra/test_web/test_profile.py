@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_profile.py                                          #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:08:41 pm                                                #
+# Modified   : Friday October 16th 2026 08:13:00 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from acquire.infra.web.profile import MetricSeries, SessionHistory
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.web
+@pytest.mark.profile
+class TestMetricSeries:  # pragma: no cover
+    # ============================================================================================ #
+    def test_moments(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(0)
+        series = MetricSeries(capacity=500, initial_capacity=8)
+        values = []
+        for batch in range(30):
+            batch_values = rng.lognormal(size=int(rng.integers(1, 100)))
+            timestamps = np.arange(
+                len(values), len(values) + len(batch_values), dtype=float
+            )
+            if batch % 3:
+                series.extend(timestamps=timestamps, values=batch_values)
+            else:
+                for timestamp, value in zip(timestamps, batch_values):
+                    series.append(timestamp=timestamp, value=value)
+            values.extend(batch_values)
+
+            # The series keeps the most recent entries, and its running moments match NumPy's.
+            expected = np.array(values[-500:])
+            assert np.allclose(series.values, expected)
+            stats = series.summarize()
+            assert stats.n == len(expected)
+            assert stats.average == pytest.approx(expected.mean())
+            assert stats.std == pytest.approx(
+                expected.std(ddof=1) if len(expected) > 1 else 0
+            )
+            assert stats.cv == pytest.approx(expected.std() / expected.mean())
+            assert stats.median == pytest.approx(np.median(expected))
+
+            # Windows are selected by timestamp.
+            since = len(values) - 50
+            recent = series.summarize(since=since)
+            assert recent.n == series.count(since=since) == min(50, len(expected))
+            assert recent.average == pytest.approx(expected[-50:].mean())
+            assert recent.max == pytest.approx(expected[-50:].max())
+
+        # Entries before a cutoff are pruned, and the moments follow.
+        series.evict_before(len(values) - 100)
+        assert len(series) == 100
+        assert series.summarize().average == pytest.approx(np.mean(values[-100:]))
+
+        series.evict(len(series))
+        assert len(series) == 0
+        assert series.summarize().n == 0
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_windows(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(1)
+        series = MetricSeries(capacity=400, initial_capacity=8, max_windows=2)
+        values = []
+        for batch in range(60):
+            batch_values = rng.lognormal(size=int(rng.integers(1, 40)))
+            timestamps = np.arange(
+                len(values), len(values) + len(batch_values), dtype=float
+            )
+            series.extend(timestamps=timestamps, values=batch_values)
+            values.extend(batch_values)
+            if batch % 7 == 6:
+                series.evict_before(len(values) - 250)
+
+            # Each sliding window's running aggregates match NumPy over the same entries.
+            retained = np.array(values[-len(series) :])
+            for window in (30, 120, 0):
+                since = len(values) - window if window else None
+                expected = retained[-window:] if window else retained
+                stats = series.summarize(since=since, window=window)
+                assert stats.n == len(expected)
+                assert stats.min == expected.min()
+                assert stats.max == expected.max()
+                assert stats.median == pytest.approx(np.median(expected))
+                assert stats.average == pytest.approx(expected.mean())
+                assert stats.std == pytest.approx(
+                    expected.std(ddof=1) if len(expected) > 1 else 0
+                )
+                assert series.total(since=since, window=window) == pytest.approx(
+                    expected.sum()
+                )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_window_cost(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(2)
+
+        def seconds_per_summary(size: int) -> float:
+            """Returns the time to summarize a window of `size` entries as it slides by one."""
+            series = MetricSeries(capacity=2 * size, initial_capacity=2 * size)
+            series.extend(
+                timestamps=np.arange(size, dtype=float), values=rng.lognormal(size=size)
+            )
+            series.summarize(since=0.0, window=size)
+            timings = []
+            for i in range(size, size + 200):
+                series.append(timestamp=float(i), value=float(rng.lognormal()))
+                started = time.perf_counter()
+                series.summarize(since=float(i - size + 1), window=size)
+                timings.append(time.perf_counter() - started)
+            return float(np.median(timings))
+
+        # A window 100 times as large costs about the same to summarize, not 100 times as much.
+        small, large = seconds_per_summary(1000), seconds_per_summary(100000)
+        assert large < 5 * small
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.web
+@pytest.mark.profile
+class TestSessionHistory:  # pragma: no cover
+    # ============================================================================================ #
+    def test_snapshot(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = [0.0]
+        history = SessionHistory(max_history=100, clock=lambda: clock[0])
+        rng = np.random.default_rng(3)
+        for _ in range(300):
+            clock[0] += 1
+            history._rates.append(timestamp=clock[0], value=float(rng.integers(1, 50)))
+            history._attempts.append(timestamp=clock[0], value=10)
+            history._errors.append(timestamp=clock[0], value=float(rng.integers(0, 3)))
+            history._prune()
+            # The fused snapshot agrees with each metric summarized on its own.
+            for time_window in (10, 60, None):
+                snapshot = history.get_snapshot(time_window=time_window)
+                assert snapshot.rate_stats == history.get_rate_stats(
+                    time_window=time_window
+                )
+                assert snapshot.attempts == history.get_attempts(
+                    time_window=time_window
+                )
+                assert snapshot.error_rate == history.get_error_rate(
+                    time_window=time_window
+                )
+        # A window includes the entries at its start, 10 seconds ago.
+        assert history.get_rate_stats(time_window=10).n == 11
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_proxy.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:35:21 pm                                                #
+# Modified   : Friday October 16th 2026 07:35:21 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+import random
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+from acquire.infra.web.proxy import ProxyPool
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+URLS = ["http://u:p@a:1", "http://u:p@b:1", "http://u:p@c:1"]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.web
+@pytest.mark.proxy
+class TestProxyPool:  # pragma: no cover
+    # ============================================================================================ #
+    def test_routing(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        assert ProxyPool(urls=[]).select() is None
+        pool = ProxyPool(
+            urls=URLS, min_samples=5, latency_factor=10, rng=random.Random(0)
+        )
+        a, b, c = pool.proxies
+        for _ in range(5):
+            pool.record(a, latency=0.1, failed=False)
+            pool.record(b, latency=0.4, failed=False)
+            pool.record(c, latency=0.4, failed=False)
+        # Traffic is weighted towards the fastest proxy.
+        counts = Counter(pool.select() for _ in range(3000))
+        assert counts[a] > 1.5 * counts[b]
+        assert counts[b] > 0 and counts[c] > 0
+        # Credentials are not exposed.
+        assert "u:p" not in repr(a)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_ejection(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = Clock()
+        pool = ProxyPool(
+            urls=URLS, min_samples=4, error_threshold=0.5, ejection_time=10, clock=clock
+        )
+        a, b, c = pool.proxies
+        for _ in range(4):
+            pool.record(b, latency=0.1, failed=False)
+            pool.record(c, latency=0.1, failed=False)
+            pool.record(a, latency=None, failed=True)
+        assert a not in pool.admitted
+        assert all(pool.select() is not a for _ in range(100))
+        # Re-admitted with a clean window once the ejection expires.
+        clock.now = 10
+        assert a in pool.admitted
+        pool.record(a, latency=0.1, failed=False)
+        assert a.samples == 1
+        # A second consecutive ejection lasts twice as long.
+        for _ in range(3):
+            pool.record(a, latency=None, failed=True)
+        assert a.ejected_until == clock.now + 20
+        # Slow proxies are ejected too.
+        for _ in range(4):
+            pool.record(c, latency=1.0, failed=False)
+        assert c not in pool.admitted
+        assert pool.select() is b
+        # With every proxy ejected, the one due back soonest is used.
+        clock.now = 15
+        for _ in range(5):
+            pool.record(b, latency=None, failed=True)
+        assert not pool.admitted
+        assert pool.select() is c
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
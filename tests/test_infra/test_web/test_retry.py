@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_retry.py                                            #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:26:59 pm                                                #
+# Modified   : Friday October 16th 2026 07:26:59 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from acquire.infra.web.retry import RetryPolicy
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+ATTEMPTS = 3
+
+
+@pytest.mark.web
+@pytest.mark.retry
+class TestRetryPolicy:  # pragma: no cover
+    # ============================================================================================ #
+    def test_should_retry(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        policy = RetryPolicy(attempts=ATTEMPTS)
+        # Statuses that cannot succeed are never retried.
+        assert not policy.should_retry(status=404, attempt=1)
+        assert not policy.should_retry(status=400, attempt=1)
+        # Throttling, server and connection errors are retried until attempts run out.
+        assert policy.should_retry(status=429, attempt=1)
+        assert policy.should_retry(status=503, attempt=1)
+        assert policy.should_retry(status=500, attempt=1)
+        assert policy.should_retry(status=None, attempt=ATTEMPTS - 1)
+        assert not policy.should_retry(status=503, attempt=ATTEMPTS)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_delay(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        policy = RetryPolicy(
+            attempts=ATTEMPTS, base=1, cap=4, retry_after_cap=30, rng=random.Random(0)
+        )
+        # Jittered backoff stays under the exponential ceiling, which is capped.
+        for attempt in range(1, 10):
+            assert (
+                0
+                <= policy.delay(status=500, attempt=attempt)
+                <= min(4, 2 ** (attempt - 1))
+            )
+        # Throttling responses wait at least as long as Retry-After, up to the cap.
+        assert policy.delay(status=429, attempt=1, retry_after=10) >= 10
+        assert policy.delay(status=429, attempt=1, retry_after=1000) <= 31
+        # Retry-After is ignored for other statuses.
+        assert policy.delay(status=500, attempt=1, retry_after=10) <= 1
+        # Retry-After is parsed from delay-seconds or an HTTP-date.
+        assert RetryPolicy.parse_retry_after({"Retry-After": "120"}) == 120
+        when = datetime.now(tz=timezone.utc) + timedelta(seconds=60)
+        parsed = RetryPolicy.parse_retry_after(
+            {"Retry-After": format_datetime(when, usegmt=True)}
+        )
+        assert 55 <= parsed <= 60
+        assert RetryPolicy.parse_retry_after({"Retry-After": "soon"}) is None
+        assert RetryPolicy.parse_retry_after({}) is None
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
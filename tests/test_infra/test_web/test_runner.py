@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_runner.py                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:48:35 pm                                                #
+# Modified   : Friday October 16th 2026 08:48:35 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+import pickle
+import queue
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.application.orchestration.project import Project
+from acquire.application.orchestration.runner import (
+    Shard,
+    _work_async,
+    project_session_factory,
+)
+from acquire.core.enum import Category, DataType
+from acquire.infra.exceptions.web import ShortCircuitError
+from acquire.infra.web.adapter import AdapterExploitStage, AdapterPIDStage
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+class PageGen:
+    def __init__(
+        self, start_page: int = 0, max_requests: int = 0, short_circuit: bool = False
+    ) -> None:
+        self.bookmark = start_page
+        self.max_requests = max_requests
+        self.short_circuit = short_circuit
+
+
+class Session:
+    """Streams each shard's pages, short-circuiting the shards that ask for it."""
+
+    def __init__(self) -> None:
+        self.endpoints = SimpleNamespace(budget=None)
+
+    async def stream(self, request_gen):
+        for _ in range(request_gen.max_requests):
+            request_gen.bookmark += 1
+            if request_gen.short_circuit and request_gen.bookmark % 10 == 5:
+                raise ShortCircuitError(reason="404 rate 0.95")
+            yield SimpleNamespace(size=1, headers=SimpleNamespace(size=1), latency=0.1)
+
+    async def __exit__(self) -> None:
+        pass
+
+
+@pytest.mark.web
+@pytest.mark.runner
+class TestShardWorker:  # pragma: no cover
+    # ============================================================================================ #
+    def test_short_circuit(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        tasks, progress = queue.Queue(), queue.Queue()
+        shards = [
+            Shard(
+                key="a",
+                request_gen_cls=PageGen,
+                request_gen_kwargs={"short_circuit": True},
+                max_requests=20,
+            ),
+            Shard(
+                key="b",
+                request_gen_cls=PageGen,
+                start_page=20,
+                bookmark=20,
+                max_requests=20,
+            ),
+        ]
+        for shard in shards + [None]:
+            tasks.put(shard)
+        asyncio.run(
+            _work_async(
+                worker=0,
+                tasks=tasks,
+                progress=progress,
+                budget=None,
+                session_factory=Session,
+                handler=None,
+                checkpoint_interval=100,
+                window=2,
+            )
+        )
+        results = {}
+        while not progress.empty():
+            kind, payload = progress.get()
+            if kind == "result":
+                results[payload.key] = payload
+        # The short-circuited shard is reported as failed, and resumes behind its last page.
+        assert "ShortCircuitError" in results["a"].error
+        assert results["a"].responses == 4
+        assert results["a"].bookmark == 3
+        # The next shard on the same session runs to completion.
+        assert not results["b"].error
+        assert results["b"].responses == 20
+        assert results["b"].bookmark == 40
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+
+@pytest.mark.web
+@pytest.mark.runner
+class TestProjectSessionFactory:  # pragma: no cover
+    # ============================================================================================ #
+    def test_controller(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        def exploit_stage(controller: str):
+            project = Project(
+                project_id="1",
+                category=Category.BUSINESS,
+                data_type=DataType.APPDATA,
+                controller=controller,
+            )
+            # The factory is passed to worker processes, so it must survive pickling.
+            factory = pickle.loads(pickle.dumps(project_session_factory(project)))
+
+            async def run():
+                s = factory()
+                try:
+                    stage = s._adapter_factory.create(isolated=True).stage
+                    # The stage after baseline, rate and concurrency exploration.
+                    for _ in range(3):
+                        stage = stage.next_stage
+                    return stage
+                finally:
+                    await s.__exit__()
+
+            return asyncio.run(run())
+
+        # Each project's sessions adapt with the project's own controller.
+        assert isinstance(exploit_stage("pid"), AdapterPIDStage)
+        stage = exploit_stage("exploit")
+        assert isinstance(stage, AdapterExploitStage)
+        assert not isinstance(stage, AdapterPIDStage)
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_simulator.py                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:25:54 pm                                                #
+# Modified   : Friday October 16th 2026 08:25:54 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import pytest
+
+from acquire.application.orchestration.simulator import (
+    AdapterSimulator,
+    LatencyTrace,
+    ServerModel,
+)
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+DEFAULTS = {
+    "rate": {"base": 50, "min": 10, "max": 500},
+    "concurrency": {"base": 50, "min": 10, "max": 200},
+    "window_size": 30,
+    "temperature": 0.0,
+}
+EXPLORE = {
+    "response_time": 120,
+    "step_increase": 50,
+    "step_decrease": 0.9,
+    "step_response_time": 10,
+    "threshold": 1.2,
+}
+CONFIG = {
+    "history": 600,
+    "history_capacity": 2**16,
+    "baseline": {**DEFAULTS, "response_time": 30},
+    "explore_rate": {**DEFAULTS, **EXPLORE},
+    "explore_concurrency": {**DEFAULTS, **EXPLORE},
+    "exploit": {**DEFAULTS, "response_time": 300, "k": 0.1, "m": 0.05},
+}
+
+
+def simulate(server: ServerModel, **kwargs):
+    return AdapterSimulator(
+        config=CONFIG, server=server, duration=600, sample_interval=60, **kwargs
+    ).run()
+
+
+@pytest.mark.web
+@pytest.mark.simulator
+class TestAdapterSimulator:  # pragma: no cover
+    # ============================================================================================ #
+    def test_capacity(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        small = simulate(ServerModel(workers=10, latency_median=0.2))
+        large = simulate(ServerModel(workers=40, latency_median=0.2))
+        # The simulation runs far faster than the time it simulates.
+        assert large.wall_time < large.duration / 10
+        # The adapter drives the larger server harder, and the smaller one queues.
+        assert large.throughput > small.throughput * 2
+        assert small.latency_p95 > large.latency_p95
+        assert small.throughput <= 10 / 0.2 * 1.5
+
+        series = large.series()
+        assert len(series) == 10
+        assert series["time"].iloc[-1] == 600
+        assert series["responses"].sum() == large.responses
+        assert {"stage", "rate", "concurrency", "throughput", "latency_p95"} <= set(
+            series.columns
+        )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_throttle_and_trace(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        # Requests beyond the upstream's rate limit fail, and do not count as throughput.
+        throttled = simulate(
+            ServerModel(workers=100, latency_median=0.1, throttle_rate=40)
+        )
+        assert throttled.failures > 0
+        assert throttled.throughput <= 40
+
+        # A recorded trace is replayed as service times: 0.1 second latencies, then 0.4.
+        timestamps = [i * 0.01 for i in range(60000)]
+        latencies = [
+            (0.1 if t < 300 else 0.4) + (i % 3 - 1) * 0.01
+            for i, t in enumerate(timestamps)
+        ]
+        trace = LatencyTrace(timestamps=timestamps, latencies=latencies)
+        result = simulate(ServerModel(workers=1000), trace=trace)
+        series = result.series()
+        assert series["latency_p50"].iloc[:4].tolist() == pytest.approx(
+            [0.1] * 4, abs=0.01
+        )
+        assert series["latency_p50"].iloc[-4:].tolist() == pytest.approx(
+            [0.4] * 4, abs=0.01
+        )
+
+        with pytest.raises(ValueError):
+            LatencyTrace(timestamps=[0.0, 1.0], latencies=[0.1])
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
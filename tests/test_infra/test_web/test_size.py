@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_size.py                                             #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:28:53 pm                                                #
+# Modified   : Friday October 16th 2026 11:02:47 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import gzip
+import inspect
+import json
+import logging
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+
+from acquire.application.orchestration.context import JobContext
+from acquire.application.orchestration.loadtest import LoadTestRequestGen
+from acquire.application.orchestration.runner import default_session_factory
+from acquire.core.enum import Category, DataType
+from acquire.infra.web.mock import SEARCH_PATH, render_search_page
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+BODY = render_search_page(genre_id=6000, offset=0, limit=50)
+PLAIN, GZIP, CHUNKED = 1, 2, 3
+
+
+async def search(request: web.Request) -> web.StreamResponse:
+    """Serves the same page as is, compressed, or chunked without a Content-Length."""
+    kind = int(request.query["genreId"])
+    headers = {"Content-Type": "application/json"}
+    if kind == GZIP:
+        return web.Response(
+            body=gzip.compress(BODY), headers={**headers, "Content-Encoding": "gzip"}
+        )
+    if kind == CHUNKED:
+        response = web.StreamResponse(headers=headers)
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        await response.write(BODY)
+        await response.write_eof()
+        return response
+    return web.Response(body=BODY, headers=headers)
+
+
+@pytest.mark.web
+@pytest.mark.size
+class TestResponseSize:  # pragma: no cover
+    # ============================================================================================ #
+    def test_size(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        context = JobContext(
+            job_id="size",
+            category=Category.BUSINESS,
+            data_type=DataType.APPDATA,
+            description="Size test",
+            dt_created=datetime.now(),
+        )
+
+        async def run() -> dict:
+            app = web.Application()
+            app.router.add_get(SEARCH_PATH, search)
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            host = f"127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+            s = default_session_factory()
+            s._states = None
+            await s.__enter__()
+            try:
+                responses = {}
+                for kind in (PLAIN, GZIP, CHUNKED):
+                    request_gen = LoadTestRequestGen(
+                        host=host,
+                        data_type="appdata",
+                        pages=1,
+                        limit=50,
+                        genre_id=kind,
+                        context=context,
+                    )
+                    responses[kind] = await s.make_request(request_gen.next_request())
+                    # The monitor records the same sizes.
+                    assert s.monitor.sizes[-1] == responses[kind].size
+                    assert s.monitor.wire_sizes[-1] == responses[kind].headers.size
+                return responses
+            finally:
+                await s.__exit__()
+                await runner.cleanup()
+
+        responses = asyncio.run(run())
+        # The size is the decompressed body, whatever the encoding.
+        for response in responses.values():
+            assert response.size == len(BODY)
+            assert response.content == json.loads(BODY)
+        # The size on the wire is the body as sent: from Content-Length, or the body read if chunked.
+        assert responses[PLAIN].headers.size == len(BODY)
+        assert responses[CHUNKED].headers.size == len(BODY)
+        # Compressed, the two differ.
+        assert responses[GZIP].headers.encoding == "gzip"
+        assert responses[GZIP].headers.size == len(gzip.compress(BODY))
+        assert responses[GZIP].headers.size < responses[GZIP].size
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
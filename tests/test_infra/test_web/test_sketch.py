@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_sketch.py                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:12:35 pm                                                #
+# Modified   : Friday October 16th 2026 08:12:35 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import logging
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from acquire.infra.web.sketch import QuantileSketch, WindowedQuantileSketch
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+
+
+@pytest.mark.web
+@pytest.mark.sketch
+class TestQuantileSketch:  # pragma: no cover
+    # ============================================================================================ #
+    def test_accuracy(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        rng = np.random.default_rng(0)
+        latencies = rng.lognormal(mean=-3, sigma=1, size=20000)
+        qs = [0.5, 0.9, 0.95, 0.99]
+        expected = np.quantile(latencies, qs, method="lower")
+
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add(latencies)
+        assert sketch.count == len(latencies)
+        for estimate, value in zip(sketch.quantiles(qs), expected):
+            assert abs(estimate - value) <= 0.01 * value + 1e-12
+
+        # Sketches of parts merge into the sketch of the whole.
+        parts = [QuantileSketch(relative_accuracy=0.01) for _ in range(4)]
+        for part, chunk in zip(parts, np.array_split(latencies, 4)):
+            part.add(chunk)
+        merged = QuantileSketch(relative_accuracy=0.01)
+        for part in parts:
+            merged.merge(part)
+        assert merged.quantiles(qs) == sketch.quantiles(qs)
+
+        # Collapsing the lowest buckets leaves the tail intact.
+        small = QuantileSketch(relative_accuracy=0.01, max_buckets=256)
+        small.add(latencies)
+        assert small.quantile(0.99) == pytest.approx(sketch.quantile(0.99))
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_window(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        sketch = WindowedQuantileSketch(interval=10)
+        sketch.add(timestamp=0, values=np.full(100, 1.0))
+        sketch.add(timestamp=15, values=np.full(100, 2.0))
+        sketch.add(timestamp=25, values=np.full(100, 4.0))
+        assert sketch.quantiles([0.5], since=20)[0] == pytest.approx(4.0, rel=0.01)
+        assert sketch.quantiles([0.5])[0] == pytest.approx(2.0, rel=0.01)
+        sketch.evict_before(20)
+        assert sketch.count == 100
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
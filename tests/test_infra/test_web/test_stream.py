@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_stream.py                                           #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 07:21:56 pm                                                #
+# Modified   : Friday October 16th 2026 10:48:31 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.application.orchestration.context import JobContext
+from acquire.application.orchestration.loadtest import LoadTestRequestGen
+from acquire.application.orchestration.runner import default_session_factory
+from acquire.core.enum import Category, DataType
+from acquire.infra.web.mock import MockAppStore, MockProfile
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+LIMIT = 200
+
+
+def profile(apps_per_genre: int = 10000) -> MockProfile:
+    return MockProfile(
+        latency_median=0.005,
+        latency_sigma=0.2,
+        apps_per_genre=apps_per_genre,
+        end_status=404,
+        throttle_interval=3600,
+        throttle_duration=0,
+    )
+
+
+def session(
+    window: int = 4,
+    adapt_interval: int = 5,
+    request_limit: int = 1000,
+    pagination: bool = False,
+):
+    """Returns the configured session, with a small window and no saved adapter states.
+
+    It must be created in a running event loop, which owns its connector.
+    """
+    s = default_session_factory()
+    s._window = window
+    s._adapt_interval = adapt_interval
+    s._session_request_limit = request_limit
+    s._states = None
+    s._pagination = SimpleNamespace(**{**vars(s._pagination), "enabled": pagination})
+    return s
+
+
+class Recorder:
+    """Wraps a session's methods to count the requests in flight, the responses of each
+    adaptation and the sessions."""
+
+    def __init__(self, s) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.adaptations: list = []
+        self.sessions = 0
+        send, adapt, create = s._send, s._adapt_stream, s._create_session
+
+        async def _send(request, **kwargs):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                return await send(request, **kwargs)
+            finally:
+                self.in_flight -= 1
+
+        async def _adapt_stream(endpoint, responses):
+            self.adaptations.append(len(responses))
+            await adapt(endpoint=endpoint, responses=responses)
+
+        async def _create_session():
+            self.sessions += 1
+            await create()
+
+        s._send, s._adapt_stream, s._create_session = (
+            _send,
+            _adapt_stream,
+            _create_session,
+        )
+
+
+async def stream(s, server: MockAppStore, pages: int) -> list:
+    context = JobContext(
+        job_id="stream",
+        category=Category.BUSINESS,
+        data_type=DataType.APPDATA,
+        description="Stream test",
+        dt_created=datetime.now(),
+    )
+    request_gen = LoadTestRequestGen(
+        host=server.host, data_type="appdata", pages=pages, limit=LIMIT, context=context
+    )
+    try:
+        return [response async for response in s.stream(request_gen=request_gen)]
+    finally:
+        await s.__exit__()
+
+
+@pytest.mark.web
+@pytest.mark.stream
+class TestStream:  # pragma: no cover
+    # ============================================================================================ #
+    def test_window(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        async def run():
+            async with MockAppStore(profile=profile()) as server:
+                s = session(window=4, adapt_interval=5)
+                recorder = Recorder(s)
+                responses = await stream(s, server=server, pages=22)
+                return responses, recorder, server.counts
+
+        responses, recorder, counts = asyncio.run(run())
+        # The window is topped up to, and never beyond, four requests in flight.
+        assert recorder.max_in_flight == 4
+        assert len(responses) == 22
+        assert counts == {200: 22}
+        # Adaptation runs once five or more requests have completed, and once more for the
+        # remainder. Requests that complete together are adapted on together.
+        assert all(count >= 5 for count in recorder.adaptations[:-1])
+        assert 0 < recorder.adaptations[-1] and sum(recorder.adaptations) == 22
+        assert len(responses[0].content["results"]) == LIMIT
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_rotation(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        async def run():
+            async with MockAppStore(profile=profile()) as server:
+                s = session(window=4, request_limit=9)
+                recorder = Recorder(s)
+                responses = await stream(s, server=server, pages=25)
+                return responses, recorder, server.counts
+
+        responses, recorder, counts = asyncio.run(run())
+        # A session is rotated once the ten requests past its limit have drained, so none is orphaned.
+        assert recorder.sessions == 3
+        assert len(responses) == 25
+        assert counts == {200: 25}
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_end_of_pages(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+
+        # ---------------------------------------------------------------------------------------- #
+        async def run():
+            # Twelve and a half pages of apps, then 404s.
+            async with MockAppStore(
+                profile=profile(apps_per_genre=12 * LIMIT + LIMIT // 2)
+            ) as server:
+                s = session(window=4, pagination=True)
+                responses = await stream(s, server=server, pages=500)
+                return responses, server.counts
+
+        responses, counts = asyncio.run(run())
+        # Every page with data is returned once, including the short last page.
+        offsets = sorted(
+            response.content["results"][0]["trackId"] for response in responses
+        )
+        assert len(offsets) == len(set(offsets)) == 13
+        assert (
+            sum(len(response.content["results"]) for response in responses)
+            == 12 * LIMIT + LIMIT // 2
+        )
+        # The probes find the end, so the stream stops long before the last page requested.
+        assert counts[200] == 13
+        assert counts[404] < 50
+        # The 404s past the end are expected, so none is logged as an error.
+        assert not [
+            record for record in caplog.records if record.levelno >= logging.ERROR
+        ]
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
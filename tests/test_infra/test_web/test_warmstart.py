@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding:utf-8 -*-
+# ================================================================================================ #
+# Project    : AppVoCAI-Acquire                                                                    #
+# Version    : 0.2.0                                                                               #
+# Python     : 3.10.14                                                                             #
+# Filename   : /tests/test_infra/test_web/test_warmstart.py                                        #
+# ------------------------------------------------------------------------------------------------ #
+# Author     : John James                                                                          #
+# Email      : john@variancexplained.com                                                           #
+# URL        : https://github.com/variancexplained/appvocai-acquire                                #
+# ------------------------------------------------------------------------------------------------ #
+# Created    : Friday October 16th 2026 08:21:43 pm                                                #
+# Modified   : Friday October 16th 2026 08:58:41 pm                                                #
+# ------------------------------------------------------------------------------------------------ #
+# License    : MIT License                                                                         #
+# Copyright  : (c) 2024 John James                                                                 #
+# ================================================================================================ #
+import inspect
+import json
+import logging
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from acquire.infra.web.adapter import (
+    Adapter,
+    AdapterBaselineStage,
+    AdapterConcurrencyExploreStage,
+    AdapterExploitStage,
+    AdapterFactory,
+    AdapterRateExploreStage,
+)
+from acquire.infra.web.profile import SessionControl, SessionHistory, SessionStats
+from acquire.infra.web.warmstart import AdapterState, AdapterStateStore
+
+# ------------------------------------------------------------------------------------------------ #
+# pylint: disable=missing-class-docstring, line-too-long
+# mypy: ignore-errors
+# ------------------------------------------------------------------------------------------------ #
+logger = logging.getLogger(__name__)
+# ------------------------------------------------------------------------------------------------ #
+double_line = f"\n{100 * '='}"
+single_line = f"\n{100 * '-'}"
+# ------------------------------------------------------------------------------------------------ #
+DEFAULTS = {
+    "rate": {"base": 50, "min": 10, "max": 500},
+    "concurrency": {"base": 50, "min": 10, "max": 200},
+    "window_size": 300,
+    "temperature": 0.0,
+    "response_time": 3600,
+}
+EXPLORE = {
+    "step_increase": 10,
+    "step_decrease": 0.9,
+    "step_response_time": 60,
+    "threshold": 1.2,
+}
+KEY = "itunes.apple.com/appdata/direct"
+
+
+def factory(history: SessionHistory = None) -> AdapterFactory:
+    return AdapterFactory(
+        adapter=Adapter,
+        history=history or SessionHistory(),
+        baseline=AdapterBaselineStage(config=DEFAULTS),
+        explore_rate=AdapterRateExploreStage(config={**DEFAULTS, **EXPLORE}),
+        explore_concurrency=AdapterConcurrencyExploreStage(
+            config={**DEFAULTS, **EXPLORE}
+        ),
+        exploit=AdapterExploitStage(config={**DEFAULTS, "k": 0.1, "m": 0.05}),
+    )
+
+
+@pytest.mark.web
+@pytest.mark.warmstart
+class TestAdapterStateStore:  # pragma: no cover
+    # ============================================================================================ #
+    def test_store(self, tmp_path, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        store = AdapterStateStore(directory=str(tmp_path), max_age=3600)
+        assert store.get(KEY) is None
+
+        baseline = SessionStats(n=500, average=0.2, cv=0.5, p95=0.4)
+        store.set(
+            AdapterState(
+                key=KEY,
+                rate=120.0,
+                concurrency=80.0,
+                baseline=baseline,
+                saved=time.time(),
+            )
+        )
+        state = store.get(KEY)
+        assert state.rate == 120.0
+        assert state.concurrency == 80.0
+        assert state.baseline == baseline
+        assert store.get("itunes.apple.com/review/us/direct") is None
+
+        # A stale state falls back to the baseline stage.
+        store.set(
+            AdapterState(
+                key=KEY,
+                rate=120.0,
+                concurrency=80.0,
+                baseline=baseline,
+                saved=time.time() - 7200,
+            )
+        )
+        assert store.get(KEY) is None
+
+        # An unreadable state is ignored.
+        for path in tmp_path.iterdir():
+            path.write_text("{")
+        assert store.get(KEY) is None
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_warm_start(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        adapter_factory = factory()
+        adapter = adapter_factory.create()
+        assert isinstance(adapter.stage, AdapterBaselineStage)
+        # An adapter that has not converged has no state to save.
+        assert adapter.get_state(key=KEY) is None
+
+        baseline = SessionStats(n=500, average=0.2, cv=0.5, p95=0.4)
+        state = AdapterState(
+            key=KEY, rate=120.0, concurrency=80.0, baseline=baseline, saved=time.time()
+        )
+        adapter_factory.warm_start(adapter=adapter, state=state)
+        assert isinstance(adapter.stage, AdapterExploitStage)
+
+        # The exploit stage begins at the saved operating point, against the saved baseline.
+        adapter.initialize(async_request=None)
+        for _ in range(50):
+            adapter.profile.add_latency(0.2)
+        adapter.adapt_requests()
+        assert adapter.stage.baseline_latency_stats == baseline
+        assert adapter.session_control.concurrency == 80.0
+        assert adapter.session_control.rate == pytest.approx(120.0, rel=0.2)
+
+        saved = adapter.get_state(key=KEY)
+        assert saved.baseline == baseline
+        assert saved.rate == adapter.session_control.rate
+        assert json.loads(json.dumps(saved.as_dict()))["baseline"]["p95"] == 0.4
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)
+
+    # ============================================================================================ #
+    def test_warm_start_back_off(self, caplog) -> None:
+        start = datetime.now()
+        logger.info(
+            f"\n\nStarted {self.__class__.__name__} {inspect.stack()[0][3]} at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(double_line)
+        # ---------------------------------------------------------------------------------------- #
+        clock = SimpleNamespace(now=1e9)
+
+        def adapt(adapter: Adapter, throttled: int) -> float:
+            adapter.initialize(async_request=None)
+            adapter.profile.send()
+            for i in range(40 - throttled):
+                adapter.profile.add_latency(0.15 + 0.1 * (i % 2))
+                adapter.profile.add_status(200)
+            for _ in range(throttled):
+                adapter.profile.add_status(429)
+            adapter.adapt_requests()
+            clock.now += 60
+            return adapter.session_control.rate
+
+        # A cold exploit stage measures its baselines, including 10% throttling, from history.
+        exploit = AdapterExploitStage(config={**DEFAULTS, "k": 0.1, "m": 0.05})
+        exploit.next_stage = AdapterBaselineStage(config=DEFAULTS)
+        cold = Adapter(
+            initial_stage=exploit, history=SessionHistory(clock=lambda: clock.now)
+        )
+        cold.session_control = SessionControl(rate=100, concurrency=50)
+        adapt(cold, throttled=4)
+        assert cold.stage.baseline_throttle_rate == pytest.approx(0.1)
+
+        # A warm-started stage restores the same baselines, rather than measuring them from an
+        # empty history.
+        state = cold.get_state(key=KEY)
+        assert state.throttle_rate == pytest.approx(0.1)
+        adapter_factory = factory(history=SessionHistory(clock=lambda: clock.now))
+        warm = adapter_factory.create()
+        adapter_factory.warm_start(adapter=warm, state=state)
+
+        # Both hold their rate at the baseline throttling, and back off as it rises.
+        for throttled, backoff in [(4, 1), (4, 1), (12, 0.5), (4, 1)]:
+            cold_rate, warm_rate = cold.session_control.rate, warm.session_control.rate
+            assert adapt(cold, throttled=throttled) == pytest.approx(
+                cold_rate * backoff
+            )
+            assert adapt(warm, throttled=throttled) == pytest.approx(
+                warm_rate * backoff
+            )
+        # ---------------------------------------------------------------------------------------- #
+        end = datetime.now()
+        duration = round((end - start).total_seconds(), 1)
+
+        logger.info(
+            f"\n\nCompleted {self.__class__.__name__} {inspect.stack()[0][3]} in {duration} seconds at {start.strftime('%I:%M:%S %p')} on {start.strftime('%m/%d/%Y')}"
+        )
+        logger.info(single_line)